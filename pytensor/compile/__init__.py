@@ -57,5 +57,5 @@ from pytensor.compile.ops import (
     register_view_op_c_code,
     view_op,
 )
-from pytensor.compile.profiling import ProfileStats
+from pytensor.compile.profiling import ProfileGuide, ProfileStats
 from pytensor.compile.sharedvalue import SharedVariable, shared, shared_constructor
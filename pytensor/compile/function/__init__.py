@@ -1,9 +1,10 @@
 import logging
 import re
 import traceback as tb
+from functools import partial
 
 from pytensor.compile.function.pfunc import pfunc
-from pytensor.compile.function.types import orig_function
+from pytensor.compile.function.types import LazyFunction, orig_function
 
 
 __all__ = ["types", "pfunc"]
@@ -96,6 +97,7 @@ def function(
     allow_input_downcast=None,
     profile=None,
     on_unused_input=None,
+    lazy=False,
 ):
     """
     Return a :class:`callable object <pytensor.compile.function.types.Function>`
@@ -153,6 +155,11 @@ def function(
     on_unused_input
         What to do if a variable in the 'inputs' list is not used in the graph.
         Possible values are 'raise', 'warn', 'ignore' and None.
+    lazy: bool or "background"
+        If True, return a :class:`pytensor.compile.function.types.LazyFunction`
+        that only rewrites and links the graph the first time it is called or
+        one of its attributes is used. With "background", that compilation is
+        started right away in a background thread instead.
 
     Returns
     -------
@@ -280,6 +287,26 @@ def function(
                 func_frame = stack[idx - 1]
             name = func_frame[0] + ":" + str(func_frame[1])
 
+    if lazy not in (False, True, "background"):
+        raise ValueError(f"lazy must be True, False or 'background', got {lazy}")
+    if lazy:
+        compile_fn = partial(
+            function,
+            inputs,
+            outputs if output_keys is None else dict(zip(output_keys, outputs)),
+            mode=mode,
+            updates=updates,
+            givens=givens,
+            no_default_updates=no_default_updates,
+            accept_inplace=accept_inplace,
+            name=name,
+            rebuild_strict=rebuild_strict,
+            allow_input_downcast=allow_input_downcast,
+            profile=profile,
+            on_unused_input=on_unused_input,
+        )
+        return LazyFunction(compile_fn, background=lazy == "background")
+
     if updates is None:
         updates = []
 
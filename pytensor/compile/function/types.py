@@ -3,8 +3,16 @@
 import copy
 import copyreg
 import logging
+import os
+import pickle
+import shutil
+import tempfile
+import threading
 import time
+import uuid
 import warnings
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
 from itertools import chain
 from typing import TYPE_CHECKING, Optional
 
@@ -12,6 +20,7 @@ import numpy as np
 
 import pytensor
 import pytensor.compile.profiling
+from pytensor.compile.compilelock import lock_ctx
 from pytensor.compile.io import In, SymbolicInput, SymbolicOutput
 from pytensor.compile.ops import deep_copy_op, view_op
 from pytensor.configdefaults import config
@@ -20,15 +29,19 @@ from pytensor.graph.basic import (
     Variable,
     ancestors,
     clone_get_equiv,
+    equal_computations,
     graph_inputs,
 )
 from pytensor.graph.destroyhandler import DestroyHandler
 from pytensor.graph.features import AlreadyThere, Feature, PreserveVariableAttributes
 from pytensor.graph.fg import FunctionGraph
 from pytensor.graph.op import HasInnerGraph
+from pytensor.graph.replace import vectorize_graph
+from pytensor.graph.rewriting.db import RewriteDatabaseQuery
 from pytensor.graph.utils import InconsistencyError, get_variable_trace_string
 from pytensor.link.basic import Container
 from pytensor.link.utils import raise_with_op
+from pytensor.utils import hash_from_code
 
 
 if TYPE_CHECKING:
@@ -38,6 +51,12 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger("pytensor.compile.function.types")
 
+# Held while a graph is rewritten and linked into a `Function`.  The rewrites,
+# the linkers and the C module cache aren't thread-safe, and the compilation
+# changes the process-global `config` flags, so the compilations run in the
+# background by `LazyFunction` mustn't overlap with any other one.
+_compile_lock = threading.RLock()
+
 
 class UnusedInputError(Exception):
     """
@@ -261,6 +280,228 @@ def std_fgraph(
     return fgraph, found_updates
 
 
+def _detached_graph(inputs, outputs):
+    """Clone the graph between `inputs` and `outputs` onto fresh root inputs.
+
+    The new inputs are plain variables of the same types, so that pickling the
+    result does not carry the values of shared variables along.
+
+    """
+    memo = {i: i.type(name=i.name) for i in inputs}
+    equiv = clone_get_equiv(inputs, outputs, copy_inputs=False, memo=memo)
+    return [memo[i] for i in inputs], [equiv[o] for o in outputs]
+
+
+class FunctionGraphCache:
+    r"""An on-disk cache of rewritten `FunctionGraph`\s.
+
+    Entries are grouped in sub-directories named after a hash of the
+    un-rewritten graph, the compilation `Mode` and the configuration. Each
+    entry stores the un-rewritten graph, which is compared with
+    `equal_computations` to rule out hash collisions, along with the graph
+    obtained after rewriting it.
+
+    Writes and evictions are done while holding the compile lock of the cache
+    directory; entries are written atomically, so readers do not need to hold
+    it.
+
+    The compiled C modules used by the linker are cached separately by the
+    `ModuleCache`.
+
+    """
+
+    def __init__(self, dirname):
+        self.dirname = dirname
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def mode_key(mode) -> Optional[str]:
+        """Return a string identifying `mode`, or ``None`` if it can't be cached."""
+        optimizer = mode.provided_optimizer
+        if not isinstance(optimizer, RewriteDatabaseQuery) or optimizer.extra_rewrites:
+            return None
+        # The rewrites steered by a profile depend on its measurements
+        if getattr(mode, "profile_guide", None) is not None:
+            return None
+        linker = mode.linker
+        linker_props = sorted(
+            (k, v)
+            for k, v in vars(linker).items()
+            if isinstance(v, (bool, int, float, str, type(None)))
+        )
+        return (
+            f"{type(mode).__name__} {type(linker).__name__}{linker_props} "
+            f"{optimizer} {sorted(mode.optdb._names)}"
+        )
+
+    def key(self, fgraph, inputs, outputs, mode, accept_inplace) -> Optional[str]:
+        """Compute the hash under which the graph of `fgraph` is cached.
+
+        ``None`` is returned when the mode can't be identified across
+        processes (e.g. a custom rewriter object was provided).
+
+        """
+        mode_key = self.mode_key(mode)
+        if mode_key is None:
+            return None
+
+        lines = [
+            pytensor.__version__,
+            config.get_config_hash(),
+            mode_key,
+            f"accept_inplace={accept_inplace}",
+        ]
+        lines.extend(
+            f"in {i.variable.type} mutable={i.mutable} borrow={i.borrow} "
+            f"update={i.update is not None}"
+            for i in inputs
+        )
+        lines.extend(f"out borrow={o.borrow}" for o in outputs)
+
+        var_ids = {v: f"i{n}" for n, v in enumerate(fgraph.inputs)}
+        for node in fgraph.toposort():
+            node_inputs = []
+            for v in node.inputs:
+                if v not in var_ids:
+                    if isinstance(v, Constant):
+                        var_ids[v] = f"c[{v.type}, {v.data!r}]"
+                    else:
+                        var_ids[v] = f"o{len(var_ids)}"
+                node_inputs.append(var_ids[v])
+            for o in node.outputs:
+                var_ids[o] = f"v{len(var_ids)}"
+            lines.append(
+                f"{node.op} {node_inputs} {[str(o.type) for o in node.outputs]}"
+            )
+        lines.append(str([var_ids.get(o, f"c[{o.type}]") for o in fgraph.outputs]))
+
+        return hash_from_code("\n".join(lines))
+
+    def _entries(self, key):
+        key_dir = os.path.join(self.dirname, key)
+        try:
+            names = sorted(os.listdir(key_dir))
+        except OSError:
+            return []
+        return [os.path.join(key_dir, n) for n in names if n.endswith(".pkl")]
+
+    def get(self, key, fgraph) -> Optional[FunctionGraph]:
+        """Return the cached rewritten version of `fgraph`, or ``None``.
+
+        The returned `FunctionGraph` has the same inputs as `fgraph` and no
+        features attached.
+
+        """
+        for entry in self._entries(key):
+            try:
+                with open(entry, "rb") as f:
+                    key_inputs, key_outputs, inputs, outputs = pickle.load(f)
+            except FileNotFoundError:
+                # Evicted by another process in the meantime
+                continue
+            except Exception:
+                _logger.warning(f"Unable to load function cache entry {entry}")
+                continue
+
+            if len(key_inputs) != len(fgraph.inputs) or not equal_computations(
+                key_outputs, fgraph.outputs, key_inputs, fgraph.inputs
+            ):
+                continue
+
+            try:
+                # Mark the entry as recently used
+                os.utime(entry)
+            except OSError:
+                pass
+
+            memo = dict(zip(inputs, fgraph.inputs))
+            equiv = clone_get_equiv(inputs, outputs, copy_inputs=False, memo=memo)
+            self.hits += 1
+            return FunctionGraph(
+                fgraph.inputs,
+                [equiv[o] for o in outputs],
+                update_mapping=fgraph.update_mapping,
+                clone=False,
+            )
+
+        self.misses += 1
+        return None
+
+    def add(self, key, key_graph, fgraph):
+        """Store the rewritten `fgraph` for the un-rewritten `key_graph`.
+
+        `key_graph` is a pair of input and output lists, as returned by
+        `_detached_graph`.
+
+        """
+        try:
+            data = pickle.dumps(
+                (*key_graph, *_detached_graph(fgraph.inputs, fgraph.outputs)),
+                protocol=pickle.HIGHEST_PROTOCOL,
+            )
+        except Exception as e:
+            _logger.debug(f"Unable to pickle the graph for the function cache: {e}")
+            return
+
+        key_dir = os.path.join(self.dirname, key)
+        with lock_ctx(self.dirname):
+            os.makedirs(key_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=key_dir, suffix=".tmp")
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, os.path.join(key_dir, f"{uuid.uuid4().hex}.pkl"))
+            self._evict()
+
+    def _evict(self):
+        now = time.time()
+        age_thresh = config.compile__function_cache_age_thresh
+        entries = []
+        for key in os.listdir(self.dirname):
+            for entry in self._entries(key):
+                stat = os.stat(entry)
+                if now - stat.st_mtime > age_thresh:
+                    os.remove(entry)
+                else:
+                    entries.append((stat.st_mtime, stat.st_size, entry))
+
+        # Remove the least recently used entries until the size limit is met
+        entries.sort()
+        total_size = sum(size for _, size, _ in entries)
+        max_size = config.compile__function_cache_size * 2**20
+        while entries and total_size > max_size:
+            _, size, entry = entries.pop(0)
+            os.remove(entry)
+            total_size -= size
+
+        for key_dir in os.listdir(self.dirname):
+            key_dir = os.path.join(self.dirname, key_dir)
+            if os.path.isdir(key_dir) and not os.listdir(key_dir):
+                os.rmdir(key_dir)
+
+    def clear(self):
+        """Remove all the entries of the cache."""
+        if not os.path.isdir(self.dirname):
+            return
+        with lock_ctx(self.dirname):
+            for key in os.listdir(self.dirname):
+                key_dir = os.path.join(self.dirname, key)
+                if os.path.isdir(key_dir):
+                    shutil.rmtree(key_dir, ignore_errors=True)
+
+
+_function_graph_caches: dict[str, FunctionGraphCache] = {}
+
+
+def get_function_graph_cache() -> FunctionGraphCache:
+    """Return the `FunctionGraphCache` of the current ``config.compiledir``."""
+    dirname = os.path.join(config.compiledir, "function_cache")
+    if dirname not in _function_graph_caches:
+        os.makedirs(dirname, exist_ok=True)
+        _function_graph_caches[dirname] = FunctionGraphCache(dirname)
+    return _function_graph_caches[dirname]
+
+
 class AliasedMemoryError(Exception):
     """
     Memory is aliased that should not be.
@@ -389,6 +630,8 @@ class Function:
         self.maker = maker
         self.profile = None  # reassigned in FunctionMaker.create
         self.trust_input = False  # If True, we don't check the input parameter
+        self._fast_call: Optional[Callable] = None  # built by `Function.fast_call`
+        self._vmap_fns: dict[tuple[bool, ...], Function] = {}  # see `Function.vmap`
         self.name = name
         self.nodes_with_inner_function = []
         self.output_keys = output_keys
@@ -738,25 +981,26 @@ class Function:
         elif isinstance(profile, str):
             profile = pytensor.compile.profiling.ProfileStats(message=profile)
 
-        f_cpy = maker.__class__(
-            inputs=ins,
-            outputs=outs,
-            fgraph=fg_cpy,
-            mode=maker.mode,
-            profile=profile,
-            # When removing updates containing variables
-            # not used in the output function, copy
-            # generates an unused implicit input.
-            # We ignore the resulting errors,
-            # but could change it to 'warn' if this might
-            # cause problems.
-            on_unused_input="ignore",
-            function_builder=maker.function_builder,
-            # As this is an rewritten graph, it can contain inplace. DebugMode
-            # check that.
-            accept_inplace=True,
-            no_fgraph_prep=True,
-        ).create(input_storage, storage_map=new_storage_map)
+        with _compile_lock:
+            f_cpy = maker.__class__(
+                inputs=ins,
+                outputs=outs,
+                fgraph=fg_cpy,
+                mode=maker.mode,
+                profile=profile,
+                # When removing updates containing variables
+                # not used in the output function, copy
+                # generates an unused implicit input.
+                # We ignore the resulting errors,
+                # but could change it to 'warn' if this might
+                # cause problems.
+                on_unused_input="ignore",
+                function_builder=maker.function_builder,
+                # As this is an rewritten graph, it can contain inplace. DebugMode
+                # check that.
+                accept_inplace=True,
+                no_fgraph_prep=True,
+            ).create(input_storage, storage_map=new_storage_map)
 
         for in_ori, in_cpy, ori, cpy in zip(
             maker.inputs, f_cpy.maker.inputs, self.input_storage, f_cpy.input_storage
@@ -973,22 +1217,7 @@ class Function:
             )
         except Exception:
             restore_defaults()
-            if hasattr(self.vm, "position_of_error"):
-                # this is a new vm-provided function or c linker
-                # they need this because the exception manipulation
-                # done by raise_with_op is not implemented in C.
-                thunk = None
-                if hasattr(self.vm, "thunks"):
-                    thunk = self.vm.thunks[self.vm.position_of_error]
-                raise_with_op(
-                    self.maker.fgraph,
-                    node=self.vm.nodes[self.vm.position_of_error],
-                    thunk=thunk,
-                    storage_map=getattr(self.vm, "storage_map", None),
-                )
-            else:
-                # old-style linkers raise their own exceptions
-                raise
+            self._reraise_vm_error()
 
         dt_fn = time.perf_counter() - t0_fn
         self.maker.mode.fn_time += dt_fn
@@ -1070,6 +1299,216 @@ class Function:
             else:
                 return [outputs[i] for i in output_subset]
 
+    def _reraise_vm_error(self):
+        """Re-raise the exception raised by `Function.vm` with the failing node."""
+        if hasattr(self.vm, "position_of_error"):
+            # this is a new vm-provided function or c linker
+            # they need this because the exception manipulation
+            # done by raise_with_op is not implemented in C.
+            thunk = None
+            if hasattr(self.vm, "thunks"):
+                thunk = self.vm.thunks[self.vm.position_of_error]
+            raise_with_op(
+                self.maker.fgraph,
+                node=self.vm.nodes[self.vm.position_of_error],
+                thunk=thunk,
+                storage_map=getattr(self.vm, "storage_map", None),
+            )
+        else:
+            # old-style linkers raise their own exceptions
+            raise
+
+    @property
+    def fast_call(self) -> Callable:
+        """A callable that evaluates the function with minimal Python overhead.
+
+        The callable is generated once per `Function` from its signature. It
+        takes exactly one positional argument for each explicit input, in
+        order, and returns the outputs like `Function.__call__` does. It
+        skips all the work `Function.__call__` does on the inputs:
+
+        - The values are not filtered. They must already have the exact
+          type of their input, as with `Function.trust_input`.
+        - Inputs can't be passed by keyword or left to their default value,
+          and there is no ``output_subset``.
+        - The inputs are not checked for aliasing. When the function has
+          borrowed or mutable inputs, the arguments must not share memory.
+
+        The outputs follow the same aliasing rules as `Function.__call__`:
+        they are fresh arrays, unless they were compiled with
+        ``borrow=True`` or are the (borrowed) inputs themselves. The
+        updates are performed as usual. When the function is profiled, this
+        is `Function.__call__` itself.
+        """
+        fast_call = getattr(self, "_fast_call", None)
+        if fast_call is None:
+            fast_call = self._fast_call = self._make_fast_call()
+        return fast_call
+
+    def _make_fast_call(self) -> Callable:
+        if self.profile:
+            return self.__call__
+
+        vm = self.vm
+        n_inputs = sum(not c.implicit for c in self.input_storage)
+        input_cells = [c.storage for c in self.input_storage[:n_inputs]]
+        output_cells = [c.storage for c in self.output_storage]
+        cleared_cells = [c.storage for c in self.input_storage if c.required]
+        if getattr(vm, "allow_gc", False):
+            cleared_cells += [
+                c.storage
+                for c, var in zip(self.output_storage, self.maker.fgraph.outputs)
+                if var.owner is not None
+            ]
+        defaults = [
+            (self.input_storage[i], value)
+            for i, (required, refeed, value) in enumerate(self.defaults)
+            if refeed
+        ]
+        if getattr(vm, "need_update_inputs", True):
+            updated = [
+                c
+                for inp, c in reversed(
+                    list(zip(self.maker.expanded_inputs, self.input_storage))
+                )
+                if inp.update is not None
+            ]
+        else:
+            updated = None
+        n_returned = self.n_returned_outputs
+        output_keys = self.output_keys
+        return_none = self.return_none
+        unpack_single = self.unpack_single and n_returned == 1
+
+        def restore_defaults():
+            for container, value in defaults:
+                if isinstance(value, Container):
+                    value = value.storage[0]
+                container.value = value
+
+        def fast_call(*args):
+            if len(args) != n_inputs:
+                raise TypeError(
+                    f"Expected {n_inputs} positional inputs, got {len(args)}"
+                )
+            for cell, arg in zip(input_cells, args):
+                cell[0] = arg
+
+            try:
+                outputs = vm()
+            except Exception:
+                restore_defaults()
+                self._reraise_vm_error()
+            if outputs is None:
+                outputs = [cell[0] for cell in output_cells]
+
+            for cell in cleared_cells:
+                cell[0] = None
+            if updated is None:
+                outputs = outputs[:n_returned]
+            else:
+                for container in updated:
+                    container.data = outputs.pop()
+            if defaults:
+                restore_defaults()
+
+            if return_none:
+                return None
+            elif unpack_single:
+                return outputs[0]
+            elif output_keys is not None:
+                return dict(zip(output_keys, outputs))
+            return outputs
+
+        return fast_call
+
+    def vmap(self, *args):
+        """Evaluate the function over a batch of inputs in a single call.
+
+        Each argument is either a value of the corresponding explicit input,
+        or a batch of such values stacked along a new leading axis. The
+        batched arguments are the ones with one more dimension than their
+        input, and they must all have the same batch size.
+
+        The first time a combination of batched inputs is used, the graph of
+        the function is vectorized with `vectorize_graph` and compiled with
+        the same mode. That function is cached, so the later calls only pay
+        for a single evaluation of the whole batch.
+
+        Returns
+        -------
+        The outputs of the function, each with a leading batch axis.
+        """
+        inputs = [inp for inp in self.maker.inputs if not inp.implicit]
+        if len(args) != len(inputs):
+            raise TypeError(
+                f"Expected {len(inputs)} positional inputs, got {len(args)}"
+            )
+        if any(inp.update is not None for inp in self.maker.inputs):
+            raise NotImplementedError("Functions with updates can't be batched")
+
+        batched = tuple(
+            getattr(inp.variable.type, "ndim", None) == np.ndim(arg) - 1
+            for inp, arg in zip(inputs, args)
+        )
+        if not any(batched):
+            raise ValueError(
+                "At least one argument must have a leading batch axis, i.e. one "
+                "more dimension than its input"
+            )
+
+        vmap_fns = getattr(self, "_vmap_fns", None)
+        if vmap_fns is None:
+            vmap_fns = self._vmap_fns = {}
+        fn = vmap_fns.get(batched)
+        if fn is None:
+            fn = vmap_fns[batched] = self._make_vmap_fn(inputs, batched)
+
+        outputs = fn(*args)
+        if self.return_none:
+            return None
+        elif self.unpack_single:
+            return outputs[0]
+        elif self.output_keys is not None:
+            return dict(zip(self.output_keys, outputs))
+        return outputs
+
+    def _make_vmap_fn(self, inputs, batched) -> "Function":
+        new_inputs = []
+        for inp, is_batched in zip(inputs, batched):
+            var = inp.variable
+            if is_batched:
+                var = var.type.clone(shape=(None, *var.type.shape))(name=var.name)
+            new_inputs.append(var)
+
+        outputs = [out.variable for out in self.maker.outputs]
+        new_outputs = vectorize_graph(
+            outputs,
+            replace={
+                inp.variable: new_inp
+                for inp, new_inp in zip(inputs, new_inputs)
+                if new_inp is not inp.variable
+            },
+        )
+        # The outputs that don't depend on the batched inputs are repeated
+        batch_size = next(
+            new_inp.shape[0] for new_inp, b in zip(new_inputs, batched) if b
+        )
+        new_outputs = [
+            new_out
+            if new_out.type.ndim > out.type.ndim
+            else pytensor.tensor.broadcast_to(new_out, (batch_size, *new_out.shape))
+            for out, new_out in zip(outputs, new_outputs)
+        ]
+
+        return pytensor.function(
+            new_inputs,
+            new_outputs,
+            mode=self.maker.mode,
+            on_unused_input="ignore",
+            name=None if self.name is None else f"{self.name}_vmap",
+        )
+
     value = property(
         lambda self: self._value,
         None,  # this property itself is not settable
@@ -1154,7 +1593,8 @@ def _constructor_Function(maker, input_storage, inputs_data, trust_input=False):
     if not config.unpickle_function:
         return None
 
-    f = maker.create(input_storage)
+    with _compile_lock:
+        f = maker.create(input_storage)
     assert len(f.input_storage) == len(inputs_data)
     for container, x in zip(f.input_storage, inputs_data):
         assert (
@@ -1169,6 +1609,95 @@ def _constructor_Function(maker, input_storage, inputs_data, trust_input=False):
 copyreg.pickle(Function, _pickle_Function)
 
 
+_lazy_compile_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_lazy_compile_executor() -> ThreadPoolExecutor:
+    global _lazy_compile_executor
+    if _lazy_compile_executor is None:
+        # The compilations are serialized by `_compile_lock` anyway
+        _lazy_compile_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="pytensor_compile"
+        )
+    return _lazy_compile_executor
+
+
+class LazyFunction:
+    """A proxy for a `Function` that is compiled only when it's needed.
+
+    The `Function` is compiled by `compile_fn` the first time it's called or
+    any of its attributes is accessed, or, when `background` is ``True``, in
+    a background thread as soon as the proxy is created. The callers that
+    need the `Function` before its compilation is done wait for it, and the
+    time they spent waiting is added to the ``compile_wait_time`` of the
+    `ProfileStats` of the function.
+
+    The whole compilation holds the lock that every other compilation of the
+    process holds, so a background compilation never runs concurrently with
+    another one. A background compilation uses a thread-local copy of the
+    PyTensor flags that were set when the proxy was created, so the flags it
+    changes aren't seen by the other threads and vice versa. A compilation on
+    first use uses the flags that are set when it happens. A pickled or
+    copied `LazyFunction` is a regular `Function`.
+    """
+
+    _attributes = ("_compile_fn", "_function", "_lock", "_future")
+
+    def __init__(self, compile_fn: Callable[[], Function], background: bool = False):
+        self._compile_fn = compile_fn
+        self._function: Optional[Function] = None
+        self._lock = threading.Lock()
+        self._future: Optional[Future] = None
+        if background:
+            self._future = _get_lazy_compile_executor().submit(
+                self._compile_in_background, config.current_flags()
+            )
+
+    def _compile(self) -> Function:
+        with _compile_lock:
+            return self._compile_fn()
+
+    def _compile_in_background(self, flags: dict) -> Function:
+        with config.thread_flags(flags):
+            return self._compile()
+
+    @property
+    def compiled(self) -> bool:
+        """Whether the `Function` has been compiled successfully."""
+        if self._future is not None:
+            return self._future.done() and self._future.exception() is None
+        return self._function is not None
+
+    @property
+    def function(self) -> Function:
+        """The compiled `Function`, waiting for its compilation if needed."""
+        if self._function is None:
+            t0 = time.perf_counter()
+            with self._lock:
+                if self._function is None:
+                    if self._future is not None:
+                        fn = self._future.result()
+                    else:
+                        fn = self._compile()
+                    if fn.profile:
+                        fn.profile.compile_wait_time += time.perf_counter() - t0
+                    self._function = fn
+        return self._function
+
+    def __call__(self, *args, **kwargs):
+        return self.function(*args, **kwargs)
+
+    def __getattr__(self, name):
+        # The attributes of the proxy itself may be missing while it's being
+        # copied or unpickled
+        if name.startswith("__") or name in LazyFunction._attributes:
+            raise AttributeError(name)
+        return getattr(self.function, name)
+
+    def __reduce__(self):
+        return _pickle_Function(self.function)
+
+
 def insert_deepcopy(fgraph, wrapped_inputs, wrapped_outputs):
     """Insert deepcopy in the fgraph to break aliasing of outputs.
 
@@ -1510,18 +2039,51 @@ class FunctionMaker:
 
         indices = [[input, None, [input]] for input in inputs]
 
+        # Only graphs built here from the inputs and outputs are cached, and
+        # not when test values need to be computed during the rewrites
+        use_graph_cache = (
+            config.compile__function_cache
+            and fgraph is None
+            and not no_fgraph_prep
+            and config.compute_test_value == "off"
+            and config.compute_test_value_opt == "off"
+        )
+
         fgraph, found_updates = std_fgraph(
             inputs, outputs, accept_inplace, fgraph=fgraph
         )
 
+        graph_cache = cache_key = cached_fgraph = None
+        if use_graph_cache:
+            graph_cache = get_function_graph_cache()
+            cache_key = graph_cache.key(fgraph, inputs, outputs, mode, accept_inplace)
+            if cache_key is not None:
+                cached_fgraph = graph_cache.get(cache_key, fgraph)
+
+        if cached_fgraph is not None:
+            # The cached graph was already rewritten; it only needs the
+            # features that `std_fgraph` attaches
+            fgraph, _ = std_fgraph(
+                inputs, outputs, accept_inplace=True, fgraph=cached_fgraph
+            )
+            no_fgraph_prep = True
+
         if fgraph.profile is None:
             fgraph.profile = profile
+        fgraph.profile_guide = getattr(mode, "profile_guide", None)
 
         self.fgraph = fgraph
 
         if not no_fgraph_prep:
+            key_graph = None
+            if cache_key is not None:
+                key_graph = _detached_graph(fgraph.inputs, fgraph.outputs)
+
             self.prepare_fgraph(inputs, outputs, found_updates, fgraph, mode, profile)
 
+            if key_graph is not None:
+                graph_cache.add(cache_key, key_graph, fgraph)
+
         assert len(fgraph.outputs) == len(outputs + found_updates)
 
         # The 'no_borrow' outputs are the ones for which that we can't
@@ -1747,19 +2309,20 @@ def orig_function(
     fn = None
     try:
         Maker = getattr(mode, "function_maker", FunctionMaker)
-        m = Maker(
-            inputs,
-            outputs,
-            mode,
-            accept_inplace=accept_inplace,
-            profile=profile,
-            on_unused_input=on_unused_input,
-            output_keys=output_keys,
-            name=name,
-            fgraph=fgraph,
-        )
-        with config.change_flags(compute_test_value="off"):
-            fn = m.create(defaults)
+        with _compile_lock:
+            m = Maker(
+                inputs,
+                outputs,
+                mode,
+                accept_inplace=accept_inplace,
+                profile=profile,
+                on_unused_input=on_unused_input,
+                output_keys=output_keys,
+                name=name,
+                fgraph=fgraph,
+            )
+            with config.change_flags(compute_test_value="off"):
+                fn = m.create(defaults)
     finally:
         if profile and fn:
             t2 = time.perf_counter()
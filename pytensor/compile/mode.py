@@ -4,10 +4,12 @@ WRITEME
 """
 
 import logging
+import os
 import warnings
 from typing import Literal, Optional, Union
 
 from pytensor.compile.function.types import Supervisor
+from pytensor.compile.profiling import ProfileGuide, ProfileStats
 from pytensor.configdefaults import config
 from pytensor.graph.destroyhandler import DestroyHandler
 from pytensor.graph.rewriting.basic import (
@@ -273,7 +275,7 @@ del _tags
 
 
 class Mode:
-    """A class that specifies the rewrites/optimizations used during function compilation.
+    r"""A class that specifies the rewrites/optimizations used during function compilation.
 
     Parameters
     ----------
@@ -286,6 +288,11 @@ class Mode:
     db
         The `RewriteDatabase` used by this `Mode`.  Note: This value
         is *not* part of a `Mode` instance's pickled state.
+    profile_guided
+        A `ProfileGuide`, a `ProfileStats`, or the path of a `ProfileGuide`
+        saved with `ProfileGuide.save`. Its measured costs steer the inplace,
+        fusion and `Gemm` rewrites (see `ProfileGuide`). Note: This value is
+        *not* part of a `Mode` instance's pickled state.
 
     See Also
     --------
@@ -300,6 +307,9 @@ class Mode:
         linker: Optional[Union[str, Linker]] = None,
         optimizer: Union[str, RewriteDatabaseQuery] = "default",
         db: RewriteDatabase = None,
+        profile_guided: Optional[
+            Union[str, os.PathLike, ProfileGuide, ProfileStats]
+        ] = None,
     ):
         if linker is None:
             linker = config.linker
@@ -314,6 +324,14 @@ class Mode:
         else:
             self.optdb = db
 
+        if isinstance(profile_guided, ProfileStats):
+            profile_guided = ProfileGuide.from_profiles(profile_guided)
+        elif profile_guided is not None and not isinstance(
+            profile_guided, ProfileGuide
+        ):
+            profile_guided = ProfileGuide.load(profile_guided)
+        self.profile_guide: Optional[ProfileGuide] = profile_guided
+
         # self.provided_optimizer - typically the `optimizer` arg.
         # But if the `optimizer` arg is keyword corresponding to a predefined
         # RewriteDatabaseQuery, then this stores the query
@@ -341,6 +359,7 @@ class Mode:
         if isinstance(optimizer, RewriteDatabaseQuery):
             self.provided_optimizer = optimizer
         self._optimizer = optimizer
+        self.profile_guide = None
         self.call_time = 0
         self.fn_time = 0
 
@@ -429,6 +448,7 @@ class Mode:
         if optimizer == "":
             optimizer = self.provided_optimizer
         new_mode = type(self)(linker=new_linker, optimizer=optimizer)
+        new_mode.profile_guide = self.profile_guide
         return new_mode
 
 
@@ -10,6 +10,7 @@ ProfileStats object for runtime and memory profiling.
 
 import atexit
 import copy
+import json
 import logging
 import operator
 import sys
@@ -98,7 +99,12 @@ def _atexit_print_fn():
                         "vm_call_time",
                         "rewriter_time",
                         "linker_time",
+                        "compile_wait_time",
                         "validate_time",
+                        "shape_feature_attach_time",
+                        "shape_canonicalize_time",
+                        "shape_cache_hits",
+                        "shape_cache_misses",
                         "import_time",
                         "linker_node_make_thunks",
                     ]:
@@ -266,9 +272,26 @@ class ProfileStats:
     # This is a subset of rewriting_time that is dominated by toposort()
     # when the destorymap feature is included.
 
+    shape_feature_attach_time: float = 0.0
+    # time spent inferring the shapes of the whole graph when a ShapeFeature
+    # is attached.  This is a subset of rewriting_time.
+
+    shape_canonicalize_time: float = 0.0
+    # time spent canonicalizing shape graphs in ShapeFeature.same_shape.
+    # This is a subset of rewriting_time.
+
+    shape_cache_hits: int = 0
+    # number of canonicalized shape graphs that were reused by ShapeFeature
+
+    shape_cache_misses: int = 0
+    # number of shape graphs that ShapeFeature had to canonicalize
+
     linker_time: float = 0.0
     # time spent linking graph (FunctionMaker.create)
 
+    compile_wait_time: float = 0.0
+    # time the callers of a `LazyFunction` spent waiting for its compilation
+
     preload_cache_time: float = 0.0
     # time spent preloading the cache, so it does not affect rewrites profiling
 
@@ -277,6 +300,16 @@ class ProfileStats:
 
     linker_node_make_thunks: float = 0.0
 
+    memory_plan_nb_vars: int = 0
+    # number of intermediate results allocated in the arena of a `PlannedLoop`
+
+    memory_plan_size: int = 0
+    # size in bytes of the arena of a `PlannedLoop`
+
+    memory_plan_unplanned_size: int = 0
+    # size in bytes the planned intermediate results would take without
+    # sharing the arena
+
     linker_make_thunk_time: dict = {}
 
     line_width = config.profiling__output_line_width
@@ -678,9 +711,9 @@ class ProfileStats:
         hs += ["<id>"]
         es += ["%3d"]
 
-        es += ["%s", "%s"]
+        es += ["%s", "%s", "%s"]
         if self.variable_shape:
-            hs += ["<Mflops>", "<Gflops/s>"]
+            hs += ["<Mflops>", "<Gflops/s>", "<GB/s>"]
 
         upto_length = sum(len(x) for x in hs) + len(hs)
         maxlen = max(self.line_width - upto_length, 0)
@@ -718,6 +751,8 @@ class ProfileStats:
             ftot = tot * 100 / local_time
             if nb_call == 0:
                 continue
+            node_cost = self.node_cost(a) if self.variable_shape else None
+            bandwidth = ""
             if not self.variable_shape:
                 flops = ""
                 flops_s = ""
@@ -728,9 +763,16 @@ class ProfileStats:
                 )
                 flops = f"{fl / 1024.0 / 1024:8.1f}"
                 flops_s = f"{fl / 1024.0 / 1024 / 1024 / t:10.1f}"
+            elif node_cost is not None and t > 0:
+                # The cost is per call, and `t` is the time of all the calls
+                flops = f"{node_cost.flops / 1024.0 / 1024:8.1f}"
+                flops_s = f"{node_cost.flops * nb_call / 1024.0**3 / t:10.1f}"
+                bandwidth = f"{node_cost.bytes * nb_call / 1024.0**3 / t:6.1f}"
             else:
                 flops = "        "
                 flops_s = "          "
+            if self.variable_shape and not bandwidth:
+                bandwidth = "      "
             print(
                 format_str
                 % (
@@ -742,6 +784,7 @@ class ProfileStats:
                     nd_id,
                     flops,
                     flops_s,
+                    bandwidth,
                     str(a)[:maxlen],
                 ),
                 file=file,
@@ -784,6 +827,26 @@ class ProfileStats:
         )
         print("", file=file)
 
+    def node_cost(self, node):
+        """Return the `OpCost` of `node` for the shapes it was last called with.
+
+        ``None`` is returned if the shapes weren't recorded, or if the `Op`
+        of `node` can't estimate its cost from them.
+
+        """
+        input_shapes = []
+        for var in node.inputs:
+            shape = self.variable_shape.get(var)
+            if shape is None:
+                return None
+            input_shapes.append(shape if isinstance(shape, tuple) else None)
+        node_cost = node.op.cost(node, input_shapes)
+        if node_cost is None or not all(
+            isinstance(v, (int, np.integer)) for v in node_cost
+        ):
+            return None
+        return node_cost
+
     def summary_function(self, file):
         print("Function profiling", file=file)
         print("==================", file=file)
@@ -803,10 +866,32 @@ class ProfileStats:
                     f"  Time in thunks: {local_time}s ({100 * local_time / self.fct_call_time:.3f}%)",
                     file=file,
                 )
+        if self.memory_plan_nb_vars:
+            print(
+                f"  Memory plan: {self.memory_plan_nb_vars} intermediate results"
+                f" in a {self.memory_plan_size}B arena"
+                f" ({self.memory_plan_unplanned_size}B without reuse)",
+                file=file,
+            )
         print(f"  Total compilation time: {self.compile_time:e}s", file=file)
+        if self.compile_wait_time > 0:
+            print(
+                f"    Time waiting for lazy compilation: {self.compile_wait_time:e}s",
+                file=file,
+            )
         print(f"    Number of Apply nodes: {int(self.nb_nodes)}", file=file)
         print(f"    PyTensor rewrite time: {self.rewriting_time:e}s", file=file)
         print(f"       PyTensor validate time: {self.validate_time:e}s", file=file)
+        print(
+            f"       ShapeFeature attach time: {self.shape_feature_attach_time:e}s",
+            file=file,
+        )
+        print(
+            f"       Shape canonicalization time: {self.shape_canonicalize_time:e}s"
+            f" ({self.shape_cache_misses} shapes canonicalized,"
+            f" {self.shape_cache_hits} reused)",
+            file=file,
+        )
         print(
             (
                 "    PyTensor Linker time (includes C, CUDA code "
@@ -1662,3 +1747,100 @@ class ProfileStats:
         ]
         for f in _profiler_printers:
             f(*params, file=file)
+
+
+class ProfileGuide:
+    r"""The measured costs of `Op`\s, used to steer the rewrites of later compilations.
+
+    A guide is built from the `ProfileStats` of profiled functions, and saved
+    to disk with `ProfileGuide.save`. When a function is compiled with
+    ``Mode(profile_guided=path)``, the guide is available to the rewrites as
+    the ``profile_guide`` attribute of the `FunctionGraph` they rewrite.
+
+    The costs are recorded for each `Op`, identified by its string
+    representation, and for each type of `Op`, so that `Op`\s that weren't
+    profiled can still be compared by their type.
+
+    The guide is used by:
+
+    - the inplace rewrite of `Elemwise`\s, which gives the `Op`\s measured to
+      be the most expensive the first chance to work inplace;
+    - `FusionOptimizer`, which doesn't fuse `Elemwise`\s into a `Composite`
+      that was measured to be slower than the `Elemwise`\s it replaces;
+    - `GemmOptimizer`, which keeps a dot product and the `Elemwise`\s around
+      it when `Gemm` was measured to be slower than them.
+    """
+
+    def __init__(
+        self,
+        op_stats: Optional[dict[str, tuple[float, int]]] = None,
+        op_type_stats: Optional[dict[str, tuple[float, int]]] = None,
+    ):
+        self.op_stats = {} if op_stats is None else dict(op_stats)
+        self.op_type_stats = {} if op_type_stats is None else dict(op_type_stats)
+
+    @classmethod
+    def from_profiles(cls, *profiles: ProfileStats) -> "ProfileGuide":
+        guide = cls()
+        for profile in profiles:
+            guide.update(profile)
+        return guide
+
+    @staticmethod
+    def op_type_key(op) -> str:
+        return f"{type(op).__module__}.{type(op).__qualname__}"
+
+    def update(self, profile: ProfileStats):
+        """Add the time spent in each `Op` of `profile` to the guide."""
+        for (fgraph, node), t in profile.apply_time.items():
+            n_calls = profile.apply_callcount.get((fgraph, node), 0)
+            for stats, key in (
+                (self.op_stats, str(node.op)),
+                (self.op_type_stats, self.op_type_key(node.op)),
+            ):
+                total_time, total_calls = stats.get(key, (0.0, 0))
+                stats[key] = (total_time + t, total_calls + n_calls)
+
+    def op_time(self, op, by_type: bool = True) -> Optional[float]:
+        r"""Return the mean time of a call to `op`, or ``None`` if it's unknown.
+
+        When `by_type` is ``True``, the time of the `Op`\s of the same type is
+        used when `op` itself wasn't profiled.
+        """
+        lookups = [(self.op_stats, str(op))]
+        if by_type:
+            lookups.append((self.op_type_stats, self.op_type_key(op)))
+        for stats, key in lookups:
+            total_time, n_calls = stats.get(key, (0.0, 0))
+            if n_calls:
+                return total_time / n_calls
+        return None
+
+    def is_slower(self, new_ops, old_ops, by_type: bool = True) -> bool:
+        r"""Return whether `new_ops` were measured to be slower than `old_ops`.
+
+        Rewrites use this to avoid replacing `old_ops` by `new_ops`. It is
+        ``False`` unless the time of every `Op` is known, so the guide only
+        prevents a rewrite when both alternatives were profiled, e.g. by
+        merging the profiles of runs compiled with and without that rewrite.
+        """
+        new_times = [self.op_time(op, by_type=by_type) for op in new_ops]
+        old_times = [self.op_time(op, by_type=by_type) for op in old_ops]
+        if None in new_times or None in old_times:
+            return False
+        return sum(new_times) > sum(old_times)
+
+    def save(self, path):
+        with open(path, "w") as f:
+            json.dump(
+                {"op_stats": self.op_stats, "op_type_stats": self.op_type_stats}, f
+            )
+
+    @classmethod
+    def load(cls, path) -> "ProfileGuide":
+        with open(path) as f:
+            data = json.load(f)
+        return cls(
+            {k: tuple(v) for k, v in data["op_stats"].items()},
+            {k: tuple(v) for k, v in data["op_type_stats"].items()},
+        )
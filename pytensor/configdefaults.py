@@ -589,6 +589,15 @@ def add_compile_configvars():
         in_c_key=False,
     )
 
+    config.add(
+        "cmodule__compile_jobs",
+        "The number of C modules that are compiled at the same time when a "
+        "function is linked by the VM linkers. With the default of 1, the "
+        "modules are compiled one after the other.",
+        IntParam(1, _is_gt_0),
+        in_c_key=False,
+    )
+
     config.add(
         "cmodule__debug",
         "If True, define a DEBUG macro (if not exists) for any compiled C code.",
@@ -614,6 +623,32 @@ def add_compile_configvars():
         in_c_key=False,
     )
 
+    config.add(
+        "compile__function_cache",
+        "If True, rewritten function graphs are stored on disk (under "
+        "compiledir) and reused by later `pytensor.function` calls that "
+        "compile an identical graph with the same mode, skipping the rewrites.",
+        BoolParam(False),
+        in_c_key=False,
+    )
+
+    config.add(
+        "compile__function_cache_size",
+        "In megabytes. Maximum size of the on-disk function graph cache; "
+        "the least recently used entries are removed above this size.",
+        IntParam(1024, validate=_is_gt_0),
+        in_c_key=False,
+    )
+
+    config.add(
+        "compile__function_cache_age_thresh",
+        "In seconds. The time after which an unused entry of the function "
+        "graph cache is removed.",
+        # 24 days
+        IntParam(60 * 60 * 24 * 24, validate=_is_gt_0),
+        in_c_key=False,
+    )
+
     config.add(
         "ctc__root",
         "Directory which contains the root of Baidu CTC library. It is assumed \
@@ -1162,6 +1197,26 @@ def add_vm_configvars():
         in_c_key=False,
     )
 
+    config.add(
+        "vm__parallel",
+        "Useful only for the VM Linkers. The number of threads used to "
+        "evaluate independent Apply nodes concurrently. With 1, the nodes "
+        "are evaluated one at a time.",
+        IntParam(1, validate=_is_gt_0),
+        in_c_key=False,
+    )
+
+    config.add(
+        "vm__memory_plan",
+        "Useful only for the VM Linkers. If True, graphs that don't need lazy "
+        "evaluation preallocate their intermediate results in a single buffer "
+        "after the first call, reusing memory between results that are not "
+        "alive at the same time. Those graphs are then evaluated by a "
+        "Python loop instead of the C VM.",
+        BoolParam(False),
+        in_c_key=False,
+    )
+
 
 def add_deprecated_configvars():
     # TODO: remove this? Agree
@@ -1207,6 +1262,16 @@ def add_numba_configvars():
         EnumStr("cpu", ["parallel", "cuda"], mutable=True),
         in_c_key=False,
     )
+    config.add(
+        "numba__parallel_minsize",
+        (
+            "If numba__vectorize_target is 'parallel', this is the minimum "
+            "size of the inputs for which element wise ops and reductions "
+            "are split across Numba's threads."
+        ),
+        IntParam(200000),
+        in_c_key=False,
+    )
     config.add(
         "numba__fastmath",
         ("If True, use Numba's fastmath mode."),
@@ -1215,7 +1280,10 @@ def add_numba_configvars():
     )
     config.add(
         "numba__cache",
-        ("If True, use Numba's file based caching."),
+        (
+            "If True, use Numba's file based caching. The functions compiled "
+            "from whole graphs are cached in compiledir."
+        ),
         BoolParam(True),
         in_c_key=False,
     )
@@ -2,6 +2,7 @@ import logging
 import os
 import shlex
 import sys
+import threading
 import warnings
 from collections.abc import Sequence
 from configparser import (
@@ -11,6 +12,7 @@ from configparser import (
     NoSectionError,
     RawConfigParser,
 )
+from contextlib import contextmanager
 from functools import wraps
 from io import StringIO
 from typing import Callable, Optional, Union
@@ -20,6 +22,10 @@ from pytensor.utils import hash_from_code
 
 _logger = logging.getLogger("pytensor.configparser")
 
+# The config values of the threads that have their own copy of them (see
+# `PyTensorConfigParser.thread_flags`)
+_thread_flags = threading.local()
+
 
 class PyTensorConfigWarning(Warning):
     @classmethod
@@ -214,6 +220,31 @@ class PyTensorConfigParser:
         """
         return _ChangeFlagsDecorator(*args, _root=self, **kwargs)
 
+    def current_flags(self) -> dict:
+        """Return the values of the config variables that have been read or set so far."""
+        return {
+            name: param.__get__(self, self.__class__)
+            for name, param in self._config_var_dict.items()
+            if hasattr(param, "val")
+        }
+
+    @contextmanager
+    def thread_flags(self, flags: dict):
+        """
+        Give the current thread its own copy of the config variables.
+
+        Within this context, the current thread reads the values of `flags`
+        (e.g. returned by `current_flags` in another thread) instead of the
+        ones shared by the process, and the changes it makes, including the
+        ones of `change_flags`, are only seen by itself.
+        """
+        old_flags = getattr(_thread_flags, "values", None)
+        _thread_flags.values = dict(flags)
+        try:
+            yield
+        finally:
+            _thread_flags.values = old_flags
+
     def warn_unused_flags(self):
         for key in self._flags_dict.keys():
             warnings.warn(f"PyTensor does not recognise this flag: {key}")
@@ -313,6 +344,9 @@ class ConfigParam:
                 f"The config parameter '{self.name}' was registered on a different instance of the PyTensorConfigParser."
                 f" It is not accessible through the instance with id '{id(cls)}' because of safeguarding."
             )
+        thread_values = getattr(_thread_flags, "values", None)
+        if thread_values is not None and self.name in thread_values:
+            return thread_values[self.name]
         if not hasattr(self, "val"):
             try:
                 val_str = cls.fetch_val_for_key(self.name, delete_key=delete_key)
@@ -322,7 +356,7 @@ class ConfigParam:
                     val_str = self.default()
                 else:
                     val_str = self.default
-            self.__set__(cls, val_str)
+            self.val = self._filter(val_str)
         return self.val
 
     def __set__(self, cls, val):
@@ -330,9 +364,17 @@ class ConfigParam:
             raise Exception(
                 f"Can't change the value of {self.name} config parameter after initialization!"
             )
+        applied = self._filter(val)
+        thread_values = getattr(_thread_flags, "values", None)
+        if thread_values is not None:
+            thread_values[self.name] = applied
+        else:
+            self.val = applied
+
+    def _filter(self, val):
         applied = self.apply(val)
         self.validate(applied)
-        self.val = applied
+        return applied
 
 
 class EnumStr(ConfigParam):
@@ -12,7 +12,7 @@ import pytensor
 from pytensor.compile.ops import ViewOp
 from pytensor.configdefaults import config
 from pytensor.graph import utils
-from pytensor.graph.basic import Apply, NominalVariable, Variable
+from pytensor.graph.basic import Apply, Constant, NominalVariable, Variable
 from pytensor.graph.null_type import NullType, null_type
 from pytensor.graph.op import get_test_values
 from pytensor.graph.type import Type
@@ -151,6 +151,7 @@ def Rop(
     eval_points: Union[Variable, Sequence[Variable]],
     disconnected_outputs: Literal["ignore", "warn", "raise"] = "raise",
     return_disconnected: Literal["none", "zero", "disconnected"] = "zero",
+    use_lop_fallback: bool = False,
 ) -> Union[Optional[Variable], Sequence[Optional[Variable]]]:
     """Computes the R-operator applied to `f` with respect to `wrt` at `eval_points`.
 
@@ -182,6 +183,12 @@ def Rop(
           ``None``
         - ``'disconnected'`` : returns variables of type `DisconnectedType`
 
+    use_lop_fallback
+        If ``True``, the R-operator of the nodes whose `Op` doesn't implement
+        `Op.R_op` is obtained by transposing their L-operator (see
+        `lop_R_op`), including in the inner graph of a `Scan`. Otherwise,
+        `NotImplementedError` is raised for them. `jvp` and `hvp` use it.
+
     Returns
     -------
     :class:`~pytensor.graph.basic.Variable` or list/tuple of Variables
@@ -225,6 +232,8 @@ def Rop(
             # Tensor, Sparse have the ndim attribute
             pass
 
+    from pytensor.scan.op import Scan
+
     seen_nodes: dict[Apply, Sequence[Variable]] = {}
 
     def _traverse(node):
@@ -290,7 +299,17 @@ def Rop(
             else:
                 same_type_eval_points.append(y)
 
-        seen_nodes[node] = op.R_op(node.inputs, same_type_eval_points)
+        try:
+            if use_lop_fallback and isinstance(op, Scan):
+                seen_nodes[node] = op.R_op(
+                    node.inputs, same_type_eval_points, use_lop_fallback=True
+                )
+            else:
+                seen_nodes[node] = op.R_op(node.inputs, same_type_eval_points)
+        except NotImplementedError:
+            if not use_lop_fallback:
+                raise
+            seen_nodes[node] = lop_R_op(node, same_type_eval_points)
 
     # end _traverse
 
@@ -345,6 +364,193 @@ def Rop(
     return as_list_or_tuple(using_list, using_tuple, rval)
 
 
+def lop_R_op(
+    node: Apply, eval_points: Sequence[Optional[Variable]]
+) -> list[Optional[Variable]]:
+    r"""Compute the R-operator of a node by transposing its L-operator.
+
+    The L-operator of `node`, applied to symbolic cotangents ``u``, is linear
+    in ``u``, so the R-operator at `eval_points` ``v`` is the gradient of
+    ``sum_i <L_op(u)[i], v[i]>`` with respect to ``u``.  Unlike the "double
+    L-operator" trick applied to a whole graph, this only involves the
+    gradient graph of a single node.
+
+    Parameters
+    ----------
+    node
+        The node whose R-operator is computed.
+    eval_points
+        The evaluation points of the inputs of `node`, or ``None`` for the
+        inputs that are not differentiated.
+
+    Returns
+    -------
+    The R-operator for each output of `node`, or ``None`` for the outputs
+    that don't depend differentiably on the evaluation points.
+    """
+    from pytensor.graph.replace import clone_replace
+    from pytensor.tensor.type import discrete_dtypes
+
+    # Differentiate a copy of `node` with fresh inputs, so that the gradients
+    # don't flow through the paths between the inputs of `node`
+    dummy_inputs = [
+        inp if isinstance(inp, Constant) else inp.type() for inp in node.inputs
+    ]
+    dummy_node = node.clone_with_new_inputs(dummy_inputs)
+
+    outputs = [
+        out
+        if getattr(out.type, "dtype", None) not in discrete_dtypes
+        and not isinstance(out.type, (NullType, DisconnectedType))
+        else None
+        for out in dummy_node.outputs
+    ]
+    cotangents = {out: out.type() for out in outputs if out is not None}
+    if not cotangents:
+        return [None] * len(outputs)
+
+    input_grads = grad(
+        cost=None,
+        known_grads=cotangents,
+        wrt=dummy_node.inputs,
+        disconnected_inputs="ignore",
+        return_disconnected="disconnected",
+        null_gradients="return",
+    )
+
+    terms = []
+    for inp, inp_grad, eval_point in zip(node.inputs, input_grads, eval_points):
+        if eval_point is None or isinstance(inp_grad.type, DisconnectedType):
+            continue
+        if getattr(inp.type, "dtype", None) in discrete_dtypes:
+            continue
+        if isinstance(inp_grad.type, NullType):
+            # The `Op` is not differentiable with respect to this input
+            return [None] * len(outputs)
+        terms.append((inp_grad * eval_point).sum())
+    if not terms:
+        return [None] * len(outputs)
+
+    output_rops = grad(
+        cost=reduce(lambda a, b: a + b, terms),
+        wrt=list(cotangents.values()),
+        disconnected_inputs="ignore",
+        return_disconnected="disconnected",
+        null_gradients="return",
+    )
+    # The result doesn't depend on the value of the cotangents, but their
+    # shapes may still be referenced
+    replace = {
+        cot: node.outputs[dummy_node.outputs.index(out)].zeros_like()
+        for out, cot in cotangents.items()
+    }
+    replace.update(
+        (dummy_inp, inp)
+        for inp, dummy_inp in zip(node.inputs, dummy_inputs)
+        if dummy_inp is not inp
+    )
+    output_rops = clone_replace(output_rops, replace=replace)
+    output_rops = iter(output_rops)
+
+    rval: list[Optional[Variable]] = []
+    for out in outputs:
+        if out is None:
+            rval.append(None)
+            continue
+        output_rop = next(output_rops)
+        if isinstance(output_rop.type, (NullType, DisconnectedType)):
+            rval.append(None)
+        else:
+            rval.append(out.type.filter_variable(output_rop, allow_convert=True))
+    return rval
+
+
+def jvp(
+    f: Union[Variable, Sequence[Variable]],
+    wrt: Union[Variable, Sequence[Variable]],
+    tangents: Union[Variable, Sequence[Variable]],
+    disconnected_outputs: Literal["ignore", "warn", "raise"] = "raise",
+) -> Union[Variable, Sequence[Variable]]:
+    """Compute the Jacobian-vector product of `f` with respect to `wrt`.
+
+    This is forward-mode differentiation: the `tangents` are propagated from
+    `wrt` to `f` with the `Op.R_op` of each node, or with `lop_R_op` when the
+    `Op` doesn't implement it.
+
+    Parameters
+    ----------
+    f
+        The outputs to differentiate.
+    wrt
+        The variables with respect to which `f` is differentiated.
+    tangents
+        The tangents of `wrt`, with the same types.
+    disconnected_outputs
+        See `Rop`.
+
+    Returns
+    -------
+    The products ``sum_j (d f[i] / d wrt[j]) tangents[j]``, with the same
+    structure as `f`.
+    """
+    return Rop(
+        f,
+        wrt,
+        tangents,
+        disconnected_outputs=disconnected_outputs,
+        return_disconnected="zero",
+        use_lop_fallback=True,
+    )
+
+
+def hvp(
+    cost: Variable,
+    wrt: Union[Variable, Sequence[Variable]],
+    p: Union[Variable, Sequence[Variable]],
+    consider_constant: Optional[Sequence[Variable]] = None,
+    disconnected_inputs: Literal["ignore", "warn", "raise"] = "raise",
+) -> Union[Variable, Sequence[Variable]]:
+    """Compute the Hessian-vector product of `cost` with respect to `wrt`.
+
+    The gradient of `cost` is differentiated once more in forward mode (see
+    `jvp`), which avoids building the graph of the full Hessian or a second
+    backward pass.
+
+    Parameters
+    ----------
+    cost
+        A scalar.
+    wrt
+        The variables with respect to which `cost` is differentiated.
+    p
+        The vectors multiplied by the Hessian, with the same types as `wrt`.
+    consider_constant
+        See `grad`.
+    disconnected_inputs
+        See `grad`.
+
+    Returns
+    -------
+    The products of the Hessian blocks of `cost` with `p`, with the same
+    structure as `wrt`.
+    """
+    using_list = isinstance(wrt, list)
+    using_tuple = isinstance(wrt, tuple)
+    _wrt = list(wrt) if isinstance(wrt, (list, tuple)) else [wrt]
+    _p = list(p) if isinstance(p, (list, tuple)) else [p]
+
+    grads = grad(
+        cost,
+        _wrt,
+        consider_constant=consider_constant,
+        disconnected_inputs=disconnected_inputs,
+    )
+    hvps = jvp(grads, _wrt, _p, disconnected_outputs="ignore")
+    if not (using_list or using_tuple):
+        return hvps[0]
+    return as_list_or_tuple(using_list, using_tuple, hvps)
+
+
 def Lop(
     f: Union[Variable, Sequence[Variable]],
     wrt: Union[Variable, Sequence[Variable]],
@@ -1890,7 +2096,13 @@ GradientError: numeric gradient and analytic gradient exceed tolerance:
 Exception args: {args_msg}"""
 
 
-def jacobian(expression, wrt, consider_constant=None, disconnected_inputs="raise"):
+def jacobian(
+    expression,
+    wrt,
+    consider_constant=None,
+    disconnected_inputs="raise",
+    vectorize=False,
+):
     """
     Compute the full Jacobian, row by row.
 
@@ -1912,6 +2124,13 @@ def jacobian(expression, wrt, consider_constant=None, disconnected_inputs="raise
         - 'warn': consider the gradient zero, and print a warning.
         - 'raise': raise an exception.
 
+    vectorize: bool
+        If ``True``, compute all the rows in a single backward pass, by
+        vectorizing the gradient graph over the rows of an identity matrix
+        with `vectorize_graph`. Otherwise, the rows are computed one at a
+        time by a `Scan`. The vectorized graph is usually much faster, but
+        holds all the intermediate gradients of the rows in memory at once.
+
     Returns
     -------
     :class:`~pytensor.graph.basic.Variable` or list/tuple of Variables (depending upon `wrt`)
@@ -1951,6 +2170,32 @@ def jacobian(expression, wrt, consider_constant=None, disconnected_inputs="raise
             ),
         )
 
+    if vectorize:
+        from pytensor.graph.replace import vectorize_graph
+        from pytensor.tensor.basic import alloc, eye
+
+        row_tangent = _float_ones_like(expression).type("row_tangent")
+        jacobian_single_rows = Lop(
+            expression,
+            wrt,
+            row_tangent,
+            consider_constant=consider_constant,
+            disconnected_inputs=disconnected_inputs,
+        )
+
+        n_rows = expression.shape[0]
+        jacobs = vectorize_graph(
+            jacobian_single_rows,
+            replace={row_tangent: eye(n_rows, dtype=row_tangent.dtype)},
+        )
+        # The gradients that don't depend on the row (e.g. those of
+        # disconnected inputs) are left unbatched by `vectorize_graph`
+        jacobs = [
+            jac if jac.ndim > inp.ndim else alloc(jac, n_rows, *jac.shape)
+            for jac, inp in zip(jacobs, wrt)
+        ]
+        return as_list_or_tuple(using_list, using_tuple, jacobs)
+
     def inner_function(*args):
         idx = args[0]
         expr = args[1]
@@ -1978,7 +2223,9 @@ def jacobian(expression, wrt, consider_constant=None, disconnected_inputs="raise
     return as_list_or_tuple(using_list, using_tuple, jacobs)
 
 
-def hessian(cost, wrt, consider_constant=None, disconnected_inputs="raise"):
+def hessian(
+    cost, wrt, consider_constant=None, disconnected_inputs="raise", vectorize=False
+):
     """
     Parameters
     ----------
@@ -1996,6 +2243,10 @@ def hessian(cost, wrt, consider_constant=None, disconnected_inputs="raise"):
         - 'warn': consider the gradient zero, and print a warning.
         - 'raise': raise an exception.
 
+    vectorize: bool
+        If ``True``, compute each Hessian with a single vectorized backward
+        pass instead of a `Scan`. See `jacobian`.
+
     Returns
     -------
     :class:`~pytensor.graph.basic.Variable` or list/tuple of Variables
@@ -2040,6 +2291,17 @@ def hessian(cost, wrt, consider_constant=None, disconnected_inputs="raise"):
         # It is possible that the inputs are disconnected from expr,
         # even if they are connected to cost.
         # This should not be an error.
+        if vectorize:
+            hess = jacobian(
+                expr,
+                input,
+                consider_constant=consider_constant,
+                disconnected_inputs="ignore",
+                vectorize=True,
+            )
+            hessians.append(hess)
+            continue
+
         hess, updates = pytensor.scan(
             lambda i, y, x: grad(
                 y[i],
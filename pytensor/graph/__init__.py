@@ -13,6 +13,7 @@ from pytensor.graph.replace import clone_replace, graph_replace, vectorize_graph
 from pytensor.graph.op import Op
 from pytensor.graph.type import Type
 from pytensor.graph.fg import FunctionGraph
+from pytensor.graph.costs import OpCost, cost
 from pytensor.graph.rewriting.basic import node_rewriter, graph_rewriter
 from pytensor.graph.rewriting.utils import rewrite_graph
 from pytensor.graph.rewriting.db import RewriteDatabaseQuery
@@ -0,0 +1,143 @@
+"""Estimate the floating point operations and memory traffic of graphs.
+
+The estimates are provided by the optional :meth:`Op.cost` protocol, and
+aggregated over a whole :class:`FunctionGraph` by :func:`cost`.
+
+"""
+
+from collections.abc import Iterable, Sequence
+from functools import reduce
+from operator import mul
+from typing import TYPE_CHECKING, Any, NamedTuple, Optional, Union
+
+import numpy as np
+
+from pytensor.graph.basic import Apply, Variable
+
+
+if TYPE_CHECKING:
+    from pytensor.graph.fg import FunctionGraph
+
+
+class OpCost(NamedTuple):
+    """The cost of evaluating a node.
+
+    The fields are either integers or symbolic integer scalars, depending on
+    the shapes the cost was estimated from.
+
+    """
+
+    flops: Any
+    """The number of floating point operations."""
+    bytes: Any
+    """The number of bytes read from the inputs and written to the outputs."""
+
+
+def size(shape: Iterable[Any]) -> Any:
+    """Return the number of elements of an array with the given `shape`."""
+    return reduce(mul, shape, 1)
+
+
+def nbytes(var: Variable, shape: Optional[Sequence[Any]]) -> Any:
+    """Return the number of bytes of `var` if it had the given `shape`.
+
+    Variables without a shape or a dtype (e.g. slices or random generators)
+    are considered to be free.
+
+    """
+    dtype = getattr(var.type, "dtype", None)
+    if shape is None or dtype is None:
+        return 0
+    return size(shape) * np.dtype(dtype).itemsize
+
+
+def io_bytes(
+    node: Apply,
+    input_shapes: Sequence[Optional[Sequence[Any]]],
+    output_shapes: Sequence[Optional[Sequence[Any]]],
+) -> Any:
+    """Return the number of bytes read from the inputs and written to the outputs of `node`."""
+    return sum(
+        (nbytes(var, shape) for var, shape in zip(node.inputs, input_shapes)), 0
+    ) + sum((nbytes(var, shape) for var, shape in zip(node.outputs, output_shapes)), 0)
+
+
+def cost(
+    fgraph: "FunctionGraph",
+    per_node: bool = False,
+    input_shapes: Optional[Sequence[Optional[Sequence[Any]]]] = None,
+) -> Union[OpCost, dict[Apply, Optional[OpCost]]]:
+    """Estimate the floating point operations and memory traffic of `fgraph`.
+
+    The shapes of the variables are taken from the :class:`ShapeFeature` of
+    `fgraph`; one is temporarily attached if `fgraph` doesn't already have
+    one. The costs are therefore symbolic in the shapes of the inputs of
+    `fgraph`, unless they are all known statically.
+
+    Parameters
+    ----------
+    fgraph
+        The graph whose cost is estimated.
+    per_node
+        If ``True``, return the cost of each node instead of their total.
+        Nodes whose `Op` doesn't implement :meth:`Op.cost` are mapped to
+        ``None``.
+    input_shapes
+        The shapes to assume for the inputs of `fgraph`, instead of their
+        symbolic shapes. `fgraph` is left untouched in that case.
+
+    Returns
+    -------
+    The total :class:`OpCost` of the nodes that implement :meth:`Op.cost`,
+    or a dictionary with the cost of each node.
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import pytensor.tensor as pt
+        from pytensor.graph import FunctionGraph, cost
+
+        x = pt.matrix("x", shape=(100, 20))
+        y = pt.matrix("y", shape=(20, 30))
+        fgraph = FunctionGraph([x, y], [pt.exp(x @ y)])
+        flops, nbytes = cost(fgraph)
+        flops.eval()  # 2 * 100 * 20 * 30 + 100 * 30
+
+    """
+    from pytensor.graph.fg import FunctionGraph
+    from pytensor.tensor.rewriting.shape import ShapeFeature
+
+    nodes = fgraph.toposort()
+    shape_feature = getattr(fgraph, "shape_feature", None)
+    attached = input_shapes is None and shape_feature is None
+
+    if input_shapes is not None:
+        # Like `pytensor.compile.builders.infer_shape`, we use a detached
+        # `ShapeFeature` seeded with the given shapes
+        shape_feature = ShapeFeature()
+        shape_feature.on_attach(FunctionGraph([], []))
+        for inp, shape in zip(fgraph.inputs, input_shapes):
+            shape_feature.set_shape(inp, shape)
+        for node in nodes:
+            shape_feature.on_import(None, node, reason="cost")
+    elif attached:
+        shape_feature = ShapeFeature()
+        fgraph.attach_feature(shape_feature)
+
+    try:
+        shape_of = shape_feature.shape_of
+        node_costs = {
+            node: node.op.cost(node, [shape_of.get(inp) for inp in node.inputs])
+            for node in nodes
+        }
+    finally:
+        if attached:
+            fgraph.remove_feature(shape_feature)
+
+    if per_node:
+        return node_costs
+
+    known = [c for c in node_costs.values() if c is not None]
+    return OpCost(sum((c.flops for c in known), 0), sum((c.bytes for c in known), 0))
@@ -405,6 +405,10 @@ class History(Feature):
         return type(self)()
 
     def unpickle(self, fgraph):
+        # `ReplaceValidate` doesn't pickle its history
+        if not hasattr(self, "history"):
+            self.history = {}
+        self.history.setdefault(fgraph, [])
         fgraph.checkpoint = GetCheckpoint(self, fgraph)
         fgraph.revert = partial(self.revert, fgraph)
 
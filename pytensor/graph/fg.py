@@ -145,6 +145,8 @@ class FunctionGraph(MetaObject):
             self.add_output(output, reason="init")
 
         self.profile = None
+        # The `ProfileGuide` of the `Mode` the graph is compiled with
+        self.profile_guide = None
         self.update_mapping = update_mapping
 
     def add_output(
@@ -912,6 +914,7 @@ class FunctionGraph(MetaObject):
 
     def __setstate__(self, dct):
         self.__dict__.update(dct)
+        self.execute_callbacks_times = dict.fromkeys(self._features, 0.0)
         for feature in self._features:
             if hasattr(feature, "unpickle"):
                 feature.unpickle(self)
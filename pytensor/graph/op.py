@@ -27,6 +27,7 @@ from pytensor.graph.utils import (
 
 if TYPE_CHECKING:
     from pytensor.compile.function.types import Function
+    from pytensor.graph.costs import OpCost
     from pytensor.graph.fg import FunctionGraph
     from pytensor.graph.type import Type
 
@@ -472,6 +473,32 @@ class Op(MetaObject):
         """
         return True
 
+    def cost(
+        self, node: Apply, input_shapes: Sequence[Optional[Sequence[Any]]]
+    ) -> Optional["OpCost"]:
+        """Estimate the floating point operations and memory traffic of `node`.
+
+        This is an optional protocol used by :func:`pytensor.graph.cost` and
+        by the profiler. The shapes can either be symbolic scalars (e.g. those
+        of a :class:`ShapeFeature`) or plain integers, so implementations
+        should only use arithmetic that works on both.
+
+        Parameters
+        ----------
+        node
+            The node whose cost is estimated.
+        input_shapes
+            The shape of each of the inputs of `node`, or ``None`` for inputs
+            that don't have one.
+
+        Returns
+        -------
+        An :class:`OpCost` with the number of floating point operations and
+        bytes read and written, or ``None`` if the `Op` can't estimate it.
+
+        """
+        return None
+
     def prepare_node(
         self,
         node: Apply,
@@ -5,6 +5,7 @@ Defines Linkers that deal with C implementations.
 import logging
 import sys
 from collections import defaultdict
+from contextlib import nullcontext
 from copy import copy
 from io import StringIO
 from typing import TYPE_CHECKING, Any, Optional
@@ -1532,11 +1533,15 @@ class CLinker(Linker):
         mod = self.get_dynamic_module()
         return mod.code()
 
-    def compile_cmodule(self, location=None):
+    def compile_cmodule(self, location=None, lock=True):
         """
         This compiles the source code for this linker and returns a
         loaded module.
 
+        The compilation lock is only held if `lock` is ``True``.  Not holding
+        it is only safe if `location` can't be removed by other processes
+        while the module is compiled (see `ModuleCache.compile_modules`).
+
         """
         if location is None:
             location = dlimport_workdir(config.compiledir)
@@ -1546,7 +1551,7 @@ class CLinker(Linker):
         preargs = self.compile_args()
         # We want to compute the code without the lock
         src_code = mod.code()
-        with lock_ctx():
+        with lock_ctx() if lock else nullcontext():
             try:
                 _logger.debug(f"LOCATION {location}")
                 module = c_compiler.compile_str(
@@ -3,6 +3,7 @@ Generate and compile C modules for Python.
 
 """
 import atexit
+import base64
 import importlib
 import logging
 import os
@@ -19,6 +20,8 @@ import tempfile
 import textwrap
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
 from io import BytesIO, StringIO
 from typing import TYPE_CHECKING, Callable, Optional, Protocol, cast
 
@@ -606,6 +609,182 @@ class KeyData:
                     pass
 
 
+class ModuleIndex:
+    """
+    Append-only index of the modules stored in a cache directory.
+
+    Each line of the index maps the name of a cache subdirectory to the file
+    name of the dynamic library it contains and to a copy of its `KeyData`
+    (i.e. its module hash and keys).  Lines are only appended (while holding
+    the compilation lock), so a reader can resume from the offset at which it
+    previously stopped instead of walking every subdirectory of the cache and
+    unpickling each of their ``key.pkl`` files again.  When a subdirectory
+    appears more than once, its last line is the valid one.
+
+    Parameters
+    ----------
+    dirname
+        The cache directory.
+
+    """
+
+    header = b"pytensor-module-index 2\n"
+    filename = "module_index.txt"
+
+    def __init__(self, dirname):
+        self.dirname = dirname
+        self.path = os.path.join(dirname, self.filename)
+        self.entries = {}
+        self.offset = 0
+        self.inode = None
+
+    def _reset(self):
+        self.entries = {}
+        self.offset = 0
+        self.inode = None
+
+    @staticmethod
+    def encode_key_data(key_data):
+        """
+        Return `key_data` pickled and encoded in a single line of text.
+
+        An empty string is returned if `key_data` is ``None`` or can't be
+        pickled, in which case readers fall back to the ``key.pkl`` file.
+
+        """
+        if key_data is None:
+            return ""
+        try:
+            data = pickle.dumps(key_data, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return ""
+        return base64.b64encode(data).decode()
+
+    @staticmethod
+    def _parse_line(line):
+        subdir, module_file, data = line.decode().split("\t")
+        if (
+            not subdir.startswith("tmp")
+            or os.sep in subdir
+            or os.sep in module_file
+            or not module_file.endswith((".so", ".pyd"))
+        ):
+            raise ValueError(line)
+        return subdir, module_file, data
+
+    def read(self):
+        """
+        Read the entries appended to the index since the last call.
+
+        Returns
+        -------
+        dict or None
+            Maps the new subdirectories to their module file names, or ``None``
+            if the index is missing or corrupt.
+
+        """
+        try:
+            with open(self.path, "rb") as f:
+                st = os.fstat(f.fileno())
+                if st.st_ino != self.inode or st.st_size < self.offset:
+                    # The index was rebuilt since the last call
+                    self._reset()
+                    self.inode = st.st_ino
+                f.seek(self.offset)
+                data = f.read()
+        except OSError:
+            self._reset()
+            return None
+
+        offset = self.offset
+        if offset == 0:
+            if not data.startswith(self.header):
+                self._reset()
+                return None
+            offset = len(self.header)
+            data = data[offset:]
+
+        new_entries = {}
+        # The last line may still be being written by another process, in
+        # which case it is read during the next call
+        *lines, _ = data.split(b"\n")
+        try:
+            for line in lines:
+                subdir, module_file, key_data = self._parse_line(line)
+                new_entries[subdir] = (module_file, key_data)
+                offset += len(line) + 1
+        except (ValueError, UnicodeDecodeError):
+            _logger.warning(f"Corrupt module index {self.path}; rebuilding it.")
+            self._reset()
+            return None
+
+        self.entries.update(new_entries)
+        self.offset = offset
+        return {subdir: module_file for subdir, (module_file, _) in new_entries.items()}
+
+    def load_key_data(self, subdir):
+        """
+        Return the `KeyData` stored in the index for `subdir`.
+
+        ``None`` is returned if the index has no (loadable) copy of it, in
+        which case it must be read from the ``key.pkl`` file instead.
+
+        """
+        _, data = self.entries.get(subdir, (None, ""))
+        if not data:
+            return None
+        try:
+            return pickle.loads(base64.b64decode(data))
+        except Exception:
+            # e.g. the keys refer to classes that aren't imported yet
+            return None
+
+    def append(self, subdir, module_file, key_data=None):
+        """
+        Add an entry to the index.
+
+        Nothing is done if the index doesn't exist, since it will be rebuilt
+        by the next `ModuleCache.refresh` anyway.
+
+        """
+        try:
+            fd = os.open(self.path, os.O_WRONLY | os.O_APPEND)
+        except OSError:
+            return
+        line = f"{subdir}\t{module_file}\t{self.encode_key_data(key_data)}\n"
+        try:
+            os.write(fd, line.encode())
+        finally:
+            os.close(fd)
+
+    def rewrite(self, entries):
+        """
+        Replace the content of the index by `entries`.
+
+        `entries` maps the subdirectories to their module file name and their
+        encoded `KeyData` (see `ModuleIndex.encode_key_data`).
+
+        """
+        try:
+            fd, tmp_path = tempfile.mkstemp(prefix="module_index.", dir=self.dirname)
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(self.header)
+                for subdir, (module_file, data) in sorted(entries.items()):
+                    f.write(f"{subdir}\t{module_file}\t{data}\n".encode())
+            os.replace(tmp_path, self.path)
+        except OSError:
+            _logger.warning(f"Could not write the module index {self.path}")
+            with suppress(OSError):
+                os.remove(tmp_path)
+            self._reset()
+            return
+        self._reset()
+        self.read()
+
+
 class ModuleCache:
     """
     Interface to the cache of dynamically compiled modules on disk.
@@ -628,6 +807,11 @@ class ModuleCache:
     - possibly a ``delete.me`` file, meaning this directory has been marked
     for deletion.
 
+    A `ModuleIndex` file listing the directories that contain a ``key.pkl``
+    file, along with a copy of their `KeyData`, is kept alongside them, so
+    that `ModuleCache.refresh` doesn't need to walk every directory of the
+    cache and unpickle their ``key.pkl`` each time it is called.
+
     Keys should be tuples of length two: ``(version, rest)``. The
     rest can be anything hashable and picklable, that uniquely
     identifies the computation in the module. The key is returned by
@@ -716,6 +900,9 @@ class ModuleCache:
         self.check_for_broken_eq = check_for_broken_eq
         self.loaded_key_pkl = set()
         self.time_spent_in_check_key = 0
+        self.index = ModuleIndex(dirname)
+        # Directories without a key.pkl file that were left alone by refresh
+        self.skipped_subdirs = set()
 
         if do_refresh:
             self.refresh()
@@ -750,6 +937,12 @@ class ModuleCache:
         Remove entries which have been removed from the filesystem.
         Also, remove malformed cache directories.
 
+        Only the directories added to the `ModuleIndex` since the last call
+        (and those that aren't indexed) are examined.  When the index is
+        missing or corrupt, every directory is examined and the index is
+        rebuilt.  The ``key.pkl`` files are only read for the directories
+        whose `KeyData` isn't stored in the index.
+
         Parameters
         ----------
         age_thresh_use
@@ -802,17 +995,41 @@ class ModuleCache:
         # to lock on the compilation directory so that those processes don't
         # work with stale/invalid data
         with lock_ctx():
+            new_entries = self.index.read()
+            full_scan = new_entries is None
+            if full_scan:
+                # Maps the directories to index to their module file and
+                # encoded `KeyData`
+                indexable = {}
+                self.skipped_subdirs.clear()
+            else:
+                self.skipped_subdirs.difference_update(new_entries)
+
             for subdirs_elem in subdirs:
                 # Never clean/remove lock_dir
                 if subdirs_elem == "lock_dir":
                     continue
+                if subdirs_elem in self.skipped_subdirs:
+                    continue
                 root = os.path.join(self.dirname, subdirs_elem)
                 key_pkl = os.path.join(root, "key.pkl")
                 if key_pkl in self.loaded_key_pkl:
                     continue
-                if not os.path.isdir(root):
+                module_file, _ = (
+                    (None, None)
+                    if full_scan
+                    else self.index.entries.get(subdirs_elem, (None, None))
+                )
+                if module_file is not None:
+                    # No need to list the content of an indexed directory
+                    files = [module_file, "key.pkl"]
+                    if os.path.exists(os.path.join(root, "delete.me")):
+                        files.append("delete.me")
+                elif not os.path.isdir(root):
+                    self.skipped_subdirs.add(subdirs_elem)
                     continue
-                files = os.listdir(root)
+                else:
+                    files = os.listdir(root)
                 if not files:
                     rmtree_empty(root, ignore_nocleanup=True, msg="empty dir")
                     continue
@@ -838,6 +1055,12 @@ class ModuleCache:
                             level=logging.INFO,
                         )
                         continue
+                    if full_scan:
+                        indexable[subdirs_elem] = (os.path.basename(entry), "")
+                    elif module_file is None:
+                        # A directory that was added by a process that didn't
+                        # update the index
+                        self.index.append(subdirs_elem, os.path.basename(entry))
                     if (time_now - last_access_time(entry)) < age_thresh_use:
                         _logger.debug(f"refresh adding {key_pkl}")
 
@@ -846,9 +1069,18 @@ class ModuleCache:
                                 f"ModuleCache.refresh() Failed to unpickle cache file {key_pkl}",
                             )
 
+                        # Only the directories the index has no copy of the
+                        # `KeyData` for need their `key.pkl` to be read
+                        key_data = (
+                            None
+                            if full_scan
+                            else self.index.load_key_data(subdirs_elem)
+                        )
+                        from_index = key_data is not None
                         try:
-                            with open(key_pkl, "rb") as f:
-                                key_data = pickle.load(f)
+                            if not from_index:
+                                with open(key_pkl, "rb") as f:
+                                    key_data = pickle.load(f)
                         except EOFError:
                             # Happened once... not sure why (would be worth
                             # investigating if it ever happens again).
@@ -1000,12 +1232,37 @@ class ModuleCache:
                         if key_data.keys:
                             del key
                         self.loaded_key_pkl.add(key_pkl)
+                        if full_scan:
+                            indexable[subdirs_elem] = (
+                                os.path.basename(entry),
+                                self.index.encode_key_data(key_data),
+                            )
+                        elif not from_index:
+                            self.index.append(
+                                subdirs_elem, os.path.basename(entry), key_data
+                            )
                     else:
                         too_old_to_use.append(entry)
 
-                # If the compilation failed, no key.pkl is in that
-                # directory, but a mod.* should be there.
-                # We do nothing here.
+                else:
+                    # If the compilation failed, no key.pkl is in that
+                    # directory, but a mod.* should be there.
+                    # We do nothing here, and only look at the directory
+                    # again once it is indexed or the index is rebuilt.
+                    self.skipped_subdirs.add(subdirs_elem)
+
+            # The directories that currently exist in the cache.
+            existing_roots = {os.path.join(self.dirname, s) for s in subdirs}
+
+            if not full_scan and cleanup:
+                # Compact the index once most of its entries are stale
+                live_entries = {
+                    s: m
+                    for s, m in self.index.entries.items()
+                    if os.path.join(self.dirname, s) in existing_roots
+                }
+                if 2 * len(live_entries) < len(self.index.entries):
+                    self.index.rewrite(live_entries)
 
             # Clean up the name space to prevent bug.
             del root, files, subdirs
@@ -1014,12 +1271,17 @@ class ModuleCache:
             items_copy = list(self.module_hash_to_key_data.items())
             for module_hash, key_data in items_copy:
                 entry = key_data.get_entry()
-                try:
-                    # Test to see that the file is [present and] readable.
-                    with open(entry):
-                        gone = False
-                except OSError:
-                    gone = True
+                if not full_scan and os.path.dirname(entry) in existing_roots:
+                    # The index is only valid if the modules aren't removed
+                    # from their directories
+                    gone = False
+                else:
+                    try:
+                        # Test to see that the file is [present and] readable.
+                        with open(entry):
+                            gone = False
+                    except OSError:
+                        gone = True
 
                 if gone:
                     # Assert that we did not have one of the deleted files
@@ -1063,6 +1325,11 @@ class ModuleCache:
                     if not files:
                         _rmtree(*a, **kw)
 
+            if full_scan:
+                for a, kw in to_delete:
+                    indexable.pop(os.path.basename(a[0]), None)
+                self.index.rewrite(indexable)
+
             _logger.debug(
                 f"Time needed to refresh cache: {time.perf_counter() - start_time}"
             )
@@ -1109,6 +1376,12 @@ class ModuleCache:
                 # time.
                 if key[0] and not key_broken and self.check_for_broken_eq:
                     self.check_key(key, key_data.key_pkl)
+                if key[0]:
+                    self.index.append(
+                        os.path.basename(os.path.dirname(key_data.key_pkl)),
+                        os.path.basename(key_data.get_entry()),
+                        key_data,
+                    )
             self._update_mappings(
                 key, key_data, module.__file__, check_in_keys=not key_broken
             )
@@ -1160,6 +1433,9 @@ class ModuleCache:
             if not key_broken and self.check_for_broken_eq:
                 self.check_key(key, key_pkl)
             self.loaded_key_pkl.add(key_pkl)
+            self.index.append(
+                os.path.basename(location), os.path.basename(name), key_data
+            )
         elif config.cmodule__warn_no_version:
             key_flat = flatten(key)
             ops = [k for k in key_flat if isinstance(k, Op)]
@@ -1259,6 +1535,84 @@ class ModuleCache:
         self.stats[2] += 1
         return module
 
+    def compile_modules(self, linkers, n_jobs):
+        """
+        Compile the modules of several linkers concurrently.
+
+        The modules that are already in the cache are skipped.  The other ones
+        are compiled by `n_jobs` threads (the compiler runs in a subprocess)
+        without holding the compilation lock: each module is compiled in its
+        own work directory, which isn't removed by other processes because it
+        isn't empty.  The lock is only taken to add the modules to the cache,
+        after which `ModuleCache.module_from_key` returns them directly.
+
+        The modules that fail to compile are ignored, so that the errors are
+        raised by `ModuleCache.module_from_key` as usual.
+
+        Parameters
+        ----------
+        linkers
+            The `CLinker` objects of the modules.
+        n_jobs
+            The number of modules compiled at the same time.
+
+        """
+        to_compile = {}
+        for lnk in linkers:
+            try:
+                key = lnk.cmodule_key()
+                if key is None or key in self.entry_from_key:
+                    continue
+                module_hash = get_module_hash(lnk.get_src_code(), key)
+                # Compute the compilation arguments (which can involve
+                # compiling test programs) before starting the threads
+                lnk.compile_args()
+            except Exception as e:
+                _logger.debug(f"Skipping the concurrent compilation of {lnk}: {e}")
+                continue
+            if module_hash not in self.module_hash_to_key_data:
+                to_compile.setdefault(module_hash, (key, lnk))
+        if not to_compile:
+            return
+
+        with lock_ctx():
+            # Other processes may have compiled some of the modules already
+            self.refresh(cleanup=False)
+            locations = {}
+            for module_hash, (key, lnk) in to_compile.items():
+                if (
+                    key in self.entry_from_key
+                    or module_hash in self.module_hash_to_key_data
+                ):
+                    continue
+                location = dlimport_workdir(self.dirname)
+                # Keep the directory from being removed as empty by refresh
+                open(os.path.join(location, "mod.cpp"), "w").close()
+                locations[module_hash] = location
+
+        def compile_module(module_hash):
+            lnk = to_compile[module_hash][1]
+            location = locations[module_hash]
+            try:
+                return lnk.compile_cmodule(location, lock=False)
+            except Exception as e:
+                _logger.debug(f"Concurrent compilation of {lnk} failed: {e}")
+                _rmtree(location, ignore_if_missing=True, msg="compilation failed")
+                return None
+
+        with ThreadPoolExecutor(max_workers=n_jobs) as executor:
+            modules = dict(zip(locations, executor.map(compile_module, locations)))
+
+        with lock_ctx():
+            for module_hash, module in modules.items():
+                if module is None:
+                    continue
+                key = to_compile[module_hash][0]
+                self.module_from_name[module.__file__] = module
+                key_data = self._add_to_cache(module, key, module_hash)
+                self.module_hash_to_key_data[module_hash] = key_data
+                self.stats[2] += 1
+
     def check_key(self, key, key_pkl):
         """
         Perform checks to detect broken __eq__ / __hash__ implementations.
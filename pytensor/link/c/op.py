@@ -35,6 +35,34 @@ def is_cthunk_wrapper_type(thunk: Callable[[], None]) -> CThunkWrapperType:
 class COp(Op, CLinkerOp):
     """An `Op` with a C implementation."""
 
+    def _c_linker(self, node: Apply, no_recycling: Collection[Variable]):
+        """Create the `CLinker` of the C thunk of `node`."""
+        # FIXME: Putting the following import on the module level causes an import cycle.
+        #        The conclusion should be that the antire "make_c_thunk" method should be defined
+        #        in pytensor.link.c and dispatched onto the Op!
+        import pytensor.link.c.basic
+        from pytensor.graph.fg import FunctionGraph
+
+        e = FunctionGraph(node.inputs, node.outputs)
+        e_no_recycling = [
+            new_o
+            for (new_o, old_o) in zip(e.outputs, node.outputs)
+            if old_o in no_recycling
+        ]
+        return pytensor.link.c.basic.CLinker().accept(e, no_recycling=e_no_recycling)
+
+    def _f16_unsupported(self, node: Apply) -> bool:
+        """Return whether `node` uses float16 without the `Op` supporting it."""
+        if getattr(self, "_f16_ok", False):
+            return False
+
+        def is_f16(t):
+            return getattr(t, "dtype", "") == "float16"
+
+        return any(is_f16(i.type) for i in node.inputs) or any(
+            is_f16(o.type) for o in node.outputs
+        )
+
     def make_c_thunk(
         self,
         node: Apply,
@@ -47,40 +75,21 @@ class COp(Op, CLinkerOp):
         Like :meth:`Op.make_thunk`, but will only try to make a C thunk.
 
         """
-        # FIXME: Putting the following import on the module level causes an import cycle.
-        #        The conclusion should be that the antire "make_c_thunk" method should be defined
-        #        in pytensor.link.c and dispatched onto the Op!
-        import pytensor.link.c.basic
-        from pytensor.graph.fg import FunctionGraph
-
         node_input_storage = [storage_map[r] for r in node.inputs]
         node_output_storage = [storage_map[r] for r in node.outputs]
 
-        e = FunctionGraph(node.inputs, node.outputs)
-        e_no_recycling = [
-            new_o
-            for (new_o, old_o) in zip(e.outputs, node.outputs)
-            if old_o in no_recycling
-        ]
-        cl = pytensor.link.c.basic.CLinker().accept(e, no_recycling=e_no_recycling)
+        cl = self._c_linker(node, no_recycling)
         # float16 gets special treatment since running
         # unprepared C code will get bad results.
-        if not getattr(self, "_f16_ok", False):
-
-            def is_f16(t):
-                return getattr(t, "dtype", "") == "float16"
-
-            if any(is_f16(i.type) for i in node.inputs) or any(
-                is_f16(o.type) for o in node.outputs
-            ):
-                # get_dynamic_module is a subset of make_thunk that is reused.
-                # This just try to build the c code
-                # It will raise an error for ops
-                # that don't implement c code. In those cases, we
-                # don't want to print a warning.
-                cl.get_dynamic_module()
-                print(f"Disabling C code for {self} due to unsupported float16")
-                raise NotImplementedError("float16")
+        if self._f16_unsupported(node):
+            # get_dynamic_module is a subset of make_thunk that is reused.
+            # This just try to build the c code
+            # It will raise an error for ops
+            # that don't implement c code. In those cases, we
+            # don't want to print a warning.
+            cl.get_dynamic_module()
+            print(f"Disabling C code for {self} due to unsupported float16")
+            raise NotImplementedError("float16")
         outputs = cl.make_thunk(
             input_storage=node_input_storage, output_storage=node_output_storage
         )
@@ -218,6 +227,37 @@ int main( int argc, const char* argv[] )
             self.update_self_openmp()
 
 
+def precompile_c_thunks(
+    nodes: Collection[Apply],
+    storage_map: StorageMapType,
+    compute_map: ComputeMapType,
+    n_jobs: int,
+) -> None:
+    """Compile the C modules of the thunks of `nodes` concurrently.
+
+    `COp.make_thunk` compiles the modules of the nodes one after the other.
+    Calling this function first compiles the ones missing from the cache at
+    the same time, so that `COp.make_thunk` only has to load them.
+
+    """
+    from pytensor.link.c.basic import get_module_cache
+
+    linkers = []
+    for node in nodes:
+        op = node.op
+        if (
+            not isinstance(op, COp)
+            or type(op).make_thunk is not COp.make_thunk
+            or op._f16_unsupported(node)
+        ):
+            continue
+        op.prepare_node(
+            node, storage_map=storage_map, compute_map=compute_map, impl="c"
+        )
+        linkers.append(op._c_linker(node, []))
+    get_module_cache().compile_modules(linkers, n_jobs)
+
+
 def lquote_macro(txt: str) -> str:
     """Turn the last line of text into a ``\\``-commented line."""
     res = []
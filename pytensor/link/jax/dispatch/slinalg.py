@@ -1,7 +1,14 @@
 import jax
 
 from pytensor.link.jax.dispatch.basic import jax_funcify
-from pytensor.tensor.slinalg import BlockDiagonal, Cholesky, Solve, SolveTriangular
+from pytensor.tensor.slinalg import (
+    BlockDiagonal,
+    Cholesky,
+    LUFactor,
+    LUSolve,
+    Solve,
+    SolveTriangular,
+)
 
 
 @jax_funcify.register(Cholesky)
@@ -47,6 +54,24 @@ def jax_funcify_SolveTriangular(op, **kwargs):
     return solve_triangular
 
 
+@jax_funcify.register(LUFactor)
+def jax_funcify_LUFactor(op, **kwargs):
+    def lu_factor(a):
+        return jax.scipy.linalg.lu_factor(a)
+
+    return lu_factor
+
+
+@jax_funcify.register(LUSolve)
+def jax_funcify_LUSolve(op, **kwargs):
+    trans = op.trans
+
+    def lu_solve(lu, piv, b):
+        return jax.scipy.linalg.lu_solve((lu, piv), b, trans=trans)
+
+    return lu_solve
+
+
 @jax_funcify.register(BlockDiagonal)
 def jax_funcify_BlockDiagonalMatrix(op, **kwargs):
     def block_diag(*inputs):
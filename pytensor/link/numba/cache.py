@@ -0,0 +1,256 @@
+r"""A persistent cache for the Numba functions generated from `FunctionGraph`\s.
+
+Numba's own file-based caching can't be used on the functions created by
+`compile_function_src`, because they aren't backed by a stable source file.
+Instead, the functions are identified by a hash of their code and of
+everything they reference (i.e. the other generated functions, their
+closures and their constants), and the compiled machine code is stored in
+``config.compiledir``.
+"""
+
+import hashlib
+import os
+import types
+from importlib import import_module
+from typing import Any, Callable, Optional
+
+import numba
+import numpy as np
+from numba.core.caching import CompileResultCacheImpl, FunctionCache, _CacheLocator
+from numba.core.dispatcher import Dispatcher
+from numba.np.ufunc.dufunc import DUFunc
+
+import pytensor
+from pytensor.configdefaults import config
+
+
+class _Unhashable(Exception):
+    """Raised when an object referenced by a function can't be hashed stably."""
+
+
+def _importable_name(obj: Any) -> Optional[str]:
+    """Return the qualified name through which `obj` can be imported, if any."""
+    module = getattr(obj, "__module__", None)
+    qualname = getattr(obj, "__qualname__", getattr(obj, "__name__", None))
+    if not isinstance(module, str) or not isinstance(qualname, str):
+        return None
+    if "<locals>" in qualname:
+        return None
+    try:
+        res = import_module(module)
+        for attr in qualname.split("."):
+            res = getattr(res, attr)
+    except (ImportError, AttributeError):
+        return None
+    if res is not obj:
+        return None
+    return f"{module}.{qualname}"
+
+
+class _FunctionHasher:
+    """Compute a hash of a function that is stable across processes."""
+
+    def __init__(self):
+        self.memo: dict[int, str] = {}
+
+    def hash_function(self, fn: Callable) -> str:
+        key = self.memo.get(id(fn))
+        if key is not None:
+            return key
+        # Recursive functions refer to themselves
+        self.memo[id(fn)] = f"recursive function {fn.__qualname__}"
+
+        closure = tuple(
+            self.hash_object(cell.cell_contents) for cell in fn.__closure__ or ()
+        )
+        defaults = tuple(self.hash_object(d) for d in fn.__defaults__ or ())
+        kwdefaults = tuple(
+            (k, self.hash_object(v))
+            for k, v in sorted((fn.__kwdefaults__ or {}).items())
+        )
+        key = hashlib.sha256(
+            repr(
+                (
+                    self.hash_code(fn.__code__, fn.__globals__),
+                    closure,
+                    defaults,
+                    kwdefaults,
+                )
+            ).encode()
+        ).hexdigest()
+        self.memo[id(fn)] = key
+        return key
+
+    def hash_code(self, code: types.CodeType, globals_: dict[str, Any]) -> tuple:
+        # The names of the global and local variables are left out, because
+        # the generated functions name them after the graph's variables, which
+        # are numbered in creation order.  The global variables are replaced
+        # by the objects they refer to.  The file names and line numbers are
+        # left out too, because the generated functions are compiled from
+        # temporary files.
+        return (
+            code.co_code,
+            tuple(self.hash_const(c, globals_) for c in code.co_consts),
+            tuple(
+                self.hash_object(globals_[name]) if name in globals_ else name
+                for name in code.co_names
+            ),
+            len(code.co_varnames),
+            len(code.co_freevars),
+            len(code.co_cellvars),
+            code.co_argcount,
+            code.co_kwonlyargcount,
+            code.co_flags,
+        )
+
+    def hash_const(self, const: Any, globals_: dict[str, Any]) -> Any:
+        if isinstance(const, types.CodeType):
+            return self.hash_code(const, globals_)
+        if isinstance(const, frozenset):
+            # The iteration order of sets of strings changes between processes
+            return ("frozenset", tuple(sorted(repr(c) for c in const)))
+        return repr(const)
+
+    def hash_object(self, obj: Any) -> Any:
+        if obj is None or isinstance(
+            obj, (bool, int, float, complex, str, bytes, np.generic, np.dtype)
+        ):
+            return (type(obj).__name__, repr(obj))
+        if obj is Ellipsis or isinstance(obj, range):
+            return repr(obj)
+        if isinstance(obj, (tuple, list)):
+            return (type(obj).__name__, tuple(self.hash_object(o) for o in obj))
+        if isinstance(obj, slice):
+            return ("slice", self.hash_object((obj.start, obj.stop, obj.step)))
+        if isinstance(obj, dict):
+            return (
+                "dict",
+                tuple((repr(k), self.hash_object(v)) for k, v in obj.items()),
+            )
+        if isinstance(obj, np.ndarray):
+            if obj.dtype.hasobject:
+                raise _Unhashable(obj)
+            return (
+                "ndarray",
+                obj.dtype.str,
+                obj.shape,
+                hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest(),
+            )
+        if isinstance(obj, types.ModuleType):
+            return ("module", obj.__name__)
+        if isinstance(obj, numba.types.Type):
+            return ("numba type", str(obj))
+        if isinstance(obj, np.ufunc):
+            for module in ("numpy", "scipy.special"):
+                if getattr(import_module(module), obj.__name__, None) is obj:
+                    return ("ufunc", f"{module}.{obj.__name__}")
+            raise _Unhashable(obj)
+
+        name = _importable_name(obj)
+        if name is not None and not name.startswith("pytensor."):
+            # Library objects are fixed by the versions of the packages
+            return ("importable", name)
+
+        if isinstance(obj, Dispatcher):
+            return (
+                "dispatcher",
+                repr(sorted(obj.targetoptions.items())),
+                self.hash_function(obj.py_func),
+            )
+        if isinstance(obj, DUFunc):
+            return (
+                "dufunc",
+                obj.identity,
+                self.hash_object(obj._dispatcher),
+            )
+        if isinstance(obj, types.FunctionType):
+            return ("function", self.hash_function(obj))
+        if name is not None:
+            return ("importable", name)
+
+        raise _Unhashable(obj)
+
+
+def function_cache_key(fn: Callable) -> Optional[str]:
+    """Compute a key that identifies a generated Numba function across processes.
+
+    Returns ``None`` when `fn` references objects that can't be identified
+    reliably, in which case it shouldn't be cached.
+    """
+    try:
+        fn_hash = _FunctionHasher().hash_function(fn)
+    except _Unhashable:
+        return None
+    return hashlib.sha256(
+        repr(
+            (
+                fn_hash,
+                pytensor.__version__,
+                numba.__version__,
+                np.__version__,
+            )
+        ).encode()
+    ).hexdigest()
+
+
+class _CompiledirCacheLocator(_CacheLocator):
+    """Locate the cache of a generated function in ``config.compiledir``."""
+
+    def __init__(self, key: str, py_file: str):
+        self._key = key
+        self._py_file = py_file
+
+    def get_cache_path(self):
+        return os.path.join(config.compiledir, "numba")
+
+    def get_source_stamp(self):
+        return self._key
+
+    def get_disambiguator(self):
+        return self._key
+
+    @classmethod
+    def from_function(cls, py_func, py_file):
+        key = getattr(py_func, "__cache_key__", None)
+        if key is None:
+            return None
+        return cls(key, py_file)
+
+
+class _CompiledirCacheImpl(CompileResultCacheImpl):
+    _locator_classes = [_CompiledirCacheLocator]
+
+    def get_filename_base(self, fullname, abiflags):
+        # The module name is the name of a temporary file, so only the
+        # qualified name of the function is kept
+        _, _, qualname = fullname.partition(".")
+        return super().get_filename_base(qualname, abiflags)
+
+    def check_cachable(self, cres):
+        # Unlike Numba, don't warn about the graphs that can't be cached
+        # (e.g. because they call LAPACK through ctypes pointers)
+        return not cres.library.has_dynamic_globals and all(
+            x.can_cache for x in cres.lifted
+        )
+
+
+class CompiledirFunctionCache(FunctionCache):
+    """A Numba `FunctionCache` for functions without a stable source file."""
+
+    _impl_class = _CompiledirCacheImpl
+
+
+def enable_compiledir_caching(dispatcher: Dispatcher) -> bool:
+    """Cache the compiled overloads of `dispatcher` in ``config.compiledir``.
+
+    Returns ``False`` when the dispatcher's function can't be cached.
+    """
+    py_func = getattr(dispatcher, "py_func", None)
+    if py_func is None:
+        return False
+    key = function_cache_key(py_func)
+    if key is None:
+        return False
+    py_func.__cache_key__ = key
+    dispatcher._cache = CompiledirFunctionCache(py_func)
+    return True
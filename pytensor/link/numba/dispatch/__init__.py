@@ -10,6 +10,9 @@ import pytensor.link.numba.dispatch.random
 import pytensor.link.numba.dispatch.elemwise
 import pytensor.link.numba.dispatch.scan
 import pytensor.link.numba.dispatch.sparse
+import pytensor.link.numba.dispatch.sparse_basic
 import pytensor.link.numba.dispatch.slinalg
+import pytensor.link.numba.dispatch.blockwise
+import pytensor.link.numba.dispatch.conv
 
 # isort: on
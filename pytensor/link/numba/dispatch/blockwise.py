@@ -0,0 +1,148 @@
+from textwrap import indent
+
+import numpy as np
+
+from pytensor.link.numba.dispatch import basic as numba_basic
+from pytensor.link.numba.dispatch.basic import (
+    create_arg_string,
+    create_tuple_string,
+    numba_funcify,
+)
+from pytensor.link.utils import compile_function_src
+from pytensor.tensor.blockwise import Blockwise
+
+
+_runtime_broadcast_error_msg = (
+    "Runtime broadcasting not allowed. "
+    "At least one input has a distinct batch dimension length of 1, but was not marked as broadcastable."
+)
+
+
+@numba_funcify.register(Blockwise)
+def numba_funcify_Blockwise(op: Blockwise, node, **kwargs):
+    """Create a compiled loop that applies the core `Op` over the batch dimensions.
+
+    The core `Op` is evaluated once on the first batch entry to find the core
+    shapes of the outputs, which are then allocated for the whole batch and
+    filled in place by the remaining iterations.
+    """
+    core_node = op._create_dummy_core_node(node.inputs)
+    core_op_fn = numba_funcify(op.core_op, node=core_node, **kwargs)
+
+    batch_ndim = op.batch_ndim(node)
+    n_outs = len(node.outputs)
+
+    global_env = {
+        "np": np,
+        "to_scalar": numba_basic.to_scalar,
+        "core_op_fn": core_op_fn,
+        **{
+            f"out_dtype_{j}": out.type.numpy_dtype for j, out in enumerate(node.outputs)
+        },
+    }
+
+    input_names = [f"i{i}" for i in range(len(node.inputs))]
+    batch_sizes = [f"bs{d}" for d in range(batch_ndim)]
+    batch_idxs = [f"b{d}" for d in range(batch_ndim)]
+    zero_idxs = ["0"] * batch_ndim
+
+    # The batch sizes are taken from the first input that is not statically
+    # broadcastable along each dimension; the others must match exactly.
+    batch_shape_lines = []
+    for d in range(batch_ndim):
+        ref = None
+        for name, inp in zip(input_names, node.inputs):
+            if inp.type.broadcastable[d]:
+                continue
+            if ref is None:
+                ref = name
+                batch_shape_lines.append(f"bs{d} = {name}.shape[{d}]")
+            else:
+                batch_shape_lines.append(
+                    f"""
+if {name}.shape[{d}] != bs{d}:
+    if {name}.shape[{d}] == 1 or bs{d} == 1:
+        raise ValueError("{_runtime_broadcast_error_msg}")
+    raise ValueError("Incompatible Blockwise batch dimensions")
+"""
+                )
+        if ref is None:
+            batch_shape_lines.append(f"bs{d} = 1")
+
+    def core_call(idxs):
+        core_args = []
+        for name, inp, sig in zip(input_names, node.inputs, op.inputs_sig):
+            if batch_ndim == 0:
+                core_args.append(name)
+                continue
+            inp_idxs = [
+                "0" if bcast else idx
+                for bcast, idx in zip(inp.type.broadcastable[:batch_ndim], idxs)
+            ]
+            core_arg = f"{name}[{create_arg_string(inp_idxs)}]"
+            if not sig:
+                # Core `Op`s expect zero-dimensional arrays, not scalars
+                core_arg = f"np.asarray({core_arg})"
+            core_args.append(core_arg)
+        return f"core_op_fn({create_arg_string(core_args)})"
+
+    res_names = [f"r{j}" for j in range(n_outs)]
+    out_names = [f"out{j}" for j in range(n_outs)]
+
+    def store_results(idxs):
+        lines = []
+        for res, out, sig in zip(res_names, out_names, op.outputs_sig):
+            res_val = res if sig else f"to_scalar({res})"
+            if batch_ndim == 0:
+                lines.append(f"{out}[...] = {res_val}")
+            else:
+                lines.append(f"{out}[{create_arg_string(idxs)}] = {res_val}")
+        return lines
+
+    # Shapes of the outputs when the batch is empty and the core `Op` can't be
+    # evaluated: core dimensions shared with an input are taken from it, the
+    # others are assumed to be empty.
+    core_dim_lengths = {}
+    for name, sig in reversed(list(zip(input_names, op.inputs_sig))):
+        for k, dim_name in enumerate(sig):
+            core_dim_lengths[dim_name] = f"{name}.shape[{batch_ndim + k}]"
+    empty_out_lines = []
+    alloc_out_lines = []
+    for j, (out, res, sig) in enumerate(zip(out_names, res_names, op.outputs_sig)):
+        empty_shape = batch_sizes + [core_dim_lengths.get(dim, "0") for dim in sig]
+        empty_out_lines.append(
+            f"{out} = np.empty({create_tuple_string(empty_shape)}, dtype=out_dtype_{j})"
+        )
+        alloc_out_lines.append(
+            f"{out} = np.empty({create_tuple_string(batch_sizes)} + np.shape({res}), dtype=out_dtype_{j})"
+        )
+
+    # Multi-index of the flat batch index `k`
+    unravel_lines = ["rem = k"]
+    for d in reversed(range(batch_ndim)):
+        unravel_lines.append(f"b{d} = rem % bs{d}")
+        unravel_lines.append(f"rem //= bs{d}")
+
+    res_target = create_arg_string(res_names)
+    outputs_src = create_tuple_string(out_names) if n_outs > 1 else out_names[0]
+
+    blockwise_src = f"""
+def blockwise({create_arg_string(input_names)}):
+{indent(chr(10).join(batch_shape_lines), " " * 4)}
+    n_batch = {" * ".join(batch_sizes) if batch_ndim else "1"}
+    if n_batch == 0:
+{indent(chr(10).join(empty_out_lines), " " * 8)}
+        return {outputs_src}
+    {res_target} = {core_call(zero_idxs)}
+{indent(chr(10).join(alloc_out_lines), " " * 4)}
+{indent(chr(10).join(store_results(zero_idxs)), " " * 4)}
+    for k in range(1, n_batch):
+{indent(chr(10).join(unravel_lines), " " * 8)}
+        {res_target} = {core_call(batch_idxs)}
+{indent(chr(10).join(store_results(batch_idxs)), " " * 8)}
+    return {outputs_src}
+    """
+
+    blockwise_fn = compile_function_src(blockwise_src, "blockwise", global_env)
+
+    return numba_basic.numba_njit(blockwise_fn)
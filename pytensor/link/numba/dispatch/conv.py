@@ -0,0 +1,144 @@
+import numba.np.unsafe.ndarray as numba_ndarray
+import numpy as np
+
+from pytensor.link.numba.dispatch import basic as numba_basic
+from pytensor.link.numba.dispatch.basic import numba_funcify
+from pytensor.tensor.conv.im2col import BaseIm2Col, Col2Im, Im2Col
+
+
+def numba_conv_geometry(op: BaseIm2Col):
+    """Create a function that computes the geometry of a convolution.
+
+    The function returns the left padding and the output shape of the
+    convolution, along with the strides and size of the flattened images.
+    """
+    convdim = op.convdim
+    subsample = np.array(op.subsample, dtype=np.int64)
+    dilation = np.array(op.filter_dilation, dtype=np.int64)
+    full = op.border_mode == "full"
+    half = op.border_mode == "half"
+    fixed_pads = np.array(op.pads([1] * convdim), dtype=np.int64)
+
+    @numba_basic.numba_njit
+    def conv_geometry(imshp, kshp):
+        pad_l = np.empty(convdim, dtype=np.int64)
+        out_shp = np.empty(convdim, dtype=np.int64)
+        strides = np.empty(convdim, dtype=np.int64)
+        img_size = 1
+        for i in range(convdim - 1, -1, -1):
+            dil_k = (kshp[i] - 1) * dilation[i] + 1
+            if full:
+                left = right = dil_k - 1
+            elif half:
+                left = right = dil_k // 2
+            else:
+                left = fixed_pads[i, 0]
+                right = fixed_pads[i, 1]
+            if kshp[i] < 1 or imshp[i] + left + right < dil_k:
+                raise ValueError("The filters don't fit in the padded images")
+            pad_l[i] = left
+            out_shp[i] = (imshp[i] + left + right - dil_k) // subsample[i] + 1
+            strides[i] = img_size
+            img_size *= imshp[i]
+        return pad_l, out_shp, strides, img_size
+
+    return conv_geometry
+
+
+@numba_funcify.register(Im2Col)
+def numba_funcify_Im2Col(op, node, **kwargs):
+    convdim = op.convdim
+    subsample = np.array(op.subsample, dtype=np.int64)
+    dilation = np.array(op.filter_dilation, dtype=np.int64)
+    conv_geometry = numba_conv_geometry(op)
+
+    @numba_basic.numba_njit(boundscheck=False)
+    def im2col(img, kshp):
+        batch, channels = img.shape[0], img.shape[1]
+        imshp = np.empty(convdim, dtype=np.int64)
+        for i in range(convdim):
+            imshp[i] = img.shape[2 + i]
+        pad_l, out_shp, strides, img_size = conv_geometry(imshp, kshp)
+        n_patches = np.prod(out_shp)
+        filter_size = np.prod(kshp)
+
+        img = np.ascontiguousarray(img).reshape((batch, channels, img_size))
+        cols = np.empty((batch, n_patches, channels * filter_size), dtype=img.dtype)
+        start = np.empty(convdim, dtype=np.int64)
+        offset = np.empty(convdim, dtype=np.int64)
+        for b in range(batch):
+            for p in range(n_patches):
+                rem = p
+                for i in range(convdim - 1, -1, -1):
+                    start[i] = (rem % out_shp[i]) * subsample[i] - pad_l[i]
+                    rem //= out_shp[i]
+                for c in range(channels):
+                    offset[:] = 0
+                    for q in range(filter_size):
+                        inside = True
+                        idx = 0
+                        for i in range(convdim):
+                            pos = start[i] + offset[i] * dilation[i]
+                            inside &= pos >= 0 and pos < imshp[i]
+                            idx += pos * strides[i]
+                        cols[b, p, c * filter_size + q] = (
+                            img[b, c, idx] if inside else 0
+                        )
+                        for i in range(convdim - 1, -1, -1):
+                            offset[i] += 1
+                            if offset[i] < kshp[i]:
+                                break
+                            offset[i] = 0
+        return cols
+
+    return im2col
+
+
+@numba_funcify.register(Col2Im)
+def numba_funcify_Col2Im(op, node, **kwargs):
+    convdim = op.convdim
+    subsample = np.array(op.subsample, dtype=np.int64)
+    dilation = np.array(op.filter_dilation, dtype=np.int64)
+    conv_geometry = numba_conv_geometry(op)
+
+    @numba_basic.numba_njit(boundscheck=False)
+    def col2im(cols, imshp, kshp):
+        batch, n_patches, size = cols.shape
+        pad_l, out_shp, strides, img_size = conv_geometry(imshp, kshp)
+        filter_size = np.prod(kshp)
+        if n_patches != np.prod(out_shp) or size % filter_size != 0:
+            raise ValueError(
+                "The patches don't match the shape of the images and filters"
+            )
+        channels = size // filter_size
+
+        img = np.zeros((batch, channels, img_size), dtype=cols.dtype)
+        start = np.empty(convdim, dtype=np.int64)
+        offset = np.empty(convdim, dtype=np.int64)
+        for b in range(batch):
+            for p in range(n_patches):
+                rem = p
+                for i in range(convdim - 1, -1, -1):
+                    start[i] = (rem % out_shp[i]) * subsample[i] - pad_l[i]
+                    rem //= out_shp[i]
+                for c in range(channels):
+                    offset[:] = 0
+                    for q in range(filter_size):
+                        inside = True
+                        idx = 0
+                        for i in range(convdim):
+                            pos = start[i] + offset[i] * dilation[i]
+                            inside &= pos >= 0 and pos < imshp[i]
+                            idx += pos * strides[i]
+                        if inside:
+                            img[b, c, idx] += cols[b, p, c * filter_size + q]
+                        for i in range(convdim - 1, -1, -1):
+                            offset[i] += 1
+                            if offset[i] < kshp[i]:
+                                break
+                            offset[i] = 0
+        return img.reshape(
+            (batch, channels) + numba_ndarray.to_fixed_tuple(imshp, convdim)
+        )
+
+    return col2im
@@ -132,6 +132,17 @@ if {res}[{idx}] > {arr}:
 """
 
 
+def vectorize_target(node: Apply) -> str:
+    """Return the target of the loops generated for `node`.
+
+    See ``config.numba__vectorize_target``.
+    """
+    return (
+        getattr(node.tag, "numba__vectorize_target", None)
+        or config.numba__vectorize_target
+    )
+
+
 def create_vectorize_func(
     scalar_op_fn: Callable,
     node: Apply,
@@ -151,13 +162,11 @@ def create_vectorize_func(
     else:
         signature = []
 
-    target = (
-        getattr(node.tag, "numba__vectorize_target", None)
-        or config.numba__vectorize_target
-    )
-
     numba_vectorized_fn = numba_basic.numba_vectorize(
-        signature, identity=identity, target=target, fastmath=config.numba__fastmath
+        signature,
+        identity=identity,
+        target=vectorize_target(node),
+        fastmath=config.numba__fastmath,
     )
 
     py_scalar_func = getattr(scalar_op_fn, "py_func", scalar_op_fn)
@@ -176,6 +185,7 @@ def create_axis_reducer(
     dtype: numba.types.Type,
     keepdims: bool = False,
     return_scalar=False,
+    parallel: bool = False,
 ) -> numba.core.dispatcher.Dispatcher:
     r"""Create Python function that performs a NumPy-like reduction on a given axis.
 
@@ -215,6 +225,10 @@ def create_axis_reducer(
         The data type of the result.
     keepdims:
         Determines whether or not the reduced dimension is retained.
+    parallel:
+        Determines whether or not the first axis of the result is split
+        across Numba's threads, when the input has at least
+        ``config.numba__parallel_minsize`` elements.
 
 
     Returns
@@ -225,6 +239,13 @@ def create_axis_reducer(
 
     axis = normalize_axis_index(axis, ndim)
 
+    # A reduction to a scalar has no result axis to split
+    parallel = parallel and ndim > 1
+    if parallel:
+        sequential_fn = numba_basic.numba_njit(
+            boundscheck=False, fastmath=config.numba__fastmath
+        )(create_axis_reducer(scalar_op, identity, axis, ndim, dtype, keepdims))
+
     reduce_elemwise_fn_name = "careduce_axis"
 
     identity = str(identity)
@@ -245,17 +266,20 @@ def create_axis_reducer(
         )
         global_env["res_shape_tuple_ctor"] = res_shape_tuple_ctor
 
-        res_indices = []
-        arr_indices = []
-        count = 0
+        if parallel:
+            # The first axis of the result is split across Numba's threads
+            res_indices = ["j"] + [f"idx_arr[{k}]" for k in range(ndim - 2)]
+            loops_src = """
+    for j in numba.prange(res_shape[0]):
+        for idx_arr in np.ndindex(res_shape[1:]):
+            for i in range(axis_shape):"""
+        else:
+            res_indices = [f"idx_arr[{k}]" for k in range(ndim - 1)]
+            loops_src = """
+    for idx_arr in np.ndindex(res_shape):
+        for i in range(axis_shape):"""
 
-        for i in range(ndim):
-            if i == axis:
-                arr_indices.append("i")
-            else:
-                res_indices.append(f"idx_arr[{count}]")
-                arr_indices.append(f"idx_arr[{count}]")
-                count = count + 1
+        arr_indices = res_indices[:axis] + ["i"] + res_indices[axis:]
 
         res_indices = ", ".join(res_indices)
         arr_indices = ", ".join(arr_indices)
@@ -263,7 +287,9 @@ def create_axis_reducer(
         inplace_update_statement = scalar_in_place_fn(
             scalar_op, res_indices, "res", f"x[{arr_indices}]"
         )
-        inplace_update_statement = indent(inplace_update_statement, " " * 4 * 3)
+        inplace_update_statement = indent(
+            inplace_update_statement, " " * 4 * (3 + parallel)
+        )
 
         return_expr = f"np.expand_dims(res, {axis})" if keepdims else "res"
         reduce_elemwise_def_src = f"""
@@ -274,9 +300,7 @@ def {reduce_elemwise_fn_name}(x):
     res = np.full(res_shape, numba_basic.to_scalar({identity}), dtype=out_dtype)
 
     axis_shape = x.shape[{axis}]
-
-    for idx_arr in np.ndindex(res_shape):
-        for i in range(axis_shape):
+{loops_src}
 {inplace_update_statement}
 
     return {return_expr}
@@ -305,6 +329,34 @@ def {reduce_elemwise_fn_name}(x):
         reduce_elemwise_def_src, reduce_elemwise_fn_name, {**globals(), **global_env}
     )
 
+    if parallel:
+        # Numba can't pickle the compiled `prange` loops of the functions
+        # that aren't backed by a source file, nor the functions calling
+        # them.  The functions returned in parallel mode mustn't be cached
+        # by Numba either.
+        parallel_fn = numba_basic.numba_njit(
+            parallel=True,
+            boundscheck=False,
+            fastmath=config.numba__fastmath,
+            cache=False,
+        )(reduce_elemwise_fn_py)
+        # Small inputs don't make up for the cost of starting the threads
+        reduce_elemwise_def_src = f"""
+def {reduce_elemwise_fn_name}(x):
+    if x.size >= parallel_minsize:
+        return parallel_fn(x)
+    return sequential_fn(x)
+        """
+        reduce_elemwise_fn_py = compile_function_src(
+            reduce_elemwise_def_src,
+            reduce_elemwise_fn_name,
+            {
+                "parallel_fn": parallel_fn,
+                "sequential_fn": sequential_fn,
+                "parallel_minsize": config.numba__parallel_minsize,
+            },
+        )
+
     return reduce_elemwise_fn_py
 
 
@@ -316,6 +368,7 @@ def create_multiaxis_reducer(
     dtype,
     input_name="input",
     return_scalar=False,
+    parallel=False,
 ):
     r"""Construct a function that reduces multiple axes.
 
@@ -348,6 +401,9 @@ def create_multiaxis_reducer(
         The data type of the result.
     return_scalar:
         If True, return a scalar, otherwise an array.
+    parallel:
+        If True, split the reduction of each axis across Numba's threads.
+        See :func:`create_axis_reducer`.
 
     Returns
     =======
@@ -355,7 +411,9 @@ def create_multiaxis_reducer(
 
     """
     if len(axes) == 1:
-        return create_axis_reducer(scalar_op, identity, axes[0], ndim, dtype)
+        return create_axis_reducer(
+            scalar_op, identity, axes[0], ndim, dtype, parallel=parallel
+        )
 
     axes = normalize_axis_tuple(axes, ndim)
 
@@ -367,9 +425,14 @@ def create_multiaxis_reducer(
 
     for i, axis in enumerate(to_reduce):
         careducer_axes_fn_name = f"careduce_axes_fn_{i}"
-        reducer_py_fn = create_axis_reducer(scalar_op, identity, axis, ndim, dtype)
+        reducer_py_fn = create_axis_reducer(
+            scalar_op, identity, axis, ndim, dtype, parallel=parallel
+        )
         reducer_fn = numba_basic.numba_njit(
-            boundscheck=False, fastmath=config.numba__fastmath
+            boundscheck=False,
+            fastmath=config.numba__fastmath,
+            # See `create_axis_reducer`
+            cache=config.numba__cache and not parallel,
         )(reducer_py_fn)
 
         global_env[careducer_axes_fn_name] = reducer_fn
@@ -598,7 +661,7 @@ def _vectorized(
             ctx.nrt.incref(
                 builder,
                 sig.return_type.types[inplace_idx],
-                outputs[inplace_idx]._get_value(),
+                outputs[inplace_idx]._getvalue(),
             )
         return ctx.make_tuple(
             builder, sig.return_type, [out._getvalue() for out in outputs]
@@ -621,6 +684,213 @@ def _vectorized(
     return sig, codegen
 
 
+def create_parallel_elemwise(
+    elemwise_fn: Callable,
+    scalar_op_fn: Callable,
+    input_bc_patterns: tuple[tuple[bool, ...], ...],
+    output_dtypes: tuple[str, ...],
+    inplace_pattern: tuple[tuple[int, int], ...],
+) -> numba.core.dispatcher.Dispatcher:
+    r"""Split an `Elemwise` along its first axis across Numba's threads.
+
+    The functions generated by this function take the following form:
+
+    .. code-block:: python
+
+        def elemwise(i0, i1):
+            s0 = i0.shape[0]
+            s1 = i0.shape[1]
+            if s0 * s1 >= parallel_minsize and i1.shape[0] == s0 and i1.shape[1] == 1:
+                return parallel_fn(i0, i1)
+            return sequential_fn(i0, i1)
+
+        def elemwise_parallel(i0, i1):
+            s0 = i0.shape[0]
+            s1 = i0.shape[1]
+            o0 = np.empty((s0, s1), dtype=out_dtype_0)
+            n_chunks = min(numba.get_num_threads(), s0)
+            for c in numba.prange(n_chunks):
+                start = c * s0 // n_chunks
+                stop = (c + 1) * s0 // n_chunks
+                elemwise_chunk(i0[start:stop], i1[start:stop], o0[start:stop])
+            return o0
+
+    The inputs whose shapes don't match, and the inputs smaller than
+    ``config.numba__parallel_minsize``, are handled by `elemwise_fn`.
+
+    Parameters
+    ==========
+    elemwise_fn:
+        The sequential implementation of the `Elemwise`.
+    scalar_op_fn:
+        The Numba implementation of the `Elemwise`'s scalar `Op`.
+    input_bc_patterns:
+        The broadcastable patterns of the inputs.
+    output_dtypes:
+        The dtypes of the outputs.
+    inplace_pattern:
+        The ``(output, input)`` pairs of the outputs computed in place.
+
+    Returns
+    =======
+    A :func:`numba.njit`-compiled function.
+
+    """
+    n_inputs = len(input_bc_patterns)
+    n_outputs = len(output_dtypes)
+    ndim = len(input_bc_patterns[0])
+    inplace_dict = dict(inplace_pattern)
+
+    # The outputs that aren't computed in place are allocated beforehand, and
+    # each chunk writes to them through extra inputs that `scalar_op_fn`
+    # ignores.  Every output of a chunk is then computed in place.
+    input_names = [f"i{j}" for j in range(n_inputs)]
+    new_output_names = [f"o{k}" for k in range(n_outputs) if k not in inplace_dict]
+    output_names = []
+    output_positions = []
+    for k in range(n_outputs):
+        if k in inplace_dict:
+            output_names.append(input_names[inplace_dict[k]])
+            output_positions.append(inplace_dict[k])
+        else:
+            output_names.append(f"o{k}")
+            output_positions.append(n_inputs + new_output_names.index(f"o{k}"))
+
+    scalar_chunk_src = f"""
+def scalar_chunk_fn({", ".join(input_names + new_output_names)}):
+    return scalar_op_fn({", ".join(input_names)})
+    """
+    scalar_chunk_fn = numba_basic.numba_njit(
+        compile_function_src(
+            scalar_chunk_src, "scalar_chunk_fn", {"scalar_op_fn": scalar_op_fn}
+        )
+    )
+
+    chunk_bc_patterns = input_bc_patterns + tuple(
+        (False,) * ndim for _ in new_output_names
+    )
+    output_bc_patterns = tuple((False,) * ndim for _ in output_dtypes)
+    chunk_inplace_pattern = tuple(enumerate(output_positions))
+
+    chunk_bc_patterns_enc = base64.encodebytes(pickle.dumps(chunk_bc_patterns)).decode()
+    output_bc_patterns_enc = base64.encodebytes(
+        pickle.dumps(output_bc_patterns)
+    ).decode()
+    output_dtypes_enc = base64.encodebytes(pickle.dumps(output_dtypes)).decode()
+    chunk_inplace_pattern_enc = base64.encodebytes(
+        pickle.dumps(chunk_inplace_pattern)
+    ).decode()
+
+    def elemwise_chunk_wrapper(*inputs):
+        return _vectorized(
+            scalar_chunk_fn,
+            chunk_bc_patterns_enc,
+            output_bc_patterns_enc,
+            output_dtypes_enc,
+            chunk_inplace_pattern_enc,
+            inputs,
+        )
+
+    # Pure python implementation, that will be used in tests
+    def elemwise_chunk(*inputs):
+        outputs = elemwise_fn(*inputs[:n_inputs])
+        if n_outputs == 1:
+            outputs = (outputs,)
+        for output, position in zip(outputs, output_positions):
+            inputs[position][...] = output
+
+    @overload(elemwise_chunk)
+    def ov_elemwise_chunk(*inputs):
+        return elemwise_chunk_wrapper
+
+    shape_lines = []
+    checks = []
+    for d in range(ndim):
+        length = None
+        for name, bc in zip(input_names, input_bc_patterns):
+            if bc[d]:
+                checks.append(f"{name}.shape[{d}] == 1")
+            elif length is None:
+                length = f"{name}.shape[{d}]"
+            else:
+                checks.append(f"{name}.shape[{d}] == s{d}")
+        shape_lines.append(f"s{d} = {length or 1}")
+    shape_src = indent("\n".join(shape_lines), " " * 4)
+    shape = f"({', '.join(f's{d}' for d in range(ndim))},)"
+    input_args = ", ".join(input_names)
+
+    alloc_src = indent(
+        "\n".join(
+            f"o{k} = np.empty({shape}, dtype=out_dtype_{k})"
+            for k in range(n_outputs)
+            if k not in inplace_dict
+        ),
+        " " * 4,
+    )
+    chunk_args = ", ".join(
+        [
+            name if bc[0] else f"{name}[start:stop]"
+            for name, bc in zip(input_names, input_bc_patterns)
+        ]
+        + [f"{name}[start:stop]" for name in new_output_names]
+    )
+    if n_outputs == 1:
+        return_expr = output_names[0]
+    else:
+        return_expr = f"({', '.join(output_names)},)"
+
+    parallel_src = f"""
+def elemwise_parallel({input_args}):
+{shape_src}
+{alloc_src}
+    n_chunks = min(numba.get_num_threads(), s0)
+    for c in numba.prange(n_chunks):
+        start = c * s0 // n_chunks
+        stop = (c + 1) * s0 // n_chunks
+        elemwise_chunk({chunk_args})
+    return {return_expr}
+    """
+    # See `create_axis_reducer` about `cache=False`
+    parallel_fn = numba_basic.numba_njit(parallel=True, cache=False)(
+        compile_function_src(
+            parallel_src,
+            "elemwise_parallel",
+            {
+                "np": np,
+                "numba": numba,
+                "elemwise_chunk": elemwise_chunk,
+                **{
+                    f"out_dtype_{k}": np.dtype(dtype)
+                    for k, dtype in enumerate(output_dtypes)
+                },
+            },
+        )
+    )
+
+    # Small inputs don't make up for the cost of starting the threads
+    size = " * ".join(f"s{d}" for d in range(ndim))
+    condition = " and ".join([f"{size} >= parallel_minsize"] + checks)
+    switch_src = f"""
+def elemwise({input_args}):
+{shape_src}
+    if {condition}:
+        return parallel_fn({input_args})
+    return sequential_fn({input_args})
+    """
+    return numba_basic.numba_njit(
+        compile_function_src(
+            switch_src,
+            "elemwise",
+            {
+                "parallel_fn": parallel_fn,
+                "sequential_fn": elemwise_fn,
+                "parallel_minsize": config.numba__parallel_minsize,
+            },
+        ),
+        cache=False,
+    )
+
+
 @numba_funcify.register(Elemwise)
 def numba_funcify_Elemwise(op, node, **kwargs):
     # Creating a new scalar node is more involved and unnecessary
@@ -701,6 +971,15 @@ def numba_funcify_Elemwise(op, node, **kwargs):
     def ov_elemwise(*inputs):
         return elemwise_wrapper
 
+    if (
+        vectorize_target(node) == "parallel"
+        and ndim > 0
+        and not all(bc[0] for bc in input_bc_patterns)
+    ):
+        return create_parallel_elemwise(
+            elemwise, scalar_op_fn, input_bc_patterns, output_dtypes, inplace_pattern
+        )
+
     return elemwise
 
 
@@ -766,6 +1045,7 @@ def numba_funcify_CAReduce(op, node, **kwargs):
 
     input_name = get_name_for_object(node.inputs[0])
     ndim = node.inputs[0].ndim
+    parallel = vectorize_target(node) == "parallel"
     careduce_py_fn = create_multiaxis_reducer(
         op.scalar_op,
         scalar_op_identity,
@@ -773,9 +1053,16 @@ def numba_funcify_CAReduce(op, node, **kwargs):
         ndim,
         np.dtype(node.outputs[0].type.dtype),
         input_name=input_name,
+        parallel=parallel,
     )
 
-    careduce_fn = jit_compile_reducer(node, careduce_py_fn, reduce_to_scalar=False)
+    careduce_fn = jit_compile_reducer(
+        node,
+        careduce_py_fn,
+        reduce_to_scalar=False,
+        # See `create_axis_reducer`
+        cache=config.numba__cache and not parallel,
+    )
     return careduce_fn
 
 
@@ -1,6 +1,8 @@
+from copy import copy
 from textwrap import dedent, indent
 from typing import Any, Callable, Optional
 
+import numba
 import numba.np.unsafe.ndarray as numba_ndarray
 import numpy as np
 from numba import _helperlib, types
@@ -12,14 +14,18 @@ import pytensor.tensor.random.basic as ptr
 from pytensor.graph.basic import Apply
 from pytensor.graph.op import Op
 from pytensor.link.numba.dispatch import basic as numba_basic
-from pytensor.link.numba.dispatch.basic import numba_funcify, numba_typify
+from pytensor.link.numba.dispatch.basic import (
+    generate_fallback_impl,
+    numba_funcify,
+    numba_typify,
+)
 from pytensor.link.utils import (
     compile_function_src,
     get_name_for_object,
     unique_name_generator,
 )
 from pytensor.tensor.basic import get_vector_length
-from pytensor.tensor.random.type import RandomStateType
+from pytensor.tensor.random.type import RandomGeneratorType, RandomStateType
 
 
 class RandomStateNumbaType(types.Type):
@@ -89,6 +95,115 @@ def numba_typify_RandomState(state, **kwargs):
     return state
 
 
+# Numba supports `Generator`s natively: their bit generators are used through
+# the ctypes interface, so their states are shared with Python and advanced in
+# place.
+generator_numba_type = numba.typeof(np.random.default_rng())
+
+# The `Generator` methods that Numba doesn't implement
+_unsupported_generator_methods = {
+    "binomial",
+    "choice",
+    "hypergeometric",
+    "multinomial",
+    "permutation",
+    "randint",
+    "vonmises",
+}
+
+
+def _uses_generator(node):
+    return isinstance(node.inputs[0].type, RandomGeneratorType)
+
+
+def numba_copy_rng(node):
+    """Create a function that copies the `Generator` of `node` when it isn't updated in place.
+
+    The copy is done in object mode, since Numba can't copy `Generator`s.
+    """
+    if node.op.inplace or not _uses_generator(node):
+
+        @numba_basic.numba_njit(inline="always")
+        def copy_rng(rng):
+            return rng
+
+    else:
+
+        @numba_basic.numba_njit
+        def copy_rng(rng):
+            with numba.objmode(new_rng=generator_numba_type):
+                new_rng = copy(rng)
+            return new_rng
+
+    return copy_rng
+
+
+def make_numba_generator_fn(node, scalar_fn):
+    """Create a Numba implementation of a scalar `RandomVariable` that uses a `Generator`.
+
+    `scalar_fn` is a jitted function that takes the `Generator` and scalar
+    parameters and returns a single draw.  It is called once for each element
+    of the output, with the broadcasted parameters.
+    """
+    tuple_size = int(get_vector_length(node.inputs[1]))
+
+    sized_fn_name = "sized_random_variable"
+    unique_names = unique_name_generator(
+        [
+            sized_fn_name,
+            "np",
+            "scalar_fn",
+            "copy_rng",
+            "to_fixed_tuple",
+            "tuple_size",
+            "out_dtype",
+            "rng",
+            "size",
+            "dtype",
+            "size_tpl",
+            "data",
+            "idx",
+        ],
+        suffix_sep="_",
+    )
+    param_names = [unique_names(i, force_unique=True) for i in node.inputs[3:]]
+    bcast_names = [f"{name}_bcast" for name in param_names]
+
+    if tuple_size > 0:
+        size_src = "size_tpl = to_fixed_tuple(size, tuple_size)"
+    else:
+        param_shapes = ", ".join(f"{name}.shape" for name in param_names)
+        size_src = f"size_tpl = np.broadcast_shapes({param_shapes})"
+    bcast_src = "\n".join(
+        f"{bcast_name} = np.broadcast_to({name}, size_tpl)"
+        for name, bcast_name in zip(param_names, bcast_names)
+    )
+    scalar_args = ", ".join(["rng"] + [f"{name}[idx]" for name in bcast_names])
+
+    sized_fn_src = dedent(
+        f"""
+def {sized_fn_name}({", ".join(["rng", "size", "dtype", *param_names])}):
+    rng = copy_rng(rng)
+    {size_src}
+{indent(bcast_src, " " * 4)}
+    data = np.empty(size_tpl, dtype=out_dtype)
+    for idx in np.ndindex(size_tpl):
+        data[idx] = scalar_fn({scalar_args})
+    return (rng, data)
+    """
+    )
+    global_env = {
+        "np": np,
+        "scalar_fn": scalar_fn,
+        "copy_rng": numba_copy_rng(node),
+        "to_fixed_tuple": numba_ndarray.to_fixed_tuple,
+        "tuple_size": tuple_size,
+        "out_dtype": node.outputs[1].type.numpy_dtype,
+    }
+    random_fn = compile_function_src(sized_fn_src, sized_fn_name, global_env)
+    return numba_basic.numba_njit(random_fn)
+
+
 def make_numba_random_fn(node, np_random_func):
     """Create Numba implementations for existing Numba-supported ``np.random`` functions.
 
@@ -196,8 +311,8 @@ def {sized_fn_name}({random_fn_input_names}):
 @numba_funcify.register(ptr.LogNormalRV)
 @numba_funcify.register(ptr.GammaRV)
 @numba_funcify.register(ptr.ParetoRV)
-@numba_funcify.register(ptr.GumbelRV)
 @numba_funcify.register(ptr.ExponentialRV)
+@numba_funcify.register(ptr.IntegersRV)
 @numba_funcify.register(ptr.WeibullRV)
 @numba_funcify.register(ptr.LogisticRV)
 @numba_funcify.register(ptr.VonMisesRV)
@@ -213,6 +328,16 @@ def {sized_fn_name}({random_fn_input_names}):
 @numba_funcify.register(ptr.PermutationRV)
 def numba_funcify_RandomVariable(op, node, **kwargs):
     name = op.name
+
+    if _uses_generator(node):
+        if op.ndim_supp > 0 or name in _unsupported_generator_methods:
+            return generate_fallback_impl(op, node, **kwargs)
+
+        def body_fn(rng, *params):
+            return f"    return {rng}.{name}({', '.join(params)})"
+
+        return create_numba_random_fn(op, node, body_fn)
+
     np_random_func = getattr(np.random, name)
 
     return make_numba_random_fn(node, np_random_func)
@@ -224,7 +349,11 @@ def create_numba_random_fn(
     scalar_fn: Callable[[str], str],
     global_env: Optional[dict[str, Any]] = None,
 ) -> Callable:
-    """Create a vectorized function from a callable that generates the ``str`` function body.
+    r"""Create a vectorized function from a callable that generates the ``str`` function body.
+
+    The first argument of `scalar_fn` is the name of the source of randomness,
+    i.e. ``np.random`` for `RandomState`\s or the `Generator` argument of the
+    function, and the rest are the names of the parameters.
 
     TODO: This could/should be generalized for other simple function
     construction cases that need unique-ified symbol names.
@@ -253,11 +382,25 @@ def create_numba_random_fn(
     )
 
     np_names = [unique_names(i, force_unique=True) for i in node.inputs[3:]]
+
+    if _uses_generator(node):
+        np_input_names = ", ".join(["rng", *np_names])
+        np_random_fn_src = f"""
+def {np_random_fn_name}({np_input_names}):
+{scalar_fn("rng", *np_names)}
+    """
+        np_random_fn = compile_function_src(
+            np_random_fn_src, np_random_fn_name, {**globals(), **np_global_env}
+        )
+        np_random_fn = numba_basic.numba_njit(inline="always")(np_random_fn)
+
+        return make_numba_generator_fn(node, np_random_fn)
+
     np_input_names = ", ".join(np_names)
     np_random_fn_src = f"""
 @numba_vectorize
 def {np_random_fn_name}({np_input_names}):
-{scalar_fn(*np_names)}
+{scalar_fn("np.random", *np_names)}
     """
     np_random_fn = compile_function_src(
         np_random_fn_src, np_random_fn_name, {**globals(), **np_global_env}
@@ -268,21 +411,45 @@ def {np_random_fn_name}({np_input_names}):
 
 @numba_funcify.register(ptr.NegBinomialRV)
 def numba_funcify_NegBinomialRV(op, node, **kwargs):
+    if _uses_generator(node):
+
+        def body_fn(rng, n, p):
+            return f"    return {rng}.negative_binomial({n}, {p})"
+
+        return create_numba_random_fn(op, node, body_fn)
+
     return make_numba_random_fn(node, np.random.negative_binomial)
 
 
+@numba_funcify.register(ptr.GumbelRV)
+def numba_funcify_GumbelRV(op, node, **kwargs):
+    if _uses_generator(node):
+        # This is NumPy's algorithm, which rejects the draws that are exactly 0
+        def body_fn(rng, loc, scale):
+            return f"""
+    while True:
+        u = 1.0 - {rng}.random()
+        if u < 1.0:
+            return {loc} - {scale} * np.log(-np.log(u))
+            """
+
+        return create_numba_random_fn(op, node, body_fn)
+
+    return make_numba_random_fn(node, np.random.gumbel)
+
+
 @numba_funcify.register(ptr.CauchyRV)
 def numba_funcify_CauchyRV(op, node, **kwargs):
-    def body_fn(loc, scale):
-        return f"    return ({loc} + np.random.standard_cauchy()) / {scale}"
+    def body_fn(rng, loc, scale):
+        return f"    return ({loc} + {rng}.standard_cauchy()) / {scale}"
 
     return create_numba_random_fn(op, node, body_fn)
 
 
 @numba_funcify.register(ptr.HalfNormalRV)
 def numba_funcify_HalfNormalRV(op, node, **kwargs):
-    def body_fn(a, b):
-        return f"    return {a} + {b} * abs(np.random.normal(0, 1))"
+    def body_fn(rng, a, b):
+        return f"    return {a} + {b} * abs({rng}.normal(0, 1))"
 
     return create_numba_random_fn(op, node, body_fn)
 
@@ -291,9 +458,9 @@ def numba_funcify_HalfNormalRV(op, node, **kwargs):
 def numba_funcify_BernoulliRV(op, node, **kwargs):
     out_dtype = node.outputs[1].type.numpy_dtype
 
-    def body_fn(a):
+    def body_fn(rng, a):
         return f"""
-    if {a} < np.random.uniform(0, 1):
+    if {a} < {rng}.uniform(0, 1):
         return direct_cast(0, out_dtype)
     else:
         return direct_cast(1, out_dtype)
@@ -307,14 +474,62 @@ def numba_funcify_BernoulliRV(op, node, **kwargs):
     )
 
 
+def numba_draw_uniform(node):
+    """Create functions that draw standard uniform samples from the `rng` input of `node`."""
+    if _uses_generator(node):
+
+        @numba_basic.numba_njit(inline="always")
+        def draw_uniform(rng):
+            return rng.uniform(0, 1)
+
+        @numba_basic.numba_njit(inline="always")
+        def draw_uniform_sized(rng, size):
+            return rng.uniform(0, 1, size)
+
+    else:
+
+        @numba_basic.numba_njit(inline="always")
+        def draw_uniform(rng):
+            return np.random.uniform(0, 1)
+
+        @numba_basic.numba_njit(inline="always")
+        def draw_uniform_sized(rng, size):
+            return np.random.uniform(0, 1, size)
+
+    return draw_uniform, draw_uniform_sized
+
+
+def numba_draw_dirichlet(node):
+    """Create a function that draws a Dirichlet vector from the `rng` input of `node`."""
+    if _uses_generator(node):
+        # This is NumPy's algorithm for concentrations that aren't all small
+        @numba_basic.numba_njit
+        def draw_dirichlet(rng, alphas):
+            samples = np.empty(alphas.shape, dtype=np.float64)
+            for i in range(alphas.shape[0]):
+                samples[i] = rng.standard_gamma(alphas[i])
+            return samples / samples.sum()
+
+    else:
+
+        @numba_basic.numba_njit(inline="always")
+        def draw_dirichlet(rng, alphas):
+            return np.random.dirichlet(alphas)
+
+    return draw_dirichlet
+
+
 @numba_funcify.register(ptr.CategoricalRV)
 def numba_funcify_CategoricalRV(op, node, **kwargs):
     out_dtype = node.outputs[1].type.numpy_dtype
     size_len = int(get_vector_length(node.inputs[1]))
     p_ndim = node.inputs[-1].ndim
+    copy_rng = numba_copy_rng(node)
+    draw_uniform, draw_uniform_sized = numba_draw_uniform(node)
 
     @numba_basic.numba_njit
     def categorical_rv(rng, size, dtype, p):
+        rng = copy_rng(rng)
         if not size_len:
             size_tpl = p.shape[:-1]
         else:
@@ -323,9 +538,9 @@ def numba_funcify_CategoricalRV(op, node, **kwargs):
 
         # Workaround https://github.com/numba/numba/issues/8975
         if not size_len and p_ndim == 1:
-            unif_samples = np.asarray(np.random.uniform(0, 1))
+            unif_samples = np.asarray(draw_uniform(rng))
         else:
-            unif_samples = np.random.uniform(0, 1, size_tpl)
+            unif_samples = draw_uniform_sized(rng, size_tpl)
 
         res = np.empty(size_tpl, dtype=out_dtype)
         for idx in np.ndindex(*size_tpl):
@@ -343,10 +558,13 @@ def numba_funcify_DirichletRV(op, node, **kwargs):
     neg_ind_shape_len = -alphas_ndim + 1
     size_len = int(get_vector_length(node.inputs[1]))
 
-    if alphas_ndim > 1:
+    if alphas_ndim > 1 or _uses_generator(node):
+        copy_rng = numba_copy_rng(node)
+        draw_dirichlet = numba_draw_dirichlet(node)
 
         @numba_basic.numba_njit
         def dirichlet_rv(rng, size, dtype, alphas):
+            rng = copy_rng(rng)
             if size_len > 0:
                 size_tpl = numba_ndarray.to_fixed_tuple(size, size_len)
                 if (
@@ -362,7 +580,7 @@ def numba_funcify_DirichletRV(op, node, **kwargs):
             alphas_bcast = np.broadcast_to(alphas, samples_shape)
 
             for index in np.ndindex(*samples_shape[:-1]):
-                res[index] = np.random.dirichlet(alphas_bcast[index])
+                res[index] = draw_dirichlet(rng, alphas_bcast[index])
 
             return (rng, res)
 
@@ -204,3 +204,46 @@ def overload_sparse_copy(inst):
         )
 
     return copy
+
+
+def _sparse_constructor(matrix_type):
+    """Create a function that builds a sparse matrix from its data, indices, indptr and shape.
+
+    The function works in both Python and Numba's nopython mode, where it
+    doesn't copy any of the arrays.
+    """
+
+    def construct(data, indices, indptr, shape):
+        return matrix_type.instance_class(data, indices, indptr, shape)
+
+    @intrinsic
+    def _construct(typingctx, data, indices, indptr, shape):
+        typ = matrix_type(data.dtype)
+
+        def codegen(context, builder, sig, args):
+            struct = cgutils.create_struct_proxy(sig.return_type)(context, builder)
+            struct.data, struct.indices, struct.indptr, struct.shape = args
+            return impl_ret_borrowed(
+                context,
+                builder,
+                sig.return_type,
+                struct._getvalue(),
+            )
+
+        sig = typ(typ.data, typ.indices, typ.indptr, typ.shape)
+
+        return sig, codegen
+
+    @overload(construct)
+    def overload_construct(data, indices, indptr, shape):
+        def impl(data, indices, indptr, shape):
+            return _construct(data, indices, indptr, shape)
+
+        return impl
+
+    construct.__name__ = f"{matrix_type.name}_from_parts"
+    return construct
+
+
+csr_matrix_from_parts = _sparse_constructor(CSRMatrixType)
+csc_matrix_from_parts = _sparse_constructor(CSCMatrixType)
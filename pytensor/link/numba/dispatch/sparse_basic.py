@@ -0,0 +1,520 @@
+"""Numba implementations of the `Op`\\s in :mod:`pytensor.sparse.basic`.
+
+The Numba types of the sparse matrices are defined in
+:mod:`pytensor.link.numba.dispatch.sparse`.  Only the ``csr`` and ``csc``
+formats are supported; every loop below walks the compressed (major) axis of
+the matrices, i.e. the rows of a ``csr`` matrix and the columns of a ``csc``
+one.
+"""
+
+import numpy as np
+
+from pytensor.link.numba.dispatch import basic as numba_basic
+from pytensor.link.numba.dispatch.basic import generate_fallback_impl, numba_funcify
+from pytensor.link.numba.dispatch.sparse import (
+    csc_matrix_from_parts,
+    csr_matrix_from_parts,
+)
+from pytensor.sparse.basic import (
+    CSM,
+    AddSD,
+    AddSS,
+    CSMProperties,
+    DenseFromSparse,
+    Dot,
+    MulSD,
+    MulSS,
+    MulSV,
+    Neg,
+    SparseFromDense,
+    SpSum,
+    StructuredAddSV,
+    StructuredDot,
+    StructuredDotGradCSC,
+    StructuredDotGradCSR,
+    Transpose,
+    Usmm,
+)
+from pytensor.sparse.type import SparseTensorType
+
+
+_matrix_from_parts = {"csr": csr_matrix_from_parts, "csc": csc_matrix_from_parts}
+
+
+def _is_sparse(var):
+    return isinstance(var.type, SparseTensorType)
+
+
+def numba_sparse_dense_dot(format: str):
+    """Create a function that adds the product of a sparse and a dense matrix to `out`."""
+    is_csr = format == "csr"
+
+    @numba_basic.numba_njit
+    def sparse_dense_dot(x, y, out):
+        for i in range(len(x.indptr) - 1):
+            for k in range(x.indptr[i], x.indptr[i + 1]):
+                if is_csr:
+                    row, col = i, x.indices[k]
+                else:
+                    row, col = x.indices[k], i
+                val = x.data[k]
+                for n in range(y.shape[1]):
+                    out[row, n] += val * y[col, n]
+        return out
+
+    return sparse_dense_dot
+
+
+def numba_dense_sparse_dot(format: str):
+    """Create a function that adds the product of a dense and a sparse matrix to `out`."""
+    is_csr = format == "csr"
+
+    @numba_basic.numba_njit
+    def dense_sparse_dot(x, y, out):
+        for i in range(len(y.indptr) - 1):
+            for k in range(y.indptr[i], y.indptr[i + 1]):
+                if is_csr:
+                    row, col = i, y.indices[k]
+                else:
+                    row, col = y.indices[k], i
+                val = y.data[k]
+                for m in range(x.shape[0]):
+                    out[m, col] += x[m, row] * val
+        return out
+
+    return dense_sparse_dot
+
+
+def numba_sparse_product(node, sparse_idx: int = 0):
+    """Create a function that computes the dense product of the two matrix inputs of `node`.
+
+    Vectors are handled as single row or column matrices, and the result is
+    reshaped to the dimensions of the output of `node`.
+    """
+    x, y = node.inputs[sparse_idx : sparse_idx + 2]
+    out_dtype = node.outputs[0].type.numpy_dtype
+    x_ndim, y_ndim = x.type.ndim, y.type.ndim
+    if _is_sparse(x):
+        dot = numba_sparse_dense_dot(x.type.format)
+    else:
+        dot = numba_dense_sparse_dot(y.type.format)
+
+    @numba_basic.numba_njit
+    def sparse_product(x, y):
+        if x_ndim == 1:
+            x = np.ascontiguousarray(x).reshape((1, x.shape[0]))
+        if y_ndim == 1:
+            y = np.ascontiguousarray(y).reshape((y.shape[0], 1))
+        if x.shape[1] != y.shape[0]:
+            raise ValueError("Shape mismatch in the sparse dot product")
+        out = dot(x, y, np.zeros((x.shape[0], y.shape[1]), dtype=out_dtype))
+        if x_ndim == 1 and y_ndim == 1:
+            return np.asarray(out[0, 0])
+        if x_ndim == 1:
+            return out[0]
+        if y_ndim == 1:
+            return out[:, 0]
+        return out
+
+    return sparse_product
+
+
+def numba_sparse_elemwise(format: str, out_dtype: np.dtype, intersect: bool):
+    """Create a function that adds or multiplies two sparse matrices of the same format.
+
+    The sum of the matrices is computed when `intersect` is ``False`` and their
+    element-wise product otherwise.  Like SciPy, the result has sorted indices
+    and no explicit zeros.
+    """
+    from_parts = _matrix_from_parts[format]
+    major_axis = 0 if format == "csr" else 1
+
+    @numba_basic.numba_njit
+    def sparse_elemwise(x, y):
+        if x.shape != y.shape:
+            raise ValueError("The sparse matrices must have the same shape")
+        n_major = x.shape[major_axis]
+        n_minor = x.shape[1 - major_axis]
+        max_nnz = x.indptr[n_major] + y.indptr[n_major]
+        data = np.empty(max_nnz, dtype=out_dtype)
+        indices = np.empty(max_nnz, dtype=np.int32)
+        indptr = np.zeros(n_major + 1, dtype=np.int32)
+
+        # Dense accumulators for the current row (or column), along with the
+        # last major index at which each of their entries was set
+        x_acc = np.zeros(n_minor, dtype=out_dtype)
+        y_acc = np.zeros(n_minor, dtype=out_dtype)
+        x_mark = np.full(n_minor, -1, dtype=np.int64)
+        y_mark = np.full(n_minor, -1, dtype=np.int64)
+
+        nnz = 0
+        for i in range(n_major):
+            start = nnz
+            for k in range(x.indptr[i], x.indptr[i + 1]):
+                j = x.indices[k]
+                if x_mark[j] != i:
+                    x_mark[j] = i
+                    x_acc[j] = 0
+                    indices[nnz] = j
+                    nnz += 1
+                x_acc[j] += x.data[k]
+            for k in range(y.indptr[i], y.indptr[i + 1]):
+                j = y.indices[k]
+                if y_mark[j] != i:
+                    y_mark[j] = i
+                    y_acc[j] = 0
+                    if x_mark[j] != i:
+                        indices[nnz] = j
+                        nnz += 1
+                y_acc[j] += y.data[k]
+
+            minor_idxs = np.sort(indices[start:nnz])
+            nnz = start
+            for j in minor_idxs:
+                in_x = x_mark[j] == i
+                in_y = y_mark[j] == i
+                if intersect:
+                    if not (in_x and in_y):
+                        continue
+                    val = x_acc[j] * y_acc[j]
+                else:
+                    val = x_acc[j] if in_x else 0
+                    if in_y:
+                        val += y_acc[j]
+                if val != 0:
+                    indices[nnz] = j
+                    data[nnz] = val
+                    nnz += 1
+            indptr[i + 1] = nnz
+
+        return from_parts(data[:nnz].copy(), indices[:nnz].copy(), indptr, x.shape)
+
+    return sparse_elemwise
+
+
+def numba_sparse_data_map(format: str, out_dtype: np.dtype, map_fn):
+    """Create a function that computes new data for the stored entries of a sparse matrix.
+
+    `map_fn` is called with each stored value, its row and its column, along
+    with the second input of the function.  The result shares the structure of
+    the sparse matrix.
+    """
+    from_parts = _matrix_from_parts[format]
+    is_csr = format == "csr"
+    map_fn = numba_basic.numba_njit(inline="always")(map_fn)
+
+    @numba_basic.numba_njit
+    def sparse_data_map(x, y):
+        data = np.empty(len(x.data), dtype=out_dtype)
+        for i in range(len(x.indptr) - 1):
+            for k in range(x.indptr[i], x.indptr[i + 1]):
+                if is_csr:
+                    row, col = i, x.indices[k]
+                else:
+                    row, col = x.indices[k], i
+                data[k] = map_fn(x.data[k], row, col, y)
+        return from_parts(data, x.indices.copy(), x.indptr.copy(), x.shape)
+
+    return sparse_data_map
+
+
+@numba_funcify.register(CSMProperties)
+def numba_funcify_CSMProperties(op, **kwargs):
+    @numba_basic.numba_njit
+    def csm_properties(x):
+        return (
+            x.data,
+            x.indices,
+            x.indptr,
+            np.asarray(x.shape, dtype=np.int32),
+        )
+
+    return csm_properties
+
+
+@numba_funcify.register(CSM)
+def numba_funcify_CSM(op, **kwargs):
+    from_parts = _matrix_from_parts[op.format]
+
+    @numba_basic.numba_njit
+    def csm(data, indices, indptr, shape):
+        if len(shape) != 2:
+            raise ValueError("Shape should be an array of length 2")
+        if data.shape != indices.shape:
+            raise ValueError("Data must have the same number of elements as indices")
+        return from_parts(
+            data,
+            indices.astype(np.int32),
+            indptr.astype(np.int32),
+            (np.int64(shape[0]), np.int64(shape[1])),
+        )
+
+    return csm
+
+
+@numba_funcify.register(Transpose)
+def numba_funcify_Transpose(op, node, **kwargs):
+    from_parts = _matrix_from_parts[node.outputs[0].type.format]
+
+    @numba_basic.numba_njit
+    def transpose(x):
+        return from_parts(x.data, x.indices, x.indptr, (x.shape[1], x.shape[0]))
+
+    return transpose
+
+
+@numba_funcify.register(Neg)
+def numba_funcify_Neg(op, node, **kwargs):
+    from_parts = _matrix_from_parts[node.outputs[0].type.format]
+
+    @numba_basic.numba_njit
+    def neg(x):
+        return from_parts(-x.data, x.indices.copy(), x.indptr.copy(), x.shape)
+
+    return neg
+
+
+@numba_funcify.register(DenseFromSparse)
+def numba_funcify_DenseFromSparse(op, node, **kwargs):
+    is_csr = node.inputs[0].type.format == "csr"
+    out_dtype = node.outputs[0].type.numpy_dtype
+
+    @numba_basic.numba_njit
+    def dense_from_sparse(x):
+        out = np.zeros(x.shape, dtype=out_dtype)
+        for i in range(len(x.indptr) - 1):
+            for k in range(x.indptr[i], x.indptr[i + 1]):
+                if is_csr:
+                    out[i, x.indices[k]] += x.data[k]
+                else:
+                    out[x.indices[k], i] += x.data[k]
+        return out
+
+    return dense_from_sparse
+
+
+@numba_funcify.register(SparseFromDense)
+def numba_funcify_SparseFromDense(op, node, **kwargs):
+    from_parts = _matrix_from_parts[op.format]
+    is_csr = op.format == "csr"
+    out_dtype = node.outputs[0].type.numpy_dtype
+
+    @numba_basic.numba_njit
+    def sparse_from_dense(x):
+        if is_csr:
+            x_major = x
+        else:
+            x_major = x.T
+        n_major, n_minor = x_major.shape
+        nnz = 0
+        for i in range(n_major):
+            for j in range(n_minor):
+                if x_major[i, j] != 0:
+                    nnz += 1
+
+        data = np.empty(nnz, dtype=out_dtype)
+        indices = np.empty(nnz, dtype=np.int32)
+        indptr = np.zeros(n_major + 1, dtype=np.int32)
+        nnz = 0
+        for i in range(n_major):
+            for j in range(n_minor):
+                if x_major[i, j] != 0:
+                    data[nnz] = x_major[i, j]
+                    indices[nnz] = j
+                    nnz += 1
+            indptr[i + 1] = nnz
+        return from_parts(data, indices, indptr, (x.shape[0], x.shape[1]))
+
+    return sparse_from_dense
+
+
+@numba_funcify.register(SpSum)
+def numba_funcify_SpSum(op, node, **kwargs):
+    axis = op.axis
+    is_csr = node.inputs[0].type.format == "csr"
+    out_dtype = node.outputs[0].type.numpy_dtype
+
+    if axis is None:
+
+        @numba_basic.numba_njit
+        def sp_sum(x):
+            return np.asarray(x.data.sum()).astype(out_dtype)
+
+        return sp_sum
+
+    @numba_basic.numba_njit
+    def sp_sum(x):
+        out = np.zeros(x.shape[1 - axis], dtype=out_dtype)
+        for i in range(len(x.indptr) - 1):
+            for k in range(x.indptr[i], x.indptr[i + 1]):
+                if is_csr:
+                    row, col = i, x.indices[k]
+                else:
+                    row, col = x.indices[k], i
+                if axis == 0:
+                    out[col] += x.data[k]
+                else:
+                    out[row] += x.data[k]
+        return out
+
+    return sp_sum
+
+
+@numba_funcify.register(AddSS)
+@numba_funcify.register(MulSS)
+def numba_funcify_AddSS_MulSS(op, node, **kwargs):
+    x, y = node.inputs
+    if x.type.format != y.type.format:
+        return generate_fallback_impl(op, node, **kwargs)
+
+    return numba_sparse_elemwise(
+        x.type.format,
+        node.outputs[0].type.numpy_dtype,
+        intersect=isinstance(op, MulSS),
+    )
+
+
+@numba_funcify.register(AddSD)
+def numba_funcify_AddSD(op, node, **kwargs):
+    is_csr = node.inputs[0].type.format == "csr"
+    out_dtype = node.outputs[0].type.numpy_dtype
+
+    @numba_basic.numba_njit
+    def add_s_d(x, y):
+        if x.shape != y.shape:
+            raise ValueError("The matrices must have the same shape")
+        out = y.astype(out_dtype)
+        for i in range(len(x.indptr) - 1):
+            for k in range(x.indptr[i], x.indptr[i + 1]):
+                if is_csr:
+                    out[i, x.indices[k]] += x.data[k]
+                else:
+                    out[x.indices[k], i] += x.data[k]
+        return out
+
+    return add_s_d
+
+
+@numba_funcify.register(MulSD)
+def numba_funcify_MulSD(op, node, **kwargs):
+    x, y = node.inputs
+    format = x.type.format
+    out_dtype = node.outputs[0].type.numpy_dtype
+    from_parts = _matrix_from_parts[format]
+
+    if y.type.ndim == 0:
+
+        @numba_basic.numba_njit
+        def mul_s_d(x, y):
+            data = (x.data * numba_basic.to_scalar(y)).astype(out_dtype)
+            return from_parts(data, x.indices.copy(), x.indptr.copy(), x.shape)
+
+        return mul_s_d
+
+    def mul_entry(val, row, col, y):
+        return val * y[row, col]
+
+    sparse_data_map = numba_sparse_data_map(format, out_dtype, mul_entry)
+
+    @numba_basic.numba_njit
+    def mul_s_d(x, y):
+        if x.shape != y.shape:
+            raise ValueError("The matrices must have the same shape")
+        return sparse_data_map(x, y)
+
+    return mul_s_d
+
+
+def _check_sparse_vector_shapes(x, y):
+    if x.shape[1] != y.shape[0]:
+        raise ValueError("The vector must have as many elements as the matrix columns")
+
+
+@numba_funcify.register(MulSV)
+def numba_funcify_MulSV(op, node, **kwargs):
+    def mul_entry(val, row, col, y):
+        return val * y[col]
+
+    sparse_data_map = numba_sparse_data_map(
+        node.inputs[0].type.format, node.outputs[0].type.numpy_dtype, mul_entry
+    )
+    check_shapes = numba_basic.numba_njit(_check_sparse_vector_shapes)
+
+    @numba_basic.numba_njit
+    def mul_s_v(x, y):
+        check_shapes(x, y)
+        return sparse_data_map(x, y)
+
+    return mul_s_v
+
+
+@numba_funcify.register(StructuredAddSV)
+def numba_funcify_StructuredAddSV(op, node, **kwargs):
+    def add_entry(val, row, col, y):
+        return val + y[col]
+
+    sparse_data_map = numba_sparse_data_map(
+        node.inputs[0].type.format, node.outputs[0].type.numpy_dtype, add_entry
+    )
+    check_shapes = numba_basic.numba_njit(_check_sparse_vector_shapes)
+
+    @numba_basic.numba_njit
+    def structured_add_s_v(x, y):
+        check_shapes(x, y)
+        return sparse_data_map(x, y)
+
+    return structured_add_s_v
+
+
+@numba_funcify.register(StructuredDot)
+@numba_funcify.register(Dot)
+def numba_funcify_Dot(op, node, **kwargs):
+    x, y = node.inputs
+    if (_is_sparse(x) and _is_sparse(y)) or _is_sparse(node.outputs[0]):
+        return generate_fallback_impl(op, node, **kwargs)
+
+    return numba_sparse_product(node)
+
+
+@numba_funcify.register(Usmm)
+def numba_funcify_Usmm(op, node, **kwargs):
+    alpha, x, y, z = node.inputs
+    if _is_sparse(x) and _is_sparse(y):
+        return generate_fallback_impl(op, node, **kwargs)
+
+    sparse_product = numba_sparse_product(node, sparse_idx=1)
+    out_dtype = node.outputs[0].type.numpy_dtype
+
+    @numba_basic.numba_njit
+    def usmm(alpha, x, y, z):
+        out = sparse_product(x, y) * numba_basic.to_scalar(alpha) + z
+        return out.astype(out_dtype)
+
+    return usmm
+
+
+@numba_funcify.register(StructuredDotGradCSC)
+@numba_funcify.register(StructuredDotGradCSR)
+def numba_funcify_StructuredDotGrad(op, node, **kwargs):
+    if any(_is_sparse(inp) for inp in node.inputs[2:]):
+        return generate_fallback_impl(op, node, **kwargs)
+
+    is_csr = isinstance(op, StructuredDotGradCSR)
+    out_dtype = node.outputs[0].type.numpy_dtype
+
+    @numba_basic.numba_njit
+    def structured_dot_grad(a_indices, a_indptr, b, g_ab):
+        g_a_data = np.zeros(len(a_indices), dtype=out_dtype)
+        for i in range(len(a_indptr) - 1):
+            for k in range(a_indptr[i], a_indptr[i + 1]):
+                if is_csr:
+                    row, col = i, a_indices[k]
+                else:
+                    row, col = a_indices[k], i
+                acc = g_a_data[k]
+                for n in range(b.shape[1]):
+                    acc += g_ab[row, n] * b[col, n]
+                g_a_data[k] = acc
+        return g_a_data
+
+    return structured_dot_grad
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Any
 import numpy as np
 
 import pytensor
+from pytensor.configdefaults import config
 from pytensor.link.basic import JITLinker
 
 
@@ -27,9 +28,14 @@ class NumbaLinker(JITLinker):
         return numba_funcify(fgraph, **kwargs)
 
     def jit_compile(self, fn):
+        from pytensor.link.numba.cache import enable_compiledir_caching
         from pytensor.link.numba.dispatch.basic import numba_njit
 
-        jitted_fn = numba_njit(fn)
+        # The generated function isn't backed by a stable source file, so
+        # Numba's own caching is replaced by one keyed on its contents
+        jitted_fn = numba_njit(fn, cache=False)
+        if config.numba__cache:
+            enable_compiledir_caching(jitted_fn)
         return jitted_fn
 
     def create_thunk_inputs(self, storage_map):
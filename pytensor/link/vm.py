@@ -9,16 +9,23 @@ import platform
 import sys
 import time
 import warnings
+import weakref
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from itertools import zip_longest
+from queue import SimpleQueue
 from typing import TYPE_CHECKING, Any, DefaultDict, Optional
 
+import numpy as np
+
 from pytensor.configdefaults import config
-from pytensor.graph.basic import Apply, Constant, Variable
+from pytensor.graph.basic import Apply, Constant, Variable, applys_between
+from pytensor.graph.op import HasInnerGraph
 from pytensor.link.basic import Container, LocalLinker
 from pytensor.link.c.exceptions import MissingGXX
+from pytensor.link.c.op import precompile_c_thunks
 from pytensor.link.utils import (
     gc_helper,
     get_destroy_dependencies,
@@ -267,6 +274,11 @@ class VM(ABC):
         if hasattr(self, "dependencies"):
             profile.dependencies = self.dependencies
 
+        if hasattr(self, "memory_plan_size"):
+            profile.memory_plan_nb_vars = self.memory_plan_nb_vars
+            profile.memory_plan_size = self.memory_plan_size
+            profile.memory_plan_unplanned_size = self.memory_plan_unplanned_size
+
         # clear the timer info out of the buffers
         for i in range(len(self.call_times)):
             self.call_times[i] = 0.0
@@ -314,6 +326,26 @@ class UpdatingVM(VM):
             for inp, inp_storage in zip(self.fgraph.inputs, self.input_storage)
             if inp in update_vars
         )
+        self._subset_nodes: dict[tuple[int, ...], list[bool]] = {}
+
+    def subset_nodes(self, output_subset: Sequence[int]) -> list[bool]:
+        """Return which of `nodes` are needed to compute the outputs in `output_subset`.
+
+        The outputs used to update the inputs are always computed.
+        """
+        key = tuple(output_subset)
+        needed = self._subset_nodes.get(key)
+        if needed is None:
+            out_idxs = set(output_subset)
+            out_idxs.update(out_idx for _, out_idx in self.inp_storage_and_out_idx)
+            needed_nodes = set(
+                applys_between(
+                    self.fgraph.inputs, [self.fgraph.outputs[i] for i in out_idxs]
+                )
+            )
+            needed = [node in needed_nodes for node in self.nodes]
+            self._subset_nodes[key] = needed
+        return needed
 
     def perform_updates(self) -> list[Any]:
         """Perform the output-to-input updates and return the output values."""
@@ -412,6 +444,404 @@ class Loop(UpdatingVM):
         return self.perform_updates()
 
 
+class PlannedLoop(Loop):
+    """A `Loop` that evaluates the intermediate results in a preallocated arena.
+
+    The first call records the shapes and dtypes of the intermediate results.
+    From them, the liveness interval of each result is used to assign it an
+    offset in a single buffer, so that results that are never alive at the
+    same time share the same memory. On later calls, the storage cell of each
+    planned result is filled with its view of the arena before its node is
+    evaluated, and the `Op`s that reuse preallocated outputs (e.g. most C
+    implementations) write into it instead of allocating a new array.
+
+    Only the outputs of nodes with a C implementation are planned, and never
+    the outputs of the graph or anything they may alias. The plan is rebuilt
+    whenever the shapes of the inputs change.
+    """
+
+    alignment = 64
+
+    def __init__(
+        self,
+        fgraph,
+        nodes,
+        thunks,
+        pre_call_clear,
+        storage_map,
+        input_storage,
+        output_storage,
+        update_vars,
+        post_thunk_clear=None,
+    ):
+        super().__init__(
+            fgraph,
+            nodes,
+            thunks,
+            pre_call_clear,
+            storage_map,
+            input_storage,
+            output_storage,
+            update_vars,
+            post_thunk_clear,
+        )
+
+        # The variables each variable may alias through the `view_map`s and
+        # `destroy_map`s, and the index of the last node that reads any of
+        # their aliases
+        roots: dict[Variable, set[Variable]] = {}
+        self.last_use: dict[Variable, int] = {}
+        self.def_idx: dict[Variable, int] = {}
+        for i, node in enumerate(nodes):
+            self.def_idx.update(dict.fromkeys(node.outputs, i))
+            for inp in node.inputs:
+                for root in roots.get(inp, (inp,)):
+                    self.last_use[root] = i
+            aliased = {
+                **getattr(node.op, "view_map", {}),
+                **getattr(node.op, "destroy_map", {}),
+            }
+            for o, i_idxs in aliased.items():
+                roots[node.outputs[o]] = set().union(
+                    *(roots.get(node.inputs[j], {node.inputs[j]}) for j in i_idxs)
+                )
+
+        unplannable = set(fgraph.outputs)
+        for out in fgraph.outputs:
+            unplannable.update(roots.get(out, ()))
+
+        self.node_plan_vars: list[list[Variable]] = [
+            [out for out in node.outputs if out not in roots and out not in unplannable]
+            if hasattr(thunk, "cthunk")
+            else []
+            for node, thunk in zip(nodes, thunks)
+        ]
+        self.plan_input_shapes: Optional[list] = None
+        self.prefill: list[list[tuple["StorageCellType", np.ndarray]]] = [
+            [] for _ in nodes
+        ]
+        self.arena: Optional[np.ndarray] = None
+        self.memory_plan_nb_vars = 0
+        self.memory_plan_size = 0
+        self.memory_plan_unplanned_size = 0
+
+    def plan_memory(self, var_shapes: dict[Variable, tuple[tuple, np.dtype]]):
+        """Assign an offset in the arena to each of the recorded variables.
+
+        The variables are placed from the largest to the smallest, at the
+        lowest offset that doesn't overlap with the variables already placed
+        whose liveness intervals intersect theirs.
+        """
+        intervals = {}
+        nbytes = {}
+        sizes = {}
+        for var, (shape, dtype) in var_shapes.items():
+            def_idx = self.def_idx[var]
+            intervals[var] = (def_idx, self.last_use.get(var, def_idx))
+            nbytes[var] = dtype.itemsize * int(np.prod(shape))
+            sizes[var] = -(-nbytes[var] // self.alignment) * self.alignment
+
+        offsets: dict[Variable, int] = {}
+        for var in sorted(sizes, key=sizes.get, reverse=True):
+            start, end = intervals[var]
+            live = [
+                other
+                for other in offsets
+                if intervals[other][0] <= end and start <= intervals[other][1]
+            ]
+            offset = 0
+            for other in sorted(live, key=offsets.get):
+                if offsets[other] - offset >= sizes[var]:
+                    break
+                offset = max(offset, offsets[other] + sizes[other])
+            offsets[var] = offset
+
+        size = max((offsets[var] + sizes[var] for var in offsets), default=0)
+        self.arena = np.empty(size, dtype=np.uint8)
+        self.prefill = [[] for _ in self.nodes]
+        for var, offset in offsets.items():
+            shape, dtype = var_shapes[var]
+            buffer = self.arena[offset : offset + nbytes[var]].view(dtype)
+            self.prefill[self.def_idx[var]].append(
+                (self.storage_map[var], buffer.reshape(shape))
+            )
+
+        self.memory_plan_nb_vars = len(offsets)
+        self.memory_plan_size = size
+        self.memory_plan_unplanned_size = sum(sizes.values())
+
+    def __call__(self, output_subset=None):
+        input_shapes = [getattr(cell[0], "shape", None) for cell in self.input_storage]
+        record = input_shapes != self.plan_input_shapes
+        if output_subset is None:
+            needed = None
+            if record:
+                self.plan_input_shapes = input_shapes
+                self.prefill = [[] for _ in self.nodes]
+                self.arena = None
+            node_prefills = self.prefill
+        else:
+            needed = self.subset_nodes(output_subset)
+            if record:
+                # A partial evaluation doesn't see the shapes of all the
+                # planned results, so the plan is neither used nor rebuilt
+                record = False
+                node_prefills = [[] for _ in self.nodes]
+            else:
+                node_prefills = self.prefill
+        var_shapes = {}
+
+        for cont in self.pre_call_clear:
+            cont[0] = None
+        try:
+            for i, (thunk, node, prefill, old_storage) in enumerate(
+                zip_longest(
+                    self.thunks,
+                    self.nodes,
+                    node_prefills,
+                    self.post_thunk_clear,
+                    fillvalue=(),
+                )
+            ):
+                if needed is not None and not needed[i]:
+                    for old_s in old_storage:
+                        old_s[0] = None
+                    continue
+                for cell, buffer in prefill:
+                    cell[0] = buffer
+                if self.time_thunks:
+                    t0 = time.perf_counter()
+                    thunk()
+                    t1 = time.perf_counter()
+                    self.call_counts[i] += 1
+                    self.call_times[i] += t1 - t0
+                else:
+                    thunk()
+                if record:
+                    for var in self.node_plan_vars[i]:
+                        value = self.storage_map[var][0]
+                        if (
+                            isinstance(value, np.ndarray)
+                            and value.size
+                            and not value.dtype.hasobject
+                        ):
+                            var_shapes[var] = (value.shape, value.dtype)
+                for old_s in old_storage:
+                    old_s[0] = None
+        except Exception:
+            self.plan_input_shapes = None
+            raise_with_op(self.fgraph, node, thunk)
+
+        if record:
+            self.plan_memory(var_shapes)
+
+        return self.perform_updates()
+
+
+class ParallelLoop(UpdatingVM):
+    """Unconditional program execution that evaluates independent nodes concurrently.
+
+    Each node is submitted to a pool of `n_threads` threads as soon as all
+    the nodes it depends on--through its inputs or through the orderings
+    requested by the `FunctionGraph`'s features (e.g. the `DestroyHandler`)--have
+    been evaluated. Speed-ups are only obtained from thunks that release the
+    GIL while they run (e.g. NumPy's BLAS calls).
+
+    Garbage collection is done when the last client of an intermediate result
+    has been evaluated, instead of relying on the toposort order like `Loop`.
+    Storage cells must not be shared between variables (i.e. no
+    `VMLinker.reduce_storage_allocations`), because the evaluation order of
+    independent nodes isn't known in advance.
+    """
+
+    def __init__(
+        self,
+        fgraph,
+        nodes,
+        thunks,
+        pre_call_clear,
+        storage_map,
+        input_storage,
+        output_storage,
+        update_vars,
+        n_threads: int,
+        allow_gc: bool,
+        computed: set[Variable],
+    ):
+        r"""
+        Parameters
+        ----------
+        n_threads
+            The number of threads used to evaluate the thunks.
+        allow_gc
+            Clear the storage of intermediate results once all their clients
+            have been evaluated.
+        computed
+            The `Variable`\s computed by `nodes`, as returned by `gc_helper`.
+        """
+        super().__init__(
+            fgraph,
+            nodes,
+            thunks,
+            pre_call_clear,
+            storage_map,
+            input_storage,
+            output_storage,
+            update_vars,
+        )
+        self.n_threads = n_threads
+        self.allow_gc = allow_gc
+        self.executor: Optional[ThreadPoolExecutor] = None
+
+        node_idx = {node: i for i, node in enumerate(nodes)}
+        ords = fgraph.orderings()
+
+        # `Op`s with inner graphs evaluate them with a compiled function that
+        # is shared by all their nodes, so those nodes are run one at a time.
+        last_inner_graph_node: dict[HasInnerGraph, int] = {}
+
+        self.node_successors: list[list[int]] = [[] for _ in nodes]
+        self.node_n_prereqs = []
+        for i, node in enumerate(nodes):
+            prereqs = {node_idx[inp.owner] for inp in node.inputs if inp.owner}
+            prereqs.update(node_idx[prereq] for prereq in ords.get(node, ()))
+            if isinstance(node.op, HasInnerGraph):
+                if node.op in last_inner_graph_node:
+                    prereqs.add(last_inner_graph_node[node.op])
+                last_inner_graph_node[node.op] = i
+            for j in prereqs:
+                self.node_successors[j].append(i)
+            self.node_n_prereqs.append(len(prereqs))
+        self.ready_nodes = [i for i, n in enumerate(self.node_n_prereqs) if n == 0]
+
+        # The number of nodes that read each intermediate result, and the
+        # intermediate results read by each node
+        gc_vars = {}
+        self.node_gc_inputs: list[list[int]] = []
+        for node in nodes:
+            gc_inputs = []
+            for inp in dict.fromkeys(node.inputs):
+                if inp in computed and inp not in fgraph.outputs:
+                    gc_inputs.append(gc_vars.setdefault(inp, len(gc_vars)))
+            self.node_gc_inputs.append(gc_inputs)
+        self.gc_storage = [storage_map[var] for var in gc_vars]
+        self.gc_n_clients = [0] * len(gc_vars)
+        for gc_inputs in self.node_gc_inputs:
+            for k in gc_inputs:
+                self.gc_n_clients[k] += 1
+        self._subset_schedules: dict[
+            tuple[int, ...], tuple[list[int], list[int], list[int]]
+        ] = {}
+
+    def subset_schedule(
+        self, output_subset: Sequence[int]
+    ) -> tuple[list[int], list[int], list[int]]:
+        """Return the prerequisite counts, ready nodes and client counts of a partial evaluation.
+
+        The nodes that aren't needed for the outputs in `output_subset` get a
+        negative prerequisite count, so they are never scheduled.
+        """
+        key = tuple(output_subset)
+        schedule = self._subset_schedules.get(key)
+        if schedule is None:
+            needed = self.subset_nodes(output_subset)
+            node_n_prereqs = [0 if is_needed else -1 for is_needed in needed]
+            gc_n_clients = [0] * len(self.gc_n_clients)
+            for i, is_needed in enumerate(needed):
+                if not is_needed:
+                    continue
+                for j in self.node_successors[i]:
+                    if needed[j]:
+                        node_n_prereqs[j] += 1
+                for k in self.node_gc_inputs[i]:
+                    gc_n_clients[k] += 1
+            ready_nodes = [i for i, n in enumerate(node_n_prereqs) if n == 0]
+            schedule = (node_n_prereqs, ready_nodes, gc_n_clients)
+            self._subset_schedules[key] = schedule
+        return schedule
+
+    def run_thunk(self, i, done):
+        try:
+            if self.time_thunks:
+                t0 = time.perf_counter()
+                self.thunks[i]()
+                t1 = time.perf_counter()
+                self.call_counts[i] += 1
+                self.call_times[i] += t1 - t0
+            else:
+                self.thunks[i]()
+        except Exception as e:
+            done.put((i, e))
+        else:
+            done.put((i, None))
+
+    def __call__(self, output_subset=None):
+        for cont in self.pre_call_clear:
+            cont[0] = None
+
+        if self.executor is None:
+            self.executor = ThreadPoolExecutor(
+                max_workers=self.n_threads, thread_name_prefix="pytensor_vm"
+            )
+            # Stop the worker threads once this `VM` is garbage collected
+            weakref.finalize(self, self.executor.shutdown, wait=False)
+
+        if output_subset is None:
+            node_n_prereqs, ready_nodes, gc_n_clients = (
+                self.node_n_prereqs,
+                self.ready_nodes,
+                self.gc_n_clients,
+            )
+        else:
+            node_n_prereqs, ready_nodes, gc_n_clients = self.subset_schedule(
+                output_subset
+            )
+
+        done: SimpleQueue = SimpleQueue()
+        node_n_prereqs = node_n_prereqs.copy()
+        gc_n_clients = gc_n_clients.copy()
+        node_successors = self.node_successors
+        allow_gc = self.allow_gc
+        error = None
+
+        for i in ready_nodes:
+            self.executor.submit(self.run_thunk, i, done)
+        n_running = len(ready_nodes)
+
+        while n_running:
+            i, exc = done.get()
+            n_running -= 1
+            if exc is not None:
+                if error is None:
+                    error = (i, exc)
+                continue
+            if error is not None:
+                # Let the nodes that are still running finish, but don't
+                # schedule new ones
+                continue
+
+            if allow_gc:
+                for k in self.node_gc_inputs[i]:
+                    gc_n_clients[k] -= 1
+                    if gc_n_clients[k] == 0:
+                        self.gc_storage[k][0] = None
+
+            for j in node_successors[i]:
+                node_n_prereqs[j] -= 1
+                if node_n_prereqs[j] == 0:
+                    self.executor.submit(self.run_thunk, j, done)
+                    n_running += 1
+
+        if error is not None:
+            i, exc = error
+            try:
+                raise exc
+            except Exception:
+                raise_with_op(self.fgraph, self.nodes[i], self.thunks[i])
+
+        return self.perform_updates()
+
+
 class Stack(UpdatingVM):
     """Finish-to-start evaluation order of thunks.
 
@@ -809,6 +1239,18 @@ class VMLinker(LocalLinker):
     allow_partial_eval
         If ``True``, enforces usage of `Stack` or `CVM`, to allow for partial
         evaluation of functions (calculating a subset of outputs).
+    parallel
+        The number of threads used to evaluate independent nodes concurrently
+        with the `ParallelLoop` VM. When ``None``, use the PyTensor flag
+        ``vm__parallel`` value. A value of ``1`` evaluates the nodes one at a
+        time. Graphs that need lazy evaluation, callbacks or memory profiling
+        always use one of the sequential VMs.
+    memory_plan
+        If ``True``, evaluate the graphs that don't need lazy evaluation with
+        the `PlannedLoop` VM, which allocates the intermediate results in a
+        single preallocated buffer after the first call. This takes precedence
+        over `use_cloop`: the thunks are called from Python instead of the
+        `CVM`. When ``None``, use the PyTensor flag ``vm__memory_plan`` value.
 
     """
 
@@ -822,6 +1264,8 @@ class VMLinker(LocalLinker):
         schedule=None,
         c_thunks=None,
         allow_partial_eval=None,
+        parallel=None,
+        memory_plan=None,
     ):
         # Note: if more parameters are added to __init__, make sure to forward
         # them in the "type(self)(...)" call in the "accept" method below.
@@ -836,6 +1280,12 @@ class VMLinker(LocalLinker):
             c_thunks = bool(config.cxx)
         self.c_thunks = c_thunks
         self.allow_partial_eval = allow_partial_eval
+        if parallel is None:
+            parallel = config.vm__parallel
+        self.parallel = parallel
+        if memory_plan is None:
+            memory_plan = config.vm__memory_plan
+        self.memory_plan = memory_plan
         self.updated_vars = {}
         super().__init__(allow_gc=allow_gc, scheduler=schedule)
 
@@ -898,6 +1348,8 @@ class VMLinker(LocalLinker):
                 schedule=self.schedule,
                 c_thunks=self.c_thunks,
                 allow_partial_eval=self.allow_partial_eval,
+                parallel=self.parallel,
+                memory_plan=self.memory_plan,
             ).accept(fgraph, no_recycling, profile)
         self.fgraph = fgraph
         self.no_recycling = no_recycling
@@ -994,6 +1446,15 @@ class VMLinker(LocalLinker):
 
         return tuple(reallocated_info.keys())
 
+    def _is_lazy(self, thunks) -> bool:
+        """Determine whether the thunks must be evaluated by a lazy `VM`."""
+        lazy = self.lazy
+        if lazy is None:
+            lazy = config.vm__lazy
+        if lazy is None:
+            lazy = any(th.lazy for th in thunks)
+        return lazy
+
     def make_vm(
         self,
         nodes,
@@ -1046,6 +1507,32 @@ class VMLinker(LocalLinker):
                 callback=self.callback,
                 callback_input=self.callback_input,
             )
+        elif self.parallel > 1 and not self._is_lazy(thunks):
+            vm = ParallelLoop(
+                self.fgraph,
+                nodes,
+                thunks,
+                pre_call_clear,
+                storage_map,
+                input_storage,
+                output_storage,
+                updated_vars,
+                self.parallel,
+                self.allow_gc,
+                computed,
+            )
+        elif self.memory_plan and not self._is_lazy(thunks):
+            vm = PlannedLoop(
+                self.fgraph,
+                nodes,
+                thunks,
+                pre_call_clear,
+                storage_map,
+                input_storage,
+                output_storage,
+                updated_vars,
+                post_thunk_clear if self.allow_gc else None,
+            )
         elif self.use_cloop and CVM is not None:
             # create a map from nodes to ints and vars to ints
             nodes_idx = {}
@@ -1165,12 +1652,7 @@ class VMLinker(LocalLinker):
                     "Detected reference count inconsistency after CVM construction"
                 )
         else:
-            lazy = self.lazy
-            if lazy is None:
-                lazy = config.vm__lazy
-            if lazy is None:
-                lazy = any(th.lazy for th in thunks)
-            if not lazy:
+            if not self._is_lazy(thunks):
                 # there is no conditional in the graph
                 vm = Loop(
                     self.fgraph,
@@ -1225,6 +1707,10 @@ class VMLinker(LocalLinker):
         impl = None
         if self.c_thunks is False:
             impl = "py"
+        elif config.cxx and config.cmodule__compile_jobs > 1:
+            precompile_c_thunks(
+                order, storage_map, compute_map, config.cmodule__compile_jobs
+            )
         for node in order:
             try:
                 thunk_start = time.perf_counter()
@@ -1253,15 +1739,12 @@ class VMLinker(LocalLinker):
             thunk.inputs = [storage_map[v] for v in node.inputs]
             thunk.outputs = [storage_map[v] for v in node.outputs]
 
-        lazy = self.lazy
-        if lazy is None:
-            lazy = config.vm__lazy
-        if lazy is None:
-            lazy = any(th.lazy for th in thunks)
         if not (
-            lazy
+            self._is_lazy(thunks)
             or ((config.profile or config.print_global_stats) and config.profile_memory)
             or self.use_cloop
+            or self.parallel > 1
+            or self.memory_plan
             or self.callback
             or self.callback_input
         ):
@@ -1323,12 +1806,23 @@ class VMLinker(LocalLinker):
             self.allow_partial_eval = None
         if not hasattr(self, "callback_input"):
             self.callback_input = None
+        if not hasattr(self, "parallel"):
+            self.parallel = 1
+        if not hasattr(self, "memory_plan"):
+            self.memory_plan = False
 
     def __repr__(self):
         args_str = ", ".join(
             [
                 f"{name}={getattr(self, name)}"
-                for name in ("use_cloop", "lazy", "allow_partial_eval", "allow_gc")
+                for name in (
+                    "use_cloop",
+                    "lazy",
+                    "allow_partial_eval",
+                    "allow_gc",
+                    "parallel",
+                    "memory_plan",
+                )
             ]
         )
         return f"{type(self).__name__}({args_str})"
@@ -174,6 +174,7 @@ def scan(
     allow_gc=None,
     strict=False,
     return_list=False,
+    checkpoint=None,
 ):
     r"""This function constructs and applies a `Scan` `Op` to the provided arguments.
 
@@ -421,6 +422,18 @@ def scan(
     return_list
         If ``True``, will always return a ``list``, even if there is only one output.
 
+    checkpoint
+        If not ``None``, the gradient of `Scan` doesn't store the states of
+        every step, but only those at some checkpoints, and recomputes the steps
+        between two checkpoints when back-propagating through them.  This trades
+        one more forward pass for memory on long loops.  With ``"sqrt"`` there
+        is a checkpoint every ``sqrt(n_steps)`` steps, which minimizes the
+        memory.  With an integer, the checkpoints are spaced so that at most
+        that many steps of the states are kept in memory at once, recomputing
+        as few inner loops as possible.  Any taps and number of steps are
+        supported, but not while loops, shared variable updates and
+        `truncate_gradient`, for which the states of every step are stored.
+
     Returns
     -------
     tuple
@@ -1135,6 +1148,7 @@ def scan(
         profile=profile,
         allow_gc=allow_gc,
         strict=strict,
+        checkpoint=checkpoint,
     )
 
     ##
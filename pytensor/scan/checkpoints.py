@@ -1,7 +1,20 @@
+from collections import OrderedDict
+
 import pytensor.tensor.basic as ptb
+from pytensor.gradient import DisconnectedType
+from pytensor.graph.replace import clone_replace
 from pytensor.scan.basic import scan
 from pytensor.tensor.basic import Join
-from pytensor.tensor.math import ceil, eq
+from pytensor.tensor.math import (
+    ceil,
+    ceil_intdiv,
+    clip,
+    eq,
+    floor,
+    maximum,
+    minimum,
+    sqrt,
+)
 from pytensor.tensor.subtensor import set_subtensor
 
 
@@ -90,7 +103,8 @@ def scan_checkpoints(
 
     See Also
     --------
-    :func:`~pytensor.scan`: Looping in PyTensor.
+    :func:`~pytensor.scan`: Looping in PyTensor. Its ``checkpoint`` argument
+    doesn't have the restrictions of this function.
 
     """
     # Standardize the format of input arguments
@@ -186,3 +200,158 @@ def scan_checkpoints(
     )
 
     return results, updates
+
+
+def checkpoint_segment_length(n_steps, checkpoint):
+    """Compute the number of steps between two checkpoints of a `Scan`.
+
+    Back-propagating through ``n_steps`` steps split in segments of ``N``
+    steps keeps about ``ceil(n_steps / N) + N`` states in memory: the
+    checkpoints, plus the states of the segment being recomputed.
+
+    Parameters
+    ----------
+    n_steps
+        The number of steps of the `Scan`.
+    checkpoint
+        Either ``"sqrt"``, which minimizes the memory with ``N =
+        ceil(sqrt(n_steps))``, or the maximum number of states to keep in
+        memory.  The largest segments that fit in this budget are used, since
+        they need the fewest inner loops; if none fit, ``"sqrt"`` is used.
+
+    """
+    n_steps = ptb.as_tensor_variable(n_steps).astype("float64")
+    min_memory_length = ceil(sqrt(n_steps))
+    if checkpoint == "sqrt":
+        length = min_memory_length
+    else:
+        # The largest root of `N**2 - checkpoint * N + n_steps`
+        disc = checkpoint**2 - 4 * n_steps
+        length = ptb.switch(
+            disc < 0,
+            min_memory_length,
+            floor((checkpoint + sqrt(maximum(disc, 0))) / 2),
+        )
+    return ptb.cast(clip(length, 1, maximum(n_steps, 1)), "int64")
+
+
+def checkpointed_scan_known_grads(op, inputs, output_grads):
+    """Rematerialize a `Scan` node from checkpoints of its states.
+
+    The steps of the node are split in segments of
+    :func:`checkpoint_segment_length` steps.  An outer `Scan` loops over the
+    segments, carrying the states needed by the taps of the recurrences from
+    one segment to the next, and runs the steps of each segment with an inner
+    `Scan` built from the inner graph of `op`.  The last segment is shorter
+    when the segment length doesn't divide the number of steps.
+
+    Each step of the outer `Scan` also outputs the dot product of the outputs
+    of its segment with their gradients, so that back-propagating a gradient
+    of one through these products back-propagates `output_grads` through the
+    node.  The gradient of the outer `Scan` then only stores the states at the
+    start of every segment, and recomputes the states of one segment at a time
+    when back-propagating through it.
+
+    Parameters
+    ----------
+    op
+        A `Scan` without while loop, mit-mot or shared outputs.
+    inputs
+        The outer inputs of a node of `op`.
+    output_grads
+        The gradients of the outputs of the node.
+
+    Returns
+    -------
+    dict
+        The gradients of the variables of the rematerialization, to be passed
+        as `known_grads` to :func:`pytensor.gradient.grad`.
+
+    """
+    info = op.info
+    n_steps = inputs[0]
+    seqs = op.outer_seqs(inputs)
+    non_seqs = op.outer_non_seqs(inputs)
+    bufs = op.outer_mitsot(inputs) + op.outer_sitsot(inputs)
+    # The number of past states the taps of each recurrence read
+    n_taps = [-min(taps) for taps in info.mit_sot_in_slices] + [1] * info.n_sit_sot
+    init_states = [buf[:n_tap] for buf, n_tap in zip(bufs, n_taps)]
+    init_states[info.n_mit_sot :] = [buf[0] for buf in op.outer_sitsot(inputs)]
+    n_states = len(init_states)
+
+    seg_length = checkpoint_segment_length(n_steps, op.checkpoint)
+    n_segments = ceil_intdiv(n_steps, seg_length)
+
+    known_grads = OrderedDict()
+    out_idxs = []
+    seg_grads = []
+    for idx, g in enumerate(output_grads):
+        if isinstance(g.type, DisconnectedType):
+            continue
+        if idx < n_states:
+            # The outputs of the recurrences start with their initial states
+            known_grads[bufs[idx][: n_taps[idx]]] = g[: n_taps[idx]]
+            g = g[n_taps[idx] :]
+        # Split the gradients in segments, padding the last one
+        shape = [g.shape[i] for i in range(1, g.ndim)]
+        g_pad = ptb.zeros((n_segments * seg_length, *shape), dtype=g.dtype)
+        g_pad = set_subtensor(g_pad[:n_steps], g)
+        out_idxs.append(idx)
+        seg_grads.append(
+            g_pad.reshape((n_segments, seg_length, *shape), ndim=g.ndim + 1)
+        )
+
+    if not out_idxs:
+        return known_grads
+
+    def step(*args):
+        return clone_replace(op.inner_outputs, replace=dict(zip(op.inner_inputs, args)))
+
+    def segment(idx, *args):
+        grads = args[: len(seg_grads)]
+        states = args[len(grads) : len(grads) + n_states]
+        seg_seqs = args[len(grads) + n_states : len(grads) + n_states + len(seqs)]
+        seg_non_seqs = args[len(grads) + n_states + len(seqs) : -2]
+        n_steps, seg_length = args[-2:]
+        start = idx * seg_length
+        length = minimum(seg_length, n_steps - start)
+
+        outputs_info = [
+            dict(initial=state, taps=list(taps))
+            for state, taps in zip(states, info.mit_sot_in_slices)
+        ] + list(states[info.n_mit_sot :])
+        outs, _ = scan(
+            step,
+            sequences=[s[start : start + length] for s in seg_seqs],
+            outputs_info=outputs_info + [None] * info.n_nit_sot,
+            non_sequences=list(seg_non_seqs),
+            n_steps=length,
+            mode=op.mode,
+            name=f"{op.name}_segment",
+            return_list=True,
+        )
+
+        new_states = [
+            ptb.concatenate([state, out])[-n_tap:]
+            for state, out, n_tap in zip(states, outs[: info.n_mit_sot], n_taps)
+        ] + [out[-1] for out in outs[info.n_mit_sot : n_states]]
+        # The gradients of the segment outputs are back-propagated through
+        # their dot products with the output gradients
+        cost = ptb.stack(
+            [(outs[o_idx] * g[:length]).sum() for o_idx, g in zip(out_idxs, grads)]
+        ).sum()
+        return [*new_states, cost]
+
+    results, _ = scan(
+        segment,
+        sequences=[ptb.arange(n_segments), *seg_grads],
+        outputs_info=[*init_states, None],
+        non_sequences=[*seqs, *non_seqs, n_steps, seg_length],
+        n_steps=n_segments,
+        mode=op.mode,
+        name=f"{op.name}_checkpoints",
+        return_list=True,
+    )
+    costs = results[-1]
+    known_grads[costs] = ptb.ones((n_segments,), dtype=costs.dtype)
+    return known_grads
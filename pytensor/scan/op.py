@@ -70,6 +70,7 @@ from pytensor.graph.basic import (
     graph_inputs,
     io_connection_pattern,
 )
+from pytensor.graph.costs import OpCost, cost
 from pytensor.graph.features import NoOutputFromInplace
 from pytensor.graph.op import HasInnerGraph, Op
 from pytensor.graph.replace import clone_replace
@@ -677,6 +678,7 @@ class Scan(Op, ScanMethodsMixin, HasInnerGraph):
         profile: Optional[Union[str, bool]] = None,
         allow_gc: bool = True,
         strict: bool = True,
+        checkpoint: Optional[Union[str, int]] = None,
     ):
         r"""
 
@@ -744,6 +746,14 @@ class Scan(Op, ScanMethodsMixin, HasInnerGraph):
             flag `pytensor.config.allow_gc` means.
         strict
             If ``True``, all the shared variables used in the inner-graph must be provided.
+        checkpoint
+            If not ``None``, the gradient of `Scan` only stores the states of
+            the loop at a few checkpoints, and recomputes the steps between two
+            checkpoints when back-propagating through them.  With ``"sqrt"``,
+            there is a checkpoint every ``sqrt(n_steps)`` steps.  With an
+            integer, the checkpoints are spaced so that at most that many steps
+            of the states are kept in memory at once.
+            See :func:`pytensor.scan.checkpoints.checkpointed_scan_known_grads`.
 
         """
         self.fgraph, shared_inputs, _, _ = construct_nominal_fgraph(inputs, outputs)
@@ -753,8 +763,17 @@ class Scan(Op, ScanMethodsMixin, HasInnerGraph):
         if shared_inputs:
             raise MissingInputError(f"Scan is missing inputs: {shared_inputs}")
 
+        if checkpoint is not None and checkpoint != "sqrt":
+            if not isinstance(checkpoint, (int, np.integer)) or checkpoint < 2:
+                raise ValueError(
+                    "checkpoint must be None, 'sqrt' or an integer memory "
+                    f"budget of at least 2 steps, got {checkpoint}"
+                )
+            checkpoint = int(checkpoint)
+
         self.info = info
         self.truncate_gradient = truncate_gradient
+        self.checkpoint = checkpoint
         self.name = name
         self.profile = profile
         self.allow_gc = allow_gc
@@ -889,6 +908,7 @@ class Scan(Op, ScanMethodsMixin, HasInnerGraph):
         return preallocated_mitmot_outs, mitmots_preallocated
 
     def __setstate__(self, d):
+        d.setdefault("checkpoint", None)
         self.__dict__.update(d)
         # Ensure that the graph associated with the inner function is valid.
         self.validate_inner_graph()
@@ -1256,6 +1276,9 @@ class Scan(Op, ScanMethodsMixin, HasInnerGraph):
         if self.truncate_gradient != other.truncate_gradient:
             return False
 
+        if self.checkpoint != other.checkpoint:
+            return False
+
         if self.name != other.name:
             return False
 
@@ -1303,6 +1326,7 @@ class Scan(Op, ScanMethodsMixin, HasInnerGraph):
                 self.info,
                 self.profile,
                 self.truncate_gradient,
+                self.checkpoint,
                 self.name,
                 self.allow_gc,
             )
@@ -2302,6 +2326,37 @@ class Scan(Op, ScanMethodsMixin, HasInnerGraph):
                     scan_outs.append((Shape_i(0)(o),) + x[1:])
         return scan_outs
 
+    def cost(self, node, input_shapes):
+        # The inner inputs have the shape of one entry of the sequences and
+        # recurrent states, and the shape of the other outer inputs
+        info = self.info
+        inner_ins_shapes = [x[1:] for x in input_shapes[1 : 1 + info.n_seqs]]
+        for idx, taps in enumerate(
+            chain(
+                info.mit_mot_in_slices, info.mit_sot_in_slices, info.sit_sot_in_slices
+            )
+        ):
+            inner_ins_shapes += [input_shapes[1 + info.n_seqs + idx][1:]] * len(taps)
+        offset = 1 + info.n_seqs + info.n_mit_mot + info.n_mit_sot + info.n_sit_sot
+        inner_ins_shapes += input_shapes[offset : offset + info.n_shared_outs]
+        offset += info.n_shared_outs + info.n_nit_sot
+        inner_ins_shapes += input_shapes[offset:]
+
+        step_cost = cost(self.fgraph, input_shapes=inner_ins_shapes)
+
+        # The cost can't be expressed in terms of the outer graph if some
+        # inner nodes couldn't infer their shapes
+        inner_inputs = set(self.inner_inputs)
+        if any(
+            inp in inner_inputs
+            for inp in graph_inputs([c for c in step_cost if isinstance(c, Variable)])
+        ):
+            return None
+
+        # For while loops, this is only an upper bound
+        n_steps = node.inputs[0]
+        return OpCost(flops=n_steps * step_cost.flops, bytes=n_steps * step_cost.bytes)
+
     def connection_pattern(self, node):
         # We cache the result of this function because, with a previous
         # implementation that repeatedly called grad, there were cases
@@ -2364,6 +2419,8 @@ class Scan(Op, ScanMethodsMixin, HasInnerGraph):
     def L_op(self, inputs, outs, dC_douts):
         if not isinstance(outs, (list, tuple)):
             outs = [outs]
+        if self.checkpoint is not None and self._can_checkpoint(dC_douts):
+            return self._checkpointed_L_op(inputs, outs, dC_douts)
         # `grad_step` equals the number of steps the original scan node has
         # done (if the original scan is a while loop than this number is the
         # length of the output sequence)
@@ -3113,7 +3170,66 @@ class Scan(Op, ScanMethodsMixin, HasInnerGraph):
                 gradients[idx] = DisconnectedType()()
         return gradients
 
-    def R_op(self, inputs, eval_points):
+    def _can_checkpoint(self, dC_douts):
+        """Tell whether the gradient can be computed from checkpoints."""
+        info = self.info
+        return (
+            not info.as_while
+            and info.n_mit_mot == 0
+            and info.n_shared_outs == 0
+            and self.truncate_gradient == -1
+            and not any(isinstance(g.type, NullType) for g in dC_douts)
+        )
+
+    def _checkpointed_L_op(self, inputs, outs, dC_douts):
+        """Compute the gradient by back-propagating through a rematerialization.
+
+        The outputs are recomputed by a `Scan` over segments of the loop, that
+        only keeps the states at the start of every segment, and whose steps
+        run the steps of a segment with an inner `Scan`.  Its gradient thus
+        reruns each segment before back-propagating through it, instead of
+        reading the states of every step from the outputs of this node.
+
+        """
+        from pytensor.scan.checkpoints import checkpointed_scan_known_grads
+
+        info = self.info
+        connection_pattern = self.connection_pattern(outs[0].owner)
+        known_grads = checkpointed_scan_known_grads(self, inputs, dC_douts)
+
+        # The number of steps and the sizes of the nit-sots are not
+        # differentiable
+        first_nitsot = 1 + info.n_seqs + info.n_mit_sot + info.n_sit_sot
+        wrt_idxs = [
+            idx
+            for idx in range(1, len(inputs))
+            if not first_nitsot <= idx < first_nitsot + info.n_nit_sot
+            and any(
+                connection_pattern[idx][odx]
+                and not isinstance(out_g.type, DisconnectedType)
+                for odx, out_g in enumerate(dC_douts)
+            )
+        ]
+        grads = grad(
+            cost=None,
+            known_grads=known_grads,
+            wrt=[inputs[idx] for idx in wrt_idxs],
+            # The output gradients enter the rematerialization, but are not
+            # differentiated
+            consider_constant=[
+                g for g in dC_douts if not isinstance(g.type, DisconnectedType)
+            ],
+            disconnected_inputs="ignore",
+            return_disconnected="disconnected",
+            null_gradients="return",
+        )
+
+        gradients = [DisconnectedType()() for _ in inputs]
+        for idx, g in zip(wrt_idxs, grads):
+            gradients[idx] = g
+        return gradients
+
+    def R_op(self, inputs, eval_points, use_lop_fallback=False):
         # Step 0. Prepare some shortcut variable
         info = self.info
         self_inputs = self.inner_inputs
@@ -3131,7 +3247,12 @@ class Scan(Op, ScanMethodsMixin, HasInnerGraph):
             rop_self_outputs = self_outputs
         if info.n_shared_outs > 0:
             rop_self_outputs = rop_self_outputs[: -info.n_shared_outs]
-        rop_outs = Rop(rop_self_outputs, rop_of_inputs, inner_eval_points)
+        rop_outs = Rop(
+            rop_self_outputs,
+            rop_of_inputs,
+            inner_eval_points,
+            use_lop_fallback=use_lop_fallback,
+        )
         if not isinstance(rop_outs, (list, tuple)):
             rop_outs = [rop_outs]
         # Step 2. Figure out what corresponds to what in the scan
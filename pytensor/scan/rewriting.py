@@ -198,6 +198,7 @@ def remove_constants_and_unused_inputs_scan(fgraph, node):
             mode=op.mode,
             profile=op.profile,
             truncate_gradient=op.truncate_gradient,
+            checkpoint=op.checkpoint,
             # TODO: This seems questionable
             name=op.name,
             allow_gc=op.allow_gc,
@@ -372,6 +373,7 @@ def push_out_non_seq_scan(fgraph, node):
             mode=op.mode,
             profile=op.profile,
             truncate_gradient=op.truncate_gradient,
+            checkpoint=op.checkpoint,
             # TODO: This seems questionable
             name=op.name,
             allow_gc=op.allow_gc,
@@ -606,6 +608,7 @@ def push_out_seq_scan(fgraph, node):
             mode=op.mode,
             profile=op.profile,
             truncate_gradient=op.truncate_gradient,
+            checkpoint=op.checkpoint,
             # TODO: This seems questionable
             name=op.name,
             allow_gc=op.allow_gc,
@@ -787,6 +790,7 @@ def add_nitsot_outputs(
         mode=old_scan_node.op.mode,
         profile=old_scan_node.op.profile,
         truncate_gradient=old_scan_node.op.truncate_gradient,
+        checkpoint=old_scan_node.op.checkpoint,
         # TODO: This seems questionable
         name=old_scan_node.op.name,
         allow_gc=old_scan_node.op.allow_gc,
@@ -1639,6 +1643,7 @@ def save_mem_new_scan(fgraph, node):
             mode=op.mode,
             profile=op.profile,
             truncate_gradient=op.truncate_gradient,
+            checkpoint=op.checkpoint,
             # TODO: This seems questionable
             name=op.name,
             allow_gc=op.allow_gc,
@@ -1932,6 +1937,7 @@ class ScanMerge(GraphRewriter):
             mode=old_op.mode,
             profile=old_op.profile,
             truncate_gradient=old_op.truncate_gradient,
+            checkpoint=old_op.checkpoint,
             allow_gc=old_op.allow_gc,
             name="&".join([nd.op.name for nd in nodes]),
         )
@@ -1948,7 +1954,8 @@ class ScanMerge(GraphRewriter):
         sense that it can be merged together with every other node in
         `set_nodes`. In order for two nodes to be mergeable, they have to go
         over the same number of steps, have the same condition (if any),
-        have the same value for truncate_gradient, and have the same mode.
+        have the same values for truncate_gradient and checkpoint, and have the
+        same mode.
         Questionable, we should also consider profile ?
 
         """
@@ -1958,6 +1965,7 @@ class ScanMerge(GraphRewriter):
         if (
             op.info.as_while != rep_op.info.as_while
             or op.truncate_gradient != rep_op.truncate_gradient
+            or op.checkpoint != rep_op.checkpoint
             or op.mode != rep_op.mode
         ):
             return False
@@ -2141,6 +2149,7 @@ def scan_merge_inouts(fgraph, node):
             mode=node.op.mode,
             profile=node.op.profile,
             truncate_gradient=node.op.truncate_gradient,
+            checkpoint=node.op.checkpoint,
             # TODO: This seems questionable
             name=node.op.name,
             allow_gc=node.op.allow_gc,
@@ -2395,6 +2404,7 @@ def push_out_dot1_scan(fgraph, node):
                         mode=op.mode,
                         profile=op.profile,
                         truncate_gradient=op.truncate_gradient,
+                        checkpoint=op.checkpoint,
                         # TODO: This seems questionable
                         name=op.name,
                         allow_gc=op.allow_gc,
@@ -212,6 +212,7 @@ pytensor.compile.optdb.register(
     ),
     "fast_run",
     "inplace",
+    "cxx_only",
     position=60,
 )
 
@@ -243,6 +244,7 @@ pytensor.compile.optdb.register(
     WalkingGraphRewriter(local_addsd_ccode),
     # Must be after local_inplace_addsd_ccode at 60
     "fast_run",
+    "cxx_only",
     position=61,
 )
 
@@ -91,6 +91,7 @@ except ImportError:
 import pytensor.scalar
 from pytensor.configdefaults import config
 from pytensor.graph.basic import Apply, view_roots
+from pytensor.graph.costs import OpCost, io_bytes, size
 from pytensor.graph.op import Op
 from pytensor.graph.utils import InconsistencyError, MethodNotDefined, TestValueError
 from pytensor.link.c.op import COp
@@ -252,6 +253,14 @@ class Gemv(Op):
     def infer_shape(self, fgraph, node, input_shapes):
         return [input_shapes[0]]
 
+    def cost(self, node, input_shapes):
+        # alpha * dot(A, x) + beta * y
+        y_shape, _, A_shape, _, _ = input_shapes
+        return OpCost(
+            flops=2 * size(A_shape) + 3 * size(y_shape),
+            bytes=io_bytes(node, input_shapes, [y_shape]),
+        )
+
 
 gemv_no_inplace = Gemv(inplace=False)
 gemv_inplace = Gemv(inplace=True)
@@ -326,6 +335,14 @@ class Ger(Op):
     def infer_shape(self, fgraph, node, input_shapes):
         return [input_shapes[0]]
 
+    def cost(self, node, input_shapes):
+        # A + alpha * outer(x, y)
+        A_shape = input_shapes[0]
+        return OpCost(
+            flops=3 * size(A_shape),
+            bytes=io_bytes(node, input_shapes, [A_shape]),
+        )
+
 
 ger = Ger(destructive=False)
 ger_destructive = Ger(destructive=True)
@@ -957,6 +974,14 @@ class Gemm(GemmRelated):
             )
         ]
 
+    def cost(self, node, input_shapes):
+        # b * z + a * dot(x, y)
+        z_shape, _, x_shape, y_shape, _ = input_shapes
+        return OpCost(
+            flops=2 * size(x_shape) * y_shape[1] + 3 * size(z_shape),
+            bytes=io_bytes(node, input_shapes, [z_shape]),
+        )
+
     setup_z_Nz_Sz_inplace = """
         // Needs broadcasting
         if (PyArray_DIMS(%(_z)s)[0] < Nx[0] || PyArray_DIMS(%(_z)s)[1] < Ny[1]){
@@ -1484,6 +1509,13 @@ class Dot22(GemmRelated):
     def infer_shape(self, fgraph, node, input_shapes):
         return [[input_shapes[0][0], input_shapes[1][1]]]
 
+    def cost(self, node, input_shapes):
+        x_shape, y_shape = input_shapes
+        return OpCost(
+            flops=2 * size(x_shape) * y_shape[1],
+            bytes=io_bytes(node, input_shapes, [[x_shape[0], y_shape[1]]]),
+        )
+
     setup_z_Nz_Sz = """
         if ((NULL == %(_zout)s)
             || (PyArray_DIMS(%(_zout)s)[0] != PyArray_DIMS(%(_x)s)[0])
@@ -1587,6 +1619,14 @@ class Dot22Scalar(GemmRelated):
     def infer_shape(self, fgraph, node, input_shapes):
         return [[input_shapes[0][0], input_shapes[1][1]]]
 
+    def cost(self, node, input_shapes):
+        # a * dot(x, y)
+        x_shape, y_shape, _ = input_shapes
+        return OpCost(
+            flops=2 * size(x_shape) * y_shape[1] + x_shape[0] * y_shape[1],
+            bytes=io_bytes(node, input_shapes, [[x_shape[0], y_shape[1]]]),
+        )
+
     setup_z_Nz_Sz = Dot22.setup_z_Nz_Sz
     broadcast_xy = ""
 
@@ -2047,6 +2087,14 @@ class BatchedDot(COp):
         xshp, yshp = shapes
         return [xshp[:-1] + yshp[2:]]
 
+    def cost(self, node, input_shapes):
+        xshp, yshp = input_shapes
+        out_shape = list(xshp[:-1]) + list(yshp[2:])
+        return OpCost(
+            flops=2 * size(xshp) * size(yshp[2:]),
+            bytes=io_bytes(node, input_shapes, [out_shape]),
+        )
+
 
 _batched_dot = BatchedDot()
 
@@ -7,6 +7,7 @@ import numpy as np
 from pytensor import config
 from pytensor.gradient import DisconnectedType
 from pytensor.graph.basic import Apply, Constant, Variable
+from pytensor.graph.costs import OpCost, size
 from pytensor.graph.null_type import NullType
 from pytensor.graph.op import Op
 from pytensor.graph.replace import (
@@ -47,7 +48,6 @@ class Blockwise(Op):
     """Generalizes a core `Op` to work with batched dimensions.
 
     TODO: Dispatch JAX (should be easy with the vectorize macro)
-    TODO: Dispatch Numba
     TODO: C implementation?
     TODO: Fuse Blockwise?
     """
@@ -211,6 +211,31 @@ class Blockwise(Op):
 
         return out_shapes
 
+    def cost(self, node, input_shapes):
+        batch_ndims = self.batch_ndim(node)
+        # Runtime broadcasting is not allowed, so each batch dimension has the
+        # length of any input whose dimension is not statically known to be 1
+        batch_shape = []
+        for dim in range(batch_ndims):
+            for inp, shape in zip(node.inputs, input_shapes):
+                if inp.type.shape[dim] != 1:
+                    batch_shape.append(shape[dim])
+                    break
+            else:
+                batch_shape.append(1)
+
+        core_node = self._create_dummy_core_node(node.inputs)
+        core_cost = self.core_op.cost(
+            core_node, [shape[batch_ndims:] for shape in input_shapes]
+        )
+        if core_cost is None:
+            return None
+
+        batch_size = size(batch_shape)
+        return OpCost(
+            flops=batch_size * core_cost.flops, bytes=batch_size * core_cost.bytes
+        )
+
     def connection_pattern(self, node):
         if hasattr(self.core_op, "connection_pattern"):
             return self.core_op.connection_pattern(node)
@@ -304,6 +329,37 @@ class Blockwise(Op):
 
         return rval
 
+    def R_op(self, inputs, eval_points):
+        # R-operator of the core Op, vectorized over the batch dimensions
+        with config.change_flags(compute_test_value="off"):
+            safe_inputs = [
+                tensor(dtype=inp.type.dtype, shape=(None,) * len(sig))
+                for inp, sig in zip(inputs, self.inputs_sig)
+            ]
+            core_inputs = self._create_dummy_core_node(safe_inputs).inputs
+            core_eval_points = [
+                None if eval_point is None else core_inp.type()
+                for eval_point, core_inp in zip(eval_points, core_inputs)
+            ]
+            core_rops = self.core_op.R_op(core_inputs, core_eval_points)
+        if all(core_rop is None for core_rop in core_rops):
+            return core_rops
+
+        replace = {
+            core_var: var
+            for core_var, var in zip(
+                core_inputs + core_eval_points, list(inputs) + list(eval_points)
+            )
+            if core_var is not None
+        }
+        rops = vectorize_graph(
+            [core_rop for core_rop in core_rops if core_rop is not None],
+            replace=replace,
+        )
+
+        rops_iter = iter(rops)
+        return [None if core_rop is None else next(rops_iter) for core_rop in core_rops]
+
     def _create_gufunc(self, node):
         gufunc_spec = self.gufunc_spec or getattr(self.core_op, "gufunc_spec", None)
 
@@ -314,21 +370,78 @@ class Blockwise(Op):
             else:
                 raise ValueError(f"Could not import gufunc {gufunc_spec[0]} for {self}")
 
+        from pytensor.tensor.random.basic import broadcast_shapes
+
         n_outs = len(self.outputs_sig)
         core_node = self._create_dummy_core_node(node.inputs)
+        destroyed_inputs = {
+            i
+            for idxs in getattr(self.core_op, "destroy_map", {}).values()
+            for i in idxs
+        }
+        core_perform = self.core_op.perform
+        core_ndim = len(self.inputs_sig[0])
+        out_dtypes = [out.type.dtype for out in core_node.outputs]
+
+        # Output core dimensions that also appear in the inputs, used to
+        # allocate the outputs when the batch is empty
+        core_dim_sources = {}
+        for i, sig in enumerate(self.inputs_sig):
+            for k, dim_name in enumerate(sig):
+                core_dim_sources.setdefault(dim_name, (i, k - len(sig)))
+
+        def gufunc(*inputs):
+            # All the inputs have the same number of batch dimensions
+            batch_ndim = inputs[0].ndim - core_ndim
+            batch_shape = broadcast_shapes(*(inp.shape[:batch_ndim] for inp in inputs))
+            # Broadcasting only creates views; indexing them with a trailing
+            # `Ellipsis` returns (possibly zero-dimensional) array views as well.
+            # Those views are read-only, so the inputs the core `Op` overwrites
+            # are copied
+            inputs = [
+                np.broadcast_to(inp, batch_shape + inp.shape[batch_ndim:])
+                for inp in inputs
+            ]
+            for i in destroyed_inputs:
+                inputs[i] = inputs[i].copy()
+
+            indices = np.ndindex(batch_shape)
+            first_idx = next(indices, None)
+            if first_idx is None:
+                outputs = []
+                for sig, dtype in zip(self.outputs_sig, out_dtypes):
+                    core_shape = tuple(
+                        inputs[core_dim_sources[dim_name][0]].shape[
+                            core_dim_sources[dim_name][1]
+                        ]
+                        if dim_name in core_dim_sources
+                        else 0
+                        for dim_name in sig
+                    )
+                    outputs.append(np.empty(batch_shape + core_shape, dtype=dtype))
+                return outputs[0] if n_outs == 1 else tuple(outputs)
 
-        def core_func(*inner_inputs):
             inner_outputs = [[None] for _ in range(n_outs)]
 
-            inner_inputs = [np.asarray(inp) for inp in inner_inputs]
-            self.core_op.perform(core_node, inner_inputs, inner_outputs)
+            first_idx += (Ellipsis,)
+            core_perform(core_node, [inp[first_idx] for inp in inputs], inner_outputs)
+            # The outputs are allocated once, now that the core shapes are known
+            outputs = [
+                np.empty(batch_shape + np.shape(r[0]), dtype=np.result_type(r[0]))
+                for r in inner_outputs
+            ]
+            for out, r in zip(outputs, inner_outputs):
+                out[first_idx] = r[0]
 
-            if len(inner_outputs) == 1:
-                return inner_outputs[0][0]
-            else:
-                return tuple(r[0] for r in inner_outputs)
+            for idx in indices:
+                idx += (Ellipsis,)
+                core_perform(core_node, [inp[idx] for inp in inputs], inner_outputs)
+                for out, r in zip(outputs, inner_outputs):
+                    out[idx] = r[0]
+
+            return outputs[0] if n_outs == 1 else tuple(outputs)
 
-        self._gufunc = np.vectorize(core_func, signature=self.signature)
+        self._gufunc = gufunc
         return self._gufunc
 
     def _check_runtime_broadcast(self, node, inputs):
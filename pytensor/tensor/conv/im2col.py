@@ -0,0 +1,444 @@
+r"""
+`Op`\s that rearrange the patches of images into the rows of a matrix, and back.
+
+They are used to lower the `AbstractConv` `Op`\s to matrix products, which
+are then computed by BLAS (see `pytensor.tensor.rewriting.conv`).
+
+"""
+
+from functools import reduce
+from operator import mul
+
+import numpy as np
+
+from pytensor.gradient import DisconnectedType
+from pytensor.graph.basic import Apply
+from pytensor.link.c.op import COp
+from pytensor.tensor.basic import as_tensor_variable, cast
+from pytensor.tensor.conv.abstract_conv import border_mode_to_pad, get_conv_output_shape
+from pytensor.tensor.type import TensorType, discrete_dtypes
+
+
+class BaseIm2Col(COp):
+    """Base class for `Im2Col` and `Col2Im`.
+
+    Parameters
+    ----------
+    border_mode: str or tuple
+        ``"valid"``, ``"full"``, ``"half"``, or a tuple with the padding of
+        each convolution dimension, as an int or a pair of ints.
+        See `BaseAbstractConv`.
+    subsample: tuple of int
+        Factor by which to subsample the output of the convolution.
+    filter_dilation: tuple of int
+        Factor by which to dilate the filters.
+
+    """
+
+    __props__ = ("border_mode", "subsample", "filter_dilation")
+
+    def __init__(self, border_mode="valid", subsample=(1, 1), filter_dilation=None):
+        self.subsample = tuple(subsample)
+        self.convdim = len(self.subsample)
+        if filter_dilation is None:
+            filter_dilation = (1,) * self.convdim
+        if len(filter_dilation) != self.convdim:
+            raise ValueError(f"filter_dilation must have {self.convdim} elements")
+        self.filter_dilation = tuple(filter_dilation)
+
+        if isinstance(border_mode, int):
+            border_mode = (border_mode,) * self.convdim
+        if isinstance(border_mode, tuple):
+            if len(border_mode) != self.convdim:
+                raise ValueError(
+                    f"invalid border_mode {border_mode}, which must be a "
+                    f"tuple of length {self.convdim}"
+                )
+            border_mode = tuple(
+                tuple(int(p) for p in m) if isinstance(m, tuple) else (int(m),) * 2
+                for m in border_mode
+            )
+        elif border_mode not in ("valid", "full", "half"):
+            raise ValueError(
+                f"invalid border_mode {border_mode}, which must be either "
+                '"valid", "full", "half", an integer or a tuple '
+                f"of length {self.convdim}"
+            )
+        self.border_mode = border_mode
+
+    def pads(self, kshp):
+        """Return the left and right padding of each dimension of the images."""
+        dil_kshp = [(k - 1) * d + 1 for k, d in zip(kshp, self.filter_dilation)]
+        return border_mode_to_pad(self.border_mode, self.convdim, dil_kshp)
+
+    def conv_shape(self, imshp, kshp):
+        """Return the spatial shape of the output of the convolution."""
+        return get_conv_output_shape(
+            (None, None, *imshp),
+            (None, None, *kshp),
+            self.border_mode,
+            self.subsample,
+            self.filter_dilation,
+        )[2:]
+
+    def _check_shapes(self, imshp, kshp):
+        pads = self.pads(kshp)
+        for i in range(self.convdim):
+            dil_k = (kshp[i] - 1) * self.filter_dilation[i] + 1
+            if kshp[i] < 1 or imshp[i] + sum(pads[i]) < dil_k:
+                raise ValueError(
+                    f"{type(self).__name__}: the filters of shape {tuple(kshp)} "
+                    f"don't fit in the padded images of shape {tuple(imshp)}"
+                )
+        return pads, self.conv_shape(imshp, kshp)
+
+    def _patch_slices(self, offsets, out_shp):
+        return (slice(None), slice(None)) + tuple(
+            slice(k * d, k * d + (o - 1) * s + 1, s)
+            for k, d, o, s in zip(
+                offsets, self.filter_dilation, out_shp, self.subsample
+            )
+        )
+
+    def c_code_cache_version(self):
+        return (1,)
+
+    def _c_geometry(self, imshp, kshp, fail):
+        """Return the C code that computes the padding and the output shape.
+
+        `imshp` must be the name of a C array with the spatial shape of the
+        images, and `kshp` the name of the array variable with the spatial
+        shape of the filters.
+
+        """
+        ndim = self.convdim
+        subsample = ", ".join(str(s) for s in self.subsample)
+        dilation = ", ".join(str(d) for d in self.filter_dilation)
+        if self.border_mode == "full":
+            pad_code = "pad_l[i] = pad_r[i] = dil_k - 1;"
+        elif self.border_mode == "half":
+            pad_code = "pad_l[i] = pad_r[i] = dil_k / 2;"
+        else:
+            # The padding doesn't depend on the filters
+            pad_code = ""
+        pads = self.pads([1] * ndim)
+        pad_l = ", ".join(str(p[0]) for p in pads)
+        pad_r = ", ".join(str(p[1]) for p in pads)
+        op_name = type(self).__name__
+
+        return """
+        const npy_intp subsample[%(ndim)s] = {%(subsample)s};
+        const npy_intp dilation[%(ndim)s] = {%(dilation)s};
+        npy_intp pad_l[%(ndim)s] = {%(pad_l)s}, pad_r[%(ndim)s] = {%(pad_r)s};
+        npy_intp k[%(ndim)s], out_shp[%(ndim)s];
+        npy_intp n_patches = 1, filter_size = 1;
+        if (PyArray_NDIM(%(kshp)s) != 1 || PyArray_DIMS(%(kshp)s)[0] != %(ndim)s) {
+            PyErr_SetString(PyExc_ValueError,
+                            "%(op_name)s: the filter shape must have %(ndim)s elements");
+            %(fail)s
+        }
+        for (int i = 0; i < %(ndim)s; i++) {
+            k[i] = ((dtype_%(kshp)s*)PyArray_GETPTR1(%(kshp)s, i))[0];
+            npy_intp dil_k = (k[i] - 1) * dilation[i] + 1;
+            %(pad_code)s
+            if (k[i] < 1 || %(imshp)s[i] + pad_l[i] + pad_r[i] < dil_k) {
+                PyErr_SetString(PyExc_ValueError,
+                                "%(op_name)s: the filters don't fit in the padded images");
+                %(fail)s
+            }
+            out_shp[i] = (%(imshp)s[i] + pad_l[i] + pad_r[i] - dil_k) / subsample[i] + 1;
+            n_patches *= out_shp[i];
+            filter_size *= k[i];
+        }
+        """ % dict(
+            ndim=ndim,
+            subsample=subsample,
+            dilation=dilation,
+            pad_code=pad_code,
+            pad_l=pad_l,
+            pad_r=pad_r,
+            op_name=op_name,
+            imshp=imshp,
+            kshp=kshp,
+            fail=fail,
+        )
+
+    def _c_loop(self, body):
+        """Return the C code that runs `body` for each value of each patch.
+
+        In `body`, ``pos`` is the position of the value in the (unpadded)
+        images, ``inside`` tells whether it is in the images, and
+        ``b``, ``p`` and ``c`` are the indices of the image, the patch and
+        the channel.
+
+        """
+        return """
+        npy_intp start[%(ndim)s], offset[%(ndim)s], pos[%(ndim)s];
+        for (npy_intp b = 0; b < batch; b++) {
+            for (npy_intp p = 0; p < n_patches; p++) {
+                npy_intp rem = p;
+                for (int i = %(ndim)s - 1; i >= 0; i--) {
+                    start[i] = (rem %% out_shp[i]) * subsample[i] - pad_l[i];
+                    rem /= out_shp[i];
+                }
+                for (npy_intp c = 0; c < channels; c++) {
+                    for (int i = 0; i < %(ndim)s; i++)
+                        offset[i] = 0;
+                    for (npy_intp q = 0; q < filter_size; q++) {
+                        int inside = 1;
+                        for (int i = 0; i < %(ndim)s; i++) {
+                            pos[i] = start[i] + offset[i] * dilation[i];
+                            inside &= (pos[i] >= 0 && pos[i] < imshp[i]);
+                        }
+                        %(body)s
+                        for (int i = %(ndim)s - 1; i >= 0; i--) {
+                            if (++offset[i] < k[i])
+                                break;
+                            offset[i] = 0;
+                        }
+                    }
+                }
+            }
+        }
+        """ % dict(
+            ndim=self.convdim, body=body
+        )
+
+
+class Im2Col(BaseIm2Col):
+    """Extract the patches of images that the filters of a convolution are applied to.
+
+    The inputs are the images, of shape ``(batch size, channels) + imshp``, and
+    the spatial shape ``kshp`` of the filters.  The output has shape
+    ``(batch size, number of patches, channels * prod(kshp))``, where the
+    patches are in the order of the outputs of the convolution, and each patch
+    is ordered by channel, then by position in the filters.
+
+    """
+
+    def make_node(self, img, kshp):
+        img = as_tensor_variable(img)
+        kshp = as_tensor_variable(kshp)
+        if img.type.ndim != 2 + self.convdim:
+            raise TypeError(f"img must be {int(2 + self.convdim)}D tensor")
+        if kshp.type.ndim != 1 or kshp.type.dtype not in discrete_dtypes:
+            raise TypeError("kshp must be an integer vector")
+        kshp = cast(kshp, "int64")
+
+        out = TensorType(img.type.dtype, shape=(img.type.shape[0], None, None))()
+        return Apply(self, [img, kshp], [out])
+
+    def perform(self, node, inputs, output_storage):
+        img, kshp = inputs
+        kshp = tuple(int(k) for k in kshp)
+        batch, channels, *imshp = img.shape
+        pads, out_shp = self._check_shapes(imshp, kshp)
+
+        img = np.pad(img, ((0, 0), (0, 0), *pads))
+        cols = np.stack(
+            [
+                img[self._patch_slices(offsets, out_shp)]
+                for offsets in np.ndindex(*kshp)
+            ],
+            axis=2,
+        )
+        cols = cols.reshape((batch, channels * int(np.prod(kshp)), -1))
+        cols = cols.transpose(0, 2, 1)
+        output_storage[0][0] = np.ascontiguousarray(cols)
+
+    def infer_shape(self, fgraph, node, input_shapes):
+        img, kshp = node.inputs
+        batch, channels, *imshp = input_shapes[0]
+        kshp = [kshp[i] for i in range(self.convdim)]
+        n_patches = reduce(mul, self.conv_shape(imshp, kshp))
+        return [(batch, n_patches, channels * reduce(mul, kshp))]
+
+    def connection_pattern(self, node):
+        return [[True], [False]]
+
+    def grad(self, inputs, output_grads):
+        img, kshp = inputs
+        (gcols,) = output_grads
+        col2im = Col2Im(self.border_mode, self.subsample, self.filter_dilation)
+        return [col2im(gcols, img.shape[2:], kshp), DisconnectedType()()]
+
+    def c_code(self, node, name, inputs, outputs, sub):
+        img, kshp = inputs
+        (cols,) = outputs
+        fail = sub["fail"]
+        ndim = self.convdim
+        geometry = self._c_geometry("imshp", kshp, fail)
+        loop = self._c_loop(
+            """
+            const char* src = img_data + b * img_strides[0] + c * img_strides[1];
+            for (int i = 0; i < %(ndim)s; i++)
+                src += pos[i] * img_strides[2 + i];
+            *out_data++ = inside ? *(dtype_%(img)s*)src : 0;
+            """
+            % locals()
+        )
+
+        return (
+            """
+        {
+        npy_intp batch = PyArray_DIMS(%(img)s)[0];
+        npy_intp channels = PyArray_DIMS(%(img)s)[1];
+        const npy_intp* imshp = PyArray_DIMS(%(img)s) + 2;
+        const npy_intp* img_strides = PyArray_STRIDES(%(img)s);
+        %(geometry)s
+        npy_intp dims[3] = {batch, n_patches, channels * filter_size};
+        if (!%(cols)s || !PyArray_IS_C_CONTIGUOUS(%(cols)s)
+            || !PyArray_CompareLists(PyArray_DIMS(%(cols)s), dims, 3)) {
+            Py_XDECREF(%(cols)s);
+            %(cols)s = (PyArrayObject*)PyArray_EMPTY(3, dims, PyArray_TYPE(%(img)s), 0);
+            if (!%(cols)s) {
+                %(fail)s
+            }
+        }
+        dtype_%(cols)s* out_data = (dtype_%(cols)s*)PyArray_DATA(%(cols)s);
+        const char* img_data = PyArray_BYTES(%(img)s);
+        %(loop)s
+        }
+        """
+            % locals()
+        )
+
+
+class Col2Im(BaseIm2Col):
+    """Sum the patches of images back into the images.
+
+    This is the transpose of `Im2Col`: the inputs are the patches, of shape
+    ``(batch size, number of patches, channels * prod(kshp))``, the spatial
+    shape ``imshp`` of the images and the spatial shape ``kshp`` of the
+    filters, and the output has shape ``(batch size, channels) + imshp``.
+
+    """
+
+    def make_node(self, cols, imshp, kshp):
+        cols = as_tensor_variable(cols)
+        imshp = as_tensor_variable(imshp)
+        kshp = as_tensor_variable(kshp)
+        if cols.type.ndim != 3:
+            raise TypeError("cols must be 3D tensor")
+        for shp in (imshp, kshp):
+            if shp.type.ndim != 1 or shp.type.dtype not in discrete_dtypes:
+                raise TypeError("imshp and kshp must be integer vectors")
+        imshp = cast(imshp, "int64")
+        kshp = cast(kshp, "int64")
+
+        out = TensorType(
+            cols.type.dtype, shape=(cols.type.shape[0],) + (None,) * (1 + self.convdim)
+        )()
+        return Apply(self, [cols, imshp, kshp], [out])
+
+    def perform(self, node, inputs, output_storage):
+        cols, imshp, kshp = inputs
+        imshp = tuple(int(i) for i in imshp)
+        kshp = tuple(int(k) for k in kshp)
+        batch, n_patches, size = cols.shape
+        pads, out_shp = self._check_shapes(imshp, kshp)
+        filter_size = int(np.prod(kshp))
+        if n_patches != np.prod(out_shp) or size % filter_size != 0:
+            raise ValueError(
+                f"Col2Im: patches of shape {cols.shape[1:]} don't match images "
+                f"of shape {imshp} and filters of shape {kshp}"
+            )
+        channels = size // filter_size
+
+        cols = cols.transpose(0, 2, 1).reshape((batch, channels, filter_size, *out_shp))
+        img = np.zeros(
+            (batch, channels) + tuple(i + sum(p) for i, p in zip(imshp, pads)),
+            dtype=cols.dtype,
+        )
+        for q, offsets in enumerate(np.ndindex(*kshp)):
+            img[self._patch_slices(offsets, out_shp)] += cols[:, :, q]
+        output_storage[0][0] = img[
+            (slice(None), slice(None))
+            + tuple(slice(p[0], p[0] + i) for i, p in zip(imshp, pads))
+        ]
+
+    def infer_shape(self, fgraph, node, input_shapes):
+        cols, imshp, kshp = node.inputs
+        batch, _, size = input_shapes[0]
+        filter_size = reduce(mul, [kshp[i] for i in range(self.convdim)])
+        return [
+            (batch, size // filter_size) + tuple(imshp[i] for i in range(self.convdim))
+        ]
+
+    def connection_pattern(self, node):
+        return [[True], [False], [False]]
+
+    def grad(self, inputs, output_grads):
+        cols, imshp, kshp = inputs
+        (gimg,) = output_grads
+        im2col = Im2Col(self.border_mode, self.subsample, self.filter_dilation)
+        return [im2col(gimg, kshp), DisconnectedType()(), DisconnectedType()()]
+
+    def c_code(self, node, name, inputs, outputs, sub):
+        cols, imshp, kshp = inputs
+        (img,) = outputs
+        fail = sub["fail"]
+        ndim = self.convdim
+        geometry = self._c_geometry("imshp", kshp, fail)
+        loop = self._c_loop(
+            """
+            if (inside) {
+                char* dst = img_data + b * img_strides[0] + c * img_strides[1];
+                for (int i = 0; i < %(ndim)s; i++)
+                    dst += pos[i] * img_strides[2 + i];
+                *(dtype_%(img)s*)dst += *cols_data;
+            }
+            cols_data++;
+            """
+            % locals()
+        )
+
+        return (
+            """
+        {
+        npy_intp batch = PyArray_DIMS(%(cols)s)[0];
+        npy_intp imshp[%(ndim)s];
+        if (PyArray_NDIM(%(imshp)s) != 1 || PyArray_DIMS(%(imshp)s)[0] != %(ndim)s) {
+            PyErr_SetString(PyExc_ValueError,
+                            "Col2Im: the image shape must have %(ndim)s elements");
+            %(fail)s
+        }
+        for (int i = 0; i < %(ndim)s; i++)
+            imshp[i] = ((dtype_%(imshp)s*)PyArray_GETPTR1(%(imshp)s, i))[0];
+        %(geometry)s
+        if (PyArray_DIMS(%(cols)s)[1] != n_patches
+            || PyArray_DIMS(%(cols)s)[2] %% filter_size != 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "Col2Im: the patches don't match the shape of the images and filters");
+            %(fail)s
+        }
+        npy_intp channels = PyArray_DIMS(%(cols)s)[2] / filter_size;
+        npy_intp dims[2 + %(ndim)s];
+        dims[0] = batch;
+        dims[1] = channels;
+        for (int i = 0; i < %(ndim)s; i++)
+            dims[2 + i] = imshp[i];
+        if (!%(img)s || !PyArray_IS_C_CONTIGUOUS(%(img)s)
+            || !PyArray_CompareLists(PyArray_DIMS(%(img)s), dims, 2 + %(ndim)s)) {
+            Py_XDECREF(%(img)s);
+            %(img)s = (PyArrayObject*)PyArray_ZEROS(
+                2 + %(ndim)s, dims, PyArray_TYPE(%(cols)s), 0);
+            if (!%(img)s) {
+                %(fail)s
+            }
+        } else {
+            PyArray_FILLWBYTE(%(img)s, 0);
+        }
+        PyArrayObject* cols_contig = PyArray_GETCONTIGUOUS(%(cols)s);
+        if (!cols_contig) {
+            %(fail)s
+        }
+        const dtype_%(cols)s* cols_data = (dtype_%(cols)s*)PyArray_DATA(cols_contig);
+        const npy_intp* img_strides = PyArray_STRIDES(%(img)s);
+        char* img_data = PyArray_BYTES(%(img)s);
+        %(loop)s
+        Py_DECREF(cols_contig);
+        }
+        """
+            % locals()
+        )
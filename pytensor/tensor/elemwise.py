@@ -8,16 +8,18 @@ import pytensor.tensor.basic
 from pytensor.configdefaults import config
 from pytensor.gradient import DisconnectedType
 from pytensor.graph.basic import Apply
+from pytensor.graph.costs import OpCost, io_bytes, size
 from pytensor.graph.null_type import NullType
 from pytensor.graph.replace import _vectorize_node, _vectorize_not_needed
 from pytensor.graph.utils import MethodNotDefined
 from pytensor.link.c.basic import failure_code
-from pytensor.link.c.op import COp, ExternalCOp, OpenMPOp
+from pytensor.link.c.op import ExternalCOp, OpenMPOp
 from pytensor.link.c.params_type import ParamsType
 from pytensor.misc.frozendict import frozendict
 from pytensor.misc.safe_asarray import _asarray
 from pytensor.printing import Printer, pprint
 from pytensor.scalar import get_scalar_type
+from pytensor.scalar.basic import Composite
 from pytensor.scalar.basic import bool as scalar_bool
 from pytensor.scalar.basic import identity as scalar_identity
 from pytensor.scalar.basic import transfer_type, upcast
@@ -809,6 +811,28 @@ class Elemwise(OpenMPOp):
         out_shape = broadcast_shape(*i_shapes, arrays_are_shapes=True)
         return [tuple(as_tensor_variable(s) for s in out_shape)] * len(node.outputs)
 
+    def cost(self, node, input_shapes):
+        # Runtime broadcasting is not allowed, so each output dimension has the
+        # length of any input whose dimension is not statically known to be 1
+        out_shape = []
+        for dim in range(node.outputs[0].type.ndim):
+            for inp, shape in zip(node.inputs, input_shapes):
+                if inp.type.shape[dim] != 1:
+                    out_shape.append(shape[dim])
+                    break
+            else:
+                out_shape.append(1)
+
+        if isinstance(self.scalar_op, Composite):
+            n_ops = len(self.scalar_op.fgraph.apply_nodes)
+        else:
+            n_ops = 1
+
+        return OpCost(
+            flops=size(out_shape) * n_ops,
+            bytes=io_bytes(node, input_shapes, [out_shape] * len(node.outputs)),
+        )
+
     def _c_all(self, node, nodename, inames, onames, sub):
         # Some `Op`s directly call `Elemwise._c_all` or `Elemwise.c_code`
         # To not request all of them to call prepare_node(), do it here.
@@ -974,9 +998,9 @@ class Elemwise(OpenMPOp):
         loop_orders = orders + [list(range(nnested))] * len(real_onames)
         dtypes = idtypes + list(real_odtypes)
         if all(
-            [o.ndim <= 1 for o in node.outputs]
+            [o.ndim == 0 for o in node.outputs]
             or
-            # Use simpler code when output ndim == 0 or 1
+            # Use simpler code when output ndim == 0
             # or for broadcated scalar.
             all(s == 1 for s in node.outputs[0].type.shape)
         ):
@@ -1171,7 +1195,7 @@ class Elemwise(OpenMPOp):
         return support_code
 
     def c_code_cache_version_apply(self, node):
-        version = [15]  # the version corresponding to the c code in this Op
+        version = [16]  # the version corresponding to the c code in this Op
 
         # now we insert versions for the ops on which we depend...
         scalar_node = Apply(
@@ -1196,7 +1220,7 @@ class Elemwise(OpenMPOp):
             return ()
 
 
-class CAReduce(COp):
+class CAReduce(OpenMPOp):
     """Reduces a scalar operation along specified axes.
 
     The scalar op should be both commutative and associative.
@@ -1240,6 +1264,7 @@ class CAReduce(COp):
         dtype=None,
         acc_dtype=None,
         upcast_discrete_output=False,
+        openmp=None,
     ):
         """
 
@@ -1277,6 +1302,10 @@ class CAReduce(COp):
             - for complex dtypes, we use at least complex128.
         upcast_discrete_output
             See
+        openmp
+            Whether the C code may reduce large contiguous inputs in parallel
+            with OpenMP. Defaults to ``config.openmp``. Only reductions over
+            the trailing dimensions of the input are parallelized.
 
         """
         if scalar_op.nin not in (-1, 2) or scalar_op.nout != 1:
@@ -1298,6 +1327,7 @@ class CAReduce(COp):
         self.dtype = dtype
         self.acc_dtype = acc_dtype
         self.upcast_discrete_output = upcast_discrete_output
+        super().__init__(openmp=openmp)
 
     @property
     def ufunc(self):
@@ -1464,6 +1494,25 @@ class CAReduce(COp):
     def __str__(self):
         return f"{type(self).__name__}{{{self.scalar_op}, {self._axis_str()}}}"
 
+    def R_op(self, inputs, eval_points):
+        from pytensor.tensor.math import sum as pt_sum
+
+        (x,) = inputs
+        (ev,) = eval_points
+        if ev is None:
+            return [None]
+        out = self(x)
+        if out.type.dtype in discrete_dtypes:
+            return [None]
+        # Each element of `x` only contributes to one element of `out`, so the
+        # L-operator with a cotangent of ones gives the derivative of `out`
+        # with respect to each element of `x`. Raises `NotImplementedError`
+        # if the subclass has no gradient.
+        (dx,) = self.L_op([x], [out], [out.ones_like()])
+        if isinstance(dx.type, (NullType, DisconnectedType)):
+            return [None]
+        return [pt_sum(dx * ev, axis=self.axis, dtype=out.type.dtype)]
+
     def perform(self, node, inp, out):
         (input,) = inp
         (output,) = out
@@ -1491,6 +1540,22 @@ class CAReduce(COp):
             return ((),)
         return ([ishape[i] for i in range(node.inputs[0].type.ndim) if i not in axis],)
 
+    def cost(self, node, input_shapes):
+        (ishape,) = input_shapes
+        axis = self.axis
+        if axis is None:
+            out_shape = []
+        else:
+            out_shape = [ishape[i] for i in range(len(ishape)) if i not in axis]
+        if isinstance(self.scalar_op, Composite):
+            n_ops = len(self.scalar_op.fgraph.apply_nodes)
+        else:
+            n_ops = 1
+        return OpCost(
+            flops=size(ishape) * n_ops,
+            bytes=io_bytes(node, input_shapes, [out_shape]),
+        )
+
     def _c_all(self, node, name, inames, onames, sub):
         input = node.inputs[0]
         output = node.outputs[0]
@@ -1645,6 +1710,13 @@ class CAReduce(COp):
             sub,
         )
 
+        ndim = input.type.ndim
+        trailing_axes = sorted(axis) == list(range(ndim - len(axis), ndim))
+        if self.openmp and ndim and trailing_axes and "complex" not in idtype + adtype:
+            loop = self._c_openmp_loop(
+                node, inames[0], aname, idtype, adtype, identity, loop, sub
+            )
+
         end = ""
         if adtype != odtype:
             end = f"""
@@ -1654,17 +1726,126 @@ class CAReduce(COp):
 
         return decl, checks, alloc, loop, end
 
+    def _c_openmp_loop(
+        self, node, iname, aname, idtype, adtype, identity, serial_loop, sub
+    ):
+        """Wrap `serial_loop` with a parallel reduction of contiguous inputs.
+
+        The input is seen as a ``(n_out, n_red)`` matrix, as only the trailing
+        dimensions are reduced. Each output element is reduced by a single
+        thread, so the result doesn't depend on the number of threads. A full
+        reduction is split in parts reduced in parallel, whose partial results
+        are combined in order. There is one part per thread, unless
+        ``config.deterministic == "more"``, in which case a fixed number of
+        parts is used so that the result is reproducible across thread counts.
+        """
+        # There can't be a `goto` out of an OpenMP block
+        sub = dict(sub, fail=failure_code(sub, use_goto=False))
+        acc_dtype = node.outputs[0].type.dtype
+        if getattr(self, "acc_dtype", None) is not None:
+            acc_dtype = self.acc_dtype
+        reduce_code = self.scalar_op.c_code(
+            Apply(
+                self.scalar_op,
+                [
+                    get_scalar_type(dtype=iv.type.dtype).make_variable()
+                    for iv in (node.inputs * 2)
+                ],
+                [
+                    get_scalar_type(dtype=ov.type.dtype).make_variable()
+                    for ov in node.outputs
+                ],
+            ),
+            None,
+            ["acc_i", "x_i"],
+            ["acc_i"],
+            sub,
+        )
+        combine_code = self.scalar_op.c_code(
+            Apply(
+                self.scalar_op,
+                [get_scalar_type(dtype=acc_dtype).make_variable() for _ in range(2)],
+                [get_scalar_type(dtype=acc_dtype).make_variable()],
+            ),
+            None,
+            ["acc_i", "part_i"],
+            ["acc_i"],
+            sub,
+        )
+        if config.deterministic == "more":
+            n_parts = "256"
+        else:
+            n_parts = "omp_get_max_threads()"
+        minsize = int(config.openmp_elemwise_minsize)
+
+        return f"""
+        {{
+            npy_intp n_out = PyArray_SIZE({aname});
+            npy_intp n_red = n_out ? PyArray_SIZE({iname}) / n_out : 0;
+            if (PyArray_SIZE({iname}) >= {minsize}
+                && PyArray_IS_C_CONTIGUOUS({iname})
+                && PyArray_IS_C_CONTIGUOUS({aname}))
+            {{
+                const {idtype}* in_ptr = (const {idtype}*)PyArray_DATA({iname});
+                {adtype}* acc_ptr = ({adtype}*)PyArray_DATA({aname});
+                if (n_out > 1)
+                {{
+                    #pragma omp parallel for schedule(static)
+                    for (npy_intp o = 0; o < n_out; ++o)
+                    {{
+                        {adtype} acc_i = {identity};
+                        const {idtype}* row = in_ptr + o * n_red;
+                        for (npy_intp k = 0; k < n_red; ++k)
+                        {{
+                            {idtype} x_i = row[k];
+                            {reduce_code}
+                        }}
+                        acc_ptr[o] = acc_i;
+                    }}
+                }}
+                else
+                {{
+                    int n_parts = {n_parts};
+                    std::vector<{adtype}> partials(n_parts);
+                    #pragma omp parallel for schedule(static)
+                    for (int p = 0; p < n_parts; ++p)
+                    {{
+                        {adtype} acc_i = {identity};
+                        npy_intp stop = n_red * (p + 1) / n_parts;
+                        for (npy_intp k = n_red * p / n_parts; k < stop; ++k)
+                        {{
+                            {idtype} x_i = in_ptr[k];
+                            {reduce_code}
+                        }}
+                        partials[p] = acc_i;
+                    }}
+                    {adtype} acc_i = {identity};
+                    for (int p = 0; p < n_parts; ++p)
+                    {{
+                        {adtype} part_i = partials[p];
+                        {combine_code}
+                    }}
+                    acc_ptr[0] = acc_i;
+                }}
+            }}
+            else
+            {{
+                {serial_loop}
+            }}
+        }}
+        """
+
     def c_code(self, node, name, inames, onames, sub):
         code = "\n".join(self._c_all(node, name, inames, onames, sub))
         return code
 
     def c_headers(self, **kwargs):
         # Sometimes, Elemwise's c_code is returned, so we need its headers
-        return ["<vector>", "<algorithm>"]
+        return ["<vector>", "<algorithm>", *super().c_headers(**kwargs)]
 
     def c_code_cache_version_apply(self, node):
         # the version corresponding to the c code in this Op
-        version = [9]
+        version = [10]
 
         # now we insert versions for the ops on which we depend...
         scalar_node = Apply(
@@ -1681,6 +1862,9 @@ class CAReduce(COp):
         version.append(self.scalar_op.c_code_cache_version_apply(scalar_node))
         for i in node.inputs + node.outputs:
             version.append(get_scalar_type(dtype=i.type.dtype).c_code_cache_version())
+        version.append(("openmp", self.openmp))
+        version.append(("openmp_elemwise_minsize", config.openmp_elemwise_minsize))
+        version.append(("deterministic", config.deterministic))
         if all(version):
             return tuple(version)
         else:
@@ -417,25 +417,74 @@ def make_reordered_loop(
             pointer_update += f"+{var}_stride_l{int(i)}*{iterv}"
         pointer_update += ");\n"
 
+    def openmp_pragma(i):
+        if i == 0 and openmp:
+            openmp_elemwise_minsize = config.openmp_elemwise_minsize
+            return f"""#pragma omp parallel for if( TOTAL_{int(i)} >={openmp_elemwise_minsize})\n"""
+        return ""
+
     loop = inner_task
-    for i in reversed(range(nnested)):
+    if nnested:
+        inner = nnested - 1
+        iterv = f"ITER_{int(inner)}"
+        loop = f"""
+        {openmp_pragma(inner)}for(int {iterv} = 0; {iterv}<TOTAL_{int(inner)}; {iterv}++)
+        {{ // begin loop {int(inner)}
+            {pointer_update}
+            {inner_task}
+        }} // end loop {int(inner)}
+        """
+
+        # Specialize the inner-most loop for when it runs over the last
+        # (C order) or the first (Fortran order) dimension, and the variables
+        # are either contiguous or broadcasted along it. The strides are then
+        # known at compile time, which lets the compiler vectorize the loop.
+        # This is checked at runtime, as the loops are ordered by the strides.
+        declare_kernels = ""
+        for dim in sorted({nnested - 1, 0}, reverse=True):
+            kernel = f"{ovar}_kernel{int(dim)}"
+            conditions = [f"{ovar}_loops.back().second == {int(dim)}"]
+            base = ""
+            refs = ""
+            for j, (loop_order, dtype) in enumerate(zip(init_loop_orders, dtypes)):
+                var = sub[f"lv{int(j)}"]
+                base += f"{dtype}* {var}_ptr = {var}_iter"
+                for i in range(inner):
+                    base += f"+{var}_stride_l{int(i)}*ITER_{int(i)}"
+                base += ";\n"
+                if loop_order[dim] == "x":
+                    # Broadcasted variables are constant over the inner loop
+                    base += f"{dtype} &{var}_i = *{var}_ptr;\n"
+                else:
+                    conditions.append(f"{var}_stride_l{int(inner)} == 1")
+                    refs += f"{dtype} &{var}_i = {var}_ptr[{iterv}];\n"
+            declare_kernels += f"bool {kernel} = {' && '.join(conditions)};\n"
+            loop = f"""
+            if ({kernel})
+            {{
+                {base}
+                {openmp_pragma(inner)}for(int {iterv} = 0; {iterv}<TOTAL_{int(inner)}; {iterv}++)
+                {{
+                    {refs}
+                    {inner_task}
+                }}
+            }}
+            else
+            {{
+                {loop}
+            }}
+            """
+        declare_strides += declare_kernels
+
+    for i in reversed(range(nnested - 1)):
         iterv = f"ITER_{int(i)}"
         total = f"TOTAL_{int(i)}"
-        update = ""
-        forloop = ""
-        # The pointers are defined only in the most inner loop
-        if i == nnested - 1:
-            update = pointer_update
-        if i == 0:
-            if openmp:
-                openmp_elemwise_minsize = config.openmp_elemwise_minsize
-                forloop += f"""#pragma omp parallel for if( {total} >={openmp_elemwise_minsize})\n"""
+        forloop = openmp_pragma(i)
         forloop += f"for(int {iterv} = 0; {iterv}<{total}; {iterv}++)"
 
         loop = f"""
         {forloop}
         {{ // begin loop {int(i)}
-            {update}
             {loop}
         }} // end loop {int(i)}
         """
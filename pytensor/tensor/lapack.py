@@ -0,0 +1,187 @@
+r"""C interface to the LAPACK routines used by the linear algebra `Op`\s.
+
+LAPACK is linked through the same ``config.blas__ldflags`` as the BLAS `Op`\s
+(most BLAS implementations, e.g. OpenBLAS and MKL, also provide LAPACK).
+When the configured library doesn't provide LAPACK, or the inputs have a
+dtype LAPACK doesn't support, the `Op`\s fall back to their Python
+implementation.
+
+"""
+
+import textwrap
+
+from pytensor.configdefaults import config
+from pytensor.graph.utils import MethodNotDefined
+from pytensor.link.c.cmodule import GCC_compiler, std_lib_dirs
+from pytensor.link.c.op import COp
+from pytensor.tensor.blas import ldflags
+from pytensor.utils import memoize
+
+
+_lapack_dtypes = {"float32": ("s", "float"), "float64": ("d", "double")}
+"""The LAPACK prefix and C type of each supported dtype."""
+
+
+@memoize
+def _try_lapack_flags(blas_ldflags):
+    test_code = textwrap.dedent(
+        """\
+        extern "C" void dgetrf_(int*, int*, double*, int*, int*, int*);
+        int main(int argc, char** argv)
+        {
+            int n = 2, info = 0;
+            int ipiv[2];
+            double a[4] = {4, 2, 2, 3};
+            dgetrf_(&n, &n, a, &n, ipiv, &info);
+            return (info == 0 && a[0] == 4) ? 0 : -1;
+        }
+        """
+    )
+    cflags = blas_ldflags.split()
+    cflags.extend([f"-L{d}" for d in std_lib_dirs()])
+    res = GCC_compiler.try_compile_tmp(
+        test_code, tmp_prefix="try_lapack_", flags=cflags, try_run=True
+    )
+    return bool(res and res[0] and res[1])
+
+
+def lapack_available():
+    """Return whether ``config.blas__ldflags`` provides LAPACK."""
+    if not config.cxx or not config.blas__ldflags:
+        return False
+    return _try_lapack_flags(config.blas__ldflags)
+
+
+def lapack_header_text():
+    """C header for the Fortran LAPACK interface and shared helpers."""
+    header = """
+    #include <cmath>
+
+    extern "C"
+    {
+    """
+    for prefix, ctype in _lapack_dtypes.values():
+        header += f"""
+        void {prefix}potrf_(char*, int*, {ctype}*, int*, int*);
+        void {prefix}potrs_(char*, int*, int*, {ctype}*, int*, {ctype}*, int*, int*);
+        void {prefix}trtrs_(char*, char*, char*, int*, int*, {ctype}*, int*, {ctype}*, int*, int*);
+        void {prefix}getrf_(int*, int*, {ctype}*, int*, int*, int*);
+        void {prefix}getrs_(char*, int*, int*, {ctype}*, int*, int*, {ctype}*, int*, int*);
+        """
+    return header + textwrap.dedent(
+        """
+        }
+
+        static void lapack_linalg_error(const char* msg)
+        {
+            PyObject* mod = PyImport_ImportModule("numpy.linalg");
+            if (mod == NULL)
+                return;
+            PyObject* exc = PyObject_GetAttrString(mod, "LinAlgError");
+            Py_DECREF(mod);
+            if (exc == NULL)
+                return;
+            PyErr_SetString(exc, msg);
+            Py_DECREF(exc);
+        }
+
+        // Return a new reference to `x` if it can be passed to LAPACK as is,
+        // i.e. if it is contiguous in either order.  Otherwise, or if `copy`
+        // is true, return a new reference to a contiguous copy of `x`.
+        static PyArrayObject* lapack_contiguous(PyArrayObject* x, bool copy)
+        {
+            if (!copy && (PyArray_IS_C_CONTIGUOUS(x) || PyArray_IS_F_CONTIGUOUS(x)))
+            {
+                Py_INCREF(x);
+                return x;
+            }
+            return (PyArrayObject*)PyArray_NewCopy(x, NPY_ANYORDER);
+        }
+
+        // Return a new reference to a Fortran-ordered copy of `x`, or to `x`
+        // itself if it is already Fortran-ordered, writeable and `inplace` is true.
+        static PyArrayObject* lapack_fortran_copy(PyArrayObject* x, bool inplace)
+        {
+            if (inplace && PyArray_IS_F_CONTIGUOUS(x) && PyArray_ISWRITEABLE(x))
+            {
+                Py_INCREF(x);
+                return x;
+            }
+            return (PyArrayObject*)PyArray_FromArray(
+                x, NULL,
+                NPY_ARRAY_F_CONTIGUOUS | NPY_ARRAY_ALIGNED | NPY_ARRAY_ENSURECOPY);
+        }
+
+        // Check that the contiguous array `x` only contains finite numbers,
+        // like the `check_finite` argument of the `scipy.linalg` functions.
+        template<typename T>
+        static int lapack_check_finite(PyArrayObject* x)
+        {
+            const T* data = (const T*)PyArray_DATA(x);
+            npy_intp size = PyArray_SIZE(x);
+            for (npy_intp i = 0; i < size; ++i)
+            {
+                if (!std::isfinite(data[i]))
+                {
+                    PyErr_SetString(PyExc_ValueError,
+                                    "array must not contain infs or NaNs");
+                    return -1;
+                }
+            }
+            return 0;
+        }
+        """
+    )
+
+
+def lapack_header_version():
+    return (1,)
+
+
+class BaseLAPACK(COp):
+    r"""Base class for the `Op`\s that call LAPACK from their C code.
+
+    The C code is only generated when LAPACK is available and all the
+    inputs and outputs of the node have the same floating point dtype;
+    otherwise the `Op` falls back to its :meth:`Op.perform` method.
+
+    """
+
+    def c_libraries(self, **kwargs):
+        return ldflags()
+
+    def c_compile_args(self, **kwargs):
+        return ldflags(libs=False, flags=True)
+
+    def c_lib_dirs(self, **kwargs):
+        return ldflags(libs=False, libs_dir=True)
+
+    def c_header_dirs(self, **kwargs):
+        return ldflags(libs=False, include_dir=True)
+
+    def c_support_code(self, **kwargs):
+        return lapack_header_text()
+
+    def c_code_cache_version(self):
+        return (1, *lapack_header_version())
+
+    def lapack_types(self, node, variables=None):
+        """Return the LAPACK prefix and C type for `node`.
+
+        All the `variables` (by default, the inputs and outputs of `node`)
+        must share the same dtype.
+
+        Raises
+        ------
+        MethodNotDefined
+            If LAPACK is unavailable or doesn't support the dtypes of `node`.
+
+        """
+        if not lapack_available():
+            raise MethodNotDefined("LAPACK is not available")
+        if variables is None:
+            variables = node.inputs + node.outputs
+        dtypes = {var.type.dtype for var in variables}
+        if len(dtypes) != 1 or next(iter(dtypes)) not in _lapack_dtypes:
+            raise MethodNotDefined(f"LAPACK doesn't support the dtypes {dtypes}")
+        return _lapack_dtypes[dtypes.pop()]
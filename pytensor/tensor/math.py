@@ -8,6 +8,7 @@ from pytensor import config, printing
 from pytensor import scalar as ps
 from pytensor.gradient import DisconnectedType
 from pytensor.graph.basic import Apply, Variable
+from pytensor.graph.costs import OpCost, io_bytes, size
 from pytensor.graph.op import Op
 from pytensor.graph.replace import _vectorize_node
 from pytensor.link.c.op import COp
@@ -2056,6 +2057,14 @@ class Dot(Op):
             return [xshp[:-1] + yshp[-1:]]
         raise NotImplementedError()
 
+    def cost(self, node, input_shapes):
+        xshp, yshp = input_shapes
+        out_shape = list(xshp[:-1]) + list(yshp[1:])
+        return OpCost(
+            flops=2 * size(xshp) * size(yshp[1:]),
+            bytes=io_bytes(node, input_shapes, [out_shape]),
+        )
+
     def __str__(self):
         return "dot"
 
@@ -6,11 +6,13 @@ import numpy as np
 from pytensor import scalar as ps
 from pytensor.gradient import DisconnectedType
 from pytensor.graph.basic import Apply
+from pytensor.graph.costs import OpCost, io_bytes
 from pytensor.graph.op import Op
 from pytensor.tensor import basic as ptb
 from pytensor.tensor import math as ptm
 from pytensor.tensor.basic import as_tensor_variable, diagonal
 from pytensor.tensor.blockwise import Blockwise
+from pytensor.tensor.lapack import BaseLAPACK
 from pytensor.tensor.type import dvector, lscalar, matrix, scalar, vector
 
 
@@ -153,6 +155,11 @@ class MatrixInverse(Op):
     def infer_shape(self, fgraph, node, shapes):
         return shapes
 
+    def cost(self, node, input_shapes):
+        (xshape,) = input_shapes
+        n = xshape[0]
+        return OpCost(flops=2 * n * n * n, bytes=io_bytes(node, input_shapes, [xshape]))
+
 
 inv = matrix_inverse = Blockwise(MatrixInverse())
 
@@ -182,7 +189,7 @@ def trace(X):
     return diagonal(X).sum()
 
 
-class Det(Op):
+class Det(BaseLAPACK):
     """
     Matrix determinant. Input should be a square matrix.
 
@@ -207,6 +214,71 @@ class Det(Op):
             print("Failed to compute determinant", x)
             raise
 
+    def c_code(self, node, name, inputs, outputs, sub):
+        prefix, ctype = self.lapack_types(node)
+        (x,) = inputs
+        (z,) = outputs
+        fail = sub["fail"]
+        return f"""
+        {{
+            int n, lda, info = 0;
+            int* ipiv;
+            {ctype}* a;
+            {ctype} det = 1;
+            PyArrayObject* a_arr;
+
+            if (PyArray_DIMS({x})[0] != PyArray_DIMS({x})[1])
+            {{
+                PyErr_SetString(PyExc_ValueError, "Input must be a square matrix");
+                {fail}
+            }}
+            if ({z} == NULL)
+            {{
+                {z} = (PyArrayObject*)PyArray_EMPTY(0, NULL, PyArray_TYPE({x}), 0);
+                if ({z} == NULL)
+                {{
+                    {fail}
+                }}
+            }}
+            a_arr = lapack_contiguous({x}, true);
+            if (a_arr == NULL)
+            {{
+                {fail}
+            }}
+            n = PyArray_DIMS(a_arr)[0];
+            lda = n > 1 ? n : 1;
+            a = ({ctype}*)PyArray_DATA(a_arr);
+            ipiv = (int*)malloc((n > 0 ? n : 1) * sizeof(int));
+            if (ipiv == NULL)
+            {{
+                Py_DECREF(a_arr);
+                PyErr_NoMemory();
+                {fail}
+            }}
+            // The determinant of the transpose of a C-ordered matrix is the same,
+            // and a singular matrix has a zero on the diagonal of its LU factor
+            {prefix}getrf_(&n, &n, a, &lda, ipiv, &info);
+            for (int i = 0; i < n; ++i)
+            {{
+                det *= a[i * (npy_intp)(n + 1)];
+                if (ipiv[i] != i + 1)
+                    det = -det;
+            }}
+            free(ipiv);
+            Py_DECREF(a_arr);
+            if (info < 0)
+            {{
+                PyErr_Format(PyExc_ValueError,
+                             "illegal value in %d-th argument of internal getrf", -info);
+                {fail}
+            }}
+            *({ctype}*)PyArray_DATA({z}) = det;
+        }}
+        """
+
+    def c_code_cache_version(self):
+        return (1, *super().c_code_cache_version())
+
     def grad(self, inputs, g_outputs):
         (gz,) = g_outputs
         (x,) = inputs
@@ -215,6 +287,13 @@ class Det(Op):
     def infer_shape(self, fgraph, node, shapes):
         return [()]
 
+    def cost(self, node, input_shapes):
+        # The LU factorization dominates
+        n = input_shapes[0][0]
+        return OpCost(
+            flops=2 * n * n * n // 3, bytes=io_bytes(node, input_shapes, [()])
+        )
+
     def __str__(self):
         return "Det"
 
@@ -250,6 +329,13 @@ class SLogDet(Op):
     def infer_shape(self, fgraph, node, shapes):
         return [(), ()]
 
+    def cost(self, node, input_shapes):
+        # The LU factorization dominates
+        n = input_shapes[0][0]
+        return OpCost(
+            flops=2 * n * n * n // 3, bytes=io_bytes(node, input_shapes, [(), ()])
+        )
+
     def __str__(self):
         return "SLogDet"
 
@@ -459,6 +459,7 @@ class GemmOptimizer(GraphRewriter):
             if new_node is not node:
                 nodelist.append(new_node)
 
+        guide = getattr(fgraph, "profile_guide", None)
         u = pytensor.graph.rewriting.basic.DispatchingFeature(
             on_import, None, None, name="GemmOptimizer"
         )
@@ -499,6 +500,12 @@ class GemmOptimizer(GraphRewriter):
                 if new_outputs:
                     new_outputs, old_dot22 = new_outputs
                     assert len(new_outputs) == len(node.outputs)
+                    if guide is not None and guide.is_slower(
+                        [gemm_no_inplace], [old_dot22.owner.op, node.op]
+                    ):
+                        # `Gemm` was measured to be slower than the dot product
+                        # and the `Elemwise` it would replace
+                        continue
                     new_outputs[
                         0
                     ].tag.values_eq_approx = values_eq_approx_remove_inf_nan
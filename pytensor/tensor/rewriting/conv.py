@@ -0,0 +1,197 @@
+r"""Rewrites that lower the `AbstractConv` `Op`\s to matrix products.
+
+The patches of the images are gathered with `Im2Col` (and scattered back with
+`Col2Im`), so that the convolutions and their gradients become `dot`\s and
+`batched_dot`\s, which the BLAS rewrites turn into ``GEMM`` calls.
+
+"""
+
+from functools import reduce
+from operator import mul
+
+from pytensor.compile.mode import optdb
+from pytensor.graph.rewriting.basic import copy_stack_trace, in2out, node_rewriter
+from pytensor.tensor.blas import batched_dot
+from pytensor.tensor.conv.abstract_conv import (
+    AbstractConv,
+    AbstractConv_gradInputs,
+    AbstractConv_gradWeights,
+)
+from pytensor.tensor.conv.im2col import Col2Im, Im2Col
+from pytensor.tensor.math import dot
+
+
+def _use_gemm(node):
+    """Tell whether the products of a convolution node can be done by BLAS."""
+    dtypes = {var.type.dtype for var in node.inputs[:2] + node.outputs}
+    return len(dtypes) == 1 and dtypes <= {"float32", "float64"}
+
+
+def _flip_filters(kern, convdim):
+    return kern[
+        (slice(None),) * (kern.ndim - convdim) + (slice(None, None, -1),) * convdim
+    ]
+
+
+def _prod(shape):
+    return reduce(mul, shape)
+
+
+def _grouped_dot(x, y, num_groups):
+    """Multiply the matrices ``x[g]`` and ``y[g]`` of each group ``g``."""
+    if num_groups == 1:
+        return dot(x[0], y[0])[None]
+    return batched_dot(x, y)
+
+
+@node_rewriter([AbstractConv])
+def local_abstractconv_im2col(fgraph, node):
+    """Compute a convolution as a product of its filters and image patches."""
+    if not _use_gemm(node):
+        return None
+
+    op = node.op
+    convdim = op.convdim
+    groups = op.num_groups
+    img, kern = node.inputs
+    if op.filter_flip:
+        kern = _flip_filters(kern, convdim)
+    kshp = kern.shape[-convdim:]
+
+    im2col = Im2Col(op.border_mode, op.subsample, op.filter_dilation)
+    cols = im2col(img, kshp)
+    batch, n_patches, size = cols.shape
+    nkern = kern.shape[0]
+    out_shp = im2col.conv_shape(
+        [img.shape[2 + i] for i in range(convdim)], [kshp[i] for i in range(convdim)]
+    )
+
+    if op.unshared:
+        # Each patch has its own filters, so there is one product per patch
+        # and group
+        cols = cols.reshape((batch, n_patches, groups, size // groups))
+        cols = cols.dimshuffle(1, 2, 0, 3).reshape(
+            (n_patches * groups, batch, size // groups)
+        )
+        kern = kern.reshape((groups, nkern // groups, n_patches, size // groups))
+        kern = kern.dimshuffle(2, 0, 3, 1).reshape(
+            (n_patches * groups, size // groups, nkern // groups)
+        )
+        out = batched_dot(cols, kern)
+        out = out.reshape((n_patches, groups, batch, nkern // groups))
+        out = out.dimshuffle(2, 0, 1, 3)
+    else:
+        cols = cols.reshape((batch * n_patches, groups, size // groups))
+        cols = cols.dimshuffle(1, 0, 2)
+        kern = kern.reshape((groups, nkern // groups, size // groups))
+        out = _grouped_dot(cols, kern.dimshuffle(0, 2, 1), groups)
+        out = out.dimshuffle(1, 0, 2)
+
+    out = out.reshape((batch, *out_shp, nkern))
+    out = out.dimshuffle(0, convdim + 1, *range(1, convdim + 1))
+    copy_stack_trace(node.outputs[0], out)
+    return [out]
+
+
+@node_rewriter([AbstractConv_gradWeights])
+def local_abstractconv_gradweights_im2col(fgraph, node):
+    """Compute the gradient of a convolution wrt its filters with `Im2Col`."""
+    if not _use_gemm(node):
+        return None
+
+    op = node.op
+    convdim = op.convdim
+    groups = op.num_groups
+    img, topgrad, shape = node.inputs
+    kshp = [shape[i] for i in range(convdim)]
+
+    cols = Im2Col(op.border_mode, op.subsample, op.filter_dilation)(img, shape)
+    batch, n_patches, size = cols.shape
+    nkern = topgrad.shape[1]
+    out_shp = [topgrad.shape[2 + i] for i in range(convdim)]
+    top = topgrad.dimshuffle(0, *range(2, convdim + 2), 1)
+
+    if op.unshared:
+        cols = cols.reshape((batch, n_patches, groups, size // groups))
+        cols = cols.dimshuffle(1, 2, 0, 3).reshape(
+            (n_patches * groups, batch, size // groups)
+        )
+        top = top.reshape((batch, n_patches, groups, nkern // groups))
+        top = top.dimshuffle(1, 2, 3, 0).reshape(
+            (n_patches * groups, nkern // groups, batch)
+        )
+        kern = batched_dot(top, cols)
+        kern = kern.reshape((n_patches, groups, nkern // groups, size // groups))
+        kern = kern.dimshuffle(1, 2, 0, 3).reshape(
+            (nkern, *out_shp, img.shape[1] // groups, *kshp)
+        )
+    else:
+        cols = cols.reshape((batch * n_patches, groups, size // groups))
+        cols = cols.dimshuffle(1, 0, 2)
+        top = top.reshape((batch * n_patches, groups, nkern // groups))
+        top = top.dimshuffle(1, 2, 0)
+        kern = _grouped_dot(top, cols, groups)
+        kern = kern.reshape((nkern, img.shape[1] // groups, *kshp))
+
+    if op.filter_flip:
+        kern = _flip_filters(kern, convdim)
+    copy_stack_trace(node.outputs[0], kern)
+    return [kern]
+
+
+@node_rewriter([AbstractConv_gradInputs])
+def local_abstractconv_gradinputs_im2col(fgraph, node):
+    """Compute the gradient of a convolution wrt its images with `Col2Im`."""
+    if not _use_gemm(node):
+        return None
+
+    op = node.op
+    convdim = op.convdim
+    groups = op.num_groups
+    kern, topgrad, shape = node.inputs
+    if op.filter_flip:
+        kern = _flip_filters(kern, convdim)
+    kshp = kern.shape[-convdim:]
+
+    batch, nkern = topgrad.shape[0], topgrad.shape[1]
+    n_patches = _prod([topgrad.shape[2 + i] for i in range(convdim)])
+    # The size of the patches of a group
+    size = kern.shape[-convdim - 1] * _prod([kshp[i] for i in range(convdim)])
+    top = topgrad.dimshuffle(0, *range(2, convdim + 2), 1)
+
+    if op.unshared:
+        top = top.reshape((batch, n_patches, groups, nkern // groups))
+        top = top.dimshuffle(1, 2, 0, 3).reshape(
+            (n_patches * groups, batch, nkern // groups)
+        )
+        kern = kern.reshape((groups, nkern // groups, n_patches, size))
+        kern = kern.dimshuffle(2, 0, 1, 3).reshape(
+            (n_patches * groups, nkern // groups, size)
+        )
+        cols = batched_dot(top, kern).reshape((n_patches, groups, batch, size))
+        cols = cols.dimshuffle(2, 0, 1, 3)
+    else:
+        top = top.reshape((batch * n_patches, groups, nkern // groups))
+        top = top.dimshuffle(1, 0, 2)
+        kern = kern.reshape((groups, nkern // groups, size))
+        cols = _grouped_dot(top, kern, groups).dimshuffle(1, 0, 2)
+
+    cols = cols.reshape((batch, n_patches, groups * size))
+    img = Col2Im(op.border_mode, op.subsample, op.filter_dilation)(cols, shape, kshp)
+    copy_stack_trace(node.outputs[0], img)
+    return [img]
+
+
+# Run after the stabilization rewrites (1.5) and before the BLAS ones (1.7),
+# which turn the products into GEMMs
+optdb.register(
+    "conv_gemm",
+    in2out(
+        local_abstractconv_im2col,
+        local_abstractconv_gradweights_im2col,
+        local_abstractconv_gradinputs_im2col,
+        name="conv_gemm",
+    ),
+    "fast_run",
+    position=1.6,
+)
@@ -151,7 +151,14 @@ class InplaceElemwiseOptimizer(GraphRewriter):
         ]
         protected_inputs = sum(protected_inputs, [])  # flatten the list
         protected_inputs.extend(fgraph.outputs)
-        for node in list(io_toposort(fgraph.inputs, fgraph.outputs)):
+
+        nodes = list(io_toposort(fgraph.inputs, fgraph.outputs))
+        guide = getattr(fgraph, "profile_guide", None)
+        if guide is not None:
+            # The nodes compete for the inputs they can destroy, so give the
+            # ones measured to be the most expensive the first chance
+            nodes.sort(key=lambda node: -(guide.op_time(node.op) or 0.0))
+        for node in nodes:
             op = node.op
             if not isinstance(op, self.op):
                 continue
@@ -664,6 +671,15 @@ class FusionOptimizer(GraphRewriter):
         ]
         return scalar_inputs, scalar_outputs
 
+    @staticmethod
+    def profiled_op(node):
+        """Return the `Op` that `node` will have once compiled, for `ProfileGuide`."""
+        # The constants of the `Composite` are inlined after the fusion
+        inlined = _inline_composite_constants(node)
+        if inlined is None:
+            return node.op
+        return Elemwise(inlined[0])
+
     def apply(self, fgraph):
         nb_replacement = 0
 
@@ -673,6 +689,7 @@ class FusionOptimizer(GraphRewriter):
             callback_before = fgraph.execute_callbacks_time
 
         max_operands = elemwise_max_operands_fct(None)
+        guide = getattr(fgraph, "profile_guide", None)
 
         def find_next_fuseable_subgraph(
             fg: FunctionGraph,
@@ -683,7 +700,8 @@ class FusionOptimizer(GraphRewriter):
             -------
             List of inputs and outputs that determine subgraphs which can be fused.
             This generator assumes that such subgraph is replaced by a single
-            Elemwise Composite before being accessed again in the next iteration.
+            Elemwise Composite, or left untouched if it shouldn't be fused, before
+            being accessed again in the next iteration.
             """
 
             FUSEABLE_MAPPING = DefaultDict[Variable, list[Apply]]
@@ -991,6 +1009,26 @@ class FusionOptimizer(GraphRewriter):
                 visited_nodes.add(new_composite_node)
                 return
 
+            def update_fuseable_mappings_after_skip(
+                *,
+                fuseable_clients: FUSEABLE_MAPPING,
+                unfuseable_clients: UNFUSEABLE_MAPPING,
+                skipped_nodes: list[Apply],
+            ) -> None:
+                # The skipped nodes stay in the graph, but they can no longer
+                # be fused with any other node
+                for skipped_node in skipped_nodes:
+                    for inp in skipped_node.inputs:
+                        if skipped_node in fuseable_clients.get(inp, ()):
+                            fuseable_clients[inp].remove(skipped_node)
+                            if not fuseable_clients[inp]:
+                                fuseable_clients.pop(inp)
+                            unfuseable_clients[inp].add(skipped_node)
+                    (skipped_out,) = skipped_node.outputs
+                    unfuseable_clients[skipped_out].update(
+                        fuseable_clients.pop(skipped_out, ())
+                    )
+
             # We start by creating two maps, 1) from each node to each potentially
             # fuseable client (both nodes must be single output Elemwise with same
             # broadcast type) and 2) from each node to each certainly unfuseable
@@ -1013,6 +1051,17 @@ class FusionOptimizer(GraphRewriter):
                     # by replacing the subgraph with a Composite Op
                     yield subgraph_inputs, subgraph_outputs
 
+                    if fg.apply_nodes == starting_nodes:
+                        # The caller decided not to fuse the subgraph
+                        update_fuseable_mappings_after_skip(
+                            fuseable_clients=fuseable_clients,
+                            unfuseable_clients=unfuseable_clients,
+                            skipped_nodes=io_toposort(
+                                subgraph_inputs, subgraph_outputs
+                            ),
+                        )
+                        continue
+
                     # This is where we avoid repeated work by using a stateful
                     # generator. For large models (as in `TestFusion.test_big_fusion`)
                     # this can provide huge speedups
@@ -1038,6 +1087,14 @@ class FusionOptimizer(GraphRewriter):
             )
             if not isinstance(composite_outputs, list):
                 composite_outputs = [composite_outputs]
+            if guide is not None and guide.is_slower(
+                [self.profiled_op(composite_outputs[0].owner)],
+                [node.op for node in io_toposort(inputs, outputs)],
+                by_type=False,
+            ):
+                # This `Composite` was measured to be slower than the
+                # `Elemwise`s it would replace
+                continue
             for old_out, composite_out in zip(outputs, composite_outputs):
                 if old_out.name:
                     composite_out.name = old_out.name
@@ -1208,14 +1265,13 @@ def local_careduce_fusion(fgraph, node):
     return [new_car_op(*elm_inputs)]
 
 
-@node_rewriter([Elemwise])
-def local_inline_composite_constants(fgraph, node):
-    """Inline scalar constants in Composite graphs."""
-    composite_op = node.op.scalar_op
-
-    if not isinstance(composite_op, ps.Composite):
-        return None
+def _inline_composite_constants(node):
+    """Return the `Composite` of `node` with its scalar constants inlined.
 
+    The remaining outer inputs are returned with it, or ``None`` if there is no
+    constant to inline.
+    """
+    composite_op = node.op.scalar_op
     new_outer_inputs = []
     new_inner_inputs = []
     inner_replacements = {}
@@ -1237,7 +1293,20 @@ def local_inline_composite_constants(fgraph, node):
     new_inner_outs = clone_replace(
         composite_op.fgraph.outputs, replace=inner_replacements
     )
-    new_composite_op = ps.Composite(new_inner_inputs, new_inner_outs)
+    return ps.Composite(new_inner_inputs, new_inner_outs), new_outer_inputs
+
+
+@node_rewriter([Elemwise])
+def local_inline_composite_constants(fgraph, node):
+    """Inline scalar constants in Composite graphs."""
+    if not isinstance(node.op.scalar_op, ps.Composite):
+        return None
+
+    inlined = _inline_composite_constants(node)
+    if inlined is None:
+        return None
+
+    new_composite_op, new_outer_inputs = inlined
     new_outputs = Elemwise(new_composite_op).make_node(*new_outer_inputs).outputs
 
     # Some of the inlined constants were broadcasting the output shape
@@ -1,13 +1,30 @@
 import logging
 from typing import cast
 
-from pytensor.graph.rewriting.basic import copy_stack_trace, node_rewriter
-from pytensor.tensor.basic import TensorVariable, diagonal, swapaxes
+from pytensor.compile import optdb
+from pytensor.graph.features import ReplaceValidate
+from pytensor.graph.rewriting.basic import (
+    GraphRewriter,
+    WalkingGraphRewriter,
+    copy_stack_trace,
+    node_rewriter,
+)
+from pytensor.graph.utils import InconsistencyError
+from pytensor.tensor.basic import (
+    TensorVariable,
+    arange,
+    diagonal,
+    eye,
+    ones_like,
+    swapaxes,
+)
 from pytensor.tensor.blas import Dot22
 from pytensor.tensor.blockwise import Blockwise
 from pytensor.tensor.elemwise import DimShuffle
-from pytensor.tensor.math import Dot, Prod, _matrix_matrix_matmul, log, prod
-from pytensor.tensor.nlinalg import MatrixInverse, det
+from pytensor.tensor.math import Dot, Prod, _matrix_matrix_matmul
+from pytensor.tensor.math import abs as pt_abs
+from pytensor.tensor.math import log, neq, prod, sign
+from pytensor.tensor.nlinalg import Det, MatrixInverse, SLogDet, det
 from pytensor.tensor.rewriting.basic import (
     register_canonicalize,
     register_specialize,
@@ -15,8 +32,12 @@ from pytensor.tensor.rewriting.basic import (
 )
 from pytensor.tensor.slinalg import (
     Cholesky,
+    LUFactor,
+    _lu_factor,
+    _lu_solve,
     Solve,
     SolveBase,
+    cho_solve,
     cholesky,
     solve,
     solve_triangular,
@@ -290,6 +311,199 @@ def local_det_chol(fgraph, node):
             return [prod(diagonal(L, axis1=-2, axis2=-1) ** 2, axis=-1)]
 
 
+class ShareLinalgFactorization(GraphRewriter):
+    r"""Share a single factorization of a matrix among the `Op`\s that decompose it.
+
+    `Solve`, `Det`, `SLogDet` and `MatrixInverse` each factorize their input
+    matrix. When several of them are applied to the same matrix, as in the
+    `solve`, `slogdet` and gradient of a Gaussian log-density, they are
+    replaced by graphs that reuse one factorization of the matrix.
+
+    The factorization is a Cholesky decomposition if the matrix is known to be
+    positive definite, i.e. if it already has a `Cholesky` decomposition, if it
+    is solved with ``assume_a="pos"`` or if it has a ``psd`` tag. Otherwise it
+    is a pivoted `LUFactor` decomposition. The `Solve`\s that only read one
+    triangle of the matrix are only merged with the decompositions that read
+    the same triangle.
+
+    The matrices whose static size is smaller than `min_size` are left alone,
+    since the few factorizations they save cost less than the nodes that the
+    shared factorization adds to the graph.
+
+    """
+
+    factor_ops = (Cholesky, LUFactor)
+    consumer_ops = (Solve, Det, SLogDet, MatrixInverse)
+    min_size = 200
+
+    def add_requirements(self, fgraph):
+        fgraph.attach_feature(ReplaceValidate())
+
+    def apply(self, fgraph):
+        decompositions = {}
+        for node in fgraph.toposort():
+            if not (
+                isinstance(node.op, Blockwise)
+                and isinstance(node.op.core_op, self.factor_ops + self.consumer_ops)
+            ):
+                continue
+            if isinstance(node.op.core_op, Solve) and node.op.core_op.assume_a in (
+                "sym",
+                "her",
+            ):
+                # `LUFactor` reads the whole matrix, not only the triangle
+                # these `Solve`s read
+                continue
+            A = node.inputs[0]
+            transposed = False
+            if isinstance(node.op.core_op, self.consumer_ops) and is_matrix_transpose(
+                A
+            ):
+                # The decompositions of `A.T` can reuse the factorization of `A`
+                [A] = A.owner.inputs
+                transposed = True
+            decompositions.setdefault(A, []).append((node, transposed))
+
+        for A, nodes in decompositions.items():
+            consumers = [
+                (node, transposed)
+                for node, transposed in nodes
+                if isinstance(node.op.core_op, self.consumer_ops)
+            ]
+            if len(nodes) < 2 or not consumers:
+                continue
+            if any(
+                dim is not None and dim < self.min_size for dim in A.type.shape[-2:]
+            ):
+                continue
+
+            replacements = self.share_factorization(A, nodes, consumers)
+            if not replacements:
+                continue
+            try:
+                fgraph.replace_all_validate(
+                    replacements, reason="share_linalg_factorization"
+                )
+            except InconsistencyError:
+                continue
+
+    def share_factorization(self, A, nodes, consumers):
+        """Return the replacements of the outputs of `consumers` by graphs sharing one factorization of `A`.
+
+        `nodes` and `consumers` are lists of ``(node, transposed)`` pairs,
+        where ``transposed`` indicates that `node` decomposes the transpose
+        of `A`. No replacements are returned when the nodes read different
+        triangles of `A`.
+        """
+        # Whether each Cholesky decomposition or positive definite `Solve`
+        # reads the lower triangle of `A`
+        triangles = set()
+        for node, transposed in nodes:
+            core_op = node.op.core_op
+            if (isinstance(core_op, Cholesky) and core_op.on_error == "raise") or (
+                isinstance(core_op, Solve) and core_op.assume_a == "pos"
+            ):
+                triangles.add(core_op.lower != transposed)
+        if len(triangles) > 1:
+            return []
+        lower = triangles.pop() if triangles else True
+        nodes = [node for node, _ in nodes]
+        core_ops = [node.op.core_op for node in nodes]
+        chol_nodes = [
+            node
+            for node, core_op in zip(nodes, core_ops)
+            if isinstance(core_op, Cholesky) and core_op.on_error == "raise"
+        ]
+        lu_nodes = [
+            node
+            for node, core_op in zip(nodes, core_ops)
+            if isinstance(core_op, LUFactor)
+        ]
+        use_cholesky = (
+            chol_nodes
+            or getattr(A.tag, "psd", None) is True
+            or any(
+                isinstance(core_op, Solve) and core_op.assume_a == "pos"
+                for core_op in core_ops
+            )
+        )
+        check_finite = any(
+            getattr(core_op, "check_finite", False) for core_op in core_ops
+        )
+
+        if use_cholesky:
+            if chol_nodes:
+                [L] = chol_nodes[0].outputs
+                if not chol_nodes[0].op.core_op.lower:
+                    L = _T(L)
+            else:
+                L = cholesky(A, lower=lower)
+                if not lower:
+                    L = _T(L)
+            diag = diagonal(L, axis1=-2, axis2=-1)
+
+            def factor_solve(b, b_ndim, transposed):
+                # `A` is symmetric, so it is its own transpose
+                return cho_solve((L, True), b, check_finite=check_finite, b_ndim=b_ndim)
+
+            def factor_slogdet():
+                logdet = 2 * log(diag).sum(axis=-1)
+                return ones_like(logdet), logdet
+
+        else:
+            if lu_nodes:
+                LU, piv = lu_nodes[0].outputs
+            else:
+                LU, piv = _lu_factor(A, check_finite=check_finite)
+            diag = diagonal(LU, axis1=-2, axis2=-1)
+            # Each pivot that isn't the identity is a row interchange
+            n_swaps = neq(piv, arange(piv.shape[-1])).sum(axis=-1)
+            perm_sign = 1 - 2 * (n_swaps % 2)
+
+            def factor_solve(b, b_ndim, transposed):
+                return _lu_solve(
+                    (LU, piv),
+                    b,
+                    trans=int(transposed),
+                    check_finite=check_finite,
+                    b_ndim=b_ndim,
+                )
+
+            def factor_slogdet():
+                return (
+                    prod(sign(diag), axis=-1) * perm_sign,
+                    log(pt_abs(diag)).sum(axis=-1),
+                )
+
+        replacements = []
+        for node, transposed in consumers:
+            core_op = node.op.core_op
+            if isinstance(core_op, Solve):
+                new_outs = [factor_solve(node.inputs[1], core_op.b_ndim, transposed)]
+            elif isinstance(core_op, MatrixInverse):
+                identity = eye(A.shape[-1], dtype=A.dtype)
+                new_outs = [factor_solve(identity, 2, transposed)]
+            elif isinstance(core_op, SLogDet):
+                new_outs = factor_slogdet()
+            elif use_cholesky:
+                new_outs = [prod(diag, axis=-1) ** 2]
+            else:
+                new_outs = [prod(diag, axis=-1) * perm_sign]
+
+            for old_out, new_out in zip(node.outputs, new_outs):
+                new_out = new_out.astype(old_out.dtype)
+                copy_stack_trace(old_out, new_out)
+                replacements.append((old_out, new_out))
+        return replacements
+
+
+share_linalg_factorization = ShareLinalgFactorization()
+# `LUFactor` and `CholeskySolve` have no Numba implementation yet
+register_specialize(
+    share_linalg_factorization, "cxx_only", name="share_linalg_factorization"
+)
+
+
 @register_canonicalize
 @register_stabilize
 @register_specialize
@@ -310,3 +524,40 @@ def local_log_prod_sqr(fgraph, node):
 
         # TODO: have a reduction like prod and sum that simply
         # returns the sign of the prod multiplication.
+
+
+@node_rewriter([Cholesky, SolveBase], inplace=True)
+def local_inplace_linalg(fgraph, node):
+    r"""Let `Cholesky` and the solvers overwrite their input in place.
+
+    LAPACK factorizes and solves in place, so this saves a copy of the input
+    matrix or right-hand side.
+    `Blockwise` `Op`\s are left alone, but unbatched ones have already been
+    replaced by their core `Op` at this point.
+    """
+    op = node.op
+    if isinstance(op, Cholesky):
+        if op.destructive:
+            return False
+        new_op = Cholesky(lower=op.lower, on_error=op.on_error, destructive=True)
+    else:
+        if op.overwrite_b or node.inputs[1].type.dtype != node.outputs[0].type.dtype:
+            return False
+        props = op._props_dict()
+        props["overwrite_b"] = True
+        new_op = type(op)(**props)
+
+    new_outs = new_op.make_node(*node.inputs).outputs
+    copy_stack_trace(node.outputs, new_outs)
+    return new_outs
+
+
+optdb.register(
+    "local_inplace_linalg",
+    WalkingGraphRewriter(
+        local_inplace_linalg, failure_callback=WalkingGraphRewriter.warn_inplace
+    ),
+    "fast_run",
+    "inplace",
+    position=60,
+)
@@ -1,7 +1,8 @@
+import time
 import traceback
+from collections.abc import Sequence
 from io import StringIO
 from typing import Optional
-from typing import cast as type_cast
 from warnings import warn
 
 import numpy as np
@@ -513,14 +514,21 @@ class ShapeFeature(Feature):
         self.scheduled = {}
         # shape var -> graph v
         self.shape_of_reverse_index = {}
+        # shape var -> canonicalized clone of shape var
+        self.canonical_of = {}
 
+        t0 = time.perf_counter()
         for node in fgraph.toposort():
             self.on_import(fgraph, node, reason="on_attach")
+        profile = getattr(fgraph, "profile", None)
+        if profile:
+            profile.shape_feature_attach_time += time.perf_counter() - t0
 
     def on_detach(self, fgraph):
         self.shape_of = {}
         self.scheduled = {}
         self.shape_of_reverse_index = {}
+        self.canonical_of = {}
         self.fgraph = None
         del fgraph.shape_feature
 
@@ -693,19 +701,7 @@ class ShapeFeature(Feature):
         # Instead, the shape information in `self.shape_of` should be operated
         # upon alongside all the other elements in a `FunctionGraph` (e.g. as
         # if `self.shape_of.values()` were additional outputs).
-        shapes_fg = FunctionGraph(
-            outputs=sx + sy,
-            # features=[self],
-            clone=True,
-            # copy_inputs=False,
-        )
-        from pytensor.graph.rewriting.utils import rewrite_graph
-
-        canon_shapes_fg = type_cast(
-            FunctionGraph,
-            rewrite_graph(shapes_fg, custom_rewrite=topo_constant_folding),
-        )
-        canon_shapes = canon_shapes_fg.outputs
+        canon_shapes = self.canonical_shapes(list(sx) + list(sy))
 
         sx = canon_shapes[: len(sx)]
         sy = canon_shapes[len(sx) :]
@@ -716,6 +712,39 @@ class ShapeFeature(Feature):
 
         return True
 
+    def canonical_shapes(self, shape_vars: Sequence[Variable]) -> list[Variable]:
+        """Return canonicalized clones of the shape graphs `shape_vars`.
+
+        The canonicalized graphs are cached for as long as the feature is
+        attached, so that the rewrite passes that compare the same shapes
+        don't canonicalize them again.  The number of cache hits and misses is
+        recorded in the `ProfileStats` of the `FunctionGraph`, if any.
+
+        """
+        missing = [s for s in dict.fromkeys(shape_vars) if s not in self.canonical_of]
+        profile = getattr(self.fgraph, "profile", None)
+
+        if missing:
+            t0 = time.perf_counter()
+            # The inputs aren't copied, so that the canonicalized graphs of
+            # different calls can be compared with `equal_computations`, and
+            # neither are the constants, which aren't modified by rewrites
+            shapes_fg = FunctionGraph(
+                outputs=missing, clone=True, copy_inputs=False, copy_orphans=False
+            )
+            from pytensor.graph.rewriting.utils import rewrite_graph
+
+            rewrite_graph(shapes_fg, custom_rewrite=topo_constant_folding)
+            self.canonical_of.update(zip(missing, shapes_fg.outputs))
+            if profile:
+                profile.shape_canonicalize_time += time.perf_counter() - t0
+
+        if profile:
+            profile.shape_cache_misses += len(missing)
+            profile.shape_cache_hits += len(shape_vars) - len(missing)
+
+        return [self.canonical_of[s] for s in shape_vars]
+
     def clone(self):
         return type(self)()
 
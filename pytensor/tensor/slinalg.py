@@ -10,14 +10,17 @@ import scipy.linalg
 import pytensor
 import pytensor.tensor as pt
 from pytensor.graph.basic import Apply
+from pytensor.graph.costs import OpCost, io_bytes
 from pytensor.graph.op import Op
+from pytensor.graph.utils import MethodNotDefined
 from pytensor.tensor import as_tensor_variable
 from pytensor.tensor import basic as ptb
 from pytensor.tensor import math as ptm
 from pytensor.tensor.blockwise import Blockwise
+from pytensor.tensor.lapack import BaseLAPACK
 from pytensor.tensor.nlinalg import matrix_dot
 from pytensor.tensor.shape import reshape
-from pytensor.tensor.type import matrix, tensor, vector
+from pytensor.tensor.type import integer_dtypes, matrix, tensor, vector
 from pytensor.tensor.variable import TensorVariable
 
 
@@ -27,7 +30,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-class Cholesky(Op):
+class Cholesky(BaseLAPACK):
     """
     Return a triangular matrix square root of positive semi-definite `x`.
 
@@ -42,25 +45,35 @@ class Cholesky(Op):
         `scipy.linalg.LinAlgError` if the matrix is not positive definite.
         If on_error is set to 'nan', it will return a matrix containing
         nans instead.
+    destructive : bool, default=False
+        Whether the factorization may overwrite `x`.
     """
 
-    # TODO: inplace
-    # TODO: for specific dtypes
-    # TODO: LAPACK wrapper with in-place behavior, for solve also
-
     __props__ = ("lower", "destructive", "on_error")
     gufunc_signature = "(m,m)->(m,m)"
 
-    def __init__(self, *, lower=True, on_error="raise"):
+    def __init__(self, *, lower=True, on_error="raise", destructive=False):
         self.lower = lower
-        self.destructive = False
+        self.destructive = destructive
+        if destructive:
+            self.destroy_map = {0: [0]}
         if on_error not in ("raise", "nan"):
             raise ValueError('on_error must be one of "raise" or ""nan"')
         self.on_error = on_error
+        if lower and on_error == "raise":
+            # Batched kernel used by `Blockwise`
+            self.gufunc_spec = ("pytensor.tensor.slinalg._batched_cholesky", 1, 1)
 
     def infer_shape(self, fgraph, node, shapes):
         return [shapes[0]]
 
+    def cost(self, node, input_shapes):
+        (xshape,) = input_shapes
+        n = xshape[0]
+        return OpCost(
+            flops=n * n * n // 3, bytes=io_bytes(node, input_shapes, [xshape])
+        )
+
     def make_node(self, x):
         x = as_tensor_variable(x)
         assert x.ndim == 2
@@ -70,13 +83,81 @@ class Cholesky(Op):
         x = inputs[0]
         z = outputs[0]
         try:
-            z[0] = scipy.linalg.cholesky(x, lower=self.lower).astype(x.dtype)
+            z[0] = scipy.linalg.cholesky(
+                x, lower=self.lower, overwrite_a=self.destructive
+            ).astype(x.dtype)
         except scipy.linalg.LinAlgError:
             if self.on_error == "raise":
                 raise
             else:
                 z[0] = (np.zeros(x.shape) * np.nan).astype(x.dtype)
 
+    def c_code(self, node, name, inputs, outputs, sub):
+        prefix, ctype = self.lapack_types(node)
+        (x,) = inputs
+        (z,) = outputs
+        fail = sub["fail"]
+        lower = int(self.lower)
+        copy = int(not self.destructive)
+        raise_error = int(self.on_error == "raise")
+        return f"""
+        {{
+            int n, lda, info = 0;
+            bool f_order;
+            char uplo;
+            {ctype}* data;
+
+            if (PyArray_DIMS({x})[0] != PyArray_DIMS({x})[1])
+            {{
+                PyErr_SetString(PyExc_ValueError, "Input must be a square matrix");
+                {fail}
+            }}
+            Py_XDECREF({z});
+            {z} = lapack_contiguous({x}, {copy} || !PyArray_ISWRITEABLE({x}));
+            if ({z} == NULL || lapack_check_finite<{ctype}>({z}))
+            {{
+                {fail}
+            }}
+
+            n = PyArray_DIMS({z})[0];
+            lda = n > 1 ? n : 1;
+            data = ({ctype}*)PyArray_DATA({z});
+            // LAPACK sees a C-ordered matrix as its transpose, so we factorize
+            // the opposite triangle, which holds the same values
+            f_order = PyArray_IS_F_CONTIGUOUS({z});
+            uplo = ({lower} == f_order) ? 'L' : 'U';
+            {prefix}potrf_(&uplo, &n, data, &lda, &info);
+
+            if (info < 0)
+            {{
+                PyErr_Format(PyExc_ValueError,
+                             "illegal value in %d-th argument of internal potrf", -info);
+                {fail}
+            }}
+            if (info > 0)
+            {{
+                if ({raise_error})
+                {{
+                    lapack_linalg_error("Matrix is not positive definite");
+                    {fail}
+                }}
+                for (npy_intp i = 0; i < (npy_intp)n * n; ++i)
+                    data[i] = NAN;
+            }}
+            else
+            {{
+                // Zero the triangle that LAPACK didn't reference
+                for (npy_intp i = 0; i < n; ++i)
+                    for (npy_intp j = 0; j < n; ++j)
+                        if ({lower} ? j > i : j < i)
+                            data[f_order ? i + j * n : i * n + j] = 0;
+            }}
+        }}
+        """
+
+    def c_code_cache_version(self):
+        return (1, *super().c_code_cache_version())
+
     def L_op(self, inputs, outputs, gradients):
         """
         Cholesky decomposition reverse-mode gradient update.
@@ -129,18 +210,30 @@ class Cholesky(Op):
             return [grad]
 
 
+def _batched_cholesky(x):
+    """Factorize stacked matrices, checking like `scipy.linalg.cholesky`."""
+    if not np.isfinite(x).all():
+        raise ValueError("array must not contain infs or NaNs")
+    return np.linalg.cholesky(x)
+
+
 def cholesky(x, lower=True, on_error="raise"):
     return Blockwise(Cholesky(lower=lower, on_error=on_error))(x)
 
 
-class SolveBase(Op):
-    """Base class for `scipy.linalg` matrix equation solvers."""
+class SolveBase(BaseLAPACK):
+    """Base class for `scipy.linalg` matrix equation solvers.
+
+    Subclasses provide their C implementation with :meth:`c_solve_code`.
+    """
 
     __props__ = (
         "lower",
         "check_finite",
         "b_ndim",
+        "overwrite_b",
     )
+    _c_copy_a = False
 
     def __init__(
         self,
@@ -148,6 +241,7 @@ class SolveBase(Op):
         lower=False,
         check_finite=True,
         b_ndim,
+        overwrite_b=False,
     ):
         self.lower = lower
         self.check_finite = check_finite
@@ -157,10 +251,96 @@ class SolveBase(Op):
             self.gufunc_signature = "(m,m),(m)->(m)"
         else:
             self.gufunc_signature = "(m,m),(m,n)->(m,n)"
+        self.overwrite_b = overwrite_b
+        if overwrite_b:
+            self.destroy_map = {0: [1]}
 
     def perform(self, node, inputs, outputs):
         pass
 
+    def c_solve_code(self, prefix, ctype, fail):
+        """Return the C code solving the system with LAPACK.
+
+        The code can use the ``n``-by-``n`` matrix ``a`` (``lda`` being its
+        leading dimension, and ``f_order`` whether it is Fortran-ordered),
+        and must overwrite the ``n``-by-``nrhs`` Fortran-ordered right-hand
+        side ``x`` with the solution. LAPACK's status goes in ``info``; other
+        errors are reported by setting a Python exception and `fail`.
+        """
+        raise MethodNotDefined()
+
+    def c_code(self, node, name, inputs, outputs, sub):
+        prefix, ctype = self.lapack_types(node)
+        A, b = inputs
+        (x,) = outputs
+        copy_a = int(self._c_copy_a)
+        overwrite_b = int(self.overwrite_b)
+        check_finite = int(self.check_finite)
+        # Release our reference to `A` before jumping to the real `fail`
+        solve_code = self.c_solve_code(prefix, ctype, "err = 1; goto done;")
+        fail = sub["fail"]
+        return f"""
+        {{
+            int n, nrhs, lda, info = 0, err = 0;
+            bool f_order;
+            {ctype}* a;
+            {ctype}* x;
+            PyArrayObject* a_arr;
+
+            if (PyArray_DIMS({A})[0] != PyArray_DIMS({A})[1])
+            {{
+                PyErr_SetString(PyExc_ValueError, "Input a must be a square matrix");
+                {fail}
+            }}
+            if (PyArray_DIMS({b})[0] != PyArray_DIMS({A})[0])
+            {{
+                PyErr_SetString(PyExc_ValueError, "Input b has incompatible shape");
+                {fail}
+            }}
+            a_arr = lapack_contiguous({A}, {copy_a});
+            if (a_arr == NULL)
+            {{
+                {fail}
+            }}
+            Py_XDECREF({x});
+            {x} = lapack_fortran_copy({b}, {overwrite_b});
+            if ({x} == NULL ||
+                ({check_finite} && (lapack_check_finite<{ctype}>(a_arr) ||
+                                    lapack_check_finite<{ctype}>({x}))))
+            {{
+                err = 1;
+                goto done;
+            }}
+
+            n = PyArray_DIMS(a_arr)[0];
+            nrhs = PyArray_NDIM({x}) == 2 ? PyArray_DIMS({x})[1] : 1;
+            lda = n > 1 ? n : 1;
+            f_order = PyArray_IS_F_CONTIGUOUS(a_arr);
+            a = ({ctype}*)PyArray_DATA(a_arr);
+            x = ({ctype}*)PyArray_DATA({x});
+            {{
+                {solve_code}
+            }}
+            if (info < 0)
+            {{
+                PyErr_Format(PyExc_ValueError,
+                             "illegal value in %d-th argument of internal LAPACK routine",
+                             -info);
+                err = 1;
+            }}
+
+        done:
+            Py_DECREF(a_arr);
+            if (err)
+            {{
+                {fail}
+            }}
+        }}
+        """
+
+    def c_code_cache_version(self):
+        return (1, *super().c_code_cache_version())
+
     def make_node(self, A, b):
         A = as_tensor_variable(A)
         b = as_tensor_variable(b)
@@ -186,6 +366,19 @@ class SolveBase(Op):
             cols = Bshape[1]
             return [(rows, cols)]
 
+    def _solve_flops(self, n, k):
+        # A triangular solve for each of the `k` right-hand sides
+        return n * n * k
+
+    def cost(self, node, input_shapes):
+        Ashape, Bshape = input_shapes
+        n = Ashape[0]
+        k = Bshape[1] if len(Bshape) == 2 else 1
+        return OpCost(
+            flops=self._solve_flops(n, k),
+            bytes=io_bytes(node, input_shapes, [Bshape]),
+        )
+
     def L_op(self, inputs, outputs, output_gradients):
         r"""Reverse-mode gradient updates for matrix solve operation :math:`c = A^{-1} b`.
 
@@ -210,6 +403,7 @@ class SolveBase(Op):
             **{
                 k: (not getattr(self, k) if k == "lower" else getattr(self, k))
                 for k in self.__props__
+                if k != "overwrite_b"
             }
         )
         b_bar = trans_solve_op(A.T, c_bar)
@@ -234,16 +428,30 @@ class CholeskySolve(SolveBase):
         kwargs.setdefault("lower", True)
         super().__init__(**kwargs)
 
+    def _solve_flops(self, n, k):
+        # A forward and a backward substitution with the Cholesky factor
+        return 2 * n * n * k
+
     def perform(self, node, inputs, output_storage):
         C, b = inputs
         rval = scipy.linalg.cho_solve(
             (C, self.lower),
             b,
+            overwrite_b=self.overwrite_b,
             check_finite=self.check_finite,
         )
 
         output_storage[0][0] = rval
 
+    def c_solve_code(self, prefix, ctype, fail):
+        lower = int(self.lower)
+        return f"""
+            // LAPACK sees a C-ordered factor as its transpose, which is the
+            // factor of the same matrix stored in the opposite triangle
+            char uplo = ({lower} == f_order) ? 'L' : 'U';
+            {prefix}potrs_(&uplo, &n, &nrhs, a, &lda, x, &lda, &info);
+        """
+
     def L_op(self, *args, **kwargs):
         raise NotImplementedError()
 
@@ -272,6 +480,282 @@ def cho_solve(c_and_lower, b, *, check_finite=True, b_ndim: Optional[int] = None
     )(A, b)
 
 
+class LUFactor(BaseLAPACK):
+    """Compute the pivoted LU decomposition of a square matrix.
+
+    The outputs are the ``lu`` matrix and the ``piv`` pivot indices, as
+    returned by `scipy.linalg.lu_factor`.
+
+    This `Op` and `LUSolve` have no gradient. They are only introduced by the
+    rewrites, after the gradients have been computed.
+    """
+
+    __props__ = ("check_finite",)
+    gufunc_signature = "(m,m)->(m,m),(m)"
+
+    def __init__(self, *, check_finite=True):
+        self.check_finite = check_finite
+
+    def make_node(self, A):
+        A = as_tensor_variable(A)
+        if A.ndim != 2:
+            raise ValueError(f"`A` must be a matrix; got {A.type} instead.")
+
+        # Infer dtype by factorizing the most simple case with a 1x1 matrix
+        o_dtype = scipy.linalg.lu_factor(np.eye(1).astype(A.dtype))[0].dtype
+        LU = tensor(dtype=o_dtype, shape=A.type.shape)
+        piv = tensor(dtype="int32", shape=A.type.shape[:1])
+        return Apply(self, [A], [LU, piv])
+
+    def perform(self, node, inputs, outputs):
+        (A,) = inputs
+        LU, piv = scipy.linalg.lu_factor(A, check_finite=self.check_finite)
+        outputs[0][0] = LU
+        outputs[1][0] = piv
+
+    def c_code(self, node, name, inputs, outputs, sub):
+        prefix, ctype = self.lapack_types(node, [node.inputs[0], node.outputs[0]])
+        (A,) = inputs
+        LU, piv = outputs
+        fail = sub["fail"]
+        check_finite = int(self.check_finite)
+        return f"""
+        {{
+            int n, lda, info = 0;
+            npy_int32* piv;
+
+            if (PyArray_DIMS({A})[0] != PyArray_DIMS({A})[1])
+            {{
+                PyErr_SetString(PyExc_ValueError, "Input must be a square matrix");
+                {fail}
+            }}
+            Py_XDECREF({LU});
+            {LU} = lapack_fortran_copy({A}, false);
+            if ({LU} == NULL ||
+                ({check_finite} && lapack_check_finite<{ctype}>({LU})))
+            {{
+                {fail}
+            }}
+            n = PyArray_DIMS({LU})[0];
+            lda = n > 1 ? n : 1;
+
+            if ({piv} == NULL || PyArray_DIMS({piv})[0] != n)
+            {{
+                npy_intp dims[1] = {{n}};
+                Py_XDECREF({piv});
+                {piv} = (PyArrayObject*)PyArray_EMPTY(1, dims, NPY_INT32, 0);
+                if ({piv} == NULL)
+                {{
+                    {fail}
+                }}
+            }}
+            piv = (npy_int32*)PyArray_DATA({piv});
+
+            {prefix}getrf_(&n, &n, ({ctype}*)PyArray_DATA({LU}), &lda, (int*)piv, &info);
+            if (info < 0)
+            {{
+                PyErr_Format(PyExc_ValueError,
+                             "illegal value in %d-th argument of internal getrf", -info);
+                {fail}
+            }}
+            // LAPACK pivot indices are one-based
+            for (int i = 0; i < n; ++i)
+                piv[i] -= 1;
+        }}
+        """
+
+    def c_code_cache_version(self):
+        return (1, *super().c_code_cache_version())
+
+    def infer_shape(self, fgraph, node, shapes):
+        (Ashape,) = shapes
+        return [Ashape, Ashape[:1]]
+
+    def cost(self, node, input_shapes):
+        (Ashape,) = input_shapes
+        n = Ashape[0]
+        return OpCost(
+            flops=2 * n * n * n // 3,
+            bytes=io_bytes(node, input_shapes, [Ashape, Ashape[:1]]),
+        )
+
+
+def _lu_factor(A, *, check_finite=True):
+    """Compute the pivoted LU decomposition of `A`.
+
+    Parameters
+    ----------
+    A : (..., M, M) array_like
+        Square matrix to decompose
+    check_finite : bool, optional
+        Whether to check that the input matrix contains only finite numbers.
+
+    Returns
+    -------
+    lu : (..., M, M) array_like
+        The upper triangular factor, with the unit lower triangular factor
+        stored in its strictly lower triangle.
+    piv : (..., M) array_like
+        The pivot indices: row ``i`` was interchanged with row ``piv[i]``.
+    """
+    return Blockwise(LUFactor(check_finite=check_finite))(A)
+
+
+class LUSolve(BaseLAPACK):
+    """Solve the linear equations A x = b, given the LU decomposition of A."""
+
+    __props__ = ("trans", "check_finite", "b_ndim")
+
+    def __init__(self, *, trans=0, check_finite=True, b_ndim):
+        self.trans = trans
+        self.check_finite = check_finite
+        assert b_ndim in (1, 2)
+        self.b_ndim = b_ndim
+        if b_ndim == 1:
+            self.gufunc_signature = "(m,m),(m),(m)->(m)"
+        else:
+            self.gufunc_signature = "(m,m),(m),(m,n)->(m,n)"
+
+    def make_node(self, LU, piv, b):
+        LU = as_tensor_variable(LU)
+        piv = as_tensor_variable(piv)
+        b = as_tensor_variable(b)
+
+        if LU.ndim != 2:
+            raise ValueError(f"`LU` must be a matrix; got {LU.type} instead.")
+        if piv.ndim != 1 or piv.dtype not in integer_dtypes:
+            raise ValueError(
+                f"`piv` must be an integer vector; got {piv.type} instead."
+            )
+        if b.ndim != self.b_ndim:
+            raise ValueError(f"`b` must have {self.b_ndim} dims; got {b.type} instead.")
+
+        # Infer dtype by solving the most simple case with 1x1 matrices
+        o_dtype = scipy.linalg.lu_solve(
+            (np.eye(1).astype(LU.dtype), np.zeros(1, dtype="int32")),
+            np.eye(1).astype(b.dtype),
+        ).dtype
+        x = tensor(dtype=o_dtype, shape=b.type.shape)
+        return Apply(self, [LU, piv, b], [x])
+
+    def perform(self, node, inputs, output_storage):
+        LU, piv, b = inputs
+        output_storage[0][0] = scipy.linalg.lu_solve(
+            (LU, piv), b, trans=self.trans, check_finite=self.check_finite
+        )
+
+    def c_code(self, node, name, inputs, outputs, sub):
+        LU_var, piv_var, b_var = node.inputs
+        if piv_var.type.dtype != "int32":
+            raise MethodNotDefined("LAPACK pivot indices must be int32")
+        prefix, ctype = self.lapack_types(node, [LU_var, b_var, *node.outputs])
+        LU, piv, b = inputs
+        (x,) = outputs
+        fail = sub["fail"]
+        trans = "T" if self.trans in (1, 2, "T", "C") else "N"
+        check_finite = int(self.check_finite)
+        return f"""
+        {{
+            int n, nrhs, lda, info = 0, err = 0;
+            char trans = '{trans}';
+            int* ipiv = NULL;
+            PyArrayObject* lu;
+
+            if (PyArray_DIMS({LU})[0] != PyArray_DIMS({LU})[1] ||
+                PyArray_DIMS({piv})[0] != PyArray_DIMS({LU})[0] ||
+                PyArray_DIMS({b})[0] != PyArray_DIMS({LU})[0])
+            {{
+                PyErr_SetString(PyExc_ValueError, "Incompatible input shapes");
+                {fail}
+            }}
+            lu = (PyArrayObject*)PyArray_FromArray(
+                {LU}, NULL, NPY_ARRAY_F_CONTIGUOUS | NPY_ARRAY_ALIGNED);
+            if (lu == NULL)
+            {{
+                {fail}
+            }}
+            Py_XDECREF({x});
+            {x} = lapack_fortran_copy({b}, false);
+            n = PyArray_DIMS(lu)[0];
+            ipiv = (int*)malloc((n > 0 ? n : 1) * sizeof(int));
+            if ({x} == NULL || ipiv == NULL ||
+                ({check_finite} && (lapack_check_finite<{ctype}>(lu) ||
+                                    lapack_check_finite<{ctype}>({x}))))
+            {{
+                if (ipiv == NULL && !PyErr_Occurred())
+                    PyErr_NoMemory();
+                err = 1;
+            }}
+            else
+            {{
+                // LAPACK pivot indices are one-based
+                for (int i = 0; i < n; ++i)
+                    ipiv[i] = ((npy_int32*)PyArray_GETPTR1({piv}, i))[0] + 1;
+                nrhs = PyArray_NDIM({x}) == 2 ? PyArray_DIMS({x})[1] : 1;
+                lda = n > 1 ? n : 1;
+                {prefix}getrs_(&trans, &n, &nrhs, ({ctype}*)PyArray_DATA(lu), &lda, ipiv,
+                               ({ctype}*)PyArray_DATA({x}), &lda, &info);
+                if (info < 0)
+                {{
+                    PyErr_Format(PyExc_ValueError,
+                                 "illegal value in %d-th argument of internal getrs",
+                                 -info);
+                    err = 1;
+                }}
+            }}
+            free(ipiv);
+            Py_DECREF(lu);
+            if (err)
+            {{
+                {fail}
+            }}
+        }}
+        """
+
+    def c_code_cache_version(self):
+        return (1, *super().c_code_cache_version())
+
+    def infer_shape(self, fgraph, node, shapes):
+        return [shapes[2]]
+
+    def cost(self, node, input_shapes):
+        LUshape, _, bshape = input_shapes
+        n = LUshape[0]
+        k = bshape[1] if len(bshape) == 2 else 1
+        # A forward and a backward substitution with the LU factors
+        return OpCost(flops=2 * n * n * k, bytes=io_bytes(node, input_shapes, [bshape]))
+
+    def L_op(self, *args, **kwargs):
+        raise NotImplementedError()
+
+
+def _lu_solve(
+    lu_and_piv, b, *, trans=0, check_finite=True, b_ndim: Optional[int] = None
+):
+    """Solve the linear equations A x = b, given the LU factorization of A.
+
+    Parameters
+    ----------
+    (lu, piv) : tuple
+        LU factorization of A, as given by `_lu_factor`
+    b : array
+        Right-hand side
+    trans : {0, 1, 2}, optional
+        Type of system to solve: ``a x = b`` (0), ``a^T x = b`` (1) or
+        ``a^H x = b`` (2).
+    check_finite : bool, optional
+        Whether to check that the input matrices contain only finite numbers.
+    b_ndim : int
+        Whether the core case of b is a vector (1) or matrix (2).
+        This will influence how batched dimensions are interpreted.
+    """
+    LU, piv = lu_and_piv
+    b_ndim = _default_b_ndim(b, b_ndim)
+    return Blockwise(LUSolve(trans=trans, check_finite=check_finite, b_ndim=b_ndim))(
+        LU, piv, b
+    )
+
+
 class SolveTriangular(SolveBase):
     """Solve a system of linear equations."""
 
@@ -281,6 +765,7 @@ class SolveTriangular(SolveBase):
         "lower",
         "check_finite",
         "b_ndim",
+        "overwrite_b",
     )
 
     def __init__(self, *, trans=0, unit_diagonal=False, **kwargs):
@@ -296,9 +781,28 @@ class SolveTriangular(SolveBase):
             lower=self.lower,
             trans=self.trans,
             unit_diagonal=self.unit_diagonal,
+            overwrite_b=self.overwrite_b,
             check_finite=self.check_finite,
         )
 
+    def c_solve_code(self, prefix, ctype, fail):
+        lower = int(self.lower)
+        trans = int(self.trans in (1, 2, "T", "C"))
+        unit_diagonal = int(self.unit_diagonal)
+        return f"""
+            // LAPACK sees a C-ordered matrix as its transpose, so we solve
+            // the transposed system with the opposite triangle
+            char uplo = ({lower} == f_order) ? 'L' : 'U';
+            char trans = ({trans} != f_order) ? 'N' : 'T';
+            char diag = {unit_diagonal} ? 'U' : 'N';
+            {prefix}trtrs_(&uplo, &trans, &diag, &n, &nrhs, a, &lda, x, &lda, &info);
+            if (info > 0)
+            {{
+                lapack_linalg_error("singular matrix");
+                {fail}
+            }}
+        """
+
     def L_op(self, inputs, outputs, output_gradients):
         res = super().L_op(inputs, outputs, output_gradients)
 
@@ -368,7 +872,10 @@ class Solve(SolveBase):
         "lower",
         "check_finite",
         "b_ndim",
+        "overwrite_b",
     )
+    # The factorization overwrites `a`
+    _c_copy_a = True
 
     def __init__(self, *, assume_a="gen", **kwargs):
         if assume_a not in ("gen", "sym", "her", "pos"):
@@ -376,6 +883,26 @@ class Solve(SolveBase):
 
         super().__init__(**kwargs)
         self.assume_a = assume_a
+        # Batched kernels used by `Blockwise`
+        if assume_a == "gen" and not self.check_finite and self.b_ndim == 2:
+            self.gufunc_spec = ("numpy.linalg.solve", 2, 1)
+        elif assume_a == "gen" and self.check_finite:
+            if self.b_ndim == 1:
+                self.gufunc_spec = (
+                    "pytensor.tensor.slinalg._batched_solve_vector",
+                    2,
+                    1,
+                )
+            else:
+                self.gufunc_spec = ("pytensor.tensor.slinalg._batched_solve", 2, 1)
+
+    def _solve_flops(self, n, k):
+        # Factorize `A`, then do a forward and a backward substitution
+        if self.assume_a == "pos":
+            factor_flops = n * n * n // 3
+        else:
+            factor_flops = 2 * n * n * n // 3
+        return factor_flops + 2 * n * n * k
 
     def perform(self, node, inputs, outputs):
         a, b = inputs
@@ -383,10 +910,59 @@ class Solve(SolveBase):
             a=a,
             b=b,
             lower=self.lower,
+            overwrite_b=self.overwrite_b,
             check_finite=self.check_finite,
             assume_a=self.assume_a,
         )
 
+    def c_solve_code(self, prefix, ctype, fail):
+        if self.assume_a == "pos":
+            lower = int(self.lower)
+            return f"""
+            char uplo = ({lower} == f_order) ? 'L' : 'U';
+            {prefix}potrf_(&uplo, &n, a, &lda, &info);
+            if (info > 0)
+            {{
+                lapack_linalg_error("Matrix is not positive definite");
+                {fail}
+            }}
+            if (info == 0)
+                {prefix}potrs_(&uplo, &n, &nrhs, a, &lda, x, &lda, &info);
+            """
+
+        # A C-ordered matrix is factorized as its transpose, so we solve the
+        # transposed system with it
+        return f"""
+            char trans = f_order ? 'N' : 'T';
+            int* ipiv = (int*)malloc((n > 0 ? n : 1) * sizeof(int));
+            if (ipiv == NULL)
+            {{
+                PyErr_NoMemory();
+                {fail}
+            }}
+            {prefix}getrf_(&n, &n, a, &lda, ipiv, &info);
+            if (info == 0)
+                {prefix}getrs_(&trans, &n, &nrhs, a, &lda, ipiv, x, &lda, &info);
+            free(ipiv);
+            if (info > 0)
+            {{
+                lapack_linalg_error("Matrix is singular.");
+                {fail}
+            }}
+        """
+
+
+def _batched_solve(a, b):
+    """Solve stacked systems with matrix right-hand sides, checking like `scipy.linalg.solve`."""
+    if not (np.isfinite(a).all() and np.isfinite(b).all()):
+        raise ValueError("array must not contain infs or NaNs")
+    return np.linalg.solve(a, b)
+
+
+def _batched_solve_vector(a, b):
+    """Solve stacked systems with vector right-hand sides, checking like `scipy.linalg.solve`."""
+    return _batched_solve(a, b[..., None])[..., 0]
+
 
 def solve(
     a,
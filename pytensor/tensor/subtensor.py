@@ -12,6 +12,7 @@ from pytensor import scalar as ps
 from pytensor.configdefaults import config
 from pytensor.gradient import DisconnectedType
 from pytensor.graph.basic import Apply, Constant, Variable
+from pytensor.graph.costs import OpCost, nbytes, size
 from pytensor.graph.op import Op
 from pytensor.graph.replace import _vectorize_node
 from pytensor.graph.type import Type
@@ -831,6 +832,10 @@ class Subtensor(COp):
         assert len(outshp) == node.outputs[0].ndim
         return [outshp]
 
+    def cost(self, node, input_shapes):
+        # The output is a view of the input
+        return OpCost(flops=0, bytes=0)
+
     def grad(self, inputs, grads):
         (gz,) = grads
         x = inputs[0]
@@ -1874,6 +1879,18 @@ class IncSubtensor(COp):
     def infer_shape(self, fgraph, node, shapes):
         return [shapes[0]]
 
+    def cost(self, node, input_shapes):
+        x, y = node.inputs[:2]
+        xshape, yshape = input_shapes[:2]
+        # Read `y` and read and write the indexed region of `x`
+        bytes = 3 * nbytes(y, yshape)
+        if not self.inplace:
+            bytes = bytes + 2 * nbytes(x, xshape)
+        return OpCost(
+            flops=0 if self.set_instead_of_inc else size(yshape),
+            bytes=bytes,
+        )
+
     def R_op(self, inputs, eval_points):
         if eval_points[0] is None or eval_points[1] is None:
             return [None]
@@ -2067,6 +2084,12 @@ class AdvancedSubtensor1(COp):
         x, ilist = ishapes
         return [ilist + x[1:]]
 
+    def cost(self, node, input_shapes):
+        xshape, ishape = input_shapes
+        out_bytes = nbytes(node.outputs[0], list(ishape) + list(xshape[1:]))
+        # Gather the indexed rows of `x` into the output
+        return OpCost(flops=0, bytes=nbytes(node.inputs[1], ishape) + 2 * out_bytes)
+
     def c_support_code(self, **kwargs):
         # In some versions of numpy, NPY_MIN_INTP is defined as MIN_LONG,
         # which is not defined. It should be NPY_MIN_LONG instead in that case.
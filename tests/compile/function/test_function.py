@@ -3,12 +3,19 @@ import pickle
 import re
 import shutil
 import tempfile
+import time
 
 import numpy as np
 import pytest
 
 from pytensor.compile import shared
 from pytensor.compile.function import function, function_dump
+from pytensor.compile.function.types import (
+    Function,
+    LazyFunction,
+    UnusedInputError,
+    _compile_lock,
+)
 from pytensor.compile.io import In
 from pytensor.configdefaults import config
 from pytensor.tensor.type import (
@@ -53,6 +60,66 @@ def test_function_name():
     assert regex.match(func.name) is not None
 
 
+@pytest.mark.parametrize("lazy", [True, "background"])
+def test_lazy_function(lazy):
+    x = dvector("x")
+    s = shared(np.array(0.0), "s")
+    f = function([x], {"out": x * 2}, updates={s: s + 1}, lazy=lazy, profile=True)
+    assert isinstance(f, LazyFunction)
+    if lazy is True:
+        assert not f.compiled
+
+    res = f([1.0, 2.0])
+    assert f.compiled
+    np.testing.assert_allclose(res["out"], [2.0, 4.0])
+    assert s.get_value() == 1
+    # The name is the one of the caller of `function`
+    assert re.match(".*test_function.pyc?", f.name)
+    assert isinstance(f.function, Function)
+    assert f.profile.compile_time > 0
+    if lazy is True:
+        assert f.profile.compile_wait_time > 0
+
+    f_copy = pickle.loads(pickle.dumps(f))
+    assert isinstance(f_copy, Function)
+    np.testing.assert_allclose(f_copy([1.0])["out"], [2.0])
+
+    with pytest.raises(ValueError, match="lazy must be"):
+        function([x], x, lazy="eager")
+
+
+def test_lazy_function_compile_lock():
+    x = dvector("x")
+    # A background compilation waits for the other compilations to be done
+    with _compile_lock:
+        f = function([x], x * 2, lazy="background")
+        time.sleep(0.1)
+        assert not f.compiled
+    np.testing.assert_allclose(f([1.0]), [2.0])
+
+
+def test_lazy_function_background_flags():
+    x = dvector("x")
+    y = dvector("y")
+    with _compile_lock:
+        with config.change_flags(on_unused_input="ignore"):
+            f = function([x, y], x * 2, lazy="background")
+        # The background compilation uses the flags set when `f` was created
+        assert config.on_unused_input == "raise"
+    np.testing.assert_allclose(f([1.0], [3.0]), [2.0])
+    assert f.compiled
+
+
+def test_lazy_function_error():
+    x = dvector("x")
+    f = function([x, x], x, lazy="background")
+    f._future.exception()
+    assert not f.compiled
+    # The compilation errors are raised when the function is needed
+    with pytest.raises(UnusedInputError):
+        f([1.0])
+
+
 class TestFunctionIn:
     def test_in_strict(self):
         a = dvector()
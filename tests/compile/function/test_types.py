@@ -1,4 +1,5 @@
 import copy
+import os
 import pickle
 
 import numpy as np
@@ -8,7 +9,7 @@ import pytensor.tensor as pt
 from pytensor.compile import shared
 from pytensor.compile.debugmode import DebugMode, InvalidValueError
 from pytensor.compile.function import function
-from pytensor.compile.function.types import UnusedInputError
+from pytensor.compile.function.types import FunctionGraphCache, UnusedInputError
 from pytensor.compile.io import In, Out
 from pytensor.compile.mode import Mode, get_default_mode
 from pytensor.configdefaults import config
@@ -32,6 +33,7 @@ from pytensor.tensor.type import (
     vector,
 )
 from pytensor.utils import exc_message
+from tests import unittest_tools as utt
 
 
 def PatternOptimizer(p1, p2, ign=True):
@@ -863,6 +865,93 @@ class TestFunction:
         with pytest.raises(AssertionError):
             function([x], outputs={(1, "b"): x, 1.0: x**2})
 
+    def test_fast_call(self):
+        x, y = dvector("x"), dscalar("y")
+        s = shared(np.array(0.0), "s")
+        f = function([x, In(y, value=2.0)], [x * y, (x * y).sum()], updates={s: s + y})
+        fast = f.fast_call
+        assert f.fast_call is fast
+
+        x_val = np.arange(3.0)
+        res = fast(x_val, np.array(3.0))
+        np.testing.assert_allclose(res[0], x_val * 3)
+        np.testing.assert_allclose(res[1], 9)
+        assert s.get_value() == 3
+        # The outputs are not reused by the next calls
+        res2 = fast(x_val, np.array(1.0))
+        assert not np.shares_memory(res[0], res2[0])
+        np.testing.assert_allclose(res[0], x_val * 3)
+        assert s.get_value() == 4
+        # The default value of `y` is left untouched
+        np.testing.assert_allclose(f(x_val)[1], 6)
+
+        with pytest.raises(TypeError, match="Expected 2 positional inputs"):
+            fast(x_val)
+
+        f = function([x], outputs={"a": x * 2, "b": x.sum()})
+        res = f.fast_call(x_val)
+        assert set(res) == {"a", "b"}
+        np.testing.assert_allclose(res["a"], x_val * 2)
+
+        f = function([x], pt.exp(x))
+        np.testing.assert_allclose(f.fast_call(x_val), np.exp(x_val))
+
+        f = function([x], x[np.int64(5)])
+        with pytest.raises(IndexError, match="Apply node that caused the error"):
+            f.fast_call(x_val)
+
+    def test_vmap(self):
+        A, x, y = dmatrix("A"), dvector("x"), dscalar("y")
+        f = function([A, x, y], [dot(A, x) * y, x.sum(), tanh(y)])
+
+        rng = np.random.default_rng(utt.fetch_seed())
+        A_val = rng.normal(size=(4, 2, 3))
+        x_val = rng.normal(size=(4, 3))
+        y_val = rng.normal(size=(4,))
+
+        def loop(args, batched):
+            n = next(len(arg) for arg, b in zip(args, batched) if b)
+            res = [
+                f(*(arg[i] if b else arg for arg, b in zip(args, batched)))
+                for i in range(n)
+            ]
+            return [np.stack(outs) for outs in zip(*res)]
+
+        for batched in [(True, True, True), (True, False, False), (False, True, False)]:
+            args = [
+                val if b else val[0] for val, b in zip((A_val, x_val, y_val), batched)
+            ]
+            res = f.vmap(*args)
+            for r, ref in zip(res, loop(args, batched)):
+                assert r.shape[0] == 4
+                np.testing.assert_allclose(r, ref)
+        assert len(f._vmap_fns) == 3
+        vmap_fn = f._vmap_fns[(True, False, False)]
+        f.vmap(A_val[:2], x_val[0], y_val[0])
+        assert f._vmap_fns[(True, False, False)] is vmap_fn
+
+        with pytest.raises(ValueError, match="leading batch axis"):
+            f.vmap(A_val[0], x_val[0], y_val[0])
+        with pytest.raises(TypeError, match="Expected 3 positional inputs"):
+            f.vmap(A_val, x_val)
+
+        f = function([x], outputs={"a": x * 2})
+        res = f.vmap(x_val)
+        np.testing.assert_allclose(res["a"], x_val * 2)
+
+        s = shared(np.array(0.0))
+        f = function([x], x + s, updates={s: s + 1})
+        with pytest.raises(NotImplementedError):
+            f.vmap(x_val)
+
+    @pytest.mark.parametrize("call", ["__call__", "fast_call"])
+    def test_fast_call_benchmark(self, call, benchmark):
+        x, y = dscalars("x", "y")
+        f = function([x, y], pt.exp(x) * y + x)
+        x_val, y_val = np.array(0.5), np.array(2.0)
+        res = benchmark(getattr(f, call), x_val, y_val)
+        np.testing.assert_allclose(res, np.exp(0.5) * 2 + 0.5)
+
 
 class TestPicklefunction:
     def test_deepcopy(self):
@@ -1264,3 +1353,68 @@ def test_empty_givens_updates():
     y = x * 2
     function([In(x)], y, givens={})
     function([In(x)], y, updates={})
+
+
+class TestFunctionGraphCache:
+    @pytest.fixture
+    def graph_cache(self, tmp_path, monkeypatch):
+        cache = FunctionGraphCache(str(tmp_path))
+        monkeypatch.setattr(
+            "pytensor.compile.function.types.get_function_graph_cache", lambda: cache
+        )
+        with config.change_flags(compile__function_cache=True):
+            yield cache
+
+    @staticmethod
+    def build_graph():
+        x = matrix("x")
+        s = shared(np.ones(3, dtype=config.floatX), name="s")
+        y = pt.exp(x).sum(0) * s + pt.log1p(x).mean()
+        return x, s, y
+
+    def test_reuse(self, graph_cache):
+        x_val = np.ones((2, 3), dtype=config.floatX)
+
+        x, s, y = self.build_graph()
+        f = function([x], y, updates={s: s * 2})
+        res = f(x_val)
+        assert graph_cache.hits == 0 and graph_cache.misses == 1
+
+        x, s, y = self.build_graph()
+        g = function([x], y, updates={s: s * 2})
+        assert graph_cache.hits == 1
+        assert g.maker.fgraph.inputs[0] is x
+        np.testing.assert_allclose(g(x_val), res)
+        np.testing.assert_allclose(s.get_value(), 2)
+        # The cached graph was rewritten
+        assert len(g.maker.fgraph.apply_nodes) == len(f.maker.fgraph.apply_nodes)
+
+        # A different graph is not retrieved
+        x, s, y = self.build_graph()
+        function([x], y * 2, updates={s: s * 2})
+        assert graph_cache.hits == 1 and graph_cache.misses == 2
+
+    def test_mode_in_key(self, graph_cache):
+        x, _, y = self.build_graph()
+        function([x], y, mode=Mode(optimizer="fast_run"))
+        function([x], y, mode=Mode(optimizer="fast_compile"))
+        assert graph_cache.hits == 0 and graph_cache.misses == 2
+
+    def test_eviction(self, graph_cache):
+        x, _, y = self.build_graph()
+        function([x], y)
+        assert len(os.listdir(graph_cache.dirname)) > 0
+
+        with config.change_flags(compile__function_cache_age_thresh=1):
+            for key in os.listdir(graph_cache.dirname):
+                for entry in graph_cache._entries(key):
+                    os.utime(entry, (0, 0))
+            function([x], y * 2)
+
+        assert graph_cache.hits == 0
+        entries = [
+            e
+            for key in os.listdir(graph_cache.dirname)
+            for e in graph_cache._entries(key)
+        ]
+        assert len(entries) == 1
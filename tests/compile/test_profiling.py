@@ -4,12 +4,16 @@
 from io import StringIO
 
 import numpy as np
+import pytest
 
+import pytensor.scalar as ps
 import pytensor.tensor as pt
-from pytensor.compile import ProfileStats
+from pytensor.compile import ProfileGuide, ProfileStats
 from pytensor.compile.function import function
+from pytensor.compile.mode import Mode
 from pytensor.configdefaults import config
 from pytensor.ifelse import ifelse
+from pytensor.tensor.blas import Gemm, _dot22, gemm_no_inplace
 from pytensor.tensor.type import fvector, scalars
 
 
@@ -105,3 +109,118 @@ class TestProfiling:
         finally:
             config.profile = config1
             config.profile_memory = config2
+
+
+class TestProfileGuide:
+    def test_from_profile(self, tmp_path):
+        x = pt.dvector("x")
+        f = function([x], pt.exp(x) * 2, profile=True)
+        f(np.ones(10))
+        f(np.ones(10))
+
+        guide = ProfileGuide.from_profiles(f.profile)
+        for node in f.maker.fgraph.apply_nodes:
+            assert guide.op_stats[str(node.op)][1] == 2
+            assert guide.op_time(node.op) >= 0
+        # The `Op`s that weren't profiled use the time of their type
+        assert guide.op_time(pt.tanh(x).owner.op) is not None
+        assert guide.op_time(pt.dot(x, x).owner.op) is None
+
+        path = tmp_path / "guide.json"
+        guide.save(path)
+        loaded = ProfileGuide.load(path)
+        assert loaded.op_stats == guide.op_stats
+        assert loaded.op_type_stats == guide.op_type_stats
+
+        mode = Mode(profile_guided=path)
+        assert mode.profile_guide.op_stats == guide.op_stats
+        assert mode.excluding("fusion").profile_guide is mode.profile_guide
+        assert Mode(profile_guided=f.profile).profile_guide.op_stats == guide.op_stats
+
+    @pytest.mark.parametrize("hot_op", ["Tanh", "Mul"])
+    def test_inplace_priority(self, hot_op):
+        # `tanh(t)` and `t * 2` can't both work inplace on `t`
+        x = pt.dvector("x")
+        t = pt.exp(x)
+        outs = [pt.tanh(t), t * 2]
+
+        guide = ProfileGuide({hot_op: (1.0, 1)})
+        mode = Mode(linker="py", optimizer="fast_run", profile_guided=guide)
+        mode = mode.excluding("fusion")
+        f = function([x], outs, mode=mode)
+
+        inplace_ops = [
+            str(node.op) for node in f.maker.fgraph.apply_nodes if node.op.destroy_map
+        ]
+        assert inplace_ops == [hot_op]
+        x_val = np.linspace(-1, 1, 5)
+        np.testing.assert_allclose(f(x_val)[0], np.tanh(np.exp(x_val)))
+        np.testing.assert_allclose(f(x_val)[1], np.exp(x_val) * 2)
+
+    @pytest.mark.parametrize("composite_time", [0.1, 10.0])
+    def test_fusion(self, composite_time):
+        x = pt.dvector("x")
+        y = pt.dvector("y")
+        outs = [pt.exp(x) * 2, pt.tanh(y) + 1]
+        mode = Mode(linker="py", optimizer="fast_run")
+        f = function([x, y], outs, mode=mode)
+        composites = [
+            str(node.op)
+            for node in f.maker.fgraph.toposort()
+            if isinstance(node.op.scalar_op, ps.Composite)
+        ]
+        assert len(composites) == 2
+
+        # Only the first `Composite` and the `Elemwise`s it replaces were measured
+        guide = ProfileGuide({composites[0]: (composite_time, 1), "Exp": (1.0, 1)})
+        guide.op_stats["Mul"] = (1.0, 1)
+        f = function(
+            [x, y],
+            outs,
+            mode=Mode(linker="py", optimizer="fast_run", profile_guided=guide),
+        )
+        ops = [str(node.op) for node in f.maker.fgraph.toposort()]
+        if composite_time > 2.0:
+            assert composites[0] not in ops
+            assert {"Exp", "Mul"} <= set(ops)
+        else:
+            assert composites[0] in ops
+        assert composites[1] in ops
+
+        x_val = np.linspace(-1, 1, 5)
+        np.testing.assert_allclose(f(x_val, x_val)[0], np.exp(x_val) * 2)
+        np.testing.assert_allclose(f(x_val, x_val)[1], np.tanh(x_val) + 1)
+
+    @pytest.mark.parametrize("gemm_time", [0.1, 10.0])
+    def test_gemm(self, gemm_time):
+        x = pt.dmatrix("x")
+        y = pt.dmatrix("y")
+        z = pt.dmatrix("z")
+        out = z + pt.dot(x, y) * 2
+
+        guide = ProfileGuide(
+            {str(_dot22): (1.0, 1), "Add": (1.0, 1)},
+            {ProfileGuide.op_type_key(gemm_no_inplace): (gemm_time, 1)},
+        )
+        mode = Mode(linker="py", optimizer="fast_run", profile_guided=guide)
+        f = function([x, y, z], out, mode=mode.excluding("fusion"))
+        has_gemm = any(isinstance(node.op, Gemm) for node in f.maker.fgraph.apply_nodes)
+        assert has_gemm == (gemm_time < 2.0)
+
+        rng = np.random.default_rng(0)
+        x_val, y_val, z_val = rng.normal(size=(3, 4, 4))
+        np.testing.assert_allclose(f(x_val, y_val, z_val), z_val + x_val @ y_val * 2)
+
+    def test_from_profiles_with_and_without_rewrites(self):
+        x = pt.dvector("x")
+        out = pt.exp(x) * 2
+        mode = Mode(linker="py", optimizer="fast_run")
+        profiles = []
+        for m in (mode, mode.excluding("fusion")):
+            f = function([x], out, mode=m, profile=True)
+            f(np.ones(10))
+            profiles.append(f.profile)
+
+        guide = ProfileGuide.from_profiles(*profiles)
+        f = function([x], out, mode=Mode(linker="py", profile_guided=guide))
+        np.testing.assert_allclose(f(np.ones(3)), np.exp(np.ones(3)) * 2)
@@ -0,0 +1,108 @@
+import numpy as np
+
+import pytensor
+import pytensor.tensor as pt
+from pytensor.compile.mode import Mode
+from pytensor.compile.profiling import ProfileStats
+from pytensor.graph import FunctionGraph, OpCost, cost
+from pytensor.link.vm import VMLinker
+from pytensor.scan.op import Scan
+from pytensor.tensor.blas import Dot22, Gemm
+from pytensor.tensor.elemwise import Elemwise
+
+
+def eval_cost(fgraph, *input_values, **kwargs):
+    flops, nbytes = cost(fgraph, **kwargs)
+    return pytensor.function(fgraph.inputs, [flops, nbytes], on_unused_input="ignore")(
+        *input_values
+    )
+
+
+def test_static_shapes():
+    x = pt.matrix("x", shape=(100, 20), dtype="float64")
+    y = pt.matrix("y", shape=(20, 30), dtype="float64")
+    fgraph = FunctionGraph([x, y], [pt.exp(x @ y)])
+
+    flops, nbytes = cost(fgraph)
+    assert flops.eval() == 2 * 100 * 20 * 30 + 100 * 30
+    assert nbytes.eval() == 8 * (100 * 20 + 20 * 30 + 100 * 30 + 2 * 100 * 30)
+
+
+def test_symbolic_shapes():
+    x = pt.matrix("x", dtype="float32")
+    fgraph = FunctionGraph([x], [pt.exp(x).sum(axis=0)])
+
+    flops, nbytes = eval_cost(fgraph, np.zeros((3, 4), dtype="float32"))
+    assert flops == 2 * 12
+    assert nbytes == 4 * (12 + 12 + 12 + 4)
+
+    # The shapes of the inputs can also be given explicitly
+    flops, nbytes = cost(fgraph, input_shapes=[(5, 6)])
+    assert flops.eval() == 2 * 30
+    assert not hasattr(fgraph, "shape_feature")
+
+
+def test_per_node():
+    x = pt.vector("x")
+    fgraph = FunctionGraph([x], [pt.exp(x), x.shape[0]])
+    node_costs = cost(fgraph, per_node=True)
+
+    exp_node = next(n for n in node_costs if isinstance(n.op, Elemwise))
+    assert isinstance(node_costs[exp_node], OpCost)
+    # `Shape` doesn't implement `Op.cost`
+    assert None in node_costs.values()
+
+
+def test_rewritten_graph():
+    x = pt.matrix("x", dtype="float64")
+    y = pt.matrix("y", dtype="float64")
+    z = pt.matrix("z", dtype="float64")
+    fn = pytensor.function(
+        [x, y, z], 2 * z + x @ y, mode=Mode(linker="py", optimizer="fast_run")
+    )
+    fgraph = fn.maker.fgraph
+    assert any(isinstance(n.op, (Dot22, Gemm)) for n in fgraph.apply_nodes)
+
+    flops, _ = eval_cost(fgraph, np.zeros((5, 3)), np.zeros((3, 4)), np.zeros((5, 4)))
+    assert flops >= 2 * 5 * 3 * 4 + 2 * 5 * 4
+
+
+def test_blockwise_linalg():
+    A = pt.tensor3("A", shape=(5, 4, 4))
+    b = pt.matrix("b", shape=(4, 2))
+    fgraph = FunctionGraph([A, b], [pt.linalg.inv(A), pt.linalg.solve(A, b)])
+    flops, _ = cost(fgraph)
+    assert flops.eval() == 5 * (2 * 4**3) + 5 * (2 * 4**3 // 3 + 2 * 4**2 * 2)
+
+
+def test_scan():
+    x = pt.matrix("x")
+    out, _ = pytensor.scan(
+        lambda xi, acc: acc + pt.exp(xi),
+        sequences=[x],
+        outputs_info=[pt.zeros(x.shape[1])],
+    )
+    fgraph = FunctionGraph([x], [out[-1]])
+    scan_node = next(n for n in fgraph.apply_nodes if isinstance(n.op, Scan))
+
+    node_costs = cost(fgraph, per_node=True)
+    scan_flops = node_costs[scan_node].flops
+    fn = pytensor.function(fgraph.inputs, scan_flops, on_unused_input="ignore")
+    assert fn(np.zeros((3, 4), dtype=x.dtype)) == 3 * (4 + 4)
+
+
+def test_profiler_node_cost():
+    x = pt.matrix("x", dtype="float64")
+    y = pt.matrix("y", dtype="float64")
+    profile = ProfileStats(atexit_print=False)
+    with pytensor.config.change_flags(profile=True, profile_memory=True):
+        fn = pytensor.function(
+            [x, y],
+            x @ y,
+            profile=profile,
+            mode=Mode(linker=VMLinker(use_cloop=False), optimizer="fast_run"),
+        )
+        fn(np.ones((5, 3)), np.ones((3, 4)))
+
+    (node,) = fn.maker.fgraph.apply_nodes
+    assert profile.node_cost(node) == (2 * 5 * 3 * 4, 8 * (15 + 12 + 20))
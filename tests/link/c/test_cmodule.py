@@ -6,6 +6,7 @@ deterministic based on the input type and the op.
 """
 import multiprocessing
 import os
+import pickle
 import re
 import sys
 import tempfile
@@ -22,7 +23,12 @@ from pytensor.configdefaults import config
 from pytensor.graph.basic import Apply
 from pytensor.graph.fg import FunctionGraph
 from pytensor.link.c.basic import CLinker
-from pytensor.link.c.cmodule import GCC_compiler, ModuleCache, default_blas_ldflags
+from pytensor.link.c.cmodule import (
+    GCC_compiler,
+    ModuleCache,
+    ModuleIndex,
+    default_blas_ldflags,
+)
 from pytensor.link.c.exceptions import CompileError
 from pytensor.link.c.op import COp
 from pytensor.tensor.type import dvectors, vector
@@ -149,6 +155,46 @@ def test_cache_versioning():
         assert stats_before < cache.stats[2]
 
 
+def test_module_index():
+    x = vector("x")
+    lnk = CLinker().accept(FunctionGraph(outputs=[MyAddVersioned()(x)]))
+    key = lnk.cmodule_key()
+
+    with tempfile.TemporaryDirectory() as dir_name:
+        cache = ModuleCache(dir_name)
+        assert os.path.exists(cache.index.path)
+        module = cache.module_from_key(key, lnk)
+        subdir = os.path.basename(os.path.dirname(module.__file__))
+
+        index = ModuleIndex(dir_name)
+        assert index.read() == {subdir: os.path.basename(module.__file__)}
+        assert index.read() == {}
+
+        # The indexed directories aren't listed by a new cache, and their keys
+        # are read from the index instead of their `key.pkl`
+        listdir = os.listdir
+        with patch("os.listdir", side_effect=listdir) as listdir_mock, patch(
+            "pickle.load", side_effect=pickle.load
+        ) as load_mock:
+            new_cache = ModuleCache(dir_name)
+        assert key in new_cache.entry_from_key
+        assert new_cache.module_hash_to_key_data
+        assert all(
+            call.args != (os.path.join(dir_name, subdir),)
+            for call in listdir_mock.call_args_list
+        )
+        load_mock.assert_not_called()
+
+        # A corrupt index is rebuilt from a scan of the cache directory
+        with open(cache.index.path, "ab") as f:
+            f.write(b"not an entry\n")
+        new_cache = ModuleCache(dir_name)
+        assert key in new_cache.entry_from_key
+        index = ModuleIndex(dir_name)
+        assert index.read() == {subdir: os.path.basename(module.__file__)}
+        assert index.load_key_data(subdir).keys == {key}
+
+
 def test_flag_detection():
     """
     TODO FIXME: This is a very poor test.
@@ -392,3 +438,33 @@ def test_cache_race_condition():
                 assert not any(
                     exit_code != 0 for exit_code in [proc.exitcode for proc in procs]
                 )
+
+
+@pytest.mark.skipif(not config.cxx, reason="G++ not available")
+def test_compile_jobs():
+    x = vector("x")
+    y = pt.cumsum(pt.exp(x)) + x.max()
+
+    with tempfile.TemporaryDirectory() as dir_name:
+        compiledir_prop = pytensor.config._config_var_dict["compiledir"]
+        cache = ModuleCache(dir_name)
+        with patch.object(compiledir_prop, "val", dir_name, create=True), patch(
+            "pytensor.link.c.basic.get_module_cache", return_value=cache
+        ), patch.object(
+            CLinker,
+            "compile_cmodule",
+            autospec=True,
+            side_effect=CLinker.compile_cmodule,
+        ) as compile_mock, config.change_flags(
+            cmodule__compile_jobs=2
+        ):
+            f = function([x], y, mode=pytensor.compile.mode.Mode(linker="cvm"))
+
+        # All the modules were compiled concurrently, without the lock
+        assert compile_mock.call_count == cache.stats[2] > 1
+        assert all(
+            call.kwargs == {"lock": False} for call in compile_mock.call_args_list
+        )
+
+    x_val = np.arange(3, dtype=config.floatX)
+    np.testing.assert_allclose(f(x_val), np.cumsum(np.exp(x_val)) + 2)
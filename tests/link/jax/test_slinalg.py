@@ -131,6 +131,22 @@ def test_jax_SolveTriangular(trans, lower, check_finite):
     )
 
 
+@pytest.mark.parametrize("trans", [0, 1])
+def test_jax_lu_solve(trans):
+    A = matrix("A")
+    b = vector("b")
+
+    out = pt_slinalg._lu_solve(pt_slinalg._lu_factor(A), b, trans=trans)
+    out_fg = FunctionGraph([A, b], [out])
+    compare_jax_and_py(
+        out_fg,
+        [
+            np.random.normal(size=(5, 5)).astype(config.floatX),
+            np.random.normal(size=(5,)).astype(config.floatX),
+        ],
+    )
+
+
 def test_jax_block_diag():
     A = matrix("A")
     B = matrix("B")
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from pytensor import config, function
+from pytensor.graph import FunctionGraph
+from pytensor.tensor import tensor
+from pytensor.tensor.blockwise import Blockwise
+from pytensor.tensor.math import Dot, matmul
+from pytensor.tensor.nlinalg import SVD
+from pytensor.tensor.slinalg import Cholesky, Solve
+from tests.link.numba.test_basic import compare_numba_and_py, numba_mode
+from tests.tensor.test_blockwise import check_blockwise_runtime_broadcasting
+
+
+pytest.importorskip("numba")
+
+
+def test_runtime_broadcasting():
+    check_blockwise_runtime_broadcasting("NUMBA")
+
+
+# Equivalent blockwise to matmul but with dumb signature
+odd_matmul = Blockwise(Dot(), signature="(i00,i01),(i10,i11)->(o00,o01)")
+
+
+@pytest.mark.parametrize("matmul_op", (matmul, odd_matmul))
+def test_matmul(matmul_op):
+    rng = np.random.default_rng(14)
+    a = tensor("a", shape=(2, 3, 5))
+    b = tensor("b", shape=(2, 5, 3))
+    test_values = [
+        rng.normal(size=(inp.type.shape)).astype(config.floatX) for inp in (a, b)
+    ]
+
+    out = matmul_op(a, b)
+    assert isinstance(out.owner.op, Blockwise)
+    compare_numba_and_py(FunctionGraph([a, b], [out]), test_values)
+
+
+def test_batched_solve_broadcast():
+    rng = np.random.default_rng(2)
+    a = tensor("a", shape=(4, 1, 3, 3))
+    b = tensor("b", shape=(1, 5, 3, 2))
+    out = Blockwise(Solve(b_ndim=2))(a, b)
+
+    a_val = rng.normal(size=(4, 1, 3, 3)) + 3 * np.eye(3)
+    b_val = rng.normal(size=(1, 5, 3, 2))
+    compare_numba_and_py(
+        FunctionGraph([a, b], [out]),
+        [a_val.astype(config.floatX), b_val.astype(config.floatX)],
+    )
+
+
+def test_multiple_outputs():
+    rng = np.random.default_rng(3)
+    x = tensor("x", shape=(None, 3, 4))
+    outs = Blockwise(SVD(full_matrices=False), signature="(m,n)->(m,k),(k),(k,n)")(x)
+
+    compare_numba_and_py(
+        FunctionGraph([x], outs),
+        [rng.normal(size=(6, 3, 4)).astype(config.floatX)],
+        # Singular vectors are only defined up to a sign
+        assert_fn=lambda x, y: np.testing.assert_allclose(
+            np.abs(x), np.abs(y), rtol=1e-4
+        ),
+    )
+
+
+def test_empty_batch():
+    x = tensor("x", shape=(None, 3, 3))
+    fn = function([x], Blockwise(Cholesky())(x), mode=numba_mode)
+    res = fn(np.zeros((0, 3, 3), dtype=config.floatX))
+    assert res.shape == (0, 3, 3)
+    assert res.dtype == config.floatX
@@ -0,0 +1,60 @@
+import numpy as np
+import pytest
+
+
+pytest.importorskip("numba")
+
+import pytensor.tensor as pt
+from pytensor import config
+from pytensor.graph import FunctionGraph
+from pytensor.link.numba.cache import _CompiledirCacheLocator, function_cache_key
+from pytensor.link.numba.dispatch import numba_funcify
+from pytensor.link.numba.linker import NumbaLinker
+from pytensor.link.utils import compile_function_src
+
+
+def funcify_graph(constant=2.0):
+    x = pt.vector("x")
+    y = pt.vector("y")
+    outs = [pt.exp(x) * constant + y, pt.cumsum(y).max()]
+    return numba_funcify(FunctionGraph([x, y], outs))
+
+
+def test_function_cache_key():
+    key = function_cache_key(funcify_graph())
+    assert key is not None
+    # The key doesn't depend on the identity of the objects in the graph
+    assert function_cache_key(funcify_graph()) == key
+    assert function_cache_key(funcify_graph(3.0)) != key
+
+
+def test_function_cache_key_unhashable():
+    fn = compile_function_src("def fn(x):\n    return obj\n", "fn", {"obj": object()})
+    assert function_cache_key(fn) is None
+
+
+def test_jit_compile_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        _CompiledirCacheLocator, "get_cache_path", lambda self: str(tmp_path)
+    )
+
+    x_val = np.linspace(0, 1, 5).astype(config.floatX)
+    y_val = np.linspace(1, 2, 5).astype(config.floatX)
+
+    with config.change_flags(numba__cache=True):
+        fn = NumbaLinker().jit_compile(funcify_graph())
+        res = fn(x_val, y_val)
+        assert sum(fn.stats.cache_misses.values()) == 1
+        assert any(tmp_path.iterdir())
+
+        cached_fn = NumbaLinker().jit_compile(funcify_graph())
+        cached_res = cached_fn(x_val, y_val)
+        assert sum(cached_fn.stats.cache_hits.values()) == 1
+
+    np.testing.assert_allclose(cached_res[0], res[0])
+    np.testing.assert_allclose(cached_res[1], res[1])
+
+    with config.change_flags(numba__cache=False):
+        fn = NumbaLinker().jit_compile(funcify_graph())
+        fn(x_val, y_val)
+        assert not fn.stats.cache_hits
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from pytensor import config
+from pytensor.graph import FunctionGraph
+from pytensor.tensor import lvector, tensor, tensor3
+from pytensor.tensor.conv.im2col import Col2Im, Im2Col
+from tests.link.numba.test_basic import compare_numba_and_py
+
+
+pytest.importorskip("numba")
+
+
+@pytest.mark.parametrize(
+    "border_mode, subsample, filter_dilation, imshp, kshp",
+    [
+        ("valid", (1, 1), (1, 1), (2, 3, 6, 5), (2, 3)),
+        ("full", (2, 1), (1, 2), (2, 3, 6, 5), (3, 2)),
+        ("half", (1, 3), (2, 1), (1, 2, 7, 7), (3, 3)),
+        ((1, 1, 0), (1, 2, 1), (1, 1, 2), (2, 2, 4, 5, 3), (2, 2, 2)),
+    ],
+)
+def test_im2col_col2im(border_mode, subsample, filter_dilation, imshp, kshp):
+    rng = np.random.default_rng(11)
+    img = tensor("img", shape=(None,) * len(imshp))
+    k = lvector("k")
+    cols = tensor3("cols")
+    s = lvector("s")
+    im2col = Im2Col(border_mode, subsample, filter_dilation)
+    col2im = Col2Im(border_mode, subsample, filter_dilation)
+
+    img_val = rng.normal(size=imshp).astype(config.floatX)
+    kshp = np.array(kshp)
+    compare_numba_and_py(FunctionGraph([img, k], [im2col(img, k)]), [img_val, kshp])
+
+    cols_shape = im2col(img_val, kshp).eval().shape
+    cols_val = rng.normal(size=cols_shape).astype(config.floatX)
+    compare_numba_and_py(
+        FunctionGraph([cols, s, k], [col2im(cols, s, k)]),
+        [cols_val, np.array(imshp[2:]), kshp],
+    )
+
+
+def test_col2im_invalid_shapes():
+    cols = tensor3("cols")
+    s = lvector("s")
+    k = lvector("k")
+    cols_val = np.zeros((1, 5, 4), dtype=config.floatX)
+    with pytest.raises(ValueError):
+        compare_numba_and_py(
+            FunctionGraph([cols, s, k], [Col2Im()(cols, s, k)]),
+            [cols_val, np.array([3, 3]), np.array([2, 2])],
+        )
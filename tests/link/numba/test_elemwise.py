@@ -620,3 +620,39 @@ def test_elemwise_out_type():
     x_val = np.broadcast_to(np.zeros((3,)), (6, 3))
 
     assert func(x_val).shape == (18,)
+
+
+@pytest.mark.parametrize("minsize", [1, 1000])
+def test_parallel(minsize):
+    x = pt.matrix("x")
+    y = pt.row("y")
+    t = pt.tensor3("t")
+    outs = [
+        pt.exp(x) * y + 1,
+        pt.sum(x, axis=1),
+        pt.max(x, axis=0),
+        pt.prod(t, axis=(0, 2)),
+    ]
+    x_val = rng.normal(size=(7, 5)).astype(config.floatX)
+    y_val = rng.normal(size=(1, 5)).astype(config.floatX)
+    t_val = rng.normal(size=(3, 4, 5)).astype(config.floatX)
+
+    with config.change_flags(
+        numba__vectorize_target="parallel", numba__parallel_minsize=minsize
+    ):
+        fn, _ = compare_numba_and_py(([x, y, t], outs), [x_val, y_val, t_val])
+
+        # Non-contiguous inputs and invalid shapes are handled too
+        res = fn(x_val.T.copy().T, y_val, t_val[:, ::-1])
+        np.testing.assert_allclose(res[0], np.exp(x_val) * y_val + 1, rtol=1e-4)
+        np.testing.assert_allclose(res[3], t_val[:, ::-1].prod(axis=(0, 2)), rtol=1e-4)
+        with pytest.raises(ValueError, match="incompatible shape"):
+            fn(x_val, y_val[:, :4], t_val)
+
+    elemwise_fn = next(
+        v
+        for v in fn.vm.jit_fn.py_func.__globals__.values()
+        if getattr(v, "py_func", None) is not None and v.py_func.__name__ == "elemwise"
+    )
+    parallel_fn = elemwise_fn.py_func.__globals__["parallel_fn"]
+    assert parallel_fn.targetoptions["parallel"] is True
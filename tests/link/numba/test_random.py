@@ -1,4 +1,5 @@
 import contextlib
+import warnings
 
 import numpy as np
 import pytest
@@ -581,12 +582,58 @@ def test_RandomState_updates():
     assert np.allclose(res, ref)
 
 
-def test_random_Generator():
+@pytest.mark.parametrize(
+    "rv_op, dist_args, size",
+    [
+        (
+            ptr.normal,
+            [
+                set_test_value(pt.dvector(), np.array([1.0, 2.0])),
+                set_test_value(pt.dscalar(), np.array(1.0)),
+            ],
+            pt.as_tensor([3, 2]),
+        ),
+        (
+            ptr.uniform,
+            [
+                set_test_value(pt.dvector(), np.array([1.0, 2.0])),
+                set_test_value(pt.dscalar(), np.array(3.0)),
+            ],
+            None,
+        ),
+        (
+            ptr.poisson,
+            [set_test_value(pt.dvector(), np.array([1.0, 20.0]))],
+            pt.as_tensor([3, 2]),
+        ),
+        (
+            ptr.integers,
+            [
+                set_test_value(pt.lscalar(), np.array(-5, dtype=np.int64)),
+                set_test_value(pt.lvector(), np.array([0, 10], dtype=np.int64)),
+            ],
+            None,
+        ),
+        (
+            ptr.categorical,
+            [set_test_value(pt.dmatrix(), np.array([[0.2, 0.8], [0.9, 0.1]]))],
+            pt.as_tensor([3, 2]),
+        ),
+        (
+            ptr.dirichlet,
+            [set_test_value(pt.dmatrix(), np.array([[1.0, 2.0], [3.0, 0.5]]))],
+            pt.as_tensor([3, 2]),
+        ),
+    ],
+    ids=str,
+)
+def test_random_Generator(rv_op, dist_args, size):
     rng = shared(np.random.default_rng(29402))
-    g = ptr.normal(rng=rng)
+    g = rv_op(*dist_args, size=size, rng=rng)
     g_fg = FunctionGraph(outputs=[g])
 
-    with pytest.raises(TypeError):
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
         compare_numba_and_py(
             g_fg,
             [
@@ -595,3 +642,51 @@ def test_random_Generator():
                 if not isinstance(i, (SharedVariable, Constant))
             ],
         )
+
+
+@pytest.mark.parametrize(
+    "rv_op, dist_args, cdf_name",
+    [
+        (ptr.gumbel, [np.array([1.0, 2.0]), np.array(1.0)], "gumbel_r"),
+        (ptr.cauchy, [np.array([1.0, 2.0]), np.array(1.0)], "cauchy"),
+        (ptr.halfnormal, [np.array([1.0, 2.0]), np.array(2.0)], "halfnorm"),
+    ],
+)
+def test_unaligned_random_Generator(rv_op, dist_args, cdf_name):
+    rng = shared(np.random.default_rng(29402))
+    g = rv_op(*dist_args, size=(2000, 2), rng=rng)
+    samples = function([], g, mode=numba_mode)()
+
+    for idx in range(2):
+        cdf_params = tuple(np.broadcast_to(arg, (2,))[idx] for arg in dist_args)
+        test_res = stats.cramervonmises(samples[:, idx], cdf_name, args=cdf_params)
+        assert test_res.pvalue > 0.1
+
+
+def test_random_Generator_updates():
+    rng = shared(np.random.default_rng(123))
+    next_rng, x = ptr.normal(size=10, rng=rng).owner.outputs
+    fn = function([], x, updates={rng: next_rng}, mode="NUMBA")
+    (rv_node,) = fn.maker.fgraph.apply_nodes
+    assert rv_node.op.inplace
+
+    # The state of the `Generator` is advanced in place
+    rng_val = rng.get_value(borrow=True)
+    res = [fn(), fn()]
+    assert rng.get_value(borrow=True) is rng_val
+
+    ref_rng = np.random.default_rng(123)
+    assert np.allclose(res, [ref_rng.normal(size=10), ref_rng.normal(size=10)])
+
+    # Without updates the `Generator` is copied
+    fn = function([], x, mode=numba_mode)
+    np.testing.assert_array_equal(fn(), fn())
+
+
+def test_random_Generator_fallback():
+    rng = shared(np.random.default_rng(123))
+    x = ptr.binomial(10, 0.5, size=(3,), rng=rng)
+
+    with pytest.warns(UserWarning, match="Numba will use object mode"):
+        fn = function([], x, mode=numba_mode)
+    assert fn().shape == (3,)
@@ -6,10 +6,30 @@ import scipy as sp
 numba = pytest.importorskip("numba")
 
 
+import pytensor
+
 # Make sure the Numba customizations are loaded
 import pytensor.link.numba.dispatch.sparse  # noqa: F401
+import pytensor.tensor as pt
 from pytensor import config
 from pytensor.sparse import Dot, SparseTensorType
+from pytensor.sparse.basic import (
+    CSM,
+    SparseFromDense,
+    add_s_d,
+    add_s_s,
+    csm_properties,
+    dense_from_sparse,
+    mul_s_d,
+    mul_s_s,
+    mul_s_v,
+    neg,
+    sp_sum,
+    structured_add_s_v,
+    structured_dot,
+    transpose,
+    usmm,
+)
 from tests.link.numba.test_basic import compare_numba_and_py
 
 
@@ -101,3 +121,185 @@ def test_sparse_objmode():
         match="Numba will use object mode to run SparseDot's perform method",
     ):
         compare_numba_and_py(((x, y), (out,)), [x_val, y_val])
+
+
+def sparse_assert_fn(a, b):
+    a_is_sparse = sp.sparse.issparse(a)
+    assert a_is_sparse == sp.sparse.issparse(b)
+    if a_is_sparse:
+        assert a.format == b.format
+        assert a.dtype == b.dtype
+        a, b = a.toarray(), b.toarray()
+    np.testing.assert_allclose(a, b, rtol=1e-4)
+    assert a.shape == b.shape
+    assert a.dtype == b.dtype
+
+
+def sparse_val(format, shape=(5, 4), density=0.4, seed=0):
+    return sp.sparse.random(
+        *shape, density=density, format=format, dtype=config.floatX, random_state=seed
+    )
+
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+def test_csm_properties_csm(format):
+    x = SparseTensorType(format, dtype=config.floatX)()
+    data, indices, indptr, shape = csm_properties(x)
+    y = CSM(format)(data * 2, indices, indptr, shape[::-1][::-1])
+
+    compare_numba_and_py(
+        ((x,), (data, indices, indptr, shape, y)),
+        [sparse_val(format)],
+        assert_fn=sparse_assert_fn,
+    )
+
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+@pytest.mark.parametrize(
+    "op",
+    [
+        transpose,
+        neg,
+        dense_from_sparse,
+        lambda x: sp_sum(x),
+        lambda x: sp_sum(x, axis=0),
+        lambda x: sp_sum(x, axis=1),
+    ],
+)
+def test_unary_sparse_ops(format, op):
+    x = SparseTensorType(format, dtype=config.floatX)()
+
+    compare_numba_and_py(
+        ((x,), (op(x),)),
+        [sparse_val(format)],
+        assert_fn=sparse_assert_fn,
+    )
+
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+def test_sparse_from_dense(format):
+    x = pt.matrix(dtype=config.floatX)
+    x_val = sparse_val(format).toarray()
+
+    compare_numba_and_py(
+        ((x,), (SparseFromDense(format)(x),)),
+        [x_val],
+        assert_fn=sparse_assert_fn,
+    )
+
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+@pytest.mark.parametrize("op", [add_s_s, mul_s_s])
+def test_sparse_sparse_elemwise(format, op):
+    x = SparseTensorType(format, dtype=config.floatX)()
+    y = SparseTensorType(format, dtype=config.floatX)()
+    x_val = sparse_val(format, seed=1)
+    # Make sure that the entries of the first row cancel out in the sum
+    first_row = sp.sparse.diags([1, 0, 0, 0, 0], dtype=config.floatX)
+    y_val = (sparse_val(format, seed=2) - first_row @ x_val).asformat(format)
+
+    compare_numba_and_py(
+        ((x, y), (op(x, y),)),
+        [x_val, y_val],
+        assert_fn=sparse_assert_fn,
+    )
+
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+@pytest.mark.parametrize(
+    "op, y_shape",
+    [
+        (add_s_d, (5, 4)),
+        (mul_s_d, (5, 4)),
+        (mul_s_d, ()),
+        (mul_s_v, (4,)),
+        (structured_add_s_v, (4,)),
+    ],
+)
+def test_sparse_dense_elemwise(format, op, y_shape):
+    x = SparseTensorType(format, dtype=config.floatX)()
+    y = pt.tensor(dtype=config.floatX, shape=(None,) * len(y_shape))
+    y_val = np.random.default_rng(3).normal(size=y_shape).astype(config.floatX)
+
+    compare_numba_and_py(
+        ((x, y), (op(x, y),)),
+        [sparse_val(format), y_val],
+        assert_fn=sparse_assert_fn,
+    )
+
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+def test_sparse_add_dense_intermediate(format):
+    # `AddSD` can work inplace on an intermediate, which the C-only
+    # `AddSD_ccode` rewrites must not do in the Numba backend
+    x = SparseTensorType(format, dtype=config.floatX)()
+    y = pt.matrix(dtype=config.floatX)
+    out = add_s_d(x, y * 2)
+    y_val = np.random.default_rng(4).normal(size=(5, 4)).astype(config.floatX)
+
+    fn = pytensor.function([x, y], out, mode="NUMBA")
+    assert not any(
+        type(node.op).__name__ == "AddSD_ccode" for node in fn.maker.fgraph.toposort()
+    )
+    x_val = sparse_val(format)
+    np.testing.assert_allclose(fn(x_val, y_val), x_val.toarray() + y_val * 2)
+
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+@pytest.mark.parametrize(
+    "x_shape, y_shape, sparse_x",
+    [
+        ((5, 4), (4, 3), True),
+        ((5, 4), (4,), True),
+        ((3, 5), (5, 4), False),
+        ((5,), (5, 4), False),
+    ],
+)
+def test_sparse_dot(format, x_shape, y_shape, sparse_x):
+    rng = np.random.default_rng(4)
+    if sparse_x:
+        x = SparseTensorType(format, dtype=config.floatX)()
+        x_val = sparse_val(format, shape=x_shape)
+        y = pt.tensor(dtype=config.floatX, shape=(None,) * len(y_shape))
+        y_val = rng.normal(size=y_shape).astype(config.floatX)
+    else:
+        x = pt.tensor(dtype=config.floatX, shape=(None,) * len(x_shape))
+        x_val = rng.normal(size=x_shape).astype(config.floatX)
+        y = SparseTensorType(format, dtype=config.floatX)()
+        y_val = sparse_val(format, shape=y_shape)
+
+    compare_numba_and_py(((x, y), (Dot()(x, y),)), [x_val, y_val])
+
+
+@pytest.mark.parametrize("format", ["csr", "csc"])
+def test_structured_dot(format):
+    x = SparseTensorType(format, dtype=config.floatX)()
+    y = pt.matrix(dtype=config.floatX)
+    out = structured_dot(x, y)
+    g_x = pytensor.grad(out.sum(), x)
+    x_val = sparse_val(format)
+    y_val = np.random.default_rng(5).normal(size=(4, 3)).astype(config.floatX)
+
+    compare_numba_and_py(
+        ((x, y), (out, g_x)),
+        [x_val, y_val],
+        assert_fn=sparse_assert_fn,
+    )
+
+
+def test_usmm():
+    alpha = pt.scalar(dtype=config.floatX)
+    x = SparseTensorType("csr", dtype=config.floatX)()
+    y = pt.matrix(dtype=config.floatX)
+    z = pt.matrix(dtype=config.floatX)
+    rng = np.random.default_rng(6)
+
+    compare_numba_and_py(
+        ((alpha, x, y, z), (usmm(alpha, x, y, z),)),
+        [
+            np.array(2.5, dtype=config.floatX),
+            sparse_val("csr"),
+            rng.normal(size=(4, 3)).astype(config.floatX),
+            rng.normal(size=(5, 3)).astype(config.floatX),
+        ],
+    )
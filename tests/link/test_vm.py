@@ -1,4 +1,6 @@
+import gc
 import time
+from io import StringIO
 
 import numpy as np
 import pytest
@@ -15,8 +17,9 @@ from pytensor.ifelse import ifelse
 from pytensor.link.c.basic import OpWiseCLinker
 from pytensor.link.c.exceptions import MissingGXX
 from pytensor.link.utils import map_storage
-from pytensor.link.vm import VM, Loop, Stack, VMLinker
-from pytensor.tensor.math import cosh, tanh
+from pytensor.link.vm import VM, Loop, ParallelLoop, PlannedLoop, Stack, VMLinker
+from pytensor.tensor.math import cosh, exp, tanh
+from pytensor.tensor.subtensor import inc_subtensor
 from pytensor.tensor.type import lscalar, scalar, scalars, vector, vectors
 from pytensor.tensor.variable import TensorConstant
 from tests import unittest_tools as utt
@@ -544,3 +547,254 @@ def test_Stack_updates():
 
     assert res == [np.array(1.0), np.array(2.0)]
     assert storage_map[a][0] == np.array(2.0)
+
+
+class TestParallelLoop:
+    def mode(self, **kwargs):
+        return Mode(linker=VMLinker(use_cloop=False, parallel=4, **kwargs))
+
+    def test_make_vm(self):
+        x = vector("x")
+        f = function([x], [x + 1, x * 2], mode=self.mode())
+        assert isinstance(f.vm, ParallelLoop)
+        assert f.vm.n_threads == 4
+
+        y = ifelse(x.sum() > 0, x, -x)
+        f = function([x], y, mode=self.mode())
+        assert not isinstance(f.vm, ParallelLoop)
+
+        with config.change_flags(vm__parallel=3):
+            linker = VMLinker()
+        assert linker.parallel == 3
+        assert "parallel=3" in repr(linker)
+
+    @pytest.mark.parametrize("allow_gc", [True, False])
+    def test_branches(self, allow_gc):
+        x = vector("x")
+        branches = [tanh(x * i) + cosh(x - i) for i in range(8)]
+        out = branches[0]
+        for b in branches[1:]:
+            out = out + b
+
+        mode = self.mode(allow_gc=allow_gc).excluding("fusion")
+        f = function([x], [out, branches[3]], mode=mode)
+        f_ref = function([x], [out, branches[3]], mode=Mode(linker="py"))
+
+        x_val = np.linspace(-1, 1, 5).astype(config.floatX)
+        for _ in range(3):
+            for res, ref in zip(f(x_val), f_ref(x_val)):
+                np.testing.assert_allclose(res, ref, rtol=1e-5)
+
+        intermediate = [
+            var
+            for node in f.maker.fgraph.apply_nodes
+            for var in node.outputs
+            if var not in f.maker.fgraph.outputs
+        ]
+        assert intermediate
+        cleared = [f.vm.storage_map[var][0] is None for var in intermediate]
+        assert all(cleared) if allow_gc else not any(cleared)
+
+    def test_destroy_orderings(self):
+        x = vector("x")
+        y = x * 2
+        # The in-place update of `y` must wait for the readers of `y`
+        z = inc_subtensor(y[0], 1)
+        outs = [y.sum() * 3, z, y.mean()]
+
+        f = function([x], outs, mode=self.mode())
+        assert any(node.op.destroy_map for node in f.maker.fgraph.apply_nodes)
+
+        x_val = np.arange(5, dtype=config.floatX)
+        for _ in range(10):
+            res = f(x_val)
+            np.testing.assert_allclose(res[0], 60)
+            np.testing.assert_allclose(res[1], [1, 2, 4, 6, 8])
+            np.testing.assert_allclose(res[2], 4)
+
+    def test_inner_graph_ops(self):
+        from pytensor.compile.builders import OpFromGraph
+
+        x, y = vectors("xy")
+        op = OpFromGraph([x, y], [tanh(x) * y])
+        outs = [op(x, y), op(y, x), op(x, x)]
+
+        f = function([x, y], outs, mode=self.mode())
+        assert isinstance(f.vm, ParallelLoop)
+
+        x_val = np.linspace(-1, 1, 5).astype(config.floatX)
+        y_val = np.linspace(0, 2, 5).astype(config.floatX)
+        for _ in range(10):
+            res = f(x_val, y_val)
+            np.testing.assert_allclose(res[0], np.tanh(x_val) * y_val, rtol=1e-5)
+            np.testing.assert_allclose(res[1], np.tanh(y_val) * x_val, rtol=1e-5)
+            np.testing.assert_allclose(res[2], np.tanh(x_val) * x_val, rtol=1e-5)
+
+    def test_updates(self):
+        a = shared(np.array(1.0, dtype=config.floatX), "a")
+        x = scalar("x")
+        f = function([x], a + x, updates={a: a + x}, mode=self.mode())
+        assert isinstance(f.vm, ParallelLoop)
+
+        assert f(2) == 3
+        assert a.get_value() == 3
+
+    def test_exception(self):
+        class BadOp(SomeOp):
+            def perform(self, node, inputs, outputs):
+                raise ValueError("bad Op")
+
+        a = scalar("a")
+        f = function([a], [BadOp()(a), a + 1], mode=self.mode())
+
+        with pytest.raises(ValueError, match="bad Op"):
+            f(1)
+
+    def test_partial_function(self):
+        x = lscalar("x")
+        a = shared(np.asarray(1, "int64"), name="a")
+        calls = []
+
+        class CountingOp(SomeOp):
+            def perform(self, node, inputs, outputs):
+                calls.append(None)
+                outputs[0][0] = inputs[0]
+
+        f = function(
+            [x],
+            [x * 2, CountingOp()(x) + 1],
+            updates=[(a, a + x)],
+            mode=self.mode(),
+        )
+        assert isinstance(f.vm, ParallelLoop)
+
+        assert f(3, output_subset=[0]) == [6]
+        assert not calls
+        assert a.get_value() == 4
+        assert f(3, output_subset=[1, 0]) == [4, 6]
+        assert len(calls) == 1
+        assert f(3) == [6, 4]
+
+    def test_threads_stopped(self):
+        x = vector("x")
+        f = function([x], [x + 1, x * 2], mode=self.mode())
+        f(np.ones(3, dtype=config.floatX))
+        threads = f.vm.executor._threads.copy()
+        assert threads
+
+        del f
+        gc.collect()
+        for thread in threads:
+            thread.join(timeout=10)
+            assert not thread.is_alive()
+
+
+@pytest.mark.skipif(
+    not config.cxx, reason="G++ not available, so we need to skip this test."
+)
+class TestPlannedLoop:
+    def mode(self, **kwargs):
+        return Mode(
+            linker=VMLinker(use_cloop=True, memory_plan=True, **kwargs),
+            optimizer="fast_run",
+        ).excluding("fusion", "inplace")
+
+    def graph(self):
+        x = vector("x")
+        a = tanh(x)
+        b = exp(a) * 2
+        c = cosh(b) + a
+        d = tanh(c) * b
+        return x, [d - c, a]
+
+    def test_make_vm(self):
+        x, outs = self.graph()
+        f = function([x], outs, mode=self.mode())
+        assert isinstance(f.vm, PlannedLoop)
+
+        y = ifelse(x.sum() > 0, x, -x)
+        f = function([x], y, mode=self.mode())
+        assert not isinstance(f.vm, PlannedLoop)
+
+        with config.change_flags(vm__memory_plan=True):
+            linker = VMLinker()
+        assert linker.memory_plan
+        assert "memory_plan=True" in repr(linker)
+
+    @pytest.mark.parametrize("allow_gc", [True, False])
+    def test_arena(self, allow_gc):
+        x, outs = self.graph()
+        f = function([x], outs, mode=self.mode(allow_gc=allow_gc))
+        f_ref = function([x], outs, mode=Mode(linker="py", optimizer=None))
+
+        for n in (5, 5, 5, 7, 7):
+            x_val = np.linspace(-1, 1, n).astype(config.floatX)
+            res = f(x_val)
+            for r, ref in zip(res, f_ref(x_val)):
+                np.testing.assert_allclose(r, ref, rtol=1e-5)
+            # The outputs are never allocated in the arena
+            assert not any(np.shares_memory(r, f.vm.arena) for r in res)
+
+        vm = f.vm
+        itemsize = np.dtype(config.floatX).itemsize
+        assert vm.memory_plan_nb_vars >= 3
+        assert vm.memory_plan_size < vm.memory_plan_unplanned_size
+        assert vm.memory_plan_size >= 2 * 7 * itemsize
+
+        if not allow_gc:
+            # The planned intermediate results were written in the arena
+            planned = [
+                vm.storage_map[var][0]
+                for node_vars in vm.node_plan_vars
+                for var in node_vars
+            ]
+            assert sum(np.shares_memory(v, vm.arena) for v in planned) >= 3
+
+    def test_views_are_not_planned(self):
+        x = vector("x")
+        a = exp(x)
+        out = a[1:] * 2
+        f = function([x], [out, a[::2]], mode=self.mode())
+
+        x_val = np.linspace(-1, 1, 5).astype(config.floatX)
+        for _ in range(3):
+            res = f(x_val)
+            np.testing.assert_allclose(res[0], np.exp(x_val)[1:] * 2, rtol=1e-5)
+            np.testing.assert_allclose(res[1], np.exp(x_val)[::2], rtol=1e-5)
+        # `a` is viewed by an output of the graph
+        assert f.vm.memory_plan_nb_vars == 0
+
+    def test_partial_function(self):
+        x, outs = self.graph()
+        f = function([x], outs, mode=self.mode())
+        f_ref = function([x], outs, mode=Mode(linker="py", optimizer=None))
+
+        for n in (5, 5, 7, 7):
+            x_val = np.linspace(-1, 1, n).astype(config.floatX)
+            ref = f_ref(x_val)
+            (res,) = f(x_val, output_subset=[1])
+            np.testing.assert_allclose(res, ref[1], rtol=1e-5)
+            res = f(x_val)
+            for r, r_ref in zip(res, ref):
+                np.testing.assert_allclose(r, r_ref, rtol=1e-5)
+        # The plan of the last full evaluation is kept
+        assert f.vm.plan_input_shapes == [(7,)]
+
+        # A partial evaluation with new shapes neither uses nor rebuilds it
+        x_val = np.linspace(-1, 1, 9).astype(config.floatX)
+        (res,) = f(x_val, output_subset=[0])
+        np.testing.assert_allclose(res, f_ref(x_val)[0], rtol=1e-5)
+        assert f.vm.plan_input_shapes == [(7,)]
+
+    def test_profile(self):
+        x, outs = self.graph()
+        f = function([x], outs, mode=self.mode(), profile=True)
+        x_val = np.linspace(-1, 1, 5).astype(config.floatX)
+        f(x_val)
+        f(x_val)
+
+        assert f.profile.memory_plan_nb_vars == f.vm.memory_plan_nb_vars > 0
+        assert f.profile.memory_plan_size == f.vm.memory_plan_size
+        buf = StringIO()
+        f.profile.summary_function(buf)
+        assert "Memory plan" in buf.getvalue()
@@ -4,9 +4,11 @@ import pytest
 from pytensor.compile.function import function
 from pytensor.gradient import grad
 from pytensor.scan.basic import scan
-from pytensor.scan.checkpoints import scan_checkpoints
+from pytensor.scan.checkpoints import checkpoint_segment_length, scan_checkpoints
+from pytensor.scan.op import Scan
 from pytensor.tensor.basic import ones_like
-from pytensor.tensor.type import iscalar, vector
+from pytensor.tensor.math import tanh
+from pytensor.tensor.type import iscalar, matrix, vector
 
 
 class TestScanCheckpoint:
@@ -47,3 +49,78 @@ class TestScanCheckpoint:
         # Test that an error rises if we use taps in outputs_info.
         with pytest.raises(RuntimeError):
             scan_checkpoints(lambda: None, [], {"initial": self.A, "taps": [-2]})
+
+
+@pytest.mark.parametrize(
+    "n_steps, checkpoint, expected",
+    [(100, "sqrt", 10), (101, "sqrt", 11), (100, 25, 20), (100, 10, 10), (7, 200, 7)],
+)
+def test_checkpoint_segment_length(n_steps, checkpoint, expected):
+    assert checkpoint_segment_length(n_steps, checkpoint).eval() == expected
+
+
+class TestCheckpointedGrad:
+    def build(self, checkpoint, truncate_gradient=-1):
+        x = matrix("x")
+        w = matrix("w")
+        h0 = vector("h0")
+        m0 = matrix("m0")
+
+        def step(x_tm1, x_tp1, m_tm3, m_tm1, h_tm1, w):
+            m_t = tanh((x_tm1 + x_tp1) @ w + m_tm3 * m_tm1)
+            h_t = tanh(h_tm1 @ w + x_tm1)
+            return m_t, h_t, (x_tp1**2).sum()
+
+        (m, h, z), _ = scan(
+            step,
+            sequences=[dict(input=x, taps=[-1, 1])],
+            outputs_info=[dict(initial=m0, taps=[-3, -1]), h0, None],
+            non_sequences=[w],
+            truncate_gradient=truncate_gradient,
+            checkpoint=checkpoint,
+        )
+        cost = m[-1].sum() + (h**2).sum() + z[::2].sum()
+        inputs = [x, w, h0, m0]
+        return function(inputs, grad(cost, inputs))
+
+    def test_grad(self):
+        rng = np.random.default_rng(1024)
+        # The segment lengths don't divide the 17 steps
+        vals = [
+            rng.normal(size=(19, 3)),
+            rng.normal(size=(3, 3)),
+            rng.normal(size=3),
+            rng.normal(size=(3, 3)),
+        ]
+        expected = self.build(None)(*vals)
+        for checkpoint in ("sqrt", 7):
+            res = self.build(checkpoint)(*vals)
+            for r, e in zip(res, expected):
+                np.testing.assert_allclose(r, e)
+
+    def test_only_checkpoints_are_stored(self):
+        f = self.build("sqrt")
+        scans = [
+            node.op for node in f.maker.fgraph.apply_nodes if isinstance(node.op, Scan)
+        ]
+        names = {op.name for op in scans}
+        assert "grad_of_scan_fn" not in names
+        assert "grad_of_scan_fn_checkpoints" in names
+        # Besides the states at the start of the segments, the loop over the
+        # segments only outputs a scalar per segment
+        (fwd_op,) = (op for op in scans if op.name == "scan_fn_checkpoints")
+        nitsot_outs = fwd_op.inner_nitsot_outs(fwd_op.inner_outputs)
+        assert all(out.ndim == 0 for out in nitsot_outs)
+
+    def test_truncate_gradient(self):
+        # Truncated gradients don't use checkpoints
+        f = self.build("sqrt", truncate_gradient=2)
+        assert not any(
+            node.op.name.endswith("checkpoints")
+            for node in f.maker.fgraph.apply_nodes
+            if isinstance(node.op, Scan)
+        )
+
+    def test_invalid_checkpoint(self):
+        with pytest.raises(ValueError, match="checkpoint must be"):
+            scan(lambda x: x * 2, sequences=[vector()], checkpoint=1)
@@ -25,6 +25,7 @@ from pytensor.tensor.conv.abstract_conv import (
     separable_conv2d,
     separable_conv3d,
 )
+from pytensor.tensor.conv.im2col import Col2Im, Im2Col
 from pytensor.tensor.type import (
     TensorType,
     ftensor4,
@@ -950,6 +951,8 @@ class BaseTestConv2d(BaseTestConv):
     reason="SciPy and cxx needed",
 )
 class TestAbstractConvNoOptim(BaseTestConv2d):
+    mode = Mode(optimizer=None)
+
     @classmethod
     def setup_class(cls):
         # This tests can run even when config.blas__ldflags is empty.
@@ -964,7 +967,6 @@ class TestAbstractConvNoOptim(BaseTestConv2d):
 
     def run_test_case(self, i, f, s, b, flip, provide_shape, fd=(1, 1)):
         o = self.get_output_shape(i, f, s, b, fd)
-        mode = Mode(optimizer=None)
         self.run_fwd(
             inputs_shape=i,
             filters_shape=f,
@@ -976,7 +978,7 @@ class TestAbstractConvNoOptim(BaseTestConv2d):
             target_op=None,
             check_trace=True,
             filter_dilation=fd,
-            mode=mode,
+            mode=self.mode,
         )
         self.run_gradweight(
             inputs_shape=i,
@@ -990,7 +992,7 @@ class TestAbstractConvNoOptim(BaseTestConv2d):
             target_op=None,
             check_trace=True,
             filter_dilation=fd,
-            mode=mode,
+            mode=self.mode,
         )
         self.run_gradinput(
             inputs_shape=i,
@@ -1004,13 +1006,12 @@ class TestAbstractConvNoOptim(BaseTestConv2d):
             target_op=None,
             check_trace=True,
             filter_dilation=fd,
-            mode=mode,
+            mode=self.mode,
         )
 
     def run_test_case_gi(
         self, i, f, o, s, b, flip, provide_shape, fd=(1, 1), expect_error=False
     ):
-        mode = Mode(optimizer=None)
         if not expect_error:
             self.run_gradinput(
                 inputs_shape=i,
@@ -1024,7 +1025,7 @@ class TestAbstractConvNoOptim(BaseTestConv2d):
                 target_op=None,
                 check_trace=True,
                 filter_dilation=fd,
-                mode=mode,
+                mode=self.mode,
             )
         else:
             with pytest.raises(ValueError):
@@ -1041,10 +1042,14 @@ class TestAbstractConvNoOptim(BaseTestConv2d):
                     check_trace=True,
                     filter_dilation=fd,
                     ref=None,
-                    mode=mode,
+                    mode=self.mode,
                 )
 
 
+class TestAbstractConvIm2col(TestAbstractConvNoOptim):
+    mode = pytensor.compile.get_default_mode().including("conv_gemm")
+
+
 class BaseTestConv3d(BaseTestConv):
     @classmethod
     def setup_class(cls):
@@ -2124,6 +2129,20 @@ class TestGroupedConv3dNoOptim(TestGroupedConvNoOptim):
         self.corr_gradi = conv3d_corr_gi
 
 
+class TestGroupedConvIm2col(TestGroupedConvNoOptim):
+    conv_op = Im2Col
+    conv_gradw_op = Im2Col
+    conv_gradi_op = Col2Im
+    mode = pytensor.compile.get_default_mode().including("conv_gemm")
+
+
+class TestGroupedConv3dIm2col(TestGroupedConv3dNoOptim):
+    conv_op = Im2Col
+    conv_gradw_op = Im2Col
+    conv_gradi_op = Col2Im
+    mode = pytensor.compile.get_default_mode().including("conv_gemm")
+
+
 class TestSeparableConv:
     def setup_method(self):
         self.x = np.array(
@@ -2552,6 +2571,13 @@ class TestUnsharedConv:
                 utt.verify_grad(conv_gradinputs, [kern, top], mode=self.mode, eps=1)
 
 
+class TestUnsharedConvIm2col(TestUnsharedConv):
+    conv2d_op = Im2Col
+    conv2d_gradw_op = Im2Col
+    conv2d_gradi_op = Col2Im
+    mode = pytensor.compile.get_default_mode().including("conv_gemm")
+
+
 class TestAsymmetricPadding:
     conv2d = abstract_conv.AbstractConv2d
     conv2d_gradw = abstract_conv.AbstractConv2d_gradWeights
@@ -2729,6 +2755,13 @@ class TestAsymmetricPadding:
             utt.verify_grad(conv_gradinputs, [kern, top], mode=self.mode, eps=1)
 
 
+class TestAsymmetricPaddingIm2col(TestAsymmetricPadding):
+    conv2d_op = Im2Col
+    conv2d_gradw_op = Im2Col
+    conv2d_gradi_op = Col2Im
+    mode = pytensor.compile.get_default_mode().including("conv_gemm")
+
+
 class TestCausalConv:
     mode = Mode(optimizer="None")
 
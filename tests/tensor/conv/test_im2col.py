@@ -0,0 +1,132 @@
+import numpy as np
+import pytest
+
+import pytensor
+from pytensor.compile.mode import Mode
+from pytensor.configdefaults import config
+from pytensor.tensor.conv.im2col import Col2Im, Im2Col
+from pytensor.tensor.type import lvector, tensor, tensor3
+from tests import unittest_tools as utt
+
+
+conv_params = [
+    ("valid", (1, 1), (1, 1), (2, 3, 6, 5), (2, 3)),
+    ("full", (2, 1), (1, 2), (2, 3, 6, 5), (3, 2)),
+    ("half", (1, 3), (2, 1), (1, 2, 7, 7), (3, 3)),
+    (((1, 2), (0, 3)), (2, 2), (1, 1), (2, 2, 5, 4), (2, 2)),
+    ((1, 1, 0), (1, 2, 1), (1, 1, 2), (2, 2, 4, 5, 3), (2, 2, 2)),
+]
+
+
+class TestIm2Col(utt.InferShapeTester):
+    @staticmethod
+    def ref_im2col(img, kshp, border_mode, subsample, filter_dilation):
+        # Loop over the outputs of the convolution, one patch at a time
+        op = Im2Col(border_mode, subsample, filter_dilation)
+        pads = op.pads(kshp)
+        img = np.pad(img, ((0, 0), (0, 0), *pads))
+        out_shp = op.conv_shape([s - sum(p) for s, p in zip(img.shape[2:], pads)], kshp)
+        patches = []
+        for pos in np.ndindex(*out_shp):
+            patch = img[
+                (slice(None), slice(None))
+                + tuple(
+                    slice(p * s, p * s + (k - 1) * d + 1, d)
+                    for p, s, k, d in zip(pos, subsample, kshp, filter_dilation)
+                )
+            ]
+            patches.append(patch.reshape((img.shape[0], -1)))
+        return np.stack(patches, axis=1)
+
+    @pytest.mark.parametrize(
+        "border_mode, subsample, filter_dilation, imshp, kshp", conv_params
+    )
+    @pytest.mark.parametrize("linker", ["py", "c"])
+    def test_perform(
+        self, border_mode, subsample, filter_dilation, imshp, kshp, linker
+    ):
+        if linker == "c" and not config.cxx:
+            pytest.skip("Need cxx for this test")
+
+        rng = np.random.default_rng(utt.fetch_seed())
+        img = tensor(dtype=config.floatX, shape=(None,) * len(imshp))
+        k = lvector()
+        cols = tensor3(dtype=config.floatX)
+        s = lvector()
+        im2col = Im2Col(border_mode, subsample, filter_dilation)
+        col2im = Col2Im(border_mode, subsample, filter_dilation)
+        mode = Mode(linker=linker, optimizer=None)
+        f_im2col = pytensor.function([img, k], im2col(img, k), mode=mode)
+        f_col2im = pytensor.function([cols, s, k], col2im(cols, s, k), mode=mode)
+
+        img_val = rng.random(imshp).astype(config.floatX)
+        res = f_im2col(img_val, kshp)
+        utt.assert_allclose(
+            res,
+            self.ref_im2col(img_val, kshp, border_mode, subsample, filter_dilation),
+        )
+
+        # `Col2Im` is the transpose of `Im2Col`
+        cols_val = rng.random(res.shape).astype(config.floatX)
+        res_t = f_col2im(cols_val, imshp[2:], kshp)
+        assert res_t.shape == imshp
+        utt.assert_allclose((res * cols_val).sum(), (res_t * img_val).sum())
+
+    def test_invalid_shapes(self):
+        img = tensor(dtype=config.floatX, shape=(None,) * 4)
+        k = lvector()
+        cols = tensor3(dtype=config.floatX)
+        s = lvector()
+        f_im2col = pytensor.function([img, k], Im2Col()(img, k))
+        f_col2im = pytensor.function([cols, s, k], Col2Im()(cols, s, k))
+
+        img_val = np.zeros((1, 1, 3, 3), dtype=config.floatX)
+        with pytest.raises(ValueError):
+            f_im2col(img_val, [4, 2])
+        with pytest.raises(ValueError):
+            f_im2col(img_val, [0, 2])
+        cols_val = np.zeros((1, 5, 4), dtype=config.floatX)
+        with pytest.raises(ValueError):
+            f_col2im(cols_val, [3, 3], [2, 2])
+
+    @pytest.mark.parametrize("border_mode", ["full", (1, 2)])
+    def test_grad(self, border_mode):
+        rng = np.random.default_rng(utt.fetch_seed())
+        kshp = np.array([2, 3])
+        im2col = Im2Col(border_mode, (2, 1), (1, 2))
+        col2im = Col2Im(border_mode, (2, 1), (1, 2))
+        img_val = rng.random((2, 2, 5, 6))
+        cols_val = rng.random(im2col(img_val, kshp).eval().shape)
+
+        utt.verify_grad(lambda img: im2col(img, kshp), [img_val])
+        utt.verify_grad(lambda cols: col2im(cols, (5, 6), kshp), [cols_val])
+
+    @pytest.mark.parametrize(
+        "border_mode, subsample, filter_dilation, imshp, kshp", conv_params
+    )
+    def test_infer_shape(self, border_mode, subsample, filter_dilation, imshp, kshp):
+        img = tensor(dtype=config.floatX, shape=(None,) * len(imshp))
+        k = lvector()
+        cols = tensor3(dtype=config.floatX)
+        s = lvector()
+        im2col = Im2Col(border_mode, subsample, filter_dilation)
+        col2im = Col2Im(border_mode, subsample, filter_dilation)
+
+        img_val = np.zeros(imshp, dtype=config.floatX)
+        cols_shape = pytensor.function([img, k], im2col(img, k).shape)(img_val, kshp)
+        self._compile_and_check(
+            [img, k],
+            [im2col(img, k)],
+            [img_val, np.array(kshp)],
+            Im2Col,
+        )
+        self._compile_and_check(
+            [cols, s, k],
+            [col2im(cols, s, k)],
+            [
+                np.zeros(cols_shape, dtype=config.floatX),
+                np.array(imshp[2:]),
+                np.array(kshp),
+            ],
+            Col2Im,
+        )
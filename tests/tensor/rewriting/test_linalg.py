@@ -14,10 +14,11 @@ from pytensor.tensor import swapaxes
 from pytensor.tensor.blockwise import Blockwise
 from pytensor.tensor.elemwise import DimShuffle
 from pytensor.tensor.math import _allclose, dot, matmul
-from pytensor.tensor.nlinalg import Det, MatrixInverse, matrix_inverse
+from pytensor.tensor.nlinalg import Det, MatrixInverse, SLogDet, matrix_inverse, slogdet
 from pytensor.tensor.rewriting.linalg import inv_as_solve
 from pytensor.tensor.slinalg import (
     Cholesky,
+    LUFactor,
     Solve,
     SolveBase,
     SolveTriangular,
@@ -268,6 +269,132 @@ def test_psd_solve_with_chol():
     )
 
 
+def core_ops(fgraph):
+    return [
+        node.op.core_op if isinstance(node.op, Blockwise) else node.op
+        for node in fgraph.apply_nodes
+    ]
+
+
+@pytest.mark.parametrize("batched", [False, True])
+def test_share_linalg_factorization_lu(batched):
+    K = tensor("K", shape=(3, None, None) if batched else (None, None))
+    y = matrix("y")
+    x = solve(K, y)
+    logdet = slogdet(K)[1]
+    # The gradient needs `inv(K)` and a solve with `K.T`
+    logp = -0.5 * (y * x).sum() - 0.5 * pt.log(pt.abs(pt.linalg.det(K))).sum()
+    outputs = [logp, logdet, pytensor.grad(logp, K)]
+
+    mode = get_default_mode()
+    f = function([K, y], outputs, mode=mode)
+    f_ref = function([K, y], outputs, mode=mode.excluding("share_linalg_factorization"))
+
+    ops = core_ops(f.maker.fgraph)
+    assert sum(isinstance(op, LUFactor) for op in ops) == 1
+    assert not any(isinstance(op, (Solve, Det, SLogDet, MatrixInverse)) for op in ops)
+
+    rng = np.random.default_rng(sum(map(ord, "test_share_linalg_factorization")))
+    K_val = rng.normal(size=(3, 4, 4) if batched else (4, 4)).astype(config.floatX)
+    y_val = rng.normal(size=(4, 2)).astype(config.floatX)
+    atol = rtol = 1e-3 if config.floatX == "float32" else 1e-8
+    for res, ref in zip(f(K_val, y_val), f_ref(K_val, y_val)):
+        assert_allclose(res, ref, atol=atol, rtol=rtol)
+
+
+def test_share_linalg_factorization_cholesky():
+    X = matrix("X")
+    y = vector("y")
+    outputs = [
+        solve(X, y, assume_a="pos"),
+        matrix_inverse(X),
+        pt.linalg.det(X),
+        slogdet(X)[1],
+    ]
+    f = function([X, y], outputs)
+
+    ops = core_ops(f.maker.fgraph)
+    assert sum(isinstance(op, Cholesky) for op in ops) == 1
+    assert not any(
+        isinstance(op, (Solve, Det, SLogDet, MatrixInverse, LUFactor)) for op in ops
+    )
+
+    rng = np.random.default_rng(sum(map(ord, "test_share_cholesky")))
+    L = rng.normal(size=(4, 4))
+    X_val = (L @ L.T + np.eye(4)).astype(config.floatX)
+    y_val = rng.normal(size=4).astype(config.floatX)
+    rtol = 1e-3 if config.floatX == "float32" else 1e-8
+    x, X_inv, det_X, logdet_X = f(X_val, y_val)
+    assert_allclose(x, np.linalg.solve(X_val, y_val), rtol=rtol)
+    assert_allclose(X_inv, np.linalg.inv(X_val), rtol=rtol)
+    assert_allclose(det_X, np.linalg.det(X_val), rtol=rtol)
+    assert_allclose(logdet_X, np.linalg.slogdet(X_val)[1], rtol=rtol)
+
+
+def test_share_linalg_factorization_single_decomposition():
+    X = matrix("X")
+    f = function([X], slogdet(X))
+    ops = core_ops(f.maker.fgraph)
+    assert any(isinstance(op, SLogDet) for op in ops)
+    assert not any(isinstance(op, LUFactor) for op in ops)
+
+
+def test_share_linalg_factorization_small_matrix():
+    # Sharing the factorization of a small matrix costs more than it saves
+    K = tensor("K", shape=(4, 4))
+    y = vector("y")
+    f = function([K, y], solve(K, y) + pt.linalg.det(K))
+    ops = core_ops(f.maker.fgraph)
+    assert any(isinstance(op, Det) for op in ops)
+    assert not any(isinstance(op, LUFactor) for op in ops)
+
+
+def test_share_linalg_factorization_not_cxx():
+    # `LUFactor` has no Numba implementation
+    K = matrix("K")
+    y = vector("y")
+    mode = get_default_mode().excluding("cxx_only")
+    f = function([K, y], solve(K, y) + pt.linalg.det(K), mode=mode)
+    assert not any(isinstance(op, LUFactor) for op in core_ops(f.maker.fgraph))
+
+
+def test_share_linalg_factorization_triangles():
+    X = matrix("X")
+    y = vector("y")
+    rng = np.random.default_rng(sum(map(ord, "test_share_triangles")))
+    L = rng.normal(size=(4, 4))
+    X_sym = L @ L.T + np.eye(4)
+    # Only the upper triangle of `X_val` is the one of a positive definite matrix
+    X_val = np.triu(X_sym) + np.tril(rng.normal(size=(4, 4)), -1)
+    X_val = X_val.astype(config.floatX)
+    y_val = rng.normal(size=4).astype(config.floatX)
+    rtol = 1e-3 if config.floatX == "float32" else 1e-8
+
+    # The decompositions that read the upper triangle share an upper Cholesky
+    # decomposition
+    outputs = [solve(X, y, assume_a="pos", lower=False), cholesky(X, lower=False)]
+    f = function([X, y], outputs)
+    ops = core_ops(f.maker.fgraph)
+    assert [op.lower for op in ops if isinstance(op, Cholesky)] == [False]
+    assert not any(isinstance(op, Solve) for op in ops)
+    assert_allclose(f(X_val, y_val)[0], np.linalg.solve(X_sym, y_val), rtol=rtol)
+
+    # The ones that read different triangles aren't merged
+    outputs = [
+        solve(X, y, assume_a="pos", lower=False),
+        solve(X.T, y, assume_a="pos", lower=False),
+    ]
+    f = function([X, y], outputs)
+    assert sum(isinstance(op, Solve) for op in core_ops(f.maker.fgraph)) == 2
+    res_upper, res_lower = f(X_val, y_val)
+    assert_allclose(res_upper, np.linalg.solve(X_sym, y_val), rtol=rtol)
+    assert_allclose(
+        res_lower,
+        scipy.linalg.solve(X_val.T, y_val, assume_a="pos", lower=False),
+        rtol=rtol,
+    )
+
+
 class TestBatchedVectorBSolveToMatrixBSolve:
     rewrite_name = "batched_vector_b_solve_to_matrix_b_solve"
 
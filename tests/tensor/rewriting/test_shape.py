@@ -8,6 +8,7 @@ from pytensor import shared
 from pytensor.compile.function import function
 from pytensor.compile.mode import get_default_mode, get_mode
 from pytensor.compile.ops import deep_copy_op
+from pytensor.compile.profiling import ProfileStats
 from pytensor.configdefaults import config
 from pytensor.graph.basic import Apply, Variable, equal_computations
 from pytensor.graph.fg import FunctionGraph
@@ -475,6 +476,30 @@ class TestSameShape:
         with pytest.raises(IndexError):
             shape_feature.same_shape(x, o, 0, 1)
 
+    def test_canonical_shapes_cache(self):
+        x = matrix()
+        y = matrix()
+        o = exp(x) + x
+        fgraph = FunctionGraph([x, y], [o, exp(y)], clone=False)
+        fgraph.profile = ProfileStats(atexit_print=False)
+        shape_feature = ShapeFeature()
+        fgraph.attach_feature(shape_feature)
+        assert fgraph.profile.shape_feature_attach_time > 0
+
+        assert shape_feature.same_shape(x, o)
+        n_hits = fgraph.profile.shape_cache_hits
+        n_misses = fgraph.profile.shape_cache_misses
+        assert n_misses > 0
+
+        # The shapes of `x` and `o` were already canonicalized
+        assert shape_feature.same_shape(o, x)
+        assert fgraph.profile.shape_cache_hits == n_hits + 4
+        assert fgraph.profile.shape_cache_misses == n_misses
+
+        assert not shape_feature.same_shape(x, y)
+        assert fgraph.profile.shape_cache_hits == n_hits + 6
+        assert fgraph.profile.shape_cache_misses == n_misses + 2
+
 
 @pytest.mark.parametrize(
     "shape",
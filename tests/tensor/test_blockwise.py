@@ -344,6 +344,103 @@ class TestSolveMatrix(BlockwiseOpTester):
     signature = "(m, m),(m, n) -> (m, n)"
 
 
+class TestCholeskyUpper(MatrixOpBlockwiseTester):
+    # Does not have a batched kernel
+    core_op = Cholesky(lower=False)
+    signature = "(m, m) -> (m, m)"
+
+
+class TestSolveVectorUnchecked(BlockwiseOpTester):
+    # Does not have a batched kernel
+    core_op = Solve(lower=True, check_finite=False, b_ndim=1)
+    signature = "(m, m),(m) -> (m)"
+
+
+@pytest.mark.parametrize(
+    "core_op",
+    [Cholesky(lower=True), Cholesky(lower=False)],
+    ids=["batched_kernel", "core_loop"],
+)
+def test_perform_empty_batch(core_op):
+    x = tensor("x", shape=(None, None, 3, 3))
+    fn = function([x], Blockwise(core_op)(x), mode="FAST_COMPILE")
+    res = fn(np.zeros((2, 0, 3, 3), dtype=config.floatX))
+    assert res.shape == (2, 0, 3, 3)
+    assert res.dtype == config.floatX
+
+
+def test_perform_core_loop_scalar_outputs():
+    class SumAndMax(Op):
+        def make_node(self, x):
+            return Apply(
+                self, [x], [x.type.clone(shape=())(), x.type.clone(shape=())()]
+            )
+
+        def perform(self, node, inputs, outputs):
+            [x] = inputs
+            outputs[0][0] = np.asarray(x.sum())
+            outputs[1][0] = np.asarray(x.max())
+
+    x = tensor("x", shape=(None, None))
+    outs = Blockwise(SumAndMax(), signature="(n)->(),()")(x)
+    fn = function([x], outs, mode="FAST_COMPILE")
+
+    x_val = np.arange(12, dtype=config.floatX).reshape(3, 4)
+    res_sum, res_max = fn(x_val)
+    np.testing.assert_allclose(res_sum, x_val.sum(-1))
+    np.testing.assert_allclose(res_max, x_val.max(-1))
+
+
+def test_batched_solve_check_finite():
+    a = tensor("a", shape=(None, 3, 3))
+    b = tensor("b", shape=(None, 3))
+    fn = function([a, b], Blockwise(Solve(b_ndim=1))(a, b), mode="FAST_COMPILE")
+
+    a_val = np.broadcast_to(np.eye(3, dtype=config.floatX), (2, 3, 3)).copy()
+    b_val = np.ones((2, 3), dtype=config.floatX)
+    np.testing.assert_allclose(fn(a_val, b_val), b_val)
+
+    b_val[1, 2] = np.nan
+    with pytest.raises(ValueError, match="must not contain infs or NaNs"):
+        fn(a_val, b_val)
+
+
+def test_batched_cholesky_check_finite():
+    x = tensor("x", shape=(None, 3, 3))
+    fn = function([x], Blockwise(Cholesky(lower=True))(x), mode="FAST_COMPILE")
+
+    x_val = np.broadcast_to(np.eye(3, dtype=config.floatX), (2, 3, 3)).copy()
+    np.testing.assert_allclose(fn(x_val), x_val)
+
+    x_val[1, 2, 2] = np.inf
+    with pytest.raises(ValueError, match="must not contain infs or NaNs"):
+        fn(x_val)
+
+
+def test_perform_core_loop_destroyed_inputs():
+    class AddInplace(Op):
+        destroy_map = {0: [0]}
+
+        def make_node(self, x, y):
+            return Apply(self, [x, y], [x.type()])
+
+        def perform(self, node, inputs, outputs):
+            x, y = inputs
+            x += y
+            outputs[0][0] = x
+
+    x = tensor("x", shape=(1, 3))
+    y = tensor("y", shape=(None, 3))
+    out = Blockwise(AddInplace(), signature="(n),(n)->(n)")(x, y)
+    fn = function([x, y], out, mode="FAST_COMPILE")
+
+    # The broadcasted (read-only) `x` is copied before being overwritten
+    x_val = np.ones((1, 3), dtype=config.floatX)
+    y_val = np.ones((2, 3), dtype=config.floatX)
+    np.testing.assert_allclose(fn(x_val, y_val), np.full((2, 3), 2))
+    np.testing.assert_allclose(x_val, 1)
+
+
 @pytest.mark.parametrize(
     "mu_batch_shape", [(), (1000,), (4, 1000)], ids=lambda arg: f"mu:{arg}"
 )
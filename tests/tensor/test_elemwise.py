@@ -316,6 +316,43 @@ class TestBroadcast:
     def test_c(self):
         self.with_linker(CLinker(), self.cop, self.ctype, self.rand_cval)
 
+    @pytest.mark.skipif(
+        not pytensor.config.cxx,
+        reason="G++ not available, so we need to skip this test.",
+    )
+    @pytest.mark.parametrize(
+        "layout",
+        [
+            lambda v: v,
+            np.asfortranarray,
+            lambda v: v.T.copy().T,
+            lambda v: v[..., ::-1],
+            lambda v: np.repeat(v, 2, axis=-1)[..., ::2],
+        ],
+        ids=["C", "F", "transposed", "reversed", "strided"],
+    )
+    def test_c_memory_layouts(self, layout):
+        # The C code specializes its inner loop on the memory layout
+        for xsh, ysh in [
+            ((4, 5), (4, 5)),
+            ((4, 5), (1, 5)),
+            ((4, 5), (4, 1)),
+            ((7,), (1,)),
+            ((2, 3, 4), (1, 3, 1)),
+            ((2, 3, 4), (2, 1, 4)),
+        ]:
+            x = self.ctype(
+                pytensor.config.floatX, shape=tuple(s if s == 1 else None for s in xsh)
+            )("x")
+            y = self.ctype(
+                pytensor.config.floatX, shape=tuple(s if s == 1 else None for s in ysh)
+            )("y")
+            e = self.cop(ps.add)(self.cop(ps.exp)(x), self.cop(ps.mul)(x, y))
+            f = make_function(CLinker().accept(FunctionGraph([x, y], [e])))
+            xv = layout(self.rand_cval(xsh))
+            yv = layout(self.rand_cval(ysh))
+            unittest_tools.assert_allclose(f(xv, yv), np.exp(xv) + xv * yv)
+
     def test_perform_inplace(self):
         self.with_linker_inplace(PerformLinker(), self.op, self.type, self.rand_val)
 
@@ -633,6 +670,32 @@ class TestCAReduce(unittest_tools.InferShapeTester):
                 Mode(linker="c"), ps.scalar_maximum, dtype=dtype, test_nan=True
             )
 
+    @pytest.mark.skipif(
+        not pytensor.config.cxx,
+        reason="G++ not available, so we need to skip this test.",
+    )
+    @pytest.mark.parametrize("deterministic", ["default", "more"])
+    def test_c_openmp(self, deterministic):
+        x = tensor(dtype=config.floatX, shape=(None, None, None))
+        with config.change_flags(
+            openmp=True, openmp_elemwise_minsize=10, deterministic=deterministic
+        ):
+            outputs = [
+                self.op(scalar_op, axis=axis)(x)
+                for scalar_op in (ps.add, ps.mul, ps.scalar_maximum)
+                for axis in (None, (1, 2), (2,), (0,))
+            ]
+            c_fn = pytensor.function([x], outputs, mode=Mode(linker="c"))
+            assert all(node.op.openmp for node in c_fn.maker.fgraph.apply_nodes)
+        py_fn = pytensor.function([x], outputs, mode=Mode(linker="py"))
+
+        rng = np.random.default_rng(utt.fetch_seed())
+        xv = rng.uniform(0.5, 1.5, size=(4, 5, 6)).astype(config.floatX)
+        # Contiguous inputs take the parallel path, the others the serial one
+        for value in (xv, xv[:, ::2]):
+            for c_res, py_res in zip(c_fn(value), py_fn(value)):
+                utt.assert_allclose(c_res, py_res)
+
     def test_infer_shape(self, dtype=None, pre_scalar_op=None):
         if dtype is None:
             dtype = pytensor.config.floatX
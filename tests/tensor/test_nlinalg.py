@@ -6,10 +6,13 @@ from numpy.testing import assert_array_almost_equal
 
 import pytensor
 from pytensor import function
+from pytensor.compile.mode import Mode
 from pytensor.configdefaults import config
+from pytensor.tensor.lapack import lapack_available
 from pytensor.tensor.math import _allclose
 from pytensor.tensor.nlinalg import (
     SVD,
+    Det,
     Eig,
     MatrixInverse,
     TensorInv,
@@ -264,6 +267,21 @@ def test_det():
     assert np.allclose(np.linalg.det(r), f(r))
 
 
+@pytest.mark.skipif(not lapack_available(), reason="LAPACK is not available")
+@pytest.mark.parametrize("order", ["C", "F"])
+@pytest.mark.parametrize("dtype", ["float32", "float64"])
+def test_det_lapack(dtype, order):
+    rng = np.random.default_rng(utt.fetch_seed())
+    x = matrix(dtype=dtype)
+    f = pytensor.function([x], Det()(x), mode=Mode(linker="cvm"))
+    assert isinstance(f.maker.fgraph.outputs[0].owner.op, Det)
+
+    r = np.asarray(rng.standard_normal((5, 5)), dtype=dtype, order=order)
+    np.testing.assert_allclose(f(r), np.linalg.det(r), rtol=1e-4)
+    assert f(np.zeros((3, 3), dtype=dtype)) == 0
+    assert f(np.zeros((0, 0), dtype=dtype)) == 1
+
+
 def test_det_grad():
     rng = np.random.default_rng(utt.fetch_seed())
 
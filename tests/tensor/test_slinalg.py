@@ -8,13 +8,19 @@ import scipy
 import pytensor
 from pytensor import function, grad
 from pytensor import tensor as pt
+from pytensor.compile.mode import Mode
 from pytensor.configdefaults import config
+from pytensor.tensor.lapack import BaseLAPACK, lapack_available
 from pytensor.tensor.slinalg import (
     Cholesky,
     CholeskySolve,
+    LUFactor,
+    LUSolve,
     Solve,
     SolveBase,
     SolveTriangular,
+    _lu_factor,
+    _lu_solve,
     block_diag,
     cho_solve,
     cholesky,
@@ -198,7 +204,10 @@ class TestSolveBase(utt.InferShapeTester):
         A = matrix()
         b = matrix()
         y = SolveBase(b_ndim=2)(A, b)
-        assert y.__repr__() == "SolveBase{lower=False, check_finite=True, b_ndim=2}.0"
+        assert (
+            y.__repr__()
+            == "SolveBase{lower=False, check_finite=True, b_ndim=2, overwrite_b=False}.0"
+        )
 
 
 class TestSolve(utt.InferShapeTester):
@@ -362,7 +371,7 @@ class TestCholeskySolve(utt.InferShapeTester):
     def test_repr(self):
         assert (
             repr(CholeskySolve(lower=True, b_ndim=1))
-            == "CholeskySolve(lower=True,check_finite=True,b_ndim=1)"
+            == "CholeskySolve(lower=True,check_finite=True,b_ndim=1,overwrite_b=False)"
         )
 
     def test_infer_shape(self):
@@ -467,6 +476,159 @@ def test_cho_solve():
     )
 
 
+class TestLUSolve(utt.InferShapeTester):
+    def test_infer_shape(self):
+        rng = np.random.default_rng(utt.fetch_seed())
+        A = matrix()
+        b = matrix()
+        LU, piv = LUFactor()(A)
+        self._compile_and_check(
+            [A, b],
+            [LU, piv, LUSolve(b_ndim=2)(LU, piv, b)],
+            [
+                np.asarray(rng.random((5, 5)), dtype=config.floatX),
+                np.asarray(rng.random((5, 2)), dtype=config.floatX),
+            ],
+            (LUFactor, LUSolve),
+            warn=False,
+        )
+
+    @pytest.mark.parametrize("trans", [0, 1])
+    @pytest.mark.parametrize("b_shape", [(5,), (5, 2), (3, 5, 2)])
+    def test_lu_solve(self, b_shape, trans):
+        rng = np.random.default_rng(utt.fetch_seed())
+        A = matrix()
+        b = tensor(shape=(None,) * len(b_shape))
+        y = _lu_solve(_lu_factor(A), b, trans=trans, b_ndim=min(len(b_shape), 2))
+        lu_solve_func = pytensor.function([A, b], y)
+
+        A_val = np.asarray(rng.random((5, 5)), dtype=config.floatX)
+        b_val = np.asarray(rng.random(b_shape), dtype=config.floatX)
+        np.testing.assert_allclose(
+            lu_solve_func(A_val, b_val),
+            np.linalg.solve(A_val.T if trans else A_val, b_val),
+            rtol=1e-4 if config.floatX == "float32" else 1e-7,
+        )
+
+    def test_lu_factor(self):
+        rng = np.random.default_rng(utt.fetch_seed())
+        A = matrix()
+        LU, piv = _lu_factor(A)
+        lu_factor_func = pytensor.function([A], [LU, piv])
+
+        A_val = np.asarray(rng.random((5, 5)), dtype=config.floatX)
+        LU_val, piv_val = lu_factor_func(A_val)
+        LU_ref, piv_ref = scipy.linalg.lu_factor(A_val)
+        np.testing.assert_allclose(LU_val, LU_ref)
+        np.testing.assert_array_equal(piv_val, piv_ref)
+        assert LU.dtype == LU_val.dtype
+        assert piv.dtype == piv_val.dtype
+
+
+@pytest.mark.skipif(not lapack_available(), reason="LAPACK is not available")
+class TestLAPACK:
+    @staticmethod
+    def compare_c_and_py(inputs, outputs, values):
+        c_fn = function(inputs, outputs, mode=Mode(linker="cvm", optimizer="fast_run"))
+        py_fn = function(inputs, outputs, mode=Mode(linker="py", optimizer="fast_run"))
+        assert any(
+            isinstance(node.op, BaseLAPACK) for node in c_fn.maker.fgraph.apply_nodes
+        )
+        rtol = 1e-3 if any(v.dtype == "float32" for v in values) else 1e-7
+        for c_res, py_res in zip(c_fn(*values), py_fn(*values)):
+            np.testing.assert_allclose(c_res, py_res, rtol=rtol)
+
+    @pytest.mark.parametrize("order", ["C", "F"])
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    @pytest.mark.parametrize("b_ndim", [1, 2])
+    @pytest.mark.parametrize(
+        "op",
+        [
+            Solve(assume_a="gen", b_ndim=1),
+            Solve(assume_a="pos", lower=True, b_ndim=1),
+            SolveTriangular(lower=True, b_ndim=1),
+            SolveTriangular(lower=False, trans=1, unit_diagonal=True, b_ndim=1),
+            CholeskySolve(lower=True, b_ndim=1),
+            CholeskySolve(lower=False, b_ndim=1),
+        ],
+        ids=str,
+    )
+    def test_solve(self, op, b_ndim, dtype, order):
+        rng = np.random.default_rng(utt.fetch_seed())
+        op = type(op)(**{**op._props_dict(), "b_ndim": b_ndim})
+        A = matrix(dtype=dtype)
+        b = tensor(dtype=dtype, shape=(None,) * b_ndim)
+
+        A_val = rng.normal(size=(5, 5))
+        A_val = A_val @ A_val.T + 5 * np.eye(5)
+        if isinstance(op, CholeskySolve):
+            A_val = scipy.linalg.cholesky(A_val, lower=op.lower)
+        A_val = np.asarray(A_val, dtype=dtype, order=order)
+        b_val = rng.normal(size=(5, 3)[:b_ndim]).astype(dtype)
+        self.compare_c_and_py([A, b], op(A, b), [A_val, b_val])
+
+    @pytest.mark.parametrize("order", ["C", "F"])
+    @pytest.mark.parametrize("dtype", ["float32", "float64"])
+    def test_factorizations(self, dtype, order):
+        rng = np.random.default_rng(utt.fetch_seed())
+        A = matrix(dtype=dtype)
+        b = matrix(dtype=dtype)
+        LU, piv = LUFactor()(A)
+        outputs = [
+            Cholesky(lower=True)(A),
+            Cholesky(lower=False)(A),
+            LU,
+            piv,
+            LUSolve(b_ndim=2)(LU, piv, b),
+            LUSolve(trans=1, b_ndim=2)(LU, piv, b),
+        ]
+
+        A_val = rng.normal(size=(5, 5))
+        A_val = np.asarray(A_val @ A_val.T + 5 * np.eye(5), dtype=dtype, order=order)
+        b_val = rng.normal(size=(5, 3)).astype(dtype)
+        self.compare_c_and_py([A, b], outputs, [A_val, b_val])
+
+    def test_errors(self):
+        A = dmatrix()
+        b = vector(dtype="float64")
+        chol_fn = function([A], Cholesky(on_error="raise")(A))
+        chol_nan_fn = function([A], Cholesky(on_error="nan")(A))
+        solve_fn = function([A, b], Solve(b_ndim=1)(A, b))
+
+        with pytest.raises(scipy.linalg.LinAlgError):
+            chol_fn(-np.eye(3))
+        assert np.isnan(chol_nan_fn(-np.eye(3))).all()
+        with pytest.raises(scipy.linalg.LinAlgError, match="singular"):
+            solve_fn(np.zeros((3, 3)), np.ones(3))
+        with pytest.raises(ValueError, match="infs or NaNs"):
+            solve_fn(np.full((3, 3), np.nan), np.ones(3))
+
+    def test_inplace(self):
+        A = dmatrix("A")
+        b = vector("b", dtype="float64")
+        outputs = [
+            Cholesky()(A + 5 * pt.eye(3)),
+            Solve(b_ndim=1)(A, b * 2),
+            Solve(b_ndim=1)(A, b),
+        ]
+        fn = function([A, b], outputs, mode="FAST_RUN")
+
+        destroyers = [
+            node.op for node in fn.maker.fgraph.apply_nodes if node.op.destroy_map
+        ]
+        assert any(isinstance(op, Cholesky) and op.destructive for op in destroyers)
+        # The graph input `b` must not be overwritten
+        assert [op.overwrite_b for op in destroyers if isinstance(op, Solve)] == [True]
+
+        A_val = np.eye(3) + 0.1
+        b_val = np.ones(3)
+        L, x, y = fn(A_val, b_val)
+        np.testing.assert_allclose(L @ L.T, A_val + 5 * np.eye(3))
+        np.testing.assert_allclose(x, np.linalg.solve(A_val, 2 * b_val))
+        np.testing.assert_allclose(y, np.linalg.solve(A_val, b_val))
+        np.testing.assert_array_equal(b_val, np.ones(3))
+
+
 def test_expm():
     rng = np.random.default_rng(utt.fetch_seed())
     A = rng.standard_normal((5, 5)).astype(config.floatX)
@@ -2,6 +2,7 @@
 import configparser as stdlib_configparser
 import io
 import pickle
+import threading
 
 import pytest
 
@@ -158,6 +159,43 @@ def test_config_context():
     assert root.test__config_context == "test_default"
 
 
+def test_config_thread_flags():
+    root = _create_test_config()
+    root.add(
+        "test__thread_flags",
+        "A config var from a test case.",
+        configparser.StrParam("test_default"),
+    )
+    with root.change_flags(test__thread_flags="main"):
+        flags = root.current_flags()
+    assert flags == {"test__thread_flags": "main"}
+
+    thread_values = []
+
+    def run():
+        with root.thread_flags(flags):
+            with root.change_flags(test__thread_flags="thread"):
+                thread_values.append(root.test__thread_flags)
+                changed.set()
+                main_changed.wait()
+                # The changes of the main thread aren't seen by this one
+                thread_values.append(root.test__thread_flags)
+            thread_values.append(root.test__thread_flags)
+
+    changed = threading.Event()
+    main_changed = threading.Event()
+    thread = threading.Thread(target=run)
+    thread.start()
+    changed.wait()
+    # The changes of the thread aren't seen by the main thread
+    assert root.test__thread_flags == "test_default"
+    root.test__thread_flags = "main2"
+    main_changed.set()
+    thread.join()
+    assert thread_values == ["thread", "thread", "main"]
+    assert root.test__thread_flags == "main2"
+
+
 def test_invalid_configvar_access():
     root = configdefaults.config
     root_test = _create_test_config()
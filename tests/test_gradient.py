@@ -30,6 +30,7 @@ from pytensor.gradient import (
 from pytensor.graph.basic import Apply, graph_inputs
 from pytensor.graph.null_type import NullType
 from pytensor.graph.op import Op
+from pytensor.scan.op import Scan
 from pytensor.tensor.math import add, dot, exp, sigmoid, sqr
 from pytensor.tensor.math import sum as pt_sum
 from pytensor.tensor.math import tanh
@@ -933,26 +934,27 @@ def test_undefined_grad_opt():
     )
 
 
-def test_jacobian_vector():
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_jacobian_vector(vectorize):
     x = vector()
     y = x * 2
     rng = np.random.default_rng(seed=utt.fetch_seed())
 
     # test when the jacobian is called with a tensor as wrt
-    Jx = jacobian(y, x)
+    Jx = jacobian(y, x, vectorize=vectorize)
     f = pytensor.function([x], Jx)
     vx = rng.uniform(size=(10,)).astype(pytensor.config.floatX)
     assert np.allclose(f(vx), np.eye(10) * 2)
 
     # test when the jacobian is called with a tuple as wrt
-    Jx = jacobian(y, (x,))
+    Jx = jacobian(y, (x,), vectorize=vectorize)
     assert isinstance(Jx, tuple)
     f = pytensor.function([x], Jx[0])
     vx = rng.uniform(size=(10,)).astype(pytensor.config.floatX)
     assert np.allclose(f(vx), np.eye(10) * 2)
 
     # test when the jacobian is called with a list as wrt
-    Jx = jacobian(y, [x])
+    Jx = jacobian(y, [x], vectorize=vectorize)
     assert isinstance(Jx, list)
     f = pytensor.function([x], Jx[0])
     vx = rng.uniform(size=(10,)).astype(pytensor.config.floatX)
@@ -961,7 +963,7 @@ def test_jacobian_vector():
     # test when the jacobian is called with a list of two elements
     z = vector()
     y = x * z
-    Js = jacobian(y, [x, z])
+    Js = jacobian(y, [x, z], vectorize=vectorize)
     f = pytensor.function([x, z], Js)
     vx = rng.uniform(size=(10,)).astype(pytensor.config.floatX)
     vz = rng.uniform(size=(10,)).astype(pytensor.config.floatX)
@@ -974,7 +976,8 @@ def test_jacobian_vector():
     assert np.allclose(vJs[1], evx)
 
 
-def test_jacobian_matrix():
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_jacobian_matrix(vectorize):
     x = matrix()
     y = 2 * x.sum(axis=0)
     rng = np.random.default_rng(seed=utt.fetch_seed())
@@ -983,20 +986,20 @@ def test_jacobian_matrix():
         ev[dx, :, dx] = 2.0
 
     # test when the jacobian is called with a tensor as wrt
-    Jx = jacobian(y, x)
+    Jx = jacobian(y, x, vectorize=vectorize)
     f = pytensor.function([x], Jx)
     vx = rng.uniform(size=(10, 10)).astype(pytensor.config.floatX)
     assert np.allclose(f(vx), ev)
 
     # test when the jacobian is called with a tuple as wrt
-    Jx = jacobian(y, (x,))
+    Jx = jacobian(y, (x,), vectorize=vectorize)
     assert isinstance(Jx, tuple)
     f = pytensor.function([x], Jx[0])
     vx = rng.uniform(size=(10, 10)).astype(pytensor.config.floatX)
     assert np.allclose(f(vx), ev)
 
     # test when the jacobian is called with a list as wrt
-    Jx = jacobian(y, [x])
+    Jx = jacobian(y, [x], vectorize=vectorize)
     assert isinstance(Jx, list)
     f = pytensor.function([x], Jx[0])
     vx = rng.uniform(size=(10, 10)).astype(pytensor.config.floatX)
@@ -1005,7 +1008,7 @@ def test_jacobian_matrix():
     # test when the jacobian is called with a list of two elements
     z = matrix()
     y = (x * z).sum(axis=1)
-    Js = jacobian(y, [x, z])
+    Js = jacobian(y, [x, z], vectorize=vectorize)
     f = pytensor.function([x, z], Js)
     vx = rng.uniform(size=(10, 10)).astype(pytensor.config.floatX)
     vz = rng.uniform(size=(10, 10)).astype(pytensor.config.floatX)
@@ -1019,26 +1022,27 @@ def test_jacobian_matrix():
     assert np.allclose(vJs[1], evx)
 
 
-def test_jacobian_scalar():
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_jacobian_scalar(vectorize):
     x = scalar()
     y = x * 2
     rng = np.random.default_rng(seed=utt.fetch_seed())
 
     # test when the jacobian is called with a tensor as wrt
-    Jx = jacobian(y, x)
+    Jx = jacobian(y, x, vectorize=vectorize)
     f = pytensor.function([x], Jx)
     vx = np.cast[pytensor.config.floatX](rng.uniform())
     assert np.allclose(f(vx), 2)
 
     # test when the jacobian is called with a tuple as wrt
-    Jx = jacobian(y, (x,))
+    Jx = jacobian(y, (x,), vectorize=vectorize)
     assert isinstance(Jx, tuple)
     f = pytensor.function([x], Jx[0])
     vx = np.cast[pytensor.config.floatX](rng.uniform())
     assert np.allclose(f(vx), 2)
 
     # test when the jacobian is called with a list as wrt
-    Jx = jacobian(y, [x])
+    Jx = jacobian(y, [x], vectorize=vectorize)
     assert isinstance(Jx, list)
     f = pytensor.function([x], Jx[0])
     vx = np.cast[pytensor.config.floatX](rng.uniform())
@@ -1047,7 +1051,7 @@ def test_jacobian_scalar():
     # test when the jacobian is called with a list of two elements
     z = scalar()
     y = x * z
-    Jx = jacobian(y, [x, z])
+    Jx = jacobian(y, [x, z], vectorize=vectorize)
     f = pytensor.function([x, z], Jx)
     vx = np.cast[pytensor.config.floatX](rng.uniform())
     vz = np.cast[pytensor.config.floatX](rng.uniform())
@@ -1057,28 +1061,55 @@ def test_jacobian_scalar():
     assert np.allclose(vJx[1], vx)
 
 
-def test_hessian():
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_hessian(vectorize):
     x = vector()
     y = pt_sum(x**2)
-    Hx = hessian(y, x)
+    Hx = hessian(y, x, vectorize=vectorize)
     f = pytensor.function([x], Hx)
     vx = np.arange(10).astype(pytensor.config.floatX)
     assert np.allclose(f(vx), np.eye(10) * 2)
 
 
-def test_jacobian_disconnected_inputs():
+@pytest.mark.parametrize("vectorize", [False, True])
+def test_jacobian_disconnected_inputs(vectorize):
     # Test that disconnected inputs are properly handled by jacobian.
 
     v1 = vector()
     v2 = vector()
-    jacobian_v = pytensor.gradient.jacobian(1 + v1, v2, disconnected_inputs="ignore")
+    jacobian_v = pytensor.gradient.jacobian(
+        1 + v1, v2, disconnected_inputs="ignore", vectorize=vectorize
+    )
     func_v = pytensor.function([v1, v2], jacobian_v)
     val = np.arange(4.0).astype(pytensor.config.floatX)
     assert np.allclose(func_v(val, val), np.zeros((4, 4)))
 
     s1 = scalar()
     s2 = scalar()
-    jacobian_s = pytensor.gradient.jacobian(1 + s1, s2, disconnected_inputs="ignore")
+    jacobian_s = pytensor.gradient.jacobian(
+        1 + s1, s2, disconnected_inputs="ignore", vectorize=vectorize
+    )
     func_s = pytensor.function([s2], jacobian_s)
     val = np.array(1.0).astype(pytensor.config.floatX)
     assert np.allclose(func_s(val), np.zeros(1))
+
+
+def test_jacobian_vectorize_no_scan():
+    x = vector("x")
+    W = matrix("W")
+    y = tanh(W @ x) * x.sum()
+
+    J = jacobian(y, [x, W], vectorize=True)
+    H = hessian(pt_sum(y**2), x, vectorize=True)
+    f = pytensor.function([x, W], [*J, H])
+    assert not any(isinstance(node.op, Scan) for node in f.maker.fgraph.apply_nodes)
+
+    J_ref = jacobian(y, [x, W])
+    H_ref = hessian(pt_sum(y**2), x)
+    f_ref = pytensor.function([x, W], [*J_ref, H_ref])
+
+    rng = np.random.default_rng(utt.fetch_seed())
+    x_val = rng.normal(size=(5,)).astype(pytensor.config.floatX)
+    W_val = rng.normal(size=(5, 5)).astype(pytensor.config.floatX)
+    for res, ref in zip(f(x_val, W_val), f_ref(x_val, W_val)):
+        utt.assert_allclose(res, ref)
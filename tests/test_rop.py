@@ -18,9 +18,19 @@ import pytest
 import pytensor
 import pytensor.tensor as pt
 from pytensor import function
-from pytensor.gradient import Lop, Rop, grad, grad_undefined
+from pytensor.gradient import (
+    Lop,
+    Rop,
+    grad,
+    grad_undefined,
+    hessian,
+    hvp,
+    jacobian,
+    jvp,
+)
 from pytensor.graph.basic import Apply
 from pytensor.graph.op import Op
+from pytensor.tensor.blockwise import Blockwise
 from pytensor.tensor.math import argmax, dot
 from pytensor.tensor.math import max as pt_max
 from pytensor.tensor.shape import unbroadcast
@@ -334,3 +344,111 @@ class TestRopLop(RopLopChecker):
         v = pytensor.shared(np.ones([20]))
         d = dot(x, v).sum()
         Rop(grad(d, v), v, v)
+
+    def test_careduce(self):
+        out = pt.prod(self.x, no_zeros_in_input=True) * self.x
+        self.check_rop_lop(out, self.in_shape)
+
+        m = pt.matrix("m")
+        out = pt.prod(m, axis=1)
+        m_val = np.arange(1, 7, dtype=pytensor.config.floatX).reshape(2, 3)
+        f = function([m], Rop(out, m, pt.ones_like(m)))
+        utt.assert_allclose(f(m_val), [11, 74])
+
+    def test_blockwise(self):
+        x = pt.tensor3("x")
+        y = pt.matrix("y")
+        vx = pt.tensor3("vx")
+        vy = pt.matrix("vy")
+        out = pt.matmul(x, y)
+        assert isinstance(out.owner.op, Blockwise)
+
+        f = function([x, y, vx, vy], Rop(out, [x, y], [vx, vy]))
+        x_val, vx_val = self.rng.uniform(size=(2, 2, 3, 4)).astype(
+            pytensor.config.floatX
+        )
+        y_val, vy_val = self.rng.uniform(size=(2, 4, 5)).astype(pytensor.config.floatX)
+        utt.assert_allclose(
+            f(x_val, y_val, vx_val, vy_val), vx_val @ y_val + x_val @ vy_val
+        )
+
+    def test_scan_careduce(self):
+        m = pt.matrix("m")
+        out, _ = pytensor.scan(lambda row: pt.prod(row * self.x), sequences=[m])
+        f = function(
+            [m, self.x, self.v], [Rop(out, self.x, self.v), jvp(out, self.x, self.v)]
+        )
+
+        m_val = self.rng.uniform(size=(2, self.in_shape[0])).astype(
+            pytensor.config.floatX
+        )
+        x_val = self.rng.uniform(size=self.in_shape).astype(pytensor.config.floatX)
+        v_val = self.rng.uniform(size=self.in_shape).astype(pytensor.config.floatX)
+        expected = [np.prod(row * x_val) * np.sum(v_val / x_val) for row in m_val]
+        rop_val, jvp_val = f(m_val, x_val, v_val)
+        utt.assert_allclose(rop_val, expected)
+        utt.assert_allclose(jvp_val, expected)
+
+    def test_lop_fallback(self):
+        # `Solve` doesn't implement `R_op`
+        A = self.x[:, None] * self.x[None, :] + pt.eye(self.x.shape[0]) * 2
+        out = pt.linalg.solve(A[None], self.x[None, :, None])[0, :, 0]
+        with pytest.raises(NotImplementedError):
+            Rop(out, self.x, self.v)
+
+        J = jacobian(out, self.x)
+        f = function(
+            [self.x, self.v],
+            [Rop(out, self.x, self.v, use_lop_fallback=True), dot(J, self.v)],
+        )
+        x_val = self.rng.uniform(size=self.in_shape).astype(pytensor.config.floatX)
+        v_val = self.rng.uniform(size=self.in_shape).astype(pytensor.config.floatX)
+        rop_val, expected = f(x_val, v_val)
+        utt.assert_allclose(rop_val, expected)
+
+    def test_lop_fallback_scan(self):
+        # The fallback is used for the inner graph of a `Scan`
+        m = pt.matrix("m")
+        out, _ = pytensor.scan(
+            lambda row: pt.linalg.solve(
+                row[:, None] * self.x[None, :] + pt.eye(self.x.shape[0]) * 2, self.x
+            ),
+            sequences=[m],
+        )
+        with pytest.raises(NotImplementedError):
+            Rop(out, self.x, self.v)
+
+        J = jacobian(out.ravel(), self.x)
+        f = function([m, self.x, self.v], [jvp(out, self.x, self.v), dot(J, self.v)])
+        m_val = self.rng.uniform(size=(2, self.in_shape[0])).astype(
+            pytensor.config.floatX
+        )
+        x_val = self.rng.uniform(size=self.in_shape).astype(pytensor.config.floatX)
+        v_val = self.rng.uniform(size=self.in_shape).astype(pytensor.config.floatX)
+        jvp_val, expected = f(m_val, x_val, v_val)
+        utt.assert_allclose(jvp_val.ravel(), expected)
+
+    def test_jvp_hvp(self):
+        x, mx, v = self.x, self.mx, self.v
+        cost = (pt.tanh(dot(mx, x)) ** 2).sum() + pt.prod(
+            pt.cumsum(x), no_zeros_in_input=True
+        )
+
+        out = pt.exp(dot(mx, x)).cumsum()
+        jvp_out = jvp(out, x, v)
+        hvp_out = hvp(cost, x, v)
+        jac = jacobian(out, x, vectorize=True)
+        hess = hessian(cost, x, vectorize=True)
+        f = function([x, mx, v], [jvp_out, dot(jac, v), hvp_out, dot(hess, v)])
+
+        vx = self.rng.uniform(size=self.in_shape).astype(pytensor.config.floatX)
+        vmx = self.rng.uniform(size=(3, self.in_shape[0])).astype(
+            pytensor.config.floatX
+        )
+        vv = self.rng.uniform(size=self.in_shape).astype(pytensor.config.floatX)
+        jvp_val, jvp_ref, hvp_val, hvp_ref = f(vx, vmx, vv)
+        utt.assert_allclose(jvp_val, jvp_ref)
+        utt.assert_allclose(hvp_val, hvp_ref)
+
+        hvp_list = hvp(cost, [x, mx], [v, self.mv])
+        assert isinstance(hvp_list, list) and len(hvp_list) == 2